@@ -30,6 +30,9 @@ class Settings(BaseSettings):
     MAX_CONCURRENT_JOBS: int = int(os.getenv("MAX_CONCURRENT_JOBS", "3"))
     JOB_TIMEOUT_SECONDS: int = int(os.getenv("JOB_TIMEOUT_SECONDS", "3600"))  # 1시간
 
+    # 성능 모니터링 설정
+    SYSTEM_METRIC_FLUSH_INTERVAL: float = float(os.getenv("SYSTEM_METRIC_FLUSH_INTERVAL", "60"))  # 시스템 메트릭 일괄 저장 주기 (초)
+
     # 로그 설정
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_FILE: str = os.getenv("LOG_FILE", "logs/batch_api.log")
@@ -7,6 +7,7 @@ Weather Flick Batch API Server
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 from app.api.routers import batch, websocket, schedule, retry, notification, performance
 from app.api.config import settings
 from app.api.services.job_manager_db import JobManagerDB
@@ -14,6 +15,7 @@ from app.api.services.schedule_manager import ScheduleManager
 from app.api.services.retry_manager import RetryManager
 from app.api.services.notification_manager import NotificationManager
 from app.core.async_database import get_async_db_manager
+from app.monitoring.system_metric_sampler import get_system_metric_sampler
 import uvicorn
 import logging
 
@@ -57,6 +59,14 @@ async def lifespan(app: FastAPI):
     notification.notification_manager = notification_manager_instance
     job_manager.notification_manager = notification_manager_instance  # 상호 참조 설정
     
+    # 시스템 메트릭 샘플러 시작 (이벤트 루프 밖 스레드에서 측정)
+    system_metric_sampler = get_system_metric_sampler()
+    system_metric_sampler.start()
+    # 샘플러에 쌓인 샘플을 주기적으로 다중 행 INSERT로 저장
+    metric_flush_task = asyncio.create_task(
+        performance.performance_manager.run_system_metric_flush(settings.SYSTEM_METRIC_FLUSH_INTERVAL)
+    )
+    
     # 데이터베이스 연결로 스케줄러 초기화 (일단 건너뛰기)
     # TODO: 데이터베이스 테이블 생성 후 활성화
     # async_db_manager = get_async_db_manager()
@@ -69,6 +79,14 @@ async def lifespan(app: FastAPI):
     logger.info("Weather Flick Batch API 종료")
     if schedule_manager_instance:
         schedule_manager_instance.shutdown()
+    metric_flush_task.cancel()
+    try:
+        await metric_flush_task
+    except asyncio.CancelledError:
+        pass
+    system_metric_sampler.stop()
+    # 종료 전 남은 샘플 저장
+    await performance.performance_manager.flush_system_metrics()
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -2,68 +2,263 @@
 배치 작업 로그 실시간 스트리밍을 위한 WebSocket 라우터
 """
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, Header, HTTPException
-from typing import Optional, Dict, Set
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, Header, HTTPException, Depends
+from typing import Optional, Dict, Any, Union, List
+from collections import deque
+from dataclasses import dataclass
 import asyncio
 import logging
 import json
+import time
 from datetime import datetime
 
+from app.api.auth import verify_api_key
 from app.api.config import settings
 from app.api.services.job_manager_db import JobManagerDB
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+
+@dataclass
+class OutboundQueueConfig:
+    """연결별 송신 큐 설정"""
+    max_queue_size: int = 1000  # 연결당 대기 메시지 수 (초과 시 가장 오래된 메시지 제거)
+    send_timeout: float = 10.0  # 단일 메시지 전송 제한 시간 (초과 시 연결 종료)
+    lag_warning_seconds: float = 5.0  # 이 시간 이상 지연되면 경고 로그
+
+
+class _OutboundMessage:
+    """송신 대기 메시지 (병합 시 payload만 교체)"""
+
+    __slots__ = ("payload", "enqueued_at", "coalesce_key")
+
+    def __init__(self, payload: Union[dict, str], enqueued_at: float, coalesce_key: Optional[str]):
+        self.payload = payload
+        self.enqueued_at = enqueued_at
+        self.coalesce_key = coalesce_key
+
+
+class ClientConnection:
+    """
+    WebSocket 연결 하나의 송신 큐와 전송 태스크
+
+    브로드캐스트는 큐에 넣기만 하고 즉시 반환하며, 실제 전송은 연결별 전송 태스크가
+    순서대로 수행한다. 느린 클라이언트는 자기 큐만 쌓이고 다른 연결에는 영향이 없다.
+    """
+
+    def __init__(self, websocket: WebSocket, job_id: str, config: OutboundQueueConfig,
+                 on_close=None):
+        self.websocket = websocket
+        self.job_id = job_id
+        self.config = config
+        self._on_close = on_close
+        self._queue: deque = deque()
+        self._pending_by_key: Dict[str, _OutboundMessage] = {}
+        self._wakeup = asyncio.Event()
+        self._writer_task: Optional[asyncio.Task] = None
+        self.closed = False
+        self.connected_at = time.monotonic()
+        self.stats = {
+            "enqueued": 0,
+            "sent": 0,
+            "dropped": 0,
+            "coalesced": 0,
+            "last_lag": 0.0,
+            "max_lag": 0.0,
+        }
+
+    def start(self):
+        """전송 태스크 시작"""
+        if self._writer_task is None:
+            self._writer_task = asyncio.create_task(self._writer())
+
+    def enqueue(self, payload: Union[dict, str], coalesce_key: Optional[str] = None) -> bool:
+        """
+        메시지를 송신 큐에 추가 (대기하지 않음)
+
+        coalesce_key가 같은 메시지가 아직 전송되지 않았다면 최신 내용으로 교체하고,
+        큐가 가득 차면 가장 오래된 메시지를 버린다.
+        """
+        if self.closed:
+            return False
+
+        self.stats["enqueued"] += 1
+        if coalesce_key is not None:
+            pending = self._pending_by_key.get(coalesce_key)
+            if pending is not None:
+                pending.payload = payload
+                self.stats["coalesced"] += 1
+                return True
+
+        if len(self._queue) >= self.config.max_queue_size:
+            dropped = self._queue.popleft()
+            if dropped.coalesce_key is not None:
+                self._pending_by_key.pop(dropped.coalesce_key, None)
+            self.stats["dropped"] += 1
+
+        message = _OutboundMessage(payload, time.monotonic(), coalesce_key)
+        self._queue.append(message)
+        if coalesce_key is not None:
+            self._pending_by_key[coalesce_key] = message
+        self._wakeup.set()
+        return True
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    def current_lag(self) -> float:
+        """가장 오래 대기 중인 메시지의 대기 시간 (초)"""
+        if not self._queue:
+            return 0.0
+        return time.monotonic() - self._queue[0].enqueued_at
+
+    async def _writer(self):
+        """큐의 메시지를 순서대로 전송"""
+        try:
+            while not self.closed:
+                if not self._queue:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                message = self._queue.popleft()
+                if message.coalesce_key is not None:
+                    self._pending_by_key.pop(message.coalesce_key, None)
+
+                if isinstance(message.payload, str):
+                    send = self.websocket.send_text(message.payload)
+                else:
+                    send = self.websocket.send_json(message.payload)
+                await asyncio.wait_for(send, timeout=self.config.send_timeout)
+
+                lag = time.monotonic() - message.enqueued_at
+                self.stats["sent"] += 1
+                self.stats["last_lag"] = lag
+                if lag > self.stats["max_lag"]:
+                    self.stats["max_lag"] = lag
+                if lag >= self.config.lag_warning_seconds:
+                    logger.warning(
+                        f"WebSocket 전송 지연: job_id={self.job_id}, 지연={lag:.2f}초, "
+                        f"대기 메시지={len(self._queue)}"
+                    )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"WebSocket 전송 실패: job_id={self.job_id}, {e}")
+            self._close()
+            if self._on_close is not None:
+                self._on_close(self)
+
+    def _close(self):
+        self.closed = True
+        self._queue.clear()
+        self._pending_by_key.clear()
+        self._wakeup.set()
+
+    async def close(self):
+        """전송 태스크 종료 및 대기 메시지 폐기"""
+        self._close()
+        task = self._writer_task
+        if task is not None and task is not asyncio.current_task() and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """연결별 전송 통계 (지연 포함)"""
+        return {
+            "job_id": self.job_id,
+            "queue_depth": len(self._queue),
+            "current_lag": round(self.current_lag(), 3),
+            "last_lag": round(self.stats["last_lag"], 3),
+            "max_lag": round(self.stats["max_lag"], 3),
+            "enqueued": self.stats["enqueued"],
+            "sent": self.stats["sent"],
+            "dropped": self.stats["dropped"],
+            "coalesced": self.stats["coalesced"],
+            "connected_seconds": round(time.monotonic() - self.connected_at, 1),
+        }
+
+
 # WebSocket 연결 관리
 class ConnectionManager:
-    def __init__(self):
-        # job_id -> Set[WebSocket]
-        self.active_connections: Dict[str, Set[WebSocket]] = {}
-        self.lock = asyncio.Lock()
+    def __init__(self, config: Optional[OutboundQueueConfig] = None):
+        self.config = config or OutboundQueueConfig()
+        # job_id -> {WebSocket: ClientConnection}
+        # 이벤트 루프 단일 스레드에서만 변경되고 await 중에 순회하지 않으므로 잠금이 필요 없음
+        self.active_connections: Dict[str, Dict[WebSocket, ClientConnection]] = {}
 
-    async def connect(self, websocket: WebSocket, job_id: str):
+    async def connect(self, websocket: WebSocket, job_id: str) -> ClientConnection:
         await websocket.accept()
-        async with self.lock:
-            if job_id not in self.active_connections:
-                self.active_connections[job_id] = set()
-            self.active_connections[job_id].add(websocket)
-            logger.info(f"WebSocket 연결 추가: job_id={job_id}, 현재 연결 수={len(self.active_connections[job_id])}")
+        connection = ClientConnection(websocket, job_id, self.config, on_close=self._remove)
+        self.active_connections.setdefault(job_id, {})[websocket] = connection
+        connection.start()
+        logger.info(f"WebSocket 연결 추가: job_id={job_id}, 현재 연결 수={len(self.active_connections[job_id])}")
+        return connection
+
+    def _remove(self, connection: ClientConnection) -> bool:
+        connections = self.active_connections.get(connection.job_id)
+        if not connections or connections.get(connection.websocket) is not connection:
+            return False
+        del connections[connection.websocket]
+        if not connections:
+            del self.active_connections[connection.job_id]
+        return True
 
     async def disconnect(self, websocket: WebSocket, job_id: str):
-        async with self.lock:
-            if job_id in self.active_connections:
-                self.active_connections[job_id].discard(websocket)
-                if not self.active_connections[job_id]:
-                    del self.active_connections[job_id]
-                logger.info(f"WebSocket 연결 제거: job_id={job_id}")
+        connection = self.active_connections.get(job_id, {}).get(websocket)
+        if connection is None:
+            return
+        self._remove(connection)
+        await connection.close()
+        logger.info(f"WebSocket 연결 제거: job_id={job_id}")
+
+    def publish(self, job_id: str, data: dict, coalesce_key: Optional[str] = None) -> int:
+        """특정 작업의 모든 연결 큐에 메시지 추가 (대기하지 않음), 추가된 연결 수 반환"""
+        connections = self.active_connections.get(job_id)
+        if not connections:
+            return 0
+        return sum(1 for connection in list(connections.values()) if connection.enqueue(data, coalesce_key))
 
     async def send_log(self, job_id: str, log_data: dict):
         """특정 작업의 모든 연결에 로그 전송"""
-        async with self.lock:
-            if job_id in self.active_connections:
-                disconnected = set()
-                for websocket in self.active_connections[job_id]:
-                    try:
-                        await websocket.send_json(log_data)
-                    except Exception as e:
-                        logger.error(f"WebSocket 전송 실패: {e}")
-                        disconnected.add(websocket)
-                
-                # 실패한 연결 제거
-                for websocket in disconnected:
-                    self.active_connections[job_id].discard(websocket)
+        self.publish(job_id, log_data)
 
     async def broadcast_job_update(self, job_id: str, update_data: dict):
         """작업 상태 업데이트 브로드캐스트"""
-        await self.send_log(job_id, {
+        # 진행률만 담긴 업데이트는 전송 전이라면 최신 값으로 병합
+        coalesce_key = "progress" if "progress" in update_data else None
+        self.publish(job_id, {
             "type": "job_update",
             "timestamp": datetime.utcnow().isoformat(),
             "data": update_data
-        })
+        }, coalesce_key=coalesce_key)
+
+    def get_connection_stats(self) -> List[Dict[str, Any]]:
+        """연결별 큐 깊이/전송 지연 통계"""
+        return [
+            connection.get_stats()
+            for connections in list(self.active_connections.values())
+            for connection in list(connections.values())
+        ]
 
 manager = ConnectionManager()
 
+
+@router.get("/connections/stats")
+async def get_websocket_connection_stats(api_key: str = Depends(verify_api_key)):
+    """WebSocket 연결별 송신 큐 및 지연 통계"""
+    connections = manager.get_connection_stats()
+    return {
+        "total_connections": len(connections),
+        "max_lag": max((c["current_lag"] for c in connections), default=0.0),
+        "connections": connections,
+    }
+
 @router.websocket("/jobs/{job_id}/logs/stream")
 async def websocket_endpoint(
     websocket: WebSocket,
@@ -80,7 +275,7 @@ async def websocket_endpoint(
         await websocket.close(code=4001, reason="Invalid API key")
         return
 
-    await manager.connect(websocket, job_id)
+    connection = await manager.connect(websocket, job_id)
     
     try:
         # 기존 로그 전송
@@ -90,7 +285,7 @@ async def websocket_endpoint(
         if logs:
             # 기존 로그를 역순으로 전송 (오래된 것부터)
             for log in reversed(logs.logs):
-                await websocket.send_json({
+                connection.enqueue({
                     "type": "log",
                     "timestamp": log.timestamp.isoformat(),
                     "level": log.level.value,
@@ -105,10 +300,12 @@ async def websocket_endpoint(
             try:
                 message = await asyncio.wait_for(websocket.receive_text(), timeout=30.0)
                 if message == "ping":
-                    await websocket.send_text("pong")
+                    connection.enqueue("pong")
             except asyncio.TimeoutError:
-                # 타임아웃 시 ping 전송
-                await websocket.send_json({"type": "ping"})
+                # 타임아웃 시 ping 전송 (전송 태스크가 끊긴 연결이면 종료)
+                if connection.closed:
+                    break
+                connection.enqueue({"type": "ping"}, coalesce_key="ping")
             except WebSocketDisconnect:
                 break
                 
@@ -4,7 +4,6 @@
 
 import asyncio
 import logging
-import psutil
 import json
 import time
 from datetime import datetime, timedelta
@@ -33,6 +32,7 @@ from app.collectors.unified_kto_client import UnifiedKTOClient
 from app.collectors.weather_collector import WeatherDataCollector
 from jobs.quality.data_quality_job import DataQualityJob
 from app.monitoring.monitoring_system import MonitoringSystem
+from app.monitoring.system_metric_sampler import get_system_metric_sampler
 from app.models_batch import BatchJobExecution, BatchJobDetail, Base
 
 logger = logging.getLogger(__name__)
@@ -889,10 +889,9 @@ class JobManagerDB:
 
     async def get_system_status(self) -> SystemStatus:
         """시스템 상태 조회"""
-        # CPU, 메모리, 디스크 사용률
-        cpu_percent = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage("/")
+        # CPU, 메모리, 디스크 사용률 (백그라운드 샘플러 스냅샷, 대기 없음)
+        sampler = get_system_metric_sampler()
+        snapshot = sampler.get_latest() or sampler.sample_now()
 
         # API 키 상태 (예시)
         api_keys_status = {
@@ -903,9 +902,9 @@ class JobManagerDB:
         return SystemStatus(
             running_jobs=len(self.running_jobs),
             max_concurrent_jobs=settings.MAX_CONCURRENT_JOBS,
-            cpu_usage=cpu_percent,
-            memory_usage=memory.percent,
-            disk_usage=disk.percent,
+            cpu_usage=snapshot.cpu_percent,
+            memory_usage=snapshot.memory_percent,
+            disk_usage=snapshot.disk_percent,
             api_keys_status=api_keys_status,
         )
 
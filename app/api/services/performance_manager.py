@@ -4,7 +4,6 @@
 
 import asyncio
 import logging
-import psutil
 import socket
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
@@ -12,7 +11,7 @@ from statistics import mean, stdev
 from collections import defaultdict
 import uuid
 
-from sqlalchemy import func, and_, or_, desc
+from sqlalchemy import func, and_, or_, desc, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
@@ -29,6 +28,10 @@ from app.models import (
     AlertRule as AlertRuleModel, PerformanceReport as PerformanceReportModel,
     BatchJobExecution, MetricType as MetricTypeEnum, AlertLevelEnum
 )
+from app.core.async_database import get_async_db_manager
+from app.monitoring.system_metric_sampler import (
+    SystemMetricSampler, SystemMetricSnapshot, get_system_metric_sampler
+)
 
 logger = logging.getLogger(__name__)
 
@@ -36,51 +39,63 @@ logger = logging.getLogger(__name__)
 class PerformanceManager:
     """성능 모니터링 매니저"""
     
-    def __init__(self):
+    def __init__(self, sampler: Optional[SystemMetricSampler] = None):
         self.hostname = socket.gethostname()
         self.service_name = "weather-flick-batch"
         self.health_weights = HealthScoreWeights()
         
+        # 시스템 메트릭은 백그라운드 샘플러가 측정 (요청 경로에서 대기하지 않음)
+        self.sampler = sampler or get_system_metric_sampler()
+        
         # 알럿 확인을 위한 캐시
         self.alert_cache = {}
         self.last_alert_check = None
         
     async def collect_system_metrics(self, db: AsyncSession):
-        """시스템 메트릭 수집"""
+        """시스템 메트릭 수집 (샘플러에 쌓인 샘플을 한 번에 저장)"""
+        samples = []
         try:
-            current_time = datetime.utcnow()
+            if not self.sampler.is_running:
+                self.sampler.start()
             
-            # CPU 사용률
-            cpu_percent = psutil.cpu_percent(interval=1)
-            await self._save_system_metric(
-                db, MetricTypeEnum.CPU_USAGE, cpu_percent, "percent", current_time
-            )
+            # 직전 저장 이후 새 샘플이 없으면 같은 측정값을 중복 저장하지 않음
+            samples = self.sampler.drain_pending()
+            if not samples:
+                return
             
-            # 메모리 사용률
-            memory = psutil.virtual_memory()
-            await self._save_system_metric(
-                db, MetricTypeEnum.MEMORY_USAGE, memory.percent, "percent", current_time
-            )
+            saved_count = await self._save_system_metrics(db, samples)
             
-            # 디스크 사용률
-            disk = psutil.disk_usage('/')
-            await self._save_system_metric(
-                db, MetricTypeEnum.DISK_USAGE, disk.percent, "percent", current_time
+            latest = samples[-1]
+            logger.debug(
+                f"시스템 메트릭 수집 완료: 샘플 {len(samples)}개/{saved_count}행, "
+                f"CPU={latest.cpu_percent}%, Memory={latest.memory_percent}%, Disk={latest.disk_percent}%"
             )
             
-            # 네트워크 I/O
-            net_io = psutil.net_io_counters()
-            if net_io:
-                await self._save_system_metric(
-                    db, MetricTypeEnum.NETWORK_IO, 
-                    net_io.bytes_sent + net_io.bytes_recv, "bytes", current_time
-                )
-                
-            logger.debug(f"시스템 메트릭 수집 완료: CPU={cpu_percent}%, Memory={memory.percent}%, Disk={disk.percent}%")
-            
         except Exception as e:
+            # 실패한 트랜잭션을 되돌리고 샘플은 다음 수집 때 다시 시도
+            try:
+                await db.rollback()
+            except Exception as rollback_error:
+                logger.error(f"시스템 메트릭 저장 롤백 오류: {rollback_error}")
+            self.sampler.requeue(samples)
             logger.error(f"시스템 메트릭 수집 오류: {e}")
     
+    async def flush_system_metrics(self, session_factory=None):
+        """샘플러 버퍼를 새 세션에서 일괄 저장"""
+        session_factory = session_factory or get_async_db_manager().get_session
+        try:
+            async with session_factory() as db:
+                await self.collect_system_metrics(db)
+        except Exception as e:
+            logger.error(f"시스템 메트릭 저장 세션 오류: {e}")
+    
+    async def run_system_metric_flush(self, interval_seconds: float = 60.0, session_factory=None):
+        """샘플러 버퍼 주기적 일괄 저장 루프 (애플리케이션 생명주기 동안 실행)"""
+        logger.info(f"시스템 메트릭 주기 저장 시작 (주기: {interval_seconds}초)")
+        while True:
+            await asyncio.sleep(interval_seconds)
+            await self.flush_system_metrics(session_factory)
+    
     async def collect_job_metric(self, db: AsyncSession, job_id: str, metric_type: MetricType, 
                                 value: float, unit: str = None, metadata: Dict[str, Any] = None):
         """작업 메트릭 수집"""
@@ -156,8 +171,15 @@ class PerformanceManager:
             current_time = datetime.utcnow()
             today_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
             
-            # 최신 시스템 메트릭 조회
-            latest_metrics = await self._get_latest_system_metrics(db)
+            # 최신 시스템 메트릭 조회 (샘플러 스냅샷이 있으면 해당 항목은 DB 조회 생략)
+            snapshot = self.sampler.get_latest()
+            if snapshot:
+                latest_metrics = self._snapshot_metrics(snapshot)
+                latest_metrics.update(await self._get_latest_system_metrics(
+                    db, [MetricTypeEnum.API_RESPONSE_TIME]
+                ))
+            else:
+                latest_metrics = await self._get_latest_system_metrics(db)
             
             # 오늘의 작업 통계
             job_stats = await self._get_today_job_stats(db, today_start, current_time)
@@ -391,21 +413,47 @@ class PerformanceManager:
     
     # Private helper methods
     
-    async def _save_system_metric(self, db: AsyncSession, metric_type: MetricTypeEnum, 
-                                 value: float, unit: str, timestamp: datetime):
-        """시스템 메트릭 저장"""
-        metric = SystemPerformanceMetric(
-            metric_id=uuid.uuid4(),
-            metric_type=metric_type,
-            metric_value=value,
-            metric_unit=unit,
-            measured_at=timestamp,
-            hostname=self.hostname,
-            service_name=self.service_name
-        )
+    def _snapshot_metrics(self, snapshot: SystemMetricSnapshot) -> Dict[str, float]:
+        """스냅샷을 메트릭 타입별 값으로 변환"""
+        return {
+            MetricTypeEnum.CPU_USAGE.value: snapshot.cpu_percent,
+            MetricTypeEnum.MEMORY_USAGE.value: snapshot.memory_percent,
+            MetricTypeEnum.DISK_USAGE.value: snapshot.disk_percent,
+        }
+    
+    def _build_system_metric_rows(self, samples: List[SystemMetricSnapshot]) -> List[Dict[str, Any]]:
+        """샘플 목록을 system_performance_metrics 행 목록으로 변환"""
+        rows = []
+        for sample in samples:
+            values = [
+                (MetricTypeEnum.CPU_USAGE, sample.cpu_percent, "percent"),
+                (MetricTypeEnum.MEMORY_USAGE, sample.memory_percent, "percent"),
+                (MetricTypeEnum.DISK_USAGE, sample.disk_percent, "percent"),
+            ]
+            if sample.network_bytes is not None:
+                values.append((MetricTypeEnum.NETWORK_IO, sample.network_bytes, "bytes"))
+            
+            for metric_type, value, unit in values:
+                rows.append({
+                    "metric_id": uuid.uuid4(),
+                    "metric_type": metric_type,
+                    "metric_value": value,
+                    "metric_unit": unit,
+                    "measured_at": sample.measured_at,
+                    "hostname": self.hostname,
+                    "service_name": self.service_name
+                })
+        return rows
+    
+    async def _save_system_metrics(self, db: AsyncSession, samples: List[SystemMetricSnapshot]) -> int:
+        """시스템 메트릭 일괄 저장 (다중 행 INSERT 한 번, 커밋 한 번)"""
+        rows = self._build_system_metric_rows(samples)
+        if not rows:
+            return 0
         
-        db.add(metric)
+        await db.execute(insert(SystemPerformanceMetric), rows)
         await db.commit()
+        return len(rows)
     
     def _calculate_start_time(self, end_time: datetime, time_range: TimeRange) -> datetime:
         """시간 범위 계산"""
@@ -512,12 +560,16 @@ class PerformanceManager:
             time_range=f"{start_time.isoformat()} ~ {end_time.isoformat()}"
         )
     
-    async def _get_latest_system_metrics(self, db: AsyncSession) -> Dict[str, float]:
+    async def _get_latest_system_metrics(self, db: AsyncSession,
+                                         metric_types: Optional[List[MetricTypeEnum]] = None) -> Dict[str, float]:
         """최신 시스템 메트릭 조회"""
         metrics = {}
         
-        for metric_type in [MetricTypeEnum.CPU_USAGE, MetricTypeEnum.MEMORY_USAGE, 
-                           MetricTypeEnum.DISK_USAGE, MetricTypeEnum.API_RESPONSE_TIME]:
+        if metric_types is None:
+            metric_types = [MetricTypeEnum.CPU_USAGE, MetricTypeEnum.MEMORY_USAGE,
+                            MetricTypeEnum.DISK_USAGE, MetricTypeEnum.API_RESPONSE_TIME]
+        
+        for metric_type in metric_types:
             query = await db.execute(
                 """
                 SELECT metric_value 
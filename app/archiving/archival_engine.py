@@ -6,7 +6,7 @@
 
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional
 from datetime import datetime
 from dataclasses import dataclass, field
 from enum import Enum
@@ -75,9 +75,15 @@ class ArchivalEngine:
         # 작업 큐 및 상태 관리
         self.active_tasks: Dict[str, ArchivalTask] = {}
         self.completed_tasks: List[ArchivalTask] = []
+        self.completed_task_count = 0
+        self.max_completed_history = 1000  # 최근 완료 작업 보관 개수
         self.max_concurrent_tasks = 5
         self.task_semaphore = asyncio.Semaphore(self.max_concurrent_tasks)
 
+        # 후보 스트리밍 설정 (메타데이터 페이지 크기, 페이로드 지연 로드 배치 크기)
+        self.candidate_page_size = 1000
+        self.payload_batch_size = 50
+
         # 통계
         self.engine_stats = {
             "total_runs": 0,
@@ -100,28 +106,47 @@ class ArchivalEngine:
         try:
             logger.info(f"아카이빙 프로세스 시작 (제공자: {api_provider}, 엔드포인트: {endpoint}, 드라이런: {dry_run})")
 
-            # 1. 아카이빙 후보 데이터 식별
-            candidates = await self._identify_archival_candidates(api_provider, endpoint)
-            summary.total_candidates = len(candidates)
-
-            if not candidates:
+            # 1. 아카이빙 후보 메타데이터를 keyset 페이지 단위로 스트리밍
+            dry_run_task_count = 0
+            async for candidates in self._iter_archival_candidate_pages(api_provider, endpoint):
+                summary.total_candidates += len(candidates)
+
+                # 2. 아카이빙 작업 생성 (페이로드 없이 메타데이터만 사용)
+                tasks = await self._create_archival_tasks(candidates)
+                if not tasks:
+                    continue
+
+                if dry_run:
+                    dry_run_task_count += len(tasks)
+                    continue
+
+                # 3. 제한된 배치 단위로 페이로드를 로드하여 실행
+                for offset in range(0, len(tasks), self.payload_batch_size):
+                    batch = tasks[offset:offset + self.payload_batch_size]
+                    await self._load_task_payloads(batch)
+                    try:
+                        await self._execute_archival_tasks(batch)
+                    finally:
+                        self._release_task_payloads(batch)
+                    self._compile_archival_summary(batch, start_time, summary)
+
+            if summary.total_candidates == 0:
                 logger.info("아카이빙할 데이터가 없습니다")
                 return summary
 
-            logger.info(f"아카이빙 후보 {len(candidates)}개 식별됨")
+            logger.info(f"아카이빙 후보 {summary.total_candidates}개 처리됨")
 
-            # 2. 아카이빙 작업 생성
-            tasks = await self._create_archival_tasks(candidates)
+            if dry_run:
+                logger.info(f"드라이런 모드: {dry_run_task_count}개 작업이 생성되었지만 실행되지 않았습니다")
+                summary.processed_items = dry_run_task_count
+            else:
+                summary.processing_time_seconds = (datetime.now() - start_time).total_seconds()
 
-            # 3. 작업 실행
+            # 4. 이번 실행에서 사용한 세그먼트 봉인
             if not dry_run:
-                results = await self._execute_archival_tasks(tasks)
-                summary = self._compile_archival_summary(results, start_time)
-            else:
-                logger.info(f"드라이런 모드: {len(tasks)}개 작업이 생성되었지만 실행되지 않았습니다")
-                summary.processed_items = len(tasks)
+                await self.backup_manager.seal_active_segments()
 
-            # 4. 통계 업데이트
+            # 5. 통계 업데이트
             self._update_engine_statistics(summary)
 
             processing_time = (datetime.now() - start_time).total_seconds()
@@ -133,13 +158,15 @@ class ArchivalEngine:
 
         return summary
 
-    async def _identify_archival_candidates(self, api_provider: str = None,
-                                          endpoint: str = None) -> List[Dict[str, Any]]:
-        """아카이빙 후보 데이터 식별"""
-        candidates = []
+    async def _iter_archival_candidate_pages(self, api_provider: str = None,
+                                             endpoint: str = None) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        아카이빙 후보 메타데이터를 (created_at, id) keyset 페이지 단위로 조회
 
-        # 데이터베이스에서 원본 API 데이터 조회
-        query = """
+        응답 본문(raw_response)은 조회하지 않으므로 테이블 크기와 무관하게
+        한 페이지 분량의 메타데이터만 메모리에 유지합니다.
+        """
+        base_query = """
             SELECT
                 id,
                 api_provider,
@@ -147,35 +174,70 @@ class ArchivalEngine:
                 created_at,
                 created_at as last_accessed_at,
                 response_size as data_size_bytes,
-                response_status as response_status_code,
-                raw_response as response_data
+                response_status as response_status_code
             FROM api_raw_data
             WHERE 1=1
         """
-        params = []
+        params: List[Any] = []
 
         if api_provider:
-            query += " AND api_provider = $1"
             params.append(api_provider)
+            base_query += f" AND api_provider = ${len(params)}"
 
         if endpoint:
-            query += f" AND endpoint = ${len(params)+1}"
             params.append(endpoint)
+            base_query += f" AND endpoint = ${len(params)}"
+
+        columns = ["id", "api_provider", "endpoint", "created_at", "last_accessed_at", "data_size_bytes", "response_status_code"]
+        last_key = None
+        total = 0
+
+        while True:
+            query = base_query
+            page_params = list(params)
+            if last_key is not None:
+                page_params.extend(last_key)
+                query += f" AND (created_at, id) > (${len(page_params) - 1}, ${len(page_params)})"
+            page_params.append(self.candidate_page_size)
+            query += f" ORDER BY created_at ASC, id ASC LIMIT ${len(page_params)}"
+
+            async with self.db_pool.get_async_connection() as conn:
+                rows = await conn.fetch(query, *page_params)
 
-        query += " ORDER BY created_at ASC"
+            if not rows:
+                break
 
+            candidates = [dict(zip(columns, row)) for row in rows]
+            total += len(candidates)
+            last_key = (candidates[-1]["created_at"], candidates[-1]["id"])
+
+            yield candidates
+
+            if len(rows) < self.candidate_page_size:
+                break
+
+        logger.debug(f"데이터베이스에서 {total}개 후보 조회됨")
+
+    async def _load_task_payloads(self, tasks: List[ArchivalTask]):
+        """작업 배치의 응답 본문을 한 번에 로드하여 후보 데이터에 연결"""
+        candidate_ids = [task.metadata["candidate_data"]["id"] for task in tasks]
+
+        query = """
+            SELECT id, raw_response
+            FROM api_raw_data
+            WHERE id = ANY($1)
+        """
         async with self.db_pool.get_async_connection() as conn:
-            if params:
-                rows = await conn.fetch(query, *params)
-            else:
-                rows = await conn.fetch(query)
-            columns = ["id", "api_provider", "endpoint", "created_at", "last_accessed_at", "data_size_bytes", "response_status_code", "response_data"]
-            for row in rows:
-                candidate = dict(zip(columns, row))
-                candidates.append(candidate)
+            rows = await conn.fetch(query, candidate_ids)
+
+        payloads = {str(row[0]): row[1] for row in rows}
+        for task in tasks:
+            task.metadata["candidate_data"]["response_data"] = payloads.get(task.data_id)
 
-        logger.debug(f"데이터베이스에서 {len(candidates)}개 후보 조회됨")
-        return candidates
+    def _release_task_payloads(self, tasks: List[ArchivalTask]):
+        """실행이 끝난 작업의 응답 본문 참조 해제"""
+        for task in tasks:
+            task.metadata["candidate_data"].pop("response_data", None)
 
     async def _create_archival_tasks(self, candidates: List[Dict[str, Any]]) -> List[ArchivalTask]:
         """아카이빙 작업 생성"""
@@ -226,9 +288,14 @@ class ArchivalEngine:
         # 동시 실행 작업들
         concurrent_tasks = []
 
+        # 같은 규칙/제공자의 작업은 하나의 백업 블록으로 묶어서 실행
+        task_groups: Dict[tuple, List[ArchivalTask]] = {}
         for task in tasks:
             self.active_tasks[task.task_id] = task
-            concurrent_task = asyncio.create_task(self._execute_single_task(task))
+            task_groups.setdefault((task.rule.rule_id, task.api_provider), []).append(task)
+
+        for group in task_groups.values():
+            concurrent_task = asyncio.create_task(self._execute_task_group(group))
             concurrent_tasks.append(concurrent_task)
 
         # 모든 작업 완료 대기
@@ -240,15 +307,24 @@ class ArchivalEngine:
                 del self.active_tasks[task.task_id]
             self.completed_tasks.append(task)
 
+        self.completed_task_count += len(tasks)
+        if len(self.completed_tasks) > self.max_completed_history:
+            del self.completed_tasks[:-self.max_completed_history]
+
         return tasks
 
     async def _execute_single_task(self, task: ArchivalTask):
         """단일 아카이빙 작업 실행"""
+        await self._execute_task_group([task])
+
+    async def _execute_task_group(self, tasks: List[ArchivalTask]):
+        """같은 규칙을 사용하는 아카이빙 작업 묶음 실행"""
         async with self.task_semaphore:
-            task.started_at = datetime.now()
-            task.status = ArchivalTaskStatus.ANALYZING
+            backup_targets = []
+            for task in tasks:
+                task.started_at = datetime.now()
+                task.status = ArchivalTaskStatus.ANALYZING
 
-            try:
                 # 후보 데이터 가져오기
                 candidate_data = task.metadata["candidate_data"]
                 response_data = candidate_data.get("response_data", {})
@@ -257,39 +333,59 @@ class ArchivalEngine:
                     task.status = ArchivalTaskStatus.SKIPPED
                     task.error_message = "응답 데이터가 없음"
                     task.completed_at = datetime.now()
-                    return
+                    continue
 
-                # 백업 실행
                 task.status = ArchivalTaskStatus.BACKING_UP
-                backup_record = await self.backup_manager.backup_data(
-                    data_id=task.data_id,
-                    api_provider=task.api_provider,
-                    endpoint=task.endpoint,
-                    data=response_data,
-                    rule=task.rule
+                backup_targets.append((task, response_data))
+
+            if not backup_targets:
+                return
+
+            try:
+                # 백업 실행
+                backup_records = await self.backup_manager.backup_data_batch(
+                    [
+                        {
+                            "data_id": task.data_id,
+                            "api_provider": task.api_provider,
+                            "endpoint": task.endpoint,
+                            "data": response_data,
+                        }
+                        for task, response_data in backup_targets
+                    ],
+                    rule=backup_targets[0][0].rule
                 )
+            except Exception as e:
+                for task, _ in backup_targets:
+                    task.status = ArchivalTaskStatus.FAILED
+                    task.error_message = str(e)
+                    task.completed_at = datetime.now()
+                    logger.error(f"아카이빙 작업 실패: {task.task_id}, 오류: {e}")
+                return
 
-                task.backup_record = backup_record
+            for (task, _), backup_record in zip(backup_targets, backup_records):
+                try:
+                    task.backup_record = backup_record
 
-                if backup_record.status == BackupStatus.COMPLETED:
-                    task.status = ArchivalTaskStatus.COMPLETED
+                    if backup_record.status == BackupStatus.COMPLETED:
+                        task.status = ArchivalTaskStatus.COMPLETED
 
-                    # 원본 데이터베이스에서 아카이빙 표시 또는 삭제
-                    await self._mark_data_as_archived(task.data_id, backup_record.backup_id)
+                        # 원본 데이터베이스에서 아카이빙 표시 또는 삭제
+                        await self._mark_data_as_archived(task.data_id, backup_record.backup_id)
 
-                else:
-                    task.status = ArchivalTaskStatus.FAILED
-                    task.error_message = backup_record.error_message
+                    else:
+                        task.status = ArchivalTaskStatus.FAILED
+                        task.error_message = backup_record.error_message
 
-                task.completed_at = datetime.now()
+                    task.completed_at = datetime.now()
 
-                logger.info(f"아카이빙 작업 완료: {task.task_id} (상태: {task.status.value})")
+                    logger.info(f"아카이빙 작업 완료: {task.task_id} (상태: {task.status.value})")
 
-            except Exception as e:
-                task.status = ArchivalTaskStatus.FAILED
-                task.error_message = str(e)
-                task.completed_at = datetime.now()
-                logger.error(f"아카이빙 작업 실패: {task.task_id}, 오류: {e}")
+                except Exception as e:
+                    task.status = ArchivalTaskStatus.FAILED
+                    task.error_message = str(e)
+                    task.completed_at = datetime.now()
+                    logger.error(f"아카이빙 작업 실패: {task.task_id}, 오류: {e}")
 
     async def _mark_data_as_archived(self, data_id: str, backup_id: str):
         """데이터를 아카이빙됨으로 표시"""
@@ -305,10 +401,11 @@ class ArchivalEngine:
             await conn.execute(update_query, datetime.now(), backup_id, data_id)
         logger.debug(f"데이터 {data_id}를 아카이빙됨으로 표시 (백업 ID: {backup_id})")
 
-    def _compile_archival_summary(self, tasks: List[ArchivalTask], start_time: datetime) -> ArchivalSummary:
-        """아카이빙 요약 컴파일"""
-        summary = ArchivalSummary()
-        summary.processed_items = len(tasks)
+    def _compile_archival_summary(self, tasks: List[ArchivalTask], start_time: datetime,
+                                  summary: Optional[ArchivalSummary] = None) -> ArchivalSummary:
+        """아카이빙 요약 컴파일 (summary가 주어지면 누적)"""
+        summary = summary or ArchivalSummary()
+        summary.processed_items += len(tasks)
 
         total_original_bytes = 0
         total_compressed_bytes = 0
@@ -324,13 +421,13 @@ class ArchivalEngine:
                 summary.skipped_items += 1
 
         # 크기 통계 (MB 단위)
-        summary.total_original_size_mb = total_original_bytes / (1024 * 1024)
-        summary.total_compressed_size_mb = total_compressed_bytes / (1024 * 1024)
+        summary.total_original_size_mb += total_original_bytes / (1024 * 1024)
+        summary.total_compressed_size_mb += total_compressed_bytes / (1024 * 1024)
 
         # 압축률 계산
-        if total_original_bytes > 0:
+        if summary.total_original_size_mb > 0:
             summary.average_compression_ratio = (
-                1 - total_compressed_bytes / total_original_bytes
+                1 - summary.total_compressed_size_mb / summary.total_original_size_mb
             ) * 100
 
         # 처리 시간
@@ -390,7 +487,7 @@ class ArchivalEngine:
     def get_archival_statistics(self) -> Dict[str, Any]:
         """아카이빙 통계 반환"""
         active_task_count = len(self.active_tasks)
-        completed_task_count = len(self.completed_tasks)
+        completed_task_count = self.completed_task_count
 
         # 최근 완료된 작업들의 상태별 집계
         recent_tasks = self.completed_tasks[-100:]  # 최근 100개
@@ -10,7 +10,7 @@ import bz2
 import lzma
 import json
 import hashlib
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -21,6 +21,9 @@ import aiofiles
 from app.archiving.archival_policies import (
     CompressionType, StorageLocation, ArchivalRule, get_archival_policy_manager
 )
+from app.core.cpu_offload_executor import (
+    PROCESS_BOUND_COMPRESSIONS, get_cpu_offload_executor
+)
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +69,37 @@ class BackupConfiguration:
     compression_level: int = 6  # 1-9 범위
     enable_deduplication: bool = True
     cloud_storage_config: Dict[str, Any] = field(default_factory=dict)
+    use_segment_format: bool = True  # 로컬 디스크 백업을 세그먼트 파일에 묶어서 저장
+    segment_max_bytes: int = 64 * 1024 * 1024  # 세그먼트 롤링 크기
+
+
+@dataclass
+class SegmentWriterState:
+    """추가 전용 세그먼트 파일 쓰기 상태"""
+    path: Path
+    size_bytes: int = 0
+    record_count: int = 0
+    hasher: Any = field(default_factory=hashlib.sha256)
+
+
+def _compress_segment_block(payloads: List[bytes], compression_value: str,
+                            level: int) -> Tuple[bytes, List[Tuple[int, int]], str]:
+    """
+    레코드 묶음을 하나의 압축 블록으로 변환 (CPU 오프로드 실행기에서 실행)
+
+    Returns:
+        Tuple[bytes, List[Tuple[int, int]], str]: (압축 블록, 블록 내 레코드 위치 목록, 블록 체크섬)
+    """
+    offsets = []
+    position = 0
+    for payload in payloads:
+        offsets.append((position, len(payload)))
+        position += len(payload) + 1  # 레코드 구분 개행 문자
+
+    block = b"\n".join(payloads) + b"\n"
+    compressor = CompressionHandler.get_compressor(CompressionType(compression_value), level)
+    compressed = compressor(block)
+    return compressed, offsets, hashlib.sha256(compressed).hexdigest()
 
 
 class CompressionHandler:
@@ -126,6 +160,16 @@ class BackupManager:
         # 동시 백업 제한용 세마포어
         self.backup_semaphore = asyncio.Semaphore(self.config.max_concurrent_backups)
         
+        # 세그먼트 저장 상태 (제공자/압축 방식별 활성 세그먼트)
+        self.segment_writers: Dict[Tuple[str, CompressionType], SegmentWriterState] = {}
+        self.segment_locks: Dict[Tuple[str, CompressionType], asyncio.Lock] = {}
+        self.segment_ref_counts: Dict[str, int] = {}
+        self._segment_sequence = 0
+        self._segment_index_loaded = False
+        
+        # 압축/체크섬 계산은 공유 CPU 오프로드 실행기에서 처리
+        self.cpu_executor = get_cpu_offload_executor()
+        
         # 통계
         self.backup_stats = {
             "total_backups": 0,
@@ -164,6 +208,274 @@ class BackupManager:
     async def backup_data(self, data_id: str, api_provider: str, endpoint: str, 
                          data: Dict[str, Any], rule: ArchivalRule) -> BackupRecord:
         """데이터 백업 실행"""
+        if self._uses_segment_format(rule):
+            records = await self.backup_data_batch(
+                [{"data_id": data_id, "api_provider": api_provider, "endpoint": endpoint, "data": data}],
+                rule
+            )
+            return records[0]
+        
+        return await self._backup_data_to_file(data_id, api_provider, endpoint, data, rule)
+    
+    async def backup_data_batch(self, items: List[Dict[str, Any]],
+                                rule: ArchivalRule) -> List[BackupRecord]:
+        """
+        여러 데이터를 세그먼트 파일에 일괄 백업
+        
+        같은 API 제공자의 레코드를 하나의 압축 블록으로 묶어 활성 세그먼트에 추가합니다.
+        
+        Args:
+            items: data_id, api_provider, endpoint, data 키를 가진 백업 대상 목록
+            rule: 적용할 아카이빙 규칙
+            
+        Returns:
+            List[BackupRecord]: items와 같은 순서의 백업 기록
+        """
+        if not self._uses_segment_format(rule):
+            return [
+                await self._backup_data_to_file(
+                    item["data_id"], item["api_provider"], item["endpoint"], item["data"], rule
+                )
+                for item in items
+            ]
+        
+        records: List[Optional[BackupRecord]] = [None] * len(items)
+        items_by_provider: Dict[str, List[int]] = {}
+        for index, item in enumerate(items):
+            items_by_provider.setdefault(item["api_provider"], []).append(index)
+        
+        for api_provider, indices in items_by_provider.items():
+            group_records = await self._backup_block(
+                api_provider, [items[index] for index in indices], rule
+            )
+            for index, record in zip(indices, group_records):
+                records[index] = record
+        
+        return records
+    
+    def _uses_segment_format(self, rule: ArchivalRule) -> bool:
+        """세그먼트 저장 방식 사용 여부"""
+        return (
+            self.config.use_segment_format
+            and rule.target_location == StorageLocation.LOCAL_DISK
+        )
+    
+    async def _backup_block(self, api_provider: str, items: List[Dict[str, Any]],
+                            rule: ArchivalRule) -> List[BackupRecord]:
+        """레코드 묶음을 하나의 압축 블록으로 세그먼트에 추가"""
+        async with self.backup_semaphore:
+            backup_records = [
+                BackupRecord(
+                    backup_id=self.generate_backup_id(api_provider, item["endpoint"], item["data_id"]),
+                    original_data_id=item["data_id"],
+                    api_provider=api_provider,
+                    endpoint=item["endpoint"],
+                    compression=rule.compression,
+                    storage_location=rule.target_location,
+                    status=BackupStatus.IN_PROGRESS
+                )
+                for item in items
+            ]
+            
+            try:
+                # 데이터를 한 줄 JSON으로 직렬화
+                payloads = [
+                    json.dumps(item["data"], ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+                    for item in items
+                ]
+                
+                # 압축은 이벤트 루프 밖에서 실행
+                compressed_block, record_offsets, block_checksum = await self._run_compression(
+                    payloads, rule.compression
+                )
+                
+                # 활성 세그먼트에 블록 추가
+                segment_path, block_offset = await self._append_block_to_segment(
+                    api_provider, rule.compression, compressed_block,
+                    backup_records, record_offsets, block_checksum
+                )
+                
+                # 무결성 검증 (추가한 블록만 다시 읽어 확인)
+                verified = True
+                if self.config.verify_integrity:
+                    verified = await self._verify_segment_block(
+                        segment_path, block_offset, len(compressed_block), block_checksum
+                    )
+                
+                block_original_size = sum(len(payload) for payload in payloads)
+                completed_at = datetime.now()
+                
+                for backup_record, payload, (record_offset, record_length) in zip(
+                    backup_records, payloads, record_offsets
+                ):
+                    backup_record.backup_path = str(segment_path)
+                    backup_record.checksum = block_checksum
+                    backup_record.original_size_bytes = len(payload)
+                    # 블록 압축 크기를 레코드 크기 비율로 배분
+                    backup_record.compressed_size_bytes = (
+                        len(compressed_block) * len(payload) // block_original_size
+                        if block_original_size else 0
+                    )
+                    if backup_record.original_size_bytes > 0:
+                        backup_record.compression_ratio = (
+                            1 - backup_record.compressed_size_bytes / backup_record.original_size_bytes
+                        ) * 100
+                    backup_record.metadata.update({
+                        "format": "segment",
+                        "block_offset": block_offset,
+                        "block_length": len(compressed_block),
+                        "record_offset": record_offset,
+                        "record_length": record_length,
+                    })
+                    
+                    if verified:
+                        backup_record.status = BackupStatus.COMPLETED
+                    else:
+                        backup_record.status = BackupStatus.CORRUPTED
+                        backup_record.error_message = "백업 무결성 검증 실패"
+                    backup_record.completed_at = completed_at
+                    
+                    self._update_backup_statistics(backup_record)
+                
+                logger.info(
+                    f"세그먼트 백업 완료: {len(backup_records)}건 → {segment_path.name}, "
+                    f"블록 크기: {len(compressed_block):,} bytes "
+                    f"(원본 {block_original_size:,} bytes)"
+                )
+                
+            except Exception as e:
+                for backup_record in backup_records:
+                    backup_record.status = BackupStatus.FAILED
+                    backup_record.error_message = str(e)
+                    backup_record.completed_at = datetime.now()
+                    self._update_backup_statistics(backup_record)
+                logger.error(f"세그먼트 백업 실패: {api_provider} {len(backup_records)}건, 오류: {e}")
+            
+            # 백업 기록 저장
+            for backup_record in backup_records:
+                self.backup_records[backup_record.backup_id] = backup_record
+            
+            return backup_records
+    
+    async def _run_compression(self, payloads: List[bytes],
+                               compression: CompressionType) -> Tuple[bytes, List[Tuple[int, int]], str]:
+        """압축 블록 생성 (lzma/bz2는 프로세스 풀, gzip은 스레드 풀에서 실행)"""
+        return await self.cpu_executor.run(
+            _compress_segment_block, payloads, compression.value, self.config.compression_level,
+            use_process=compression.value in PROCESS_BOUND_COMPRESSIONS
+        )
+    
+    def _new_segment_path(self, api_provider: str, compression: CompressionType) -> Path:
+        """새 세그먼트 파일 경로 생성"""
+        # 제공자별 디렉토리 구조: backups/KTO/segments/2024/01/KTO_20240101_120000_0001.seg.gz
+        now = datetime.now()
+        segment_dir = self.backup_base_path / api_provider / "segments" / now.strftime("%Y/%m")
+        segment_dir.mkdir(parents=True, exist_ok=True)
+        
+        self._segment_sequence += 1
+        file_extension = self.compression_handler.get_file_extension(compression)
+        filename = f"{api_provider}_{now.strftime('%Y%m%d_%H%M%S')}_{self._segment_sequence:04d}.seg{file_extension}"
+        return segment_dir / filename
+    
+    async def _append_block_to_segment(self, api_provider: str, compression: CompressionType,
+                                       compressed_block: bytes, backup_records: List[BackupRecord],
+                                       record_offsets: List[Tuple[int, int]],
+                                       block_checksum: str) -> Tuple[Path, int]:
+        """활성 세그먼트에 블록과 오프셋 인덱스 추가 (크기 초과 시 롤링)"""
+        writer_key = (api_provider, compression)
+        lock = self.segment_locks.setdefault(writer_key, asyncio.Lock())
+        
+        async with lock:
+            writer = self.segment_writers.get(writer_key)
+            if writer is not None and writer.size_bytes >= self.config.segment_max_bytes:
+                await self._seal_segment(writer)
+                writer = None
+            
+            if writer is None:
+                writer = SegmentWriterState(path=self._new_segment_path(api_provider, compression))
+                self.segment_writers[writer_key] = writer
+            
+            block_offset = writer.size_bytes
+            async with aiofiles.open(writer.path, 'ab') as f:
+                await f.write(compressed_block)
+            
+            index_lines = "".join(
+                json.dumps({
+                    "backup_id": backup_record.backup_id,
+                    "data_id": backup_record.original_data_id,
+                    "api_provider": api_provider,
+                    "endpoint": backup_record.endpoint,
+                    "compression": compression.value,
+                    "created_at": backup_record.created_at.isoformat(),
+                    "block_offset": block_offset,
+                    "block_length": len(compressed_block),
+                    "record_offset": record_offset,
+                    "record_length": record_length,
+                    "checksum": block_checksum,
+                }, ensure_ascii=False) + "\n"
+                for backup_record, (record_offset, record_length) in zip(backup_records, record_offsets)
+            )
+            async with aiofiles.open(self._segment_index_path(writer.path), 'a', encoding='utf-8') as f:
+                await f.write(index_lines)
+            
+            writer.size_bytes += len(compressed_block)
+            writer.record_count += len(backup_records)
+            writer.hasher.update(compressed_block)
+            
+            segment_key = str(writer.path)
+            self.segment_ref_counts[segment_key] = (
+                self.segment_ref_counts.get(segment_key, 0) + len(backup_records)
+            )
+            
+            return writer.path, block_offset
+    
+    @staticmethod
+    def _segment_index_path(segment_path: Path) -> Path:
+        """세그먼트 오프셋 인덱스 파일 경로"""
+        return segment_path.with_name(segment_path.name + ".idx")
+    
+    @staticmethod
+    def _segment_checksum_path(segment_path: Path) -> Path:
+        """세그먼트 체크섬 파일 경로"""
+        return segment_path.with_name(segment_path.name + ".sha256")
+    
+    async def _seal_segment(self, writer: SegmentWriterState):
+        """세그먼트 봉인 (전체 체크섬 기록)"""
+        async with aiofiles.open(self._segment_checksum_path(writer.path), 'w', encoding='utf-8') as f:
+            await f.write(f"{writer.hasher.hexdigest()}  {writer.path.name}\n")
+        
+        logger.info(
+            f"세그먼트 봉인: {writer.path.name} "
+            f"({writer.record_count}건, {writer.size_bytes:,} bytes)"
+        )
+    
+    async def seal_active_segments(self):
+        """모든 활성 세그먼트 봉인 (아카이빙 실행 종료 시 호출)"""
+        for writer_key, writer in list(self.segment_writers.items()):
+            async with self.segment_locks[writer_key]:
+                if self.segment_writers.get(writer_key) is writer:
+                    await self._seal_segment(writer)
+                    del self.segment_writers[writer_key]
+    
+    async def _read_segment_block(self, segment_path: Path, offset: int, length: int) -> bytes:
+        """세그먼트에서 블록 하나만 읽기"""
+        async with aiofiles.open(segment_path, 'rb') as f:
+            await f.seek(offset)
+            return await f.read(length)
+    
+    async def _verify_segment_block(self, segment_path: Path, offset: int,
+                                    length: int, checksum: str) -> bool:
+        """세그먼트 블록 무결성 검증"""
+        try:
+            stored_block = await self._read_segment_block(segment_path, offset, length)
+            return await self.cpu_executor.checksum(stored_block) == checksum
+        except Exception as e:
+            logger.error(f"세그먼트 블록 무결성 검증 오류: {e}")
+            return False
+    
+    async def _backup_data_to_file(self, data_id: str, api_provider: str, endpoint: str,
+                                   data: Dict[str, Any], rule: ArchivalRule) -> BackupRecord:
+        """데이터 백업 실행 (레코드별 개별 파일)"""
         async with self.backup_semaphore:
             backup_id = self.generate_backup_id(api_provider, endpoint, data_id)
             
@@ -184,10 +496,9 @@ class BackupManager:
                 backup_record.original_size_bytes = len(original_bytes)
                 
                 # 압축 적용
-                compressor = self.compression_handler.get_compressor(
-                    rule.compression, self.config.compression_level
+                compressed_data = await self.cpu_executor.compress(
+                    original_bytes, rule.compression.value, self.config.compression_level
                 )
-                compressed_data = compressor(original_bytes)
                 backup_record.compressed_size_bytes = len(compressed_data)
                 
                 # 압축률 계산
@@ -197,7 +508,7 @@ class BackupManager:
                     ) * 100
                 
                 # 체크섬 계산
-                backup_record.checksum = self.calculate_checksum(compressed_data)
+                backup_record.checksum = await self.cpu_executor.checksum(compressed_data)
                 
                 # 백업 파일 경로 설정
                 backup_path = self.get_backup_path(backup_record)
@@ -274,7 +585,7 @@ class BackupManager:
                     stored_data = await f.read()
                 
                 # 체크섬 검증
-                stored_checksum = self.calculate_checksum(stored_data)
+                stored_checksum = await self.cpu_executor.checksum(stored_data)
                 return stored_checksum == backup_record.checksum
             
             # 다른 저장 위치는 구현 예정
@@ -304,12 +615,19 @@ class BackupManager:
     
     async def restore_data(self, backup_id: str) -> Optional[Dict[str, Any]]:
         """백업 데이터 복원"""
+        if backup_id not in self.backup_records:
+            # 재시작 이전에 저장된 세그먼트 레코드는 오프셋 인덱스에서 찾음
+            await self._load_segment_index()
+        
         if backup_id not in self.backup_records:
             logger.error(f"백업 기록을 찾을 수 없습니다: {backup_id}")
             return None
         
         backup_record = self.backup_records[backup_id]
         
+        if backup_record.metadata.get("format") == "segment":
+            return await self._restore_segment_record(backup_record)
+        
         try:
             # 백업 파일 읽기
             if backup_record.storage_location == StorageLocation.LOCAL_DISK:
@@ -321,13 +639,14 @@ class BackupManager:
                 return None
             
             # 무결성 검증
-            if self.calculate_checksum(compressed_data) != backup_record.checksum:
+            if await self.cpu_executor.checksum(compressed_data) != backup_record.checksum:
                 logger.error(f"백업 파일 체크섬 불일치: {backup_id}")
                 return None
             
             # 압축 해제
-            decompressor = self.compression_handler.get_decompressor(backup_record.compression)
-            original_data = decompressor(compressed_data)
+            original_data = await self.cpu_executor.decompress(
+                compressed_data, backup_record.compression.value
+            )
             
             # JSON 파싱
             json_data = original_data.decode('utf-8')
@@ -340,19 +659,51 @@ class BackupManager:
             logger.error(f"백업 데이터 복원 실패: {backup_id}, 오류: {e}")
             return None
     
+    async def _restore_segment_record(self, backup_record: BackupRecord) -> Optional[Dict[str, Any]]:
+        """세그먼트에서 단일 레코드 복원 (해당 블록만 읽어 압축 해제)"""
+        try:
+            metadata = backup_record.metadata
+            block = await self._read_segment_block(
+                Path(backup_record.backup_path), metadata["block_offset"], metadata["block_length"]
+            )
+            
+            # 무결성 검증
+            if await self.cpu_executor.checksum(block) != backup_record.checksum:
+                logger.error(f"세그먼트 블록 체크섬 불일치: {backup_record.backup_id}")
+                return None
+            
+            # 압축 해제
+            original_block = await self.cpu_executor.decompress(block, backup_record.compression.value)
+            
+            record_offset = metadata["record_offset"]
+            record_bytes = original_block[record_offset:record_offset + metadata["record_length"]]
+            restored_data = json.loads(record_bytes.decode('utf-8'))
+            
+            logger.info(f"백업 데이터 복원 완료: {backup_record.backup_id}")
+            return restored_data
+            
+        except Exception as e:
+            logger.error(f"백업 데이터 복원 실패: {backup_record.backup_id}, 오류: {e}")
+            return None
+    
     async def cleanup_old_backups(self, cleanup_days: Optional[int] = None) -> int:
         """오래된 백업 정리"""
         cleanup_days = cleanup_days or self.config.auto_cleanup_days
         cutoff_date = datetime.now() - timedelta(days=cleanup_days)
         
+        # 재시작 이전 세그먼트 레코드와 참조 수 복구
+        await self._load_segment_index()
+        
         cleaned_count = 0
         backup_ids_to_remove = []
         
         for backup_id, backup_record in self.backup_records.items():
             if backup_record.created_at < cutoff_date:
                 try:
-                    # 백업 파일 삭제
-                    if backup_record.storage_location == StorageLocation.LOCAL_DISK:
+                    # 백업 파일 삭제 (세그먼트는 참조하는 레코드가 모두 정리된 경우에만 삭제)
+                    if backup_record.metadata.get("format") == "segment":
+                        self._release_segment_reference(Path(backup_record.backup_path))
+                    elif backup_record.storage_location == StorageLocation.LOCAL_DISK:
                         backup_path = Path(backup_record.backup_path)
                         if backup_path.exists():
                             backup_path.unlink()
@@ -370,6 +721,86 @@ class BackupManager:
         logger.info(f"오래된 백업 정리 완료: {cleaned_count}개 삭제")
         return cleaned_count
     
+    async def _load_segment_index(self):
+        """
+        세그먼트 오프셋 인덱스(.idx)에서 메모리에 없는 백업 기록과 세그먼트 참조 수 복구
+        
+        프로세스 재시작 후 이전 실행에서 저장한 세그먼트 레코드를 복원/정리할 수 있도록
+        최초 한 번만 모든 인덱스 파일을 읽습니다.
+        """
+        if self._segment_index_loaded:
+            return
+        self._segment_index_loaded = True
+        
+        loaded_count = 0
+        for index_path in sorted(self.backup_base_path.glob("*/segments/**/*.idx")):
+            segment_path = index_path.with_name(index_path.name[:-len(".idx")])
+            if not segment_path.exists():
+                continue
+            
+            try:
+                async with aiofiles.open(index_path, 'r', encoding='utf-8') as f:
+                    lines = await f.readlines()
+            except Exception as e:
+                logger.error(f"세그먼트 인덱스 읽기 실패: {index_path}, 오류: {e}")
+                continue
+            
+            for line in lines:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # 쓰기 도중 중단된 마지막 줄
+                    logger.warning(f"손상된 세그먼트 인덱스 항목 무시: {index_path.name}")
+                    continue
+                
+                if entry["backup_id"] in self.backup_records:
+                    continue
+                
+                created_at = datetime.fromisoformat(entry["created_at"])
+                self.backup_records[entry["backup_id"]] = BackupRecord(
+                    backup_id=entry["backup_id"],
+                    original_data_id=entry["data_id"],
+                    api_provider=entry["api_provider"],
+                    endpoint=entry["endpoint"],
+                    backup_path=str(segment_path),
+                    compression=CompressionType(entry["compression"]),
+                    original_size_bytes=entry["record_length"],
+                    checksum=entry["checksum"],
+                    status=BackupStatus.COMPLETED,
+                    created_at=created_at,
+                    completed_at=created_at,
+                    metadata={
+                        "format": "segment",
+                        "block_offset": entry["block_offset"],
+                        "block_length": entry["block_length"],
+                        "record_offset": entry["record_offset"],
+                        "record_length": entry["record_length"],
+                    }
+                )
+                segment_key = str(segment_path)
+                self.segment_ref_counts[segment_key] = self.segment_ref_counts.get(segment_key, 0) + 1
+                loaded_count += 1
+        
+        if loaded_count:
+            logger.info(f"세그먼트 인덱스에서 백업 기록 복구: {loaded_count}건")
+    
+    def _release_segment_reference(self, segment_path: Path):
+        """세그먼트 참조 해제 후 더 이상 참조가 없는 봉인된 세그먼트 삭제"""
+        segment_key = str(segment_path)
+        remaining = self.segment_ref_counts.get(segment_key, 0) - 1
+        
+        is_active = any(writer.path == segment_path for writer in self.segment_writers.values())
+        if remaining > 0 or is_active:
+            self.segment_ref_counts[segment_key] = max(remaining, 0)
+            return
+        
+        self.segment_ref_counts.pop(segment_key, None)
+        for path in (segment_path, self._segment_index_path(segment_path),
+                     self._segment_checksum_path(segment_path)):
+            if path.exists():
+                path.unlink()
+        logger.debug(f"세그먼트 삭제: {segment_path.name}")
+    
     def get_backup_statistics(self) -> Dict[str, Any]:
         """백업 통계 반환"""
         return {
@@ -6,6 +6,8 @@
 
 import logging
 import asyncio
+import math
+import uuid
 from datetime import datetime
 from typing import Dict, List, Optional
 
@@ -95,6 +97,7 @@ class UnifiedKTOClient:
         include_new_apis: bool = True,
         include_hierarchical_regions: bool = False,
         use_priority_sorting: bool = False,
+        parallel_pages: bool = False,
     ) -> Dict:
         """
         모든 KTO 데이터 수집 (신규 API 포함)
@@ -107,6 +110,7 @@ class UnifiedKTOClient:
             include_new_apis: 신규 추가된 4개 API 포함 여부
             include_hierarchical_regions: 계층적 지역코드 수집 포함 여부
             use_priority_sorting: 데이터 부족 순으로 우선순위 정렬 여부
+            parallel_pages: 지역별 목록 페이지 병렬 수집 여부
 
         Returns:
             Dict: 수집 결과 요약
@@ -208,6 +212,7 @@ class UnifiedKTOClient:
                             sync_batch_id,
                             store_raw,
                             auto_transform,
+                            parallel_pages=parallel_pages,
                         )
 
                         content_results["areas"][area_code] = area_result
@@ -956,9 +961,15 @@ class UnifiedKTOClient:
         sync_batch_id: str,
         store_raw: bool,
         auto_transform: bool,
+        parallel_pages: bool = False,
     ) -> Dict:
         """특정 지역의 특정 타입 데이터 수집"""
 
+        if parallel_pages and self.enable_parallel and self.concurrent_manager:
+            return await self._collect_area_data_parallel(
+                content_type, area_code, sync_batch_id, store_raw, auto_transform
+            )
+
         area_result = {
             "area_code": area_code,
             "content_type": content_type,
@@ -974,22 +985,9 @@ class UnifiedKTOClient:
 
         while True:
             try:
-                # API 호출 파라미터 구성
-                params = {
-                    **self.default_params,
-                    "contentTypeId": content_type,
-                    "areaCode": area_code,
-                    "pageNo": page_no,
-                    "numOfRows": num_of_rows,
-                }
-
                 # API 호출
-                response = await self.api_client.call_api(
-                    api_provider=APIProvider.KTO,
-                    endpoint="areaBasedList2",
-                    params=params,
-                    store_raw=store_raw,
-                    cache_ttl=7200,  # 2시간 캐시
+                response = await self._fetch_area_page(
+                    content_type, area_code, page_no, num_of_rows, store_raw
                 )
 
                 if not response.success:
@@ -997,49 +995,14 @@ class UnifiedKTOClient:
                     area_result["errors"].append(error_msg)
                     break
 
-                # 응답 데이터 확인
-                response_body = response.data  # UnifiedAPIClient가 이미 body만 반환
-                total_count = response_body.get("totalCount", 0)
-                items = response_body.get("items", {})
+                total_count, current_page_count = await self._process_area_page(
+                    content_type, response, area_result, auto_transform
+                )
 
-                if total_count == 0 or not items or "item" not in items:
+                if current_page_count == 0:
                     # 더 이상 데이터가 없음
                     break
 
-                page_items = items["item"]
-                if isinstance(page_items, dict):
-                    page_items = [page_items]
-
-                current_page_count = len(page_items)
-                area_result["raw_records"] += current_page_count
-                area_result["pages_collected"] += 1
-
-                if response.raw_data_id:
-                    area_result["raw_data_ids"].append(response.raw_data_id)
-
-                # 자동 변환 수행
-                if auto_transform and response.raw_data_id:
-                    try:
-                        transform_result = (
-                            await self.transformation_pipeline.transform_raw_data(
-                                response.raw_data_id
-                            )
-                        )
-
-                        if transform_result.success:
-                            # 변환된 데이터를 데이터베이스에 저장
-                            saved_count = await self._save_processed_data(
-                                content_type,
-                                transform_result.processed_data,
-                                response.raw_data_id,
-                                transform_result.quality_score,
-                            )
-                            area_result["processed_records"] += saved_count
-
-                    except Exception as e:
-                        error_msg = f"데이터 변환 실패: {e}"
-                        area_result["errors"].append(error_msg)
-
                 # 페이지네이션 조건 확인
                 if (
                     current_page_count < num_of_rows
@@ -1056,6 +1019,203 @@ class UnifiedKTOClient:
 
         return area_result
 
+    async def _collect_area_data_parallel(
+        self,
+        content_type: str,
+        area_code: str,
+        sync_batch_id: str,
+        store_raw: bool,
+        auto_transform: bool,
+    ) -> Dict:
+        """
+        특정 지역의 특정 타입 데이터 병렬 수집
+
+        첫 페이지 응답의 totalCount로 전체 페이지 수를 계산한 뒤,
+        나머지 페이지를 ConcurrentAPIManager를 통해 동시에 요청하고
+        결과는 페이지 순서대로 처리합니다.
+        """
+
+        area_result = {
+            "area_code": area_code,
+            "content_type": content_type,
+            "raw_records": 0,
+            "processed_records": 0,
+            "pages_collected": 0,
+            "raw_data_ids": [],
+            "errors": [],
+        }
+
+        num_of_rows = 100
+
+        try:
+            first_response = await self._fetch_area_page(
+                content_type, area_code, 1, num_of_rows, store_raw
+            )
+        except Exception as e:
+            area_result["errors"].append(f"페이지 1 수집 실패: {e}")
+            return area_result
+
+        if not first_response.success:
+            area_result["errors"].append(f"API 호출 실패: {first_response.error}")
+            return area_result
+
+        total_count, first_page_count = await self._process_area_page(
+            content_type, first_response, area_result, auto_transform
+        )
+
+        if first_page_count == 0 or first_page_count >= total_count:
+            return area_result
+
+        total_pages = math.ceil(total_count / num_of_rows)
+
+        # 동시 호출 수는 ConcurrentAPIManager의 제공자별 제한과 키별 토큰 버킷이 관리
+        self.logger.info(
+            f"병렬 페이지 수집: 타입 {content_type}, 지역 {area_code} - "
+            f"총 {total_count}건, {total_pages}페이지 "
+            f"(동시 최대 {self.concurrent_manager.config.max_concurrent_kto}개)"
+        )
+
+        page_tasks = []
+        for page_no in range(2, total_pages + 1):
+            page_tasks.append(APICallTask(
+                task_id=f"area_page_{page_no}",
+                api_provider=APIProvider.KTO,
+                endpoint="areaBasedList2",
+                params=self._build_area_params(
+                    content_type, area_code, page_no, num_of_rows
+                ),
+                callback=self._create_page_callback(store_raw),
+                priority=APICallPriority.MEDIUM,
+            ))
+
+        # execute_batch는 입력 순서대로 결과를 반환하므로 위치가 곧 페이지 순서
+        batch_results = await self.concurrent_manager.execute_batch(page_tasks)
+
+        for page_no, batch_result in enumerate(batch_results, start=2):
+
+            if not batch_result or not batch_result["success"]:
+                error = batch_result["error"] if batch_result else "결과 없음"
+                area_result["errors"].append(f"페이지 {page_no} 수집 실패: {error}")
+                continue
+
+            response = batch_result["data"]
+            if not response.success:
+                area_result["errors"].append(f"API 호출 실패: {response.error}")
+                continue
+
+            try:
+                await self._process_area_page(
+                    content_type, response, area_result, auto_transform
+                )
+            except Exception as e:
+                area_result["errors"].append(f"페이지 {page_no} 처리 실패: {e}")
+
+        return area_result
+
+    def _build_area_params(
+        self, content_type: str, area_code: str, page_no: int, num_of_rows: int
+    ) -> Dict:
+        """areaBasedList2 호출 파라미터 구성"""
+        return {
+            **self.default_params,
+            "contentTypeId": content_type,
+            "areaCode": area_code,
+            "pageNo": page_no,
+            "numOfRows": num_of_rows,
+        }
+
+    async def _fetch_area_page(
+        self,
+        content_type: str,
+        area_code: str,
+        page_no: int,
+        num_of_rows: int,
+        store_raw: bool,
+    ):
+        """areaBasedList2 단일 페이지 호출"""
+        return await self.api_client.call_api(
+            api_provider=APIProvider.KTO,
+            endpoint="areaBasedList2",
+            params=self._build_area_params(content_type, area_code, page_no, num_of_rows),
+            store_raw=store_raw,
+            cache_ttl=7200,  # 2시간 캐시
+        )
+
+    def _create_page_callback(self, store_raw: bool):
+        """페이지 수집용 API 콜백 함수 생성"""
+
+        async def callback(endpoint: str, params: Dict):
+            return await self.api_client.call_api(
+                api_provider=APIProvider.KTO,
+                endpoint=endpoint,
+                params=params,
+                store_raw=store_raw,
+                cache_ttl=7200,  # 2시간 캐시
+            )
+
+        return callback
+
+    async def _process_area_page(
+        self,
+        content_type: str,
+        response,
+        area_result: Dict,
+        auto_transform: bool,
+    ) -> tuple:
+        """
+        areaBasedList2 페이지 응답 처리
+
+        Returns:
+            tuple: (totalCount, 현재 페이지 항목 수)
+        """
+
+        # 응답 데이터 확인
+        response_body = response.data  # UnifiedAPIClient가 이미 body만 반환
+        total_count = response_body.get("totalCount", 0)
+        items = response_body.get("items", {})
+
+        if total_count == 0 or not items or "item" not in items:
+            return total_count, 0
+
+        page_items = items["item"]
+        if isinstance(page_items, dict):
+            page_items = [page_items]
+
+        current_page_count = len(page_items)
+        area_result["raw_records"] += current_page_count
+        area_result["pages_collected"] += 1
+
+        if response.raw_data_id:
+            area_result["raw_data_ids"].append(response.raw_data_id)
+
+        # 자동 변환 수행
+        if auto_transform and response.raw_data_id:
+            try:
+                transform_result = (
+                    await self.transformation_pipeline.transform_response(
+                        APIProvider.KTO.value,
+                        "areaBasedList2",
+                        response.data,
+                        response.raw_data_id,
+                    )
+                )
+
+                if transform_result.success:
+                    # 변환된 데이터를 데이터베이스에 저장
+                    saved_count = await self._save_processed_data(
+                        content_type,
+                        transform_result.processed_data,
+                        response.raw_data_id,
+                        transform_result.quality_score,
+                    )
+                    area_result["processed_records"] += saved_count
+
+            except Exception as e:
+                error_msg = f"데이터 변환 실패: {e}"
+                area_result["errors"].append(error_msg)
+
+        return total_count, current_page_count
+
     async def _collect_pet_tour_area_data(
         self,
         content_type_id: str,
@@ -1105,8 +1265,11 @@ class UnifiedKTOClient:
                     # 자동 변환 수행
                     if auto_transform and response.raw_data_id:
                         try:
-                            transform_result = await self.transformation_pipeline.transform_raw_data(
-                                response.raw_data_id
+                            transform_result = await self.transformation_pipeline.transform_response(
+                                APIProvider.KTO.value,
+                                "detailPetTour2",
+                                response.data,
+                                response.raw_data_id,
                             )
 
                             if transform_result.success:
@@ -1191,8 +1354,11 @@ class UnifiedKTOClient:
                     # 자동 변환 수행
                     if auto_transform and response.raw_data_id:
                         try:
-                            transform_result = await self.transformation_pipeline.transform_raw_data(
-                                response.raw_data_id
+                            transform_result = await self.transformation_pipeline.transform_response(
+                                APIProvider.KTO.value,
+                                "areaBasedSyncList2",
+                                response.data,
+                                response.raw_data_id,
                             )
 
                             if transform_result.success:
@@ -1269,8 +1435,11 @@ class UnifiedKTOClient:
                     # 자동 변환 수행
                     if auto_transform and response.raw_data_id:
                         try:
-                            transform_result = await self.transformation_pipeline.transform_raw_data(
-                                response.raw_data_id
+                            transform_result = await self.transformation_pipeline.transform_response(
+                                APIProvider.KTO.value,
+                                "ldongCode2",
+                                response.data,
+                                response.raw_data_id,
                             )
 
                             if transform_result.success:
@@ -1519,7 +1688,7 @@ class UnifiedKTOClient:
         raw_data_id: str,
         quality_score: float,
     ) -> int:
-        """처리된 데이터를 데이터베이스에 저장"""
+        """처리된 데이터를 데이터베이스에 저장 (테이블별 다중 행 UPSERT)"""
 
         if not processed_data:
             return 0
@@ -1527,43 +1696,43 @@ class UnifiedKTOClient:
         try:
             target_table = self._get_target_table(content_type)
 
-            saved_count = 0
+            # raw_data_id가 유효한 UUID 형식인지 확인하고, 아니면 None으로 설정
+            self.logger.debug(f"원본 raw_data_id: {raw_data_id} (타입: {type(raw_data_id)})")
+            try:
+                uuid.UUID(str(raw_data_id))  # UUID 유효성 검사
+                valid_raw_data_id = raw_data_id
+            except (ValueError, TypeError, AttributeError):
+                self.logger.warning(f"유효하지 않은 raw_data_id: {raw_data_id}, NULL로 설정")
+                valid_raw_data_id = None
+
+            sync_time = datetime.utcnow()
 
             for item in processed_data:
                 # raw_data_id와 품질 점수 추가
-                self.logger.debug(f"원본 raw_data_id: {raw_data_id} (타입: {type(raw_data_id)})")
-                # raw_data_id가 유효한 UUID 형식인지 확인하고, 아니면 None으로 설정
-                try:
-                    import uuid
-                    uuid.UUID(str(raw_data_id))  # UUID 유효성 검사
-                    item["raw_data_id"] = raw_data_id
-                except (ValueError, TypeError, AttributeError):
-                    self.logger.warning(f"유효하지 않은 raw_data_id: {raw_data_id}, NULL로 설정")
-                    item["raw_data_id"] = None
+                item["raw_data_id"] = valid_raw_data_id
                 item["data_quality_score"] = quality_score
-                item["last_sync_at"] = datetime.utcnow()
-
-                # 테이블별 저장 로직
-                if target_table == "tourist_attractions":
-                    self.db_manager.upsert_tourist_attraction(item)
-                elif target_table == "accommodations":
-                    self.db_manager.upsert_accommodation(item)
-                elif target_table == "festivals_events":
-                    self.db_manager.upsert_festival_event(item)
-                elif target_table == "restaurants":
-                    self.db_manager.upsert_restaurant(item)
-                elif target_table == "leisure_sports":
+                item["last_sync_at"] = sync_time
+
+                if target_table == "leisure_sports" and not item.get("facility_name"):
                     # facility_name이 없거나 빈 값이면 기본값 대입
-                    if not item.get("facility_name"):
-                        item["facility_name"] = "미상"
-                    self.db_manager.upsert_leisure_sport(item)
-                elif target_table == "cultural_facilities":
-                    self.db_manager.upsert_cultural_facility(item)
-                else:
-                    self.logger.warning(f"지원하지 않는 테이블: {target_table}, 관광지로 저장")
-                    self.db_manager.upsert_tourist_attraction(item)
+                    item["facility_name"] = "미상"
+
+            # 테이블별 저장 로직
+            batch_upserts = {
+                "tourist_attractions": self.db_manager.upsert_tourist_attractions_batch,
+                "accommodations": self.db_manager.upsert_accommodations_batch,
+                "festivals_events": self.db_manager.upsert_festival_events_batch,
+                "restaurants": self.db_manager.upsert_restaurants_batch,
+                "leisure_sports": self.db_manager.upsert_leisure_sports_batch,
+                "cultural_facilities": self.db_manager.upsert_cultural_facilities_batch,
+            }
 
-                saved_count += 1
+            batch_upsert = batch_upserts.get(target_table)
+            if batch_upsert is None:
+                self.logger.warning(f"지원하지 않는 테이블: {target_table}, 관광지로 저장")
+                batch_upsert = self.db_manager.upsert_tourist_attractions_batch
+
+            saved_count = batch_upsert(processed_data)
 
             self.logger.debug(
                 f"처리된 데이터 저장 완료: {target_table} {saved_count}건"
@@ -2049,147 +2218,64 @@ class UnifiedKTOClient:
             "errors": []
         }
 
-        # 배치 단위로 처리
-        for batch_start in range(0, len(content_ids), batch_size):
-            batch_end = min(batch_start + batch_size, len(content_ids))
-            batch_content_ids = content_ids[batch_start:batch_end]
-
-            self.logger.info(f"배치 {batch_start//batch_size + 1} 처리 중: {len(batch_content_ids)}개 컨텐츠")
-
-            # 배치별 API 작업 생성
-            batch_tasks = []
-
-            for content_id in batch_content_ids:
-                # detailCommon2 작업
-                batch_tasks.append(APICallTask(
-                    task_id=f"detail_common_{content_id}",
-                    api_provider=APIProvider.KTO,
-                    endpoint="detailCommon2",
-                    params={
-                        **self.default_params,
-                        "contentId": content_id,
-                        "contentTypeId": content_type_id
-                    },
-                    callback=self._create_api_callback("detailCommon2", content_id, content_type_id, store_raw),
-                    priority=APICallPriority.HIGH
-                ))
-
-                # detailIntro2 작업
-                batch_tasks.append(APICallTask(
-                    task_id=f"detail_intro_{content_id}",
-                    api_provider=APIProvider.KTO,
-                    endpoint="detailIntro2",
-                    params={
-                        **self.default_params,
-                        "contentId": content_id,
-                        "contentTypeId": content_type_id
-                    },
-                    callback=self._create_api_callback("detailIntro2", content_id, content_type_id, store_raw),
-                    priority=APICallPriority.MEDIUM
-                ))
+        # 컨텐츠별 상세 API 작업 생성 (배치 경계 없이 한 번에 큐에 제출)
+        detail_apis = [
+            ("detail_common", "detailCommon2", content_type_id, APICallPriority.HIGH),
+            ("detail_intro", "detailIntro2", content_type_id, APICallPriority.MEDIUM),
+            ("detail_info", "detailInfo2", content_type_id, APICallPriority.MEDIUM),
+            ("detail_images", "detailImage2", "12", APICallPriority.LOW),
+        ]
 
-                # detailInfo2 작업
-                batch_tasks.append(APICallTask(
-                    task_id=f"detail_info_{content_id}",
-                    api_provider=APIProvider.KTO,
-                    endpoint="detailInfo2",
-                    params={
-                        **self.default_params,
-                        "contentId": content_id,
-                        "contentTypeId": content_type_id
-                    },
-                    callback=self._create_api_callback("detailInfo2", content_id, content_type_id, store_raw),
-                    priority=APICallPriority.MEDIUM
-                ))
+        tasks = []
+        for content_id in content_ids:
+            for api_type, endpoint, callback_type_id, priority in detail_apis:
+                if endpoint == "detailImage2":
+                    params = {**self.default_params, "contentId": content_id, "imageYN": "Y"}
+                else:
+                    params = {**self.default_params, "contentId": content_id, "contentTypeId": content_type_id}
 
-                # detailImage2 작업
-                batch_tasks.append(APICallTask(
-                    task_id=f"detail_images_{content_id}",
+                tasks.append(APICallTask(
+                    task_id=f"{api_type}_{content_id}",
                     api_provider=APIProvider.KTO,
-                    endpoint="detailImage2",
-                    params={
-                        **self.default_params,
-                        "contentId": content_id,
-                        "imageYN": "Y"
-                    },
-                    callback=self._create_api_callback("detailImage2", content_id, "12", store_raw),
-                    priority=APICallPriority.LOW
+                    endpoint=endpoint,
+                    params=params,
+                    callback=self._create_api_callback(endpoint, content_id, callback_type_id, store_raw),
+                    priority=priority
                 ))
 
-            # 배치 병렬 실행
-            batch_results = await self.concurrent_manager.execute_batch(batch_tasks)
-
-            # 결과 집계
-            content_success_count = {}
-
-            for batch_result in batch_results:
-                if batch_result['success']:
-                    # 작업 ID에서 API 타입과 content_id 추출
-                    task_id = batch_result['task_id']
-
-                    # API 타입 매핑
-                    if task_id.startswith('detail_common_'):
-                        api_type = 'detail_common'
-                        content_id = task_id.replace('detail_common_', '')
-                    elif task_id.startswith('detail_intro_'):
-                        api_type = 'detail_intro'
-                        content_id = task_id.replace('detail_intro_', '')
-                    elif task_id.startswith('detail_info_'):
-                        api_type = 'detail_info'
-                        content_id = task_id.replace('detail_info_', '')
-                    elif task_id.startswith('detail_images_'):
-                        api_type = 'detail_images'
-                        content_id = task_id.replace('detail_images_', '')
-                    else:
-                        self.logger.warning(f"알 수 없는 작업 ID 형식: {task_id}")
-                        continue
+        # 완료되는 순서대로 결과 집계 (동시 실행 슬롯을 계속 채움)
+        content_success_count = {}
+        completed = 0
 
-                    result[api_type] += 1
-
-                    # 컨텐츠별 성공 카운트
-                    if content_id not in content_success_count:
-                        content_success_count[content_id] = 0
-                    content_success_count[content_id] += 1
+        async for task_result in self.concurrent_manager.stream_batch(tasks):
+            completed += 1
+            api_type, content_id = self._parse_detail_task_id(task_result['task_id'])
 
+            if task_result['success']:
+                if api_type is None:
+                    self.logger.warning(f"알 수 없는 작업 ID 형식: {task_result['task_id']}")
                 else:
-                    # 실패한 작업 처리
-                    task_id = batch_result['task_id']
-
-                    # API 타입 매핑
-                    if task_id.startswith('detail_common_'):
-                        api_type = 'detail_common'
-                        content_id = task_id.replace('detail_common_', '')
-                    elif task_id.startswith('detail_intro_'):
-                        api_type = 'detail_intro'
-                        content_id = task_id.replace('detail_intro_', '')
-                    elif task_id.startswith('detail_info_'):
-                        api_type = 'detail_info'
-                        content_id = task_id.replace('detail_info_', '')
-                    elif task_id.startswith('detail_images_'):
-                        api_type = 'detail_images'
-                        content_id = task_id.replace('detail_images_', '')
-                    else:
-                        api_type = 'unknown'
-                        content_id = task_id
-
-                    error_msg = f"{content_id} {api_type}: {batch_result['error']}"
-                    result["errors"].append(error_msg)
-
-            # 성공/실패한 컨텐츠 ID 분류
-            for content_id in batch_content_ids:
-                success_count = content_success_count.get(content_id, 0)
-                if success_count > 0:
-                    result["successful_content_ids"].append({
-                        "content_id": content_id,
-                        "successful_apis": success_count,
-                        "total_apis": 4
-                    })
-                else:
-                    result["failed_content_ids"].append(content_id)
+                    result[api_type] += 1
+                    content_success_count[content_id] = content_success_count.get(content_id, 0) + 1
+            else:
+                error_msg = f"{content_id} {api_type or 'unknown'}: {task_result['error']}"
+                result["errors"].append(error_msg)
 
-            # 배치 간 대기 (API 과부하 방지)
-            if batch_end < len(content_ids):
-                await asyncio.sleep(1.0)
+            # 진행 상황 로그 (batch_size개 컨텐츠 분량마다)
+            if completed % (batch_size * len(detail_apis)) == 0:
+                self.logger.info(f"상세 정보 수집 진행: {completed}/{len(tasks)}개 API 호출 완료")
+
+        # 성공/실패한 컨텐츠 ID 분류
+        for content_id in content_ids:
+            success_count = content_success_count.get(content_id, 0)
+            if success_count > 0:
+                result["successful_content_ids"].append({
+                    "content_id": content_id,
+                    "successful_apis": success_count,
+                    "total_apis": len(detail_apis)
+                })
+            else:
+                result["failed_content_ids"].append(content_id)
 
         result["completed_at"] = datetime.utcnow().isoformat()
 
@@ -2204,6 +2290,15 @@ class UnifiedKTOClient:
 
         return result
 
+    @staticmethod
+    def _parse_detail_task_id(task_id: str):
+        """상세 API 작업 ID에서 (API 타입, content_id) 추출"""
+        for api_type in ("detail_common", "detail_intro", "detail_info", "detail_images"):
+            prefix = f"{api_type}_"
+            if task_id.startswith(prefix):
+                return api_type, task_id[len(prefix):]
+        return None, task_id
+
     def _create_api_callback(self, api_name: str, content_id: str, content_type_id: str, store_raw: bool):
         """API 콜백 함수 생성"""
 
@@ -5,14 +5,17 @@ API 호출 병렬 처리 및 속도 제한을 효율적으로 관리합니다.
 """
 
 import asyncio
+import itertools
 import time
 import logging
-from typing import List, Dict, Callable
-from dataclasses import dataclass
+from typing import List, Dict, Callable, AsyncIterator, Optional, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 
-from app.core.multi_api_key_manager import get_api_key_manager, APIProvider
+from app.core.multi_api_key_manager import (
+    get_api_key_manager, APIProvider, APIKeyInfo, set_preferred_api_key, reset_preferred_api_key
+)
 
 
 class APICallPriority(Enum):
@@ -51,55 +54,200 @@ class ConcurrencyConfig:
     max_concurrent_kto: int = 5        # KTO API 동시 호출 수
     max_concurrent_kma: int = 3        # KMA API 동시 호출 수
     max_concurrent_total: int = 8      # 전체 동시 호출 수
+    max_concurrent_per_key: int = 2    # API 키당 동시 호출 수
     
     # 속도 제한 설정
     min_delay_between_calls: float = 0.1    # 최소 호출 간격
     adaptive_delay: bool = True             # 적응형 지연 시간
+    kto_requests_per_second_per_key: float = 10.0  # KTO API 키당 초당 호출 수
+    kma_requests_per_second_per_key: float = 10.0  # KMA API 키당 초당 호출 수
+    rate_limit_burst: int = 5               # 키별 토큰 버킷 최대 버스트
     
     # 배치 처리 설정
     batch_size: int = 50               # 배치당 작업 수
     queue_timeout: int = 300           # 큐 대기 타임아웃 (초)
+    worker_count: int = 0              # 작업 큐 워커 수 (0: max_concurrent_total)
     
     # 에러 처리 설정
     circuit_breaker_threshold: int = 5  # 연속 실패 임계값
     circuit_breaker_reset_time: int = 60  # 회로 차단기 리셋 시간 (초)
 
 
-class AdaptiveRateLimiter:
-    """적응형 속도 제한기"""
-    
-    def __init__(self, initial_delay: float = 0.1):
-        self.current_delay = initial_delay
-        self.min_delay = 0.05
-        self.max_delay = 2.0
-        self.success_count = 0
-        self.error_count = 0
-        self.last_adjustment = time.time()
-        
-    async def wait_and_adjust(self, success: bool, api_provider: APIProvider):
-        """성공/실패에 따라 지연 시간 조정"""
-        
-        if success:
-            self.success_count += 1
-            self.error_count = 0
+@dataclass
+class _CallStream:
+    """한 번의 배치 제출에 대한 결과 수신 채널"""
+    
+    results: asyncio.Queue
+    cancelled: bool = False
+
+
+@dataclass(order=True)
+class _QueuedCall:
+    """우선순위 큐 항목 (우선순위 높은 순 → 제출 순)"""
+    
+    sort_key: tuple
+    task: APICallTask = field(compare=False)
+    stream: _CallStream = field(compare=False)
+    index: int = field(compare=False)
+    enqueued_at: float = field(compare=False, default=0.0)
+
+
+class TokenBucket:
+    """토큰 버킷 (초당 rate개 보충, 최대 capacity개 보관)"""
+    
+    # 부동소수점 오차로 0.999...에 머무는 경우를 토큰 1개로 간주
+    EPSILON = 1e-9
+    
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = now
+    
+    def _refill(self, now: float):
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+    
+    def available(self, now: float) -> float:
+        """현재 토큰 수"""
+        self._refill(now)
+        return self.tokens
+    
+    def has_token(self, now: float) -> bool:
+        """토큰 1개 이상 보유 여부"""
+        self._refill(now)
+        return self.tokens >= 1 - self.EPSILON
+    
+    def try_acquire(self, now: float) -> bool:
+        """토큰 1개 획득 시도"""
+        if self.has_token(now):
+            self.tokens -= 1
+            return True
+        return False
+    
+    def wait_time(self, now: float) -> float:
+        """다음 토큰까지 남은 시간 (초)"""
+        if self.has_token(now):
+            return 0.0
+        return (1 - self.tokens) / self.rate
+    
+    def drain(self, now: float):
+        """남은 토큰 소진 (오류 후 감속용)"""
+        self._refill(now)
+        self.tokens = min(self.tokens, 0.0)
+
+
+class APIKeyRateLimiter:
+    """API 키별 토큰 버킷 속도 제한기
+    
+    제공자의 사용 가능한 키마다 버킷을 두고, 토큰이 가장 많은 키
+    (같으면 일일 한도 대비 사용률이 낮은 키)를 골라 호출을 분산합니다.
+    모든 키의 버킷이 비었을 때만 대기합니다. 일일 한도는 진행 중인 호출까지
+    포함해 APIKeyInfo.daily_limit을 넘지 않도록 확인합니다.
+    """
+    
+    def __init__(self, key_manager, rates: Dict[APIProvider, float], burst: int,
+                 clock: Callable[[], float] = time.monotonic):
+        self.key_manager = key_manager
+        self.rates = rates
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._buckets: Dict[Tuple[APIProvider, Optional[str]], TokenBucket] = {}
+        self._in_flight: Dict[Tuple[APIProvider, str], int] = {}
+        self.stats = {
+            'acquired': 0,
+            'waits': 0,
+            'total_wait_time': 0.0,
+            'calls_by_key': {}
+        }
+    
+    def _bucket(self, provider: APIProvider, key: Optional[str], now: float) -> TokenBucket:
+        bucket = self._buckets.get((provider, key))
+        if bucket is None:
+            rate = self.rates.get(provider, 10.0)
+            bucket = TokenBucket(rate, min(self.burst, max(1.0, rate)), now)
+            self._buckets[(provider, key)] = bucket
+        return bucket
+    
+    def _has_daily_quota(self, provider: APIProvider, key_info: APIKeyInfo) -> bool:
+        in_flight = self._in_flight.get((provider, key_info.key), 0)
+        return key_info.current_usage + in_flight < key_info.daily_limit
+    
+    async def acquire(self, provider: APIProvider) -> Optional[APIKeyInfo]:
+        """호출 토큰 획득 후 사용할 키 반환 (키가 없으면 제공자 버킷 사용, None 반환)"""
+        
+        while True:
+            now = self._clock()
+            keys = [
+                key_info for key_info in self.key_manager.get_available_keys(provider)
+                if self._has_daily_quota(provider, key_info)
+            ]
             
-            # 연속 성공 시 지연 시간 감소
-            if self.success_count >= 5:
-                self.current_delay = max(self.min_delay, self.current_delay * 0.9)
-                self.success_count = 0
+            if keys:
+                best_key, best_rank, wait = None, None, float('inf')
+                for key_info in keys:
+                    bucket = self._bucket(provider, key_info.key, now)
+                    if bucket.has_token(now):
+                        tokens = bucket.available(now)
+                        usage_ratio = key_info.current_usage / key_info.daily_limit if key_info.daily_limit else 1.0
+                        rank = (tokens, -usage_ratio)
+                        if best_rank is None or rank > best_rank:
+                            best_key, best_rank = key_info, rank
+                    else:
+                        wait = min(wait, bucket.wait_time(now))
                 
-        else:
-            self.error_count += 1
-            self.success_count = 0
+                if best_key is not None:
+                    self._bucket(provider, best_key.key, now).try_acquire(now)
+                    self._in_flight[(provider, best_key.key)] = self._in_flight.get((provider, best_key.key), 0) + 1
+                    self._record_acquire(best_key.key)
+                    return best_key
+            else:
+                # 사용 가능한 키가 없으면 제공자 단위 버킷으로 제한 (키 선택은 키 매니저에 위임)
+                bucket = self._bucket(provider, None, now)
+                if bucket.try_acquire(now):
+                    self._record_acquire(None)
+                    return None
+                wait = bucket.wait_time(now)
             
-            # 에러 발생 시 지연 시간 증가
-            self.current_delay = min(self.max_delay, self.current_delay * 1.5)
+            self.stats['waits'] += 1
+            self.stats['total_wait_time'] += wait
+            await asyncio.sleep(wait)
+    
+    def release(self, provider: APIProvider, key_info: Optional[APIKeyInfo], success: bool = True):
+        """호출 종료 처리 (실패 시 해당 키 버킷을 비워 감속)"""
         
-        # API 제공자별 추가 지연 (KTO는 더 보수적으로)
-        provider_multiplier = 1.2 if api_provider == APIProvider.KTO else 1.0
-        actual_delay = self.current_delay * provider_multiplier
+        key = key_info.key if key_info else None
+        if key is not None:
+            in_flight = self._in_flight.get((provider, key), 0) - 1
+            if in_flight > 0:
+                self._in_flight[(provider, key)] = in_flight
+            else:
+                self._in_flight.pop((provider, key), None)
         
-        await asyncio.sleep(actual_delay)
+        if not success:
+            now = self._clock()
+            self._bucket(provider, key, now).drain(now)
+    
+    def _record_acquire(self, key: Optional[str]):
+        self.stats['acquired'] += 1
+        key_preview = key[:10] + "..." if key else "provider"
+        self.stats['calls_by_key'][key_preview] = self.stats['calls_by_key'].get(key_preview, 0) + 1
+    
+    def get_status(self) -> Dict:
+        """속도 제한 상태"""
+        now = self._clock()
+        return {
+            'acquired': self.stats['acquired'],
+            'waits': self.stats['waits'],
+            'total_wait_time': self.stats['total_wait_time'],
+            'calls_by_key': dict(self.stats['calls_by_key']),
+            'buckets': {
+                f"{provider.value}:{key[:10] + '...' if key else 'provider'}": round(bucket.available(now), 2)
+                for (provider, key), bucket in self._buckets.items()
+            }
+        }
 
 
 class CircuitBreaker:
@@ -153,11 +301,18 @@ class ConcurrentAPIManager:
         self.kma_semaphore = asyncio.Semaphore(self.config.max_concurrent_kma)
         self.total_semaphore = asyncio.Semaphore(self.config.max_concurrent_total)
         
-        # 속도 제한기
-        self.rate_limiters = {
-            APIProvider.KTO: AdaptiveRateLimiter(0.2),
-            APIProvider.KMA: AdaptiveRateLimiter(0.1),
-        }
+        # API 키 매니저
+        self.key_manager = get_api_key_manager()
+        
+        # 키별 토큰 버킷 속도 제한기
+        self.rate_limiter: Optional[APIKeyRateLimiter] = APIKeyRateLimiter(
+            self.key_manager,
+            rates={
+                APIProvider.KTO: self.config.kto_requests_per_second_per_key,
+                APIProvider.KMA: self.config.kma_requests_per_second_per_key,
+            },
+            burst=self.config.rate_limit_burst
+        )
         
         # 회로 차단기
         self.circuit_breakers = {
@@ -167,16 +322,27 @@ class ConcurrentAPIManager:
                                           self.config.circuit_breaker_reset_time),
         }
         
-        # API 키 매니저
-        self.key_manager = get_api_key_manager()
+        # 우선순위 작업 큐와 상주 워커 (이벤트 루프별로 지연 생성)
+        self._work_queue: Optional[asyncio.PriorityQueue] = None
+        self._workers: List[asyncio.Task] = []
+        self._worker_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sequence = itertools.count()
         
         # 통계
-        self.stats = {
+        self.stats = self._new_stats()
+    
+    @staticmethod
+    def _new_stats() -> Dict:
+        """통계 초기값"""
+        return {
             'total_calls': 0,
             'successful_calls': 0,
             'failed_calls': 0,
             'circuit_breaker_trips': 0,
             'average_response_time': 0.0,
+            'queued_calls': 0,
+            'max_queue_depth': 0,
+            'average_queue_wait': 0.0,
             'concurrent_peaks': {
                 'kto': 0,
                 'kma': 0,
@@ -224,10 +390,9 @@ class ConcurrentAPIManager:
                     self.stats['concurrent_peaks']['kma'], current_provider
                 )
             
-            # 속도 제한 적용
-            rate_limiter = self.rate_limiters.get(provider)
-            if rate_limiter:
-                await rate_limiter.wait_and_adjust(True, provider)  # 초기값 True
+            # 속도 제한 적용 (토큰이 있는 키 선택, 모두 비었을 때만 대기)
+            rate_limiter = self.rate_limiter
+            key_info = await rate_limiter.acquire(provider) if rate_limiter else None
             
             # API 호출 실행
             start_time = time.time()
@@ -235,11 +400,15 @@ class ConcurrentAPIManager:
             try:
                 self.stats['total_calls'] += 1
                 
-                # 실제 API 호출
-                result = await asyncio.wait_for(
-                    task.callback(task.endpoint, task.params),
-                    timeout=task.timeout
-                )
+                # 실제 API 호출 (선택한 키를 호출 컨텍스트에 지정)
+                key_token = set_preferred_api_key(key_info.key if key_info else None)
+                try:
+                    result = await asyncio.wait_for(
+                        task.callback(task.endpoint, task.params),
+                        timeout=task.timeout
+                    )
+                finally:
+                    reset_preferred_api_key(key_token)
                 
                 duration = time.time() - start_time
                 
@@ -248,7 +417,7 @@ class ConcurrentAPIManager:
                     circuit_breaker.record_success()
                 
                 if rate_limiter:
-                    await rate_limiter.wait_and_adjust(True, provider)
+                    rate_limiter.release(provider, key_info, success=True)
                 
                 self.stats['successful_calls'] += 1
                 self._update_average_response_time(duration)
@@ -262,6 +431,11 @@ class ConcurrentAPIManager:
                     'duration': duration
                 }
                 
+            except asyncio.CancelledError:
+                if rate_limiter:
+                    rate_limiter.release(provider, key_info)
+                raise
+                
             except asyncio.TimeoutError:
                 self.logger.error(f"API 호출 타임아웃: {task.task_id}")
                 error_msg = f"Timeout after {task.timeout}s"
@@ -277,7 +451,7 @@ class ConcurrentAPIManager:
                 circuit_breaker.record_failure()
             
             if rate_limiter:
-                await rate_limiter.wait_and_adjust(False, provider)
+                rate_limiter.release(provider, key_info, success=False)
             
             self.stats['failed_calls'] += 1
             self._update_average_response_time(duration)
@@ -290,34 +464,21 @@ class ConcurrentAPIManager:
             }
     
     async def execute_batch(self, tasks: List[APICallTask]) -> List[Dict]:
-        """배치 API 호출 실행"""
+        """배치 API 호출 실행 (결과는 입력 작업 순서)"""
+        
+        if not tasks:
+            return []
         
         self.logger.info(f"배치 API 호출 시작: {len(tasks)}개 작업")
         
-        # 우선순위별 정렬
-        sorted_tasks = sorted(tasks, key=lambda t: t.priority.value, reverse=True)
+        start_time = time.time()
+        processed_results: List[Optional[Dict]] = [None] * len(tasks)
         
-        # 비동기 작업 생성
-        async_tasks = [self.execute_single_call(task) for task in sorted_tasks]
+        async for index, result in self._stream_indexed(tasks):
+            processed_results[index] = result
         
-        # 병렬 실행
-        start_time = time.time()
-        results = await asyncio.gather(*async_tasks, return_exceptions=True)
         total_duration = time.time() - start_time
         
-        # 예외 처리된 결과 정리
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                processed_results.append({
-                    'success': False,
-                    'error': str(result),
-                    'task_id': sorted_tasks[i].task_id,
-                    'duration': 0
-                })
-            else:
-                processed_results.append(result)
-        
         # 통계 정보
         successful_count = sum(1 for r in processed_results if r['success'])
         
@@ -328,6 +489,118 @@ class ConcurrentAPIManager:
         
         return processed_results
     
+    async def stream_batch(self, tasks: List[APICallTask]) -> AsyncIterator[Dict]:
+        """작업들을 우선순위 큐에 넣고 완료되는 순서대로 결과 반환
+        
+        배치 경계 없이 워커가 계속 다음 작업을 가져가므로 동시 실행 슬롯이
+        비지 않습니다. 반복을 중간에 멈추면 아직 시작하지 않은 작업은 취소됩니다.
+        """
+        async for _, result in self._stream_indexed(tasks):
+            yield result
+    
+    async def _stream_indexed(self, tasks: List[APICallTask]) -> AsyncIterator[tuple]:
+        """(입력 인덱스, 결과) 스트림"""
+        
+        if not tasks:
+            return
+        
+        queue = self._ensure_workers()
+        stream = _CallStream(results=asyncio.Queue())
+        now = time.monotonic()
+        
+        for index, task in enumerate(tasks):
+            queue.put_nowait(_QueuedCall(
+                sort_key=(-task.priority.value, next(self._sequence)),
+                task=task,
+                stream=stream,
+                index=index,
+                enqueued_at=now
+            ))
+        
+        self.stats['queued_calls'] += len(tasks)
+        self.stats['max_queue_depth'] = max(self.stats['max_queue_depth'], queue.qsize())
+        
+        try:
+            for _ in range(len(tasks)):
+                yield await stream.results.get()
+        finally:
+            # 소비가 중단된 경우 남은 작업은 워커가 건너뜀
+            stream.cancelled = True
+    
+    def _ensure_workers(self) -> asyncio.PriorityQueue:
+        """현재 이벤트 루프의 작업 큐와 워커 준비"""
+        
+        loop = asyncio.get_running_loop()
+        if self._worker_loop is not loop or self._work_queue is None:
+            self._work_queue = asyncio.PriorityQueue()
+            self._workers = []
+            self._worker_loop = loop
+        
+        worker_count = self.config.worker_count or self.config.max_concurrent_total
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        while len(self._workers) < worker_count:
+            self._workers.append(loop.create_task(self._worker(self._work_queue)))
+        
+        return self._work_queue
+    
+    async def _worker(self, queue: asyncio.PriorityQueue):
+        """우선순위 큐에서 작업을 꺼내 실행하는 상주 워커"""
+        
+        while True:
+            item: _QueuedCall = await queue.get()
+            try:
+                if item.stream.cancelled:
+                    continue
+                
+                self._update_average_queue_wait(time.monotonic() - item.enqueued_at)
+                
+                try:
+                    result = await self.execute_single_call(item.task)
+                except asyncio.CancelledError:
+                    self._fail_queued_call(item, "작업 큐 워커 종료")
+                    raise
+                except Exception as e:
+                    result = {
+                        'success': False,
+                        'error': str(e),
+                        'task_id': item.task.task_id,
+                        'duration': 0
+                    }
+                
+                item.stream.results.put_nowait((item.index, result))
+            finally:
+                queue.task_done()
+    
+    @staticmethod
+    def _fail_queued_call(item: _QueuedCall, error: str):
+        """실행하지 못한 작업의 실패 결과 전달"""
+        item.stream.results.put_nowait((item.index, {
+            'success': False,
+            'error': error,
+            'task_id': item.task.task_id,
+            'duration': 0
+        }))
+    
+    async def shutdown(self):
+        """상주 워커 종료 (대기 중인 작업은 실패 처리)"""
+        
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        
+        queue, self._work_queue = self._work_queue, None
+        while queue is not None and not queue.empty():
+            item = queue.get_nowait()
+            if not item.stream.cancelled:
+                self._fail_queued_call(item, "작업 큐 종료")
+        
+        self._worker_loop = None
+    
+    def _update_average_queue_wait(self, wait: float):
+        """평균 큐 대기 시간 업데이트"""
+        self.stats['average_queue_wait'] += (wait - self.stats['average_queue_wait']) * 0.05
+    
     def _update_average_response_time(self, duration: float):
         """평균 응답 시간 업데이트"""
         total_calls = self.stats['total_calls']
@@ -351,15 +624,12 @@ class ConcurrentAPIManager:
             ),
             'average_response_time': self.stats['average_response_time'],
             'circuit_breaker_trips': self.stats['circuit_breaker_trips'],
+            'queued_calls': self.stats['queued_calls'],
+            'max_queue_depth': self.stats['max_queue_depth'],
+            'average_queue_wait': self.stats['average_queue_wait'],
+            'active_workers': sum(1 for worker in self._workers if not worker.done()),
             'concurrent_peaks': self.stats['concurrent_peaks'],
-            'rate_limiter_status': {
-                provider.value: {
-                    'current_delay': limiter.current_delay,
-                    'success_count': limiter.success_count,
-                    'error_count': limiter.error_count
-                }
-                for provider, limiter in self.rate_limiters.items()
-            },
+            'rate_limiter_status': self.rate_limiter.get_status() if self.rate_limiter else {},
             'circuit_breaker_status': {
                 provider.value: {
                     'state': breaker.state,
@@ -371,18 +641,7 @@ class ConcurrentAPIManager:
     
     def reset_stats(self):
         """통계 초기화"""
-        self.stats = {
-            'total_calls': 0,
-            'successful_calls': 0,
-            'failed_calls': 0,
-            'circuit_breaker_trips': 0,
-            'average_response_time': 0.0,
-            'concurrent_peaks': {
-                'kto': 0,
-                'kma': 0,
-                'total': 0
-            }
-        }
+        self.stats = self._new_stats()
 
 
 # 싱글톤 인스턴스
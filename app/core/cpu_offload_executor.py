@@ -0,0 +1,217 @@
+"""
+CPU 작업 오프로드 실행기
+
+압축, 체크섬 계산처럼 CPU를 오래 사용하는 작업을 이벤트 루프 밖에서 실행합니다.
+- lzma/bz2 같은 무거운 압축은 프로세스 풀에서 실행
+- gzip(zlib)과 해시 계산은 GIL을 해제하므로 스레드 풀에서 실행
+- 이벤트 루프별 대기 작업 수 제한 (큐 깊이 제한)
+"""
+
+import asyncio
+import bz2
+import gzip
+import hashlib
+import logging
+import lzma
+import shutil
+import threading
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# 프로세스 풀에서 실행할 압축 방식
+PROCESS_BOUND_COMPRESSIONS = {"bzip2", "lzma"}
+
+
+def compress_bytes(data: bytes, compression: str, level: int = 6) -> bytes:
+    """압축 방식 이름으로 데이터 압축 (프로세스 풀에서 호출 가능하도록 모듈 함수로 정의)"""
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=level)
+    if compression == "bzip2":
+        return bz2.compress(data, compresslevel=level)
+    if compression == "lzma":
+        return lzma.compress(data, preset=level)
+    return data
+
+
+def decompress_bytes(data: bytes, compression: str) -> bytes:
+    """압축 방식 이름으로 데이터 압축 해제"""
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if compression == "bzip2":
+        return bz2.decompress(data)
+    if compression == "lzma":
+        return lzma.decompress(data)
+    return data
+
+
+def sha256_hexdigest(data: bytes) -> str:
+    """SHA-256 체크섬 계산"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def gzip_file(source_path: Path, target_path: Path, level: int = 9):
+    """파일을 gzip으로 압축하여 저장"""
+    with open(source_path, "rb") as f_in:
+        with gzip.open(target_path, "wb", compresslevel=level) as f_out:
+            shutil.copyfileobj(f_in, f_out)
+
+
+@dataclass
+class CPUOffloadConfig:
+    """CPU 오프로드 실행기 설정"""
+
+    process_workers: int = 2
+    thread_workers: int = 4
+    max_pending: int = 16  # 이벤트 루프별 동시 제출 작업 수 상한
+
+
+class CPUOffloadExecutor:
+    """공유 CPU 오프로드 실행기"""
+
+    def __init__(self, config: Optional[CPUOffloadConfig] = None):
+        self.config = config or CPUOffloadConfig()
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+        # 이벤트 루프별 대기열 제한 세마포어
+        self._loop_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        self.stats = {
+            "thread_tasks": 0,
+            "process_tasks": 0,
+            "process_fallbacks": 0,
+            "in_flight": 0,
+            "max_queue_wait_ms": 0.0,
+        }
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self.config.thread_workers,
+                    thread_name_prefix="cpu-offload",
+                )
+            return self._thread_pool
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.config.process_workers
+                )
+            return self._process_pool
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._loop_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.config.max_pending)
+            self._loop_semaphores[loop] = semaphore
+        return semaphore
+
+    async def run(self, func: Callable, *args, use_process: bool = False) -> Any:
+        """
+        CPU 작업 실행
+
+        Args:
+            func: 실행할 함수 (프로세스 풀 사용 시 모듈 수준 함수여야 함)
+            use_process: True면 프로세스 풀, False면 스레드 풀에서 실행
+        """
+        loop = asyncio.get_running_loop()
+        wait_start = time.monotonic()
+
+        async with self._get_semaphore():
+            wait_ms = (time.monotonic() - wait_start) * 1000
+            self.stats["max_queue_wait_ms"] = max(self.stats["max_queue_wait_ms"], wait_ms)
+            self.stats["in_flight"] += 1
+
+            try:
+                if use_process:
+                    try:
+                        result = await loop.run_in_executor(self._get_process_pool(), func, *args)
+                        self.stats["process_tasks"] += 1
+                        return result
+                    except (BrokenProcessPool, OSError, NotImplementedError) as e:
+                        logger.warning(f"프로세스 풀 사용 불가, 스레드에서 실행: {e}")
+                        self.stats["process_fallbacks"] += 1
+                        with self._pool_lock:
+                            self._process_pool = None
+
+                result = await loop.run_in_executor(self._get_thread_pool(), func, *args)
+                self.stats["thread_tasks"] += 1
+                return result
+            finally:
+                self.stats["in_flight"] -= 1
+
+    async def compress(self, data: bytes, compression: str, level: int = 6) -> bytes:
+        """데이터 압축 (lzma/bz2는 프로세스 풀, 그 외는 스레드 풀)"""
+        if compression == "none":
+            return data
+        return await self.run(
+            compress_bytes, data, compression, level,
+            use_process=compression in PROCESS_BOUND_COMPRESSIONS,
+        )
+
+    async def decompress(self, data: bytes, compression: str) -> bytes:
+        """데이터 압축 해제"""
+        if compression == "none":
+            return data
+        return await self.run(decompress_bytes, data, compression)
+
+    async def checksum(self, data: bytes) -> str:
+        """SHA-256 체크섬 계산"""
+        return await self.run(sha256_hexdigest, data)
+
+    async def gzip_file(self, source_path: Path, target_path: Path, level: int = 9):
+        """파일 gzip 압축"""
+        await self.run(gzip_file, source_path, target_path, level)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """실행 통계 반환"""
+        return {
+            **self.stats,
+            "process_workers": self.config.process_workers,
+            "thread_workers": self.config.thread_workers,
+            "max_pending": self.config.max_pending,
+        }
+
+    def shutdown(self, wait: bool = True):
+        """실행기 종료"""
+        with self._pool_lock:
+            if self._thread_pool is not None:
+                self._thread_pool.shutdown(wait=wait)
+                self._thread_pool = None
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=wait)
+                self._process_pool = None
+
+
+# 싱글톤 인스턴스
+_cpu_offload_executor: Optional[CPUOffloadExecutor] = None
+
+
+def get_cpu_offload_executor() -> CPUOffloadExecutor:
+    """CPU 오프로드 실행기 싱글톤 인스턴스 반환"""
+    global _cpu_offload_executor
+    if _cpu_offload_executor is None:
+        _cpu_offload_executor = CPUOffloadExecutor()
+    return _cpu_offload_executor
+
+
+def reset_cpu_offload_executor():
+    """CPU 오프로드 실행기 인스턴스 재설정 (테스트용)"""
+    global _cpu_offload_executor
+    if _cpu_offload_executor is not None:
+        _cpu_offload_executor.shutdown(wait=False)
+    _cpu_offload_executor = None
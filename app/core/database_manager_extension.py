@@ -9,13 +9,335 @@ import uuid
 import logging
 import json
 from datetime import datetime
-from typing import Dict, List, Optional
-from app.core.database_manager import SyncDatabaseManager
+from typing import Any, Callable, Dict, List, Optional
+
+import psycopg2.extras
+
+from app.core.database_manager import SyncDatabaseManager, QueryError
 from app.core.batch_insert_optimizer import (
     BatchInsertOptimizer
 )
 
 
+TOURIST_ATTRACTION_UPSERT_SQL = """
+INSERT INTO tourist_attractions (
+    content_id, region_code, attraction_name, category_code, category_name,
+    address, latitude, longitude, description, image_url, homepage,
+    booktour, createdtime, modifiedtime, telname, faxno, zipcode, mlevel,
+    detail_intro_info, detail_additional_info,
+    raw_data_id, last_sync_at, data_quality_score, processing_status
+) VALUES %s
+ON CONFLICT (content_id) DO UPDATE SET
+    region_code = EXCLUDED.region_code,
+    attraction_name = EXCLUDED.attraction_name,
+    category_code = EXCLUDED.category_code,
+    category_name = EXCLUDED.category_name,
+    address = EXCLUDED.address,
+    latitude = EXCLUDED.latitude,
+    longitude = EXCLUDED.longitude,
+    description = EXCLUDED.description,
+    image_url = EXCLUDED.image_url,
+    homepage = EXCLUDED.homepage,
+    booktour = EXCLUDED.booktour,
+    createdtime = EXCLUDED.createdtime,
+    modifiedtime = EXCLUDED.modifiedtime,
+    telname = EXCLUDED.telname,
+    faxno = EXCLUDED.faxno,
+    zipcode = EXCLUDED.zipcode,
+    mlevel = EXCLUDED.mlevel,
+    detail_intro_info = EXCLUDED.detail_intro_info,
+    detail_additional_info = EXCLUDED.detail_additional_info,
+    raw_data_id = EXCLUDED.raw_data_id,
+    last_sync_at = EXCLUDED.last_sync_at,
+    data_quality_score = EXCLUDED.data_quality_score,
+    processing_status = EXCLUDED.processing_status,
+    updated_at = CURRENT_TIMESTAMP
+"""
+
+ACCOMMODATION_UPSERT_SQL = """
+INSERT INTO accommodations (
+    content_id, region_code, accommodation_name, accommodation_type,
+    address, tel, latitude, longitude, category_code, sub_category_code, parking,
+    raw_data_id
+) VALUES %s
+ON CONFLICT (content_id) DO UPDATE SET
+    region_code = EXCLUDED.region_code,
+    accommodation_name = EXCLUDED.accommodation_name,
+    accommodation_type = EXCLUDED.accommodation_type,
+    address = EXCLUDED.address,
+    tel = EXCLUDED.tel,
+    latitude = EXCLUDED.latitude,
+    longitude = EXCLUDED.longitude,
+    category_code = EXCLUDED.category_code,
+    sub_category_code = EXCLUDED.sub_category_code,
+    parking = EXCLUDED.parking,
+    raw_data_id = EXCLUDED.raw_data_id,
+    created_at = CURRENT_TIMESTAMP
+"""
+
+FESTIVAL_EVENT_UPSERT_SQL = """
+INSERT INTO festivals_events (
+    content_id, region_code, event_name, address,
+    latitude, longitude, first_image, event_start_date, event_end_date,
+    homepage, booktour, createdtime, modifiedtime, telname, faxno, zipcode, mlevel,
+    detail_intro_info, detail_additional_info,
+    raw_data_id, last_sync_at, data_quality_score
+) VALUES %s
+ON CONFLICT (content_id) DO UPDATE SET
+    region_code = EXCLUDED.region_code,
+    event_name = EXCLUDED.event_name,
+    address = EXCLUDED.address,
+    latitude = EXCLUDED.latitude,
+    longitude = EXCLUDED.longitude,
+    first_image = EXCLUDED.first_image,
+    event_start_date = EXCLUDED.event_start_date,
+    event_end_date = EXCLUDED.event_end_date,
+    homepage = EXCLUDED.homepage,
+    booktour = EXCLUDED.booktour,
+    createdtime = EXCLUDED.createdtime,
+    modifiedtime = EXCLUDED.modifiedtime,
+    telname = EXCLUDED.telname,
+    faxno = EXCLUDED.faxno,
+    zipcode = EXCLUDED.zipcode,
+    mlevel = EXCLUDED.mlevel,
+    detail_intro_info = EXCLUDED.detail_intro_info,
+    detail_additional_info = EXCLUDED.detail_additional_info,
+    raw_data_id = EXCLUDED.raw_data_id,
+    last_sync_at = EXCLUDED.last_sync_at,
+    data_quality_score = EXCLUDED.data_quality_score,
+    updated_at = CURRENT_TIMESTAMP
+"""
+
+RESTAURANT_UPSERT_SQL = """
+INSERT INTO restaurants (
+    content_id, region_code, restaurant_name, address, detail_address,
+    latitude, longitude, first_image, first_image_small, tel,
+    category_code, sub_category_code,
+    overview, homepage,
+    booktour, createdtime, modifiedtime, telname, faxno, zipcode, mlevel,
+    detail_intro_info, detail_additional_info,
+    raw_data_id, last_sync_at, data_quality_score
+) VALUES %s
+ON CONFLICT (content_id) DO UPDATE SET
+    region_code = EXCLUDED.region_code,
+    restaurant_name = EXCLUDED.restaurant_name,
+    address = EXCLUDED.address,
+    detail_address = EXCLUDED.detail_address,
+    latitude = EXCLUDED.latitude,
+    longitude = EXCLUDED.longitude,
+    first_image = EXCLUDED.first_image,
+    first_image_small = EXCLUDED.first_image_small,
+    tel = EXCLUDED.tel,
+    category_code = EXCLUDED.category_code,
+    sub_category_code = EXCLUDED.sub_category_code,
+    overview = EXCLUDED.overview,
+    homepage = EXCLUDED.homepage,
+    booktour = EXCLUDED.booktour,
+    createdtime = EXCLUDED.createdtime,
+    modifiedtime = EXCLUDED.modifiedtime,
+    telname = EXCLUDED.telname,
+    faxno = EXCLUDED.faxno,
+    zipcode = EXCLUDED.zipcode,
+    mlevel = EXCLUDED.mlevel,
+    detail_intro_info = EXCLUDED.detail_intro_info,
+    detail_additional_info = EXCLUDED.detail_additional_info,
+    raw_data_id = EXCLUDED.raw_data_id,
+    last_sync_at = EXCLUDED.last_sync_at,
+    data_quality_score = EXCLUDED.data_quality_score,
+    updated_at = CURRENT_TIMESTAMP
+"""
+
+CULTURAL_FACILITY_UPSERT_SQL = """
+INSERT INTO cultural_facilities (
+    content_id, region_code, facility_name, category_code, sub_category_code,
+    address, detail_address, latitude, longitude, zipcode, tel,
+    homepage, overview, first_image, first_image_small,
+    facility_type, admission_fee, operating_hours, parking_info, rest_date, use_season, use_time,
+    booktour, createdtime, modifiedtime, telname, faxno, mlevel,
+    detail_intro_info, detail_additional_info,
+    raw_data_id, last_sync_at, data_quality_score, processing_status
+) VALUES %s
+ON CONFLICT (content_id) DO UPDATE SET
+    region_code = EXCLUDED.region_code,
+    facility_name = EXCLUDED.facility_name,
+    category_code = EXCLUDED.category_code,
+    sub_category_code = EXCLUDED.sub_category_code,
+    address = EXCLUDED.address,
+    detail_address = EXCLUDED.detail_address,
+    latitude = EXCLUDED.latitude,
+    longitude = EXCLUDED.longitude,
+    zipcode = EXCLUDED.zipcode,
+    tel = EXCLUDED.tel,
+    homepage = EXCLUDED.homepage,
+    overview = EXCLUDED.overview,
+    first_image = EXCLUDED.first_image,
+    first_image_small = EXCLUDED.first_image_small,
+    facility_type = EXCLUDED.facility_type,
+    admission_fee = EXCLUDED.admission_fee,
+    operating_hours = EXCLUDED.operating_hours,
+    parking_info = EXCLUDED.parking_info,
+    rest_date = EXCLUDED.rest_date,
+    use_season = EXCLUDED.use_season,
+    use_time = EXCLUDED.use_time,
+    booktour = EXCLUDED.booktour,
+    createdtime = EXCLUDED.createdtime,
+    modifiedtime = EXCLUDED.modifiedtime,
+    telname = EXCLUDED.telname,
+    faxno = EXCLUDED.faxno,
+    mlevel = EXCLUDED.mlevel,
+    detail_intro_info = EXCLUDED.detail_intro_info,
+    detail_additional_info = EXCLUDED.detail_additional_info,
+    raw_data_id = EXCLUDED.raw_data_id,
+    last_sync_at = EXCLUDED.last_sync_at,
+    data_quality_score = EXCLUDED.data_quality_score,
+    processing_status = EXCLUDED.processing_status,
+    updated_at = CURRENT_TIMESTAMP
+"""
+
+TRAVEL_COURSE_UPSERT_SQL = """
+INSERT INTO travel_courses (
+    content_id, region_code, sigungu_code, course_name, category_code, sub_category_code,
+    address, detail_address, latitude, longitude, zipcode, tel,
+    homepage, overview, first_image, first_image_small,
+    course_theme, course_distance, required_time, difficulty_level, schedule,
+    booktour, createdtime, modifiedtime, telname, faxno, mlevel,
+    detail_intro_info, detail_additional_info,
+    raw_data_id, last_sync_at, data_quality_score, processing_status
+) VALUES %s
+ON CONFLICT (content_id) DO UPDATE SET
+    region_code = EXCLUDED.region_code,
+    sigungu_code = EXCLUDED.sigungu_code,
+    course_name = EXCLUDED.course_name,
+    category_code = EXCLUDED.category_code,
+    sub_category_code = EXCLUDED.sub_category_code,
+    address = EXCLUDED.address,
+    detail_address = EXCLUDED.detail_address,
+    latitude = EXCLUDED.latitude,
+    longitude = EXCLUDED.longitude,
+    zipcode = EXCLUDED.zipcode,
+    tel = EXCLUDED.tel,
+    homepage = EXCLUDED.homepage,
+    overview = EXCLUDED.overview,
+    first_image = EXCLUDED.first_image,
+    first_image_small = EXCLUDED.first_image_small,
+    course_theme = EXCLUDED.course_theme,
+    course_distance = EXCLUDED.course_distance,
+    required_time = EXCLUDED.required_time,
+    difficulty_level = EXCLUDED.difficulty_level,
+    schedule = EXCLUDED.schedule,
+    booktour = EXCLUDED.booktour,
+    createdtime = EXCLUDED.createdtime,
+    modifiedtime = EXCLUDED.modifiedtime,
+    telname = EXCLUDED.telname,
+    faxno = EXCLUDED.faxno,
+    mlevel = EXCLUDED.mlevel,
+    detail_intro_info = EXCLUDED.detail_intro_info,
+    detail_additional_info = EXCLUDED.detail_additional_info,
+    raw_data_id = EXCLUDED.raw_data_id,
+    last_sync_at = EXCLUDED.last_sync_at,
+    data_quality_score = EXCLUDED.data_quality_score,
+    processing_status = EXCLUDED.processing_status,
+    updated_at = CURRENT_TIMESTAMP
+"""
+
+LEISURE_SPORT_UPSERT_SQL = """
+INSERT INTO leisure_sports (
+    content_id, region_code, sigungu_code, facility_name, category_code, sub_category_code,
+    address, detail_address, latitude, longitude, zipcode, tel,
+    homepage, overview, first_image, first_image_small,
+    sports_type, reservation_info, operating_hours, admission_fee, parking_info, rental_info, capacity,
+    booktour, createdtime, modifiedtime, telname, faxno, mlevel,
+    detail_intro_info, detail_additional_info,
+    raw_data_id, last_sync_at, data_quality_score, processing_status
+) VALUES %s
+ON CONFLICT (content_id) DO UPDATE SET
+    region_code = EXCLUDED.region_code,
+    sigungu_code = EXCLUDED.sigungu_code,
+    facility_name = EXCLUDED.facility_name,
+    category_code = EXCLUDED.category_code,
+    sub_category_code = EXCLUDED.sub_category_code,
+    address = EXCLUDED.address,
+    detail_address = EXCLUDED.detail_address,
+    latitude = EXCLUDED.latitude,
+    longitude = EXCLUDED.longitude,
+    zipcode = EXCLUDED.zipcode,
+    tel = EXCLUDED.tel,
+    homepage = EXCLUDED.homepage,
+    overview = EXCLUDED.overview,
+    first_image = EXCLUDED.first_image,
+    first_image_small = EXCLUDED.first_image_small,
+    sports_type = EXCLUDED.sports_type,
+    reservation_info = EXCLUDED.reservation_info,
+    operating_hours = EXCLUDED.operating_hours,
+    admission_fee = EXCLUDED.admission_fee,
+    parking_info = EXCLUDED.parking_info,
+    rental_info = EXCLUDED.rental_info,
+    capacity = EXCLUDED.capacity,
+    booktour = EXCLUDED.booktour,
+    createdtime = EXCLUDED.createdtime,
+    modifiedtime = EXCLUDED.modifiedtime,
+    telname = EXCLUDED.telname,
+    faxno = EXCLUDED.faxno,
+    mlevel = EXCLUDED.mlevel,
+    detail_intro_info = EXCLUDED.detail_intro_info,
+    detail_additional_info = EXCLUDED.detail_additional_info,
+    raw_data_id = EXCLUDED.raw_data_id,
+    last_sync_at = EXCLUDED.last_sync_at,
+    data_quality_score = EXCLUDED.data_quality_score,
+    processing_status = EXCLUDED.processing_status,
+    updated_at = CURRENT_TIMESTAMP
+"""
+
+SHOPPING_UPSERT_SQL = """
+INSERT INTO shopping (
+    content_id, region_code, shop_name, category_code, sub_category_code,
+    address, detail_address, latitude, longitude, zipcode, tel,
+    homepage, overview, first_image, first_image_small,
+    shop_type, opening_hours, rest_date, parking_info, credit_card, pet_allowed, baby_carriage, sale_item, fair_day,
+    booktour, createdtime, modifiedtime, telname, faxno, mlevel,
+    detail_intro_info, detail_additional_info,
+    raw_data_id, last_sync_at, data_quality_score, processing_status
+) VALUES %s
+ON CONFLICT (content_id) DO UPDATE SET
+    region_code = EXCLUDED.region_code,
+    shop_name = EXCLUDED.shop_name,
+    category_code = EXCLUDED.category_code,
+    sub_category_code = EXCLUDED.sub_category_code,
+    address = EXCLUDED.address,
+    detail_address = EXCLUDED.detail_address,
+    latitude = EXCLUDED.latitude,
+    longitude = EXCLUDED.longitude,
+    zipcode = EXCLUDED.zipcode,
+    tel = EXCLUDED.tel,
+    homepage = EXCLUDED.homepage,
+    overview = EXCLUDED.overview,
+    first_image = EXCLUDED.first_image,
+    first_image_small = EXCLUDED.first_image_small,
+    shop_type = EXCLUDED.shop_type,
+    opening_hours = EXCLUDED.opening_hours,
+    rest_date = EXCLUDED.rest_date,
+    parking_info = EXCLUDED.parking_info,
+    credit_card = EXCLUDED.credit_card,
+    pet_allowed = EXCLUDED.pet_allowed,
+    baby_carriage = EXCLUDED.baby_carriage,
+    sale_item = EXCLUDED.sale_item,
+    fair_day = EXCLUDED.fair_day,
+    booktour = EXCLUDED.booktour,
+    createdtime = EXCLUDED.createdtime,
+    modifiedtime = EXCLUDED.modifiedtime,
+    telname = EXCLUDED.telname,
+    faxno = EXCLUDED.faxno,
+    mlevel = EXCLUDED.mlevel,
+    detail_intro_info = EXCLUDED.detail_intro_info,
+    detail_additional_info = EXCLUDED.detail_additional_info,
+    raw_data_id = EXCLUDED.raw_data_id,
+    last_sync_at = EXCLUDED.last_sync_at,
+    data_quality_score = EXCLUDED.data_quality_score,
+    processing_status = EXCLUDED.processing_status,
+    updated_at = CURRENT_TIMESTAMP
+"""
+
+
 class DatabaseManagerExtension:
     """데이터베이스 매니저 확장 클래스 (배치 최적화 포함)"""
 
@@ -24,6 +346,77 @@ class DatabaseManagerExtension:
         self.logger = logging.getLogger(__name__)
         self.batch_optimizer = BatchInsertOptimizer(db_manager)
 
+    def _execute_upsert(self, query: str, rows: List[tuple]) -> int:
+        """VALUES %s 형태의 UPSERT 쿼리를 다중 행 구문으로 실행"""
+
+        if not rows:
+            return 0
+
+        try:
+            with self.db_manager.get_cursor() as cursor:
+                psycopg2.extras.execute_values(
+                    cursor,
+                    query,
+                    rows,
+                    page_size=self.batch_optimizer.config.batch_size,
+                )
+                return cursor.rowcount
+        except Exception as e:
+            self.logger.error(f"다중 행 UPSERT 실행 실패: {e}")
+            raise QueryError(f"다중 행 UPSERT 실행 실패: {e}")
+
+    def _batch_upsert(
+        self,
+        label: str,
+        query: str,
+        records: List[Dict],
+        row_builder: Callable[[Dict], tuple],
+        single_upsert: Callable[[Dict], bool],
+        after_batch: Optional[Callable[[List[Dict]], Any]] = None,
+    ) -> List[Dict]:
+        """
+        레코드 목록을 단일 다중 행 UPSERT로 저장
+
+        같은 구문 안에서 동일한 content_id가 두 번 갱신되면 ON CONFLICT가
+        실패하므로 마지막 레코드만 남기고, content_id가 없는 레코드는 제외합니다.
+        배치 저장이 실패하면 문제 레코드를 격리하기 위해 건별 UPSERT로 대체합니다.
+        after_batch는 다중 행 UPSERT가 성공했을 때만 저장된 레코드로 호출됩니다
+        (건별 UPSERT는 연관 테이블 저장을 자체적으로 수행).
+
+        Returns:
+            List[Dict]: 저장에 성공한 레코드 목록
+        """
+
+        if not records:
+            return []
+
+        deduplicated = {}
+        skipped = 0
+        for record in records:
+            content_id = record.get("content_id")
+            if not content_id:
+                skipped += 1
+                continue
+            deduplicated[content_id] = record
+        unique_records = list(deduplicated.values())
+
+        if skipped:
+            self.logger.warning(f"{label} content_id 누락 레코드 {skipped}건 제외")
+        if not unique_records:
+            return []
+
+        try:
+            rows = [row_builder(record) for record in unique_records]
+            self._execute_upsert(query, rows)
+            self.logger.debug(f"{label} 배치 UPSERT 완료: {len(unique_records)}건")
+        except Exception as e:
+            self.logger.warning(f"{label} 배치 UPSERT 실패, 건별 처리로 전환: {e}")
+            return [record for record in unique_records if single_upsert(record)]
+
+        if after_batch is not None:
+            after_batch(unique_records)
+        return unique_records
+
     def insert_raw_data(self, raw_data: Dict) -> str:
         """원본 API 데이터 삽입"""
 
@@ -233,47 +626,49 @@ class DatabaseManagerExtension:
             self.logger.error(f"만료 데이터 정리 실패: {e}")
             return 0
 
-    def upsert_tourist_attraction(self, data: Dict) -> bool:
-        """관광지 데이터 UPSERT (새로운 10개 필드 지원)"""
-
-        query = """
-        INSERT INTO tourist_attractions (
-            content_id, region_code, attraction_name, category_code, category_name,
-            address, latitude, longitude, description, image_url, homepage,
-            booktour, createdtime, modifiedtime, telname, faxno, zipcode, mlevel,
-            detail_intro_info, detail_additional_info,
-            raw_data_id, last_sync_at, data_quality_score, processing_status
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-        )
-        ON CONFLICT (content_id) DO UPDATE SET
-            region_code = EXCLUDED.region_code,
-            attraction_name = EXCLUDED.attraction_name,
-            category_code = EXCLUDED.category_code,
-            category_name = EXCLUDED.category_name,
-            address = EXCLUDED.address,
-            latitude = EXCLUDED.latitude,
-            longitude = EXCLUDED.longitude,
-            description = EXCLUDED.description,
-            image_url = EXCLUDED.image_url,
-            homepage = EXCLUDED.homepage,
-            booktour = EXCLUDED.booktour,
-            createdtime = EXCLUDED.createdtime,
-            modifiedtime = EXCLUDED.modifiedtime,
-            telname = EXCLUDED.telname,
-            faxno = EXCLUDED.faxno,
-            zipcode = EXCLUDED.zipcode,
-            mlevel = EXCLUDED.mlevel,
-            detail_intro_info = EXCLUDED.detail_intro_info,
-            detail_additional_info = EXCLUDED.detail_additional_info,
-            raw_data_id = EXCLUDED.raw_data_id,
-            last_sync_at = EXCLUDED.last_sync_at,
-            data_quality_score = EXCLUDED.data_quality_score,
-            processing_status = EXCLUDED.processing_status,
-            updated_at = CURRENT_TIMESTAMP
-        """
-
-        params = (
+    def _tourist_attraction_to_travel_course(self, data: Dict) -> Dict:
+        """관광지 데이터를 여행코스 데이터로 매핑"""
+
+        return {
+            "content_id": data.get("content_id"),
+            "region_code": data.get("region_code"),
+            "sigungu_code": data.get("sigungu_code"),
+            "course_name": data.get("attraction_name"),
+            "category_code": data.get("category_code"),
+            "sub_category_code": data.get("sub_category_code"),
+            "address": data.get("address"),
+            "detail_address": data.get("detail_address"),
+            "latitude": data.get("latitude"),
+            "longitude": data.get("longitude"),
+            "zipcode": data.get("zipcode") or data.get("zip_code"),
+            "tel": data.get("tel") or data.get("telname"),
+            "homepage": data.get("homepage"),
+            "overview": data.get("description"),
+            "first_image": data.get("first_image") or data.get("image_url"),
+            "first_image_small": data.get("first_image_small"),
+            "course_theme": data.get("course_theme"),
+            "course_distance": data.get("course_distance"),
+            "required_time": data.get("required_time"),
+            "difficulty_level": data.get("difficulty_level"),
+            "schedule": data.get("schedule"),
+            "booktour": data.get("booktour") or data.get("book_tour"),
+            "createdtime": data.get("createdtime") or data.get("created_time"),
+            "modifiedtime": data.get("modifiedtime") or data.get("modified_time"),
+            "telname": data.get("telname"),
+            "faxno": data.get("faxno"),
+            "mlevel": data.get("mlevel"),
+            "detail_intro_info": data.get("detail_intro_info"),
+            "detail_additional_info": data.get("detail_additional_info"),
+            "raw_data_id": data.get("raw_data_id"),
+            "last_sync_at": data.get("last_sync_at"),
+            "data_quality_score": data.get("data_quality_score"),
+            "processing_status": data.get("processing_status"),
+        }
+
+    def _tourist_attraction_row(self, data: Dict) -> tuple:
+        """관광지 데이터 UPSERT 파라미터 구성"""
+
+        return (
             data.get("content_id"),
             data.get("region_code"),
             data.get("attraction_name"),
@@ -302,78 +697,26 @@ class DatabaseManagerExtension:
             data.get("processing_status"),
         )
 
+    def upsert_tourist_attraction(self, data: Dict) -> bool:
+        """관광지 데이터 UPSERT (새로운 10개 필드 지원)"""
+
+        query = TOURIST_ATTRACTION_UPSERT_SQL
+        params = self._tourist_attraction_row(data)
+
         try:
-            self.db_manager.execute_update(query, params)
+            self._execute_upsert(query, [params])
             # --- travel_courses에도 저장 ---
-            # 매핑: 관광지 데이터에서 여행코스 데이터로 변환
-            travel_course_data = {
-                "content_id": data.get("content_id"),
-                "region_code": data.get("region_code"),
-                "sigungu_code": data.get("sigungu_code"),
-                "course_name": data.get("attraction_name"),
-                "category_code": data.get("category_code"),
-                "sub_category_code": data.get("sub_category_code"),
-                "address": data.get("address"),
-                "detail_address": data.get("detail_address"),
-                "latitude": data.get("latitude"),
-                "longitude": data.get("longitude"),
-                "zipcode": data.get("zipcode") or data.get("zip_code"),
-                "tel": data.get("tel") or data.get("telname"),
-                "homepage": data.get("homepage"),
-                "overview": data.get("description"),
-                "first_image": data.get("first_image") or data.get("image_url"),
-                "first_image_small": data.get("first_image_small"),
-                "course_theme": data.get("course_theme"),
-                "course_distance": data.get("course_distance"),
-                "required_time": data.get("required_time"),
-                "difficulty_level": data.get("difficulty_level"),
-                "schedule": data.get("schedule"),
-                "booktour": data.get("booktour") or data.get("book_tour"),
-                "createdtime": data.get("createdtime") or data.get("created_time"),
-                "modifiedtime": data.get("modifiedtime") or data.get("modified_time"),
-                "telname": data.get("telname"),
-                "faxno": data.get("faxno"),
-                "mlevel": data.get("mlevel"),
-                "detail_intro_info": data.get("detail_intro_info"),
-                "detail_additional_info": data.get("detail_additional_info"),
-                "raw_data_id": data.get("raw_data_id"),
-                "last_sync_at": data.get("last_sync_at"),
-                "data_quality_score": data.get("data_quality_score"),
-                "processing_status": data.get("processing_status"),
-            }
+            travel_course_data = self._tourist_attraction_to_travel_course(data)
             self.upsert_travel_course(travel_course_data)
             return True
         except Exception as e:
             self.logger.error(f"관광지 데이터 UPSERT 실패: {e}")
             return False
 
-    def upsert_accommodation(self, data: Dict) -> bool:
-        """숙박 데이터 UPSERT"""
-
-        query = """
-        INSERT INTO accommodations (
-            content_id, region_code, accommodation_name, accommodation_type,
-            address, tel, latitude, longitude, category_code, sub_category_code, parking,
-            raw_data_id
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-        )
-        ON CONFLICT (content_id) DO UPDATE SET
-            region_code = EXCLUDED.region_code,
-            accommodation_name = EXCLUDED.accommodation_name,
-            accommodation_type = EXCLUDED.accommodation_type,
-            address = EXCLUDED.address,
-            tel = EXCLUDED.tel,
-            latitude = EXCLUDED.latitude,
-            longitude = EXCLUDED.longitude,
-            category_code = EXCLUDED.category_code,
-            sub_category_code = EXCLUDED.sub_category_code,
-            parking = EXCLUDED.parking,
-            raw_data_id = EXCLUDED.raw_data_id,
-            created_at = CURRENT_TIMESTAMP
-        """
+    def _accommodation_row(self, data: Dict) -> tuple:
+        """숙박 데이터 UPSERT 파라미터 구성"""
 
-        params = (
+        return (
             data.get("content_id"),
             data.get("region_code"),
             data.get("accommodation_name") or data.get("title") or "미상",
@@ -388,52 +731,23 @@ class DatabaseManagerExtension:
             data.get("raw_data_id"),
         )
 
+    def upsert_accommodation(self, data: Dict) -> bool:
+        """숙박 데이터 UPSERT"""
+
+        query = ACCOMMODATION_UPSERT_SQL
+        params = self._accommodation_row(data)
+
         try:
-            self.db_manager.execute_update(query, params)
+            self._execute_upsert(query, [params])
             return True
         except Exception as e:
             self.logger.error(f"숙박 데이터 UPSERT 실패: {e}")
             return False
 
-    def upsert_festival_event(self, data: Dict) -> bool:
-        """축제/행사 데이터 UPSERT"""
+    def _festival_event_row(self, data: Dict) -> tuple:
+        """축제/행사 데이터 UPSERT 파라미터 구성"""
 
-        query = """
-        INSERT INTO festivals_events (
-            content_id, region_code, event_name, address,
-            latitude, longitude, first_image, event_start_date, event_end_date,
-            homepage, booktour, createdtime, modifiedtime, telname, faxno, zipcode, mlevel,
-            detail_intro_info, detail_additional_info,
-            raw_data_id, last_sync_at, data_quality_score
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-        )
-        ON CONFLICT (content_id) DO UPDATE SET
-            region_code = EXCLUDED.region_code,
-            event_name = EXCLUDED.event_name,
-            address = EXCLUDED.address,
-            latitude = EXCLUDED.latitude,
-            longitude = EXCLUDED.longitude,
-            first_image = EXCLUDED.first_image,
-            event_start_date = EXCLUDED.event_start_date,
-            event_end_date = EXCLUDED.event_end_date,
-            homepage = EXCLUDED.homepage,
-            booktour = EXCLUDED.booktour,
-            createdtime = EXCLUDED.createdtime,
-            modifiedtime = EXCLUDED.modifiedtime,
-            telname = EXCLUDED.telname,
-            faxno = EXCLUDED.faxno,
-            zipcode = EXCLUDED.zipcode,
-            mlevel = EXCLUDED.mlevel,
-            detail_intro_info = EXCLUDED.detail_intro_info,
-            detail_additional_info = EXCLUDED.detail_additional_info,
-            raw_data_id = EXCLUDED.raw_data_id,
-            last_sync_at = EXCLUDED.last_sync_at,
-            data_quality_score = EXCLUDED.data_quality_score,
-            updated_at = CURRENT_TIMESTAMP
-        """
-
-        params = (
+        return (
             data.get("content_id"),
             data.get("region_code"),
             data.get("event_name"),
@@ -460,8 +774,14 @@ class DatabaseManagerExtension:
             data.get("data_quality_score"),
         )
 
+    def upsert_festival_event(self, data: Dict) -> bool:
+        """축제/행사 데이터 UPSERT"""
+
+        query = FESTIVAL_EVENT_UPSERT_SQL
+        params = self._festival_event_row(data)
+
         try:
-            self.db_manager.execute_update(query, params)
+            self._execute_upsert(query, [params])
             return True
         except Exception as e:
             self.logger.error(f"축제/행사 데이터 UPSERT 실패: {e}")
@@ -539,51 +859,10 @@ class DatabaseManagerExtension:
             self.logger.error(f"반려동물 동반여행 정보 UPSERT 실패: {e}")
             return False
 
-    def upsert_restaurant(self, data: Dict) -> bool:
-        """음식점 데이터 UPSERT"""
-
-        query = """
-        INSERT INTO restaurants (
-            content_id, region_code, restaurant_name, address, detail_address,
-            latitude, longitude, first_image, first_image_small, tel,
-            category_code, sub_category_code,
-            overview, homepage,
-            booktour, createdtime, modifiedtime, telname, faxno, zipcode, mlevel,
-            detail_intro_info, detail_additional_info,
-            raw_data_id, last_sync_at, data_quality_score
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-        )
-        ON CONFLICT (content_id) DO UPDATE SET
-            region_code = EXCLUDED.region_code,
-            restaurant_name = EXCLUDED.restaurant_name,
-            address = EXCLUDED.address,
-            detail_address = EXCLUDED.detail_address,
-            latitude = EXCLUDED.latitude,
-            longitude = EXCLUDED.longitude,
-            first_image = EXCLUDED.first_image,
-            first_image_small = EXCLUDED.first_image_small,
-            tel = EXCLUDED.tel,
-            category_code = EXCLUDED.category_code,
-            sub_category_code = EXCLUDED.sub_category_code,
-            overview = EXCLUDED.overview,
-            homepage = EXCLUDED.homepage,
-            booktour = EXCLUDED.booktour,
-            createdtime = EXCLUDED.createdtime,
-            modifiedtime = EXCLUDED.modifiedtime,
-            telname = EXCLUDED.telname,
-            faxno = EXCLUDED.faxno,
-            zipcode = EXCLUDED.zipcode,
-            mlevel = EXCLUDED.mlevel,
-            detail_intro_info = EXCLUDED.detail_intro_info,
-            detail_additional_info = EXCLUDED.detail_additional_info,
-            raw_data_id = EXCLUDED.raw_data_id,
-            last_sync_at = EXCLUDED.last_sync_at,
-            data_quality_score = EXCLUDED.data_quality_score,
-            updated_at = CURRENT_TIMESTAMP
-        """
+    def _restaurant_row(self, data: Dict) -> tuple:
+        """음식점 데이터 UPSERT 파라미터 구성"""
 
-        params = (
+        return (
             data.get("content_id"),
             data.get("region_code"),
             data.get("restaurant_name"),
@@ -614,10 +893,16 @@ class DatabaseManagerExtension:
             data.get("data_quality_score"),
         )
 
+    def upsert_restaurant(self, data: Dict) -> bool:
+        """음식점 데이터 UPSERT"""
+
+        query = RESTAURANT_UPSERT_SQL
+        params = self._restaurant_row(data)
+
         try:
             self.logger.debug(f"음식점 UPSERT - 파라미터 개수: {len(params)}")
             self.logger.debug(f"음식점 UPSERT - 쿼리: {query[:200]}...")
-            self.db_manager.execute_update(query, params)
+            self._execute_upsert(query, [params])
             return True
         except Exception as e:
             self.logger.error(f"음식점 데이터 UPSERT 실패: {e}")
@@ -806,59 +1091,10 @@ class DatabaseManagerExtension:
             self.logger.error(f"컨텐츠 상세 정보 배치 삽입 실패: {e}")
             return 0
 
-    def upsert_cultural_facility(self, data: Dict) -> bool:
-        """문화시설 데이터 UPSERT"""
-
-        query = """
-        INSERT INTO cultural_facilities (
-            content_id, region_code, facility_name, category_code, sub_category_code,
-            address, detail_address, latitude, longitude, zipcode, tel,
-            homepage, overview, first_image, first_image_small,
-            facility_type, admission_fee, operating_hours, parking_info, rest_date, use_season, use_time,
-            booktour, createdtime, modifiedtime, telname, faxno, mlevel,
-            detail_intro_info, detail_additional_info,
-            raw_data_id, last_sync_at, data_quality_score, processing_status
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-        )
-        ON CONFLICT (content_id) DO UPDATE SET
-            region_code = EXCLUDED.region_code,
-            facility_name = EXCLUDED.facility_name,
-            category_code = EXCLUDED.category_code,
-            sub_category_code = EXCLUDED.sub_category_code,
-            address = EXCLUDED.address,
-            detail_address = EXCLUDED.detail_address,
-            latitude = EXCLUDED.latitude,
-            longitude = EXCLUDED.longitude,
-            zipcode = EXCLUDED.zipcode,
-            tel = EXCLUDED.tel,
-            homepage = EXCLUDED.homepage,
-            overview = EXCLUDED.overview,
-            first_image = EXCLUDED.first_image,
-            first_image_small = EXCLUDED.first_image_small,
-            facility_type = EXCLUDED.facility_type,
-            admission_fee = EXCLUDED.admission_fee,
-            operating_hours = EXCLUDED.operating_hours,
-            parking_info = EXCLUDED.parking_info,
-            rest_date = EXCLUDED.rest_date,
-            use_season = EXCLUDED.use_season,
-            use_time = EXCLUDED.use_time,
-            booktour = EXCLUDED.booktour,
-            createdtime = EXCLUDED.createdtime,
-            modifiedtime = EXCLUDED.modifiedtime,
-            telname = EXCLUDED.telname,
-            faxno = EXCLUDED.faxno,
-            mlevel = EXCLUDED.mlevel,
-            detail_intro_info = EXCLUDED.detail_intro_info,
-            detail_additional_info = EXCLUDED.detail_additional_info,
-            raw_data_id = EXCLUDED.raw_data_id,
-            last_sync_at = EXCLUDED.last_sync_at,
-            data_quality_score = EXCLUDED.data_quality_score,
-            processing_status = EXCLUDED.processing_status,
-            updated_at = CURRENT_TIMESTAMP
-        """
+    def _cultural_facility_row(self, data: Dict) -> tuple:
+        """문화시설 데이터 UPSERT 파라미터 구성"""
 
-        params = (
+        return (
             data.get("content_id"),
             data.get("region_code"),
             data.get("facility_name") or data.get("title") or "미상",  # null 방지
@@ -897,65 +1133,23 @@ class DatabaseManagerExtension:
             data.get("processing_status"),
         )
 
+    def upsert_cultural_facility(self, data: Dict) -> bool:
+        """문화시설 데이터 UPSERT"""
+
+        query = CULTURAL_FACILITY_UPSERT_SQL
+        params = self._cultural_facility_row(data)
+
         try:
-            self.db_manager.execute_update(query, params)
+            self._execute_upsert(query, [params])
             return True
         except Exception as e:
             self.logger.error(f"문화시설 데이터 UPSERT 실패: {e}")
             return False
 
-    def upsert_travel_course(self, data: Dict) -> bool:
-        """여행코스 데이터 UPSERT"""
+    def _travel_course_row(self, data: Dict) -> tuple:
+        """여행코스 데이터 UPSERT 파라미터 구성"""
 
-        query = """
-        INSERT INTO travel_courses (
-            content_id, region_code, sigungu_code, course_name, category_code, sub_category_code,
-            address, detail_address, latitude, longitude, zipcode, tel,
-            homepage, overview, first_image, first_image_small,
-            course_theme, course_distance, required_time, difficulty_level, schedule,
-            booktour, createdtime, modifiedtime, telname, faxno, mlevel,
-            detail_intro_info, detail_additional_info,
-            raw_data_id, last_sync_at, data_quality_score, processing_status
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-        )
-        ON CONFLICT (content_id) DO UPDATE SET
-            region_code = EXCLUDED.region_code,
-            sigungu_code = EXCLUDED.sigungu_code,
-            course_name = EXCLUDED.course_name,
-            category_code = EXCLUDED.category_code,
-            sub_category_code = EXCLUDED.sub_category_code,
-            address = EXCLUDED.address,
-            detail_address = EXCLUDED.detail_address,
-            latitude = EXCLUDED.latitude,
-            longitude = EXCLUDED.longitude,
-            zipcode = EXCLUDED.zipcode,
-            tel = EXCLUDED.tel,
-            homepage = EXCLUDED.homepage,
-            overview = EXCLUDED.overview,
-            first_image = EXCLUDED.first_image,
-            first_image_small = EXCLUDED.first_image_small,
-            course_theme = EXCLUDED.course_theme,
-            course_distance = EXCLUDED.course_distance,
-            required_time = EXCLUDED.required_time,
-            difficulty_level = EXCLUDED.difficulty_level,
-            schedule = EXCLUDED.schedule,
-            booktour = EXCLUDED.booktour,
-            createdtime = EXCLUDED.createdtime,
-            modifiedtime = EXCLUDED.modifiedtime,
-            telname = EXCLUDED.telname,
-            faxno = EXCLUDED.faxno,
-            mlevel = EXCLUDED.mlevel,
-            detail_intro_info = EXCLUDED.detail_intro_info,
-            detail_additional_info = EXCLUDED.detail_additional_info,
-            raw_data_id = EXCLUDED.raw_data_id,
-            last_sync_at = EXCLUDED.last_sync_at,
-            data_quality_score = EXCLUDED.data_quality_score,
-            processing_status = EXCLUDED.processing_status,
-            updated_at = CURRENT_TIMESTAMP
-        """
-
-        params = (
+        return (
             data.get("content_id"),
             data.get("region_code"),
             data.get("sigungu_code"),
@@ -993,67 +1187,23 @@ class DatabaseManagerExtension:
             data.get("processing_status"),
         )
 
+    def upsert_travel_course(self, data: Dict) -> bool:
+        """여행코스 데이터 UPSERT"""
+
+        query = TRAVEL_COURSE_UPSERT_SQL
+        params = self._travel_course_row(data)
+
         try:
-            self.db_manager.execute_update(query, params)
+            self._execute_upsert(query, [params])
             return True
         except Exception as e:
             self.logger.error(f"여행코스 데이터 UPSERT 실패: {e}")
             return False
 
-    def upsert_leisure_sport(self, data: Dict) -> bool:
-        """레포츠 데이터 UPSERT"""
-
-        query = """
-        INSERT INTO leisure_sports (
-            content_id, region_code, sigungu_code, facility_name, category_code, sub_category_code,
-            address, detail_address, latitude, longitude, zipcode, tel,
-            homepage, overview, first_image, first_image_small,
-            sports_type, reservation_info, operating_hours, admission_fee, parking_info, rental_info, capacity,
-            booktour, createdtime, modifiedtime, telname, faxno, mlevel,
-            detail_intro_info, detail_additional_info,
-            raw_data_id, last_sync_at, data_quality_score, processing_status
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-        )
-        ON CONFLICT (content_id) DO UPDATE SET
-            region_code = EXCLUDED.region_code,
-            sigungu_code = EXCLUDED.sigungu_code,
-            facility_name = EXCLUDED.facility_name,
-            category_code = EXCLUDED.category_code,
-            sub_category_code = EXCLUDED.sub_category_code,
-            address = EXCLUDED.address,
-            detail_address = EXCLUDED.detail_address,
-            latitude = EXCLUDED.latitude,
-            longitude = EXCLUDED.longitude,
-            zipcode = EXCLUDED.zipcode,
-            tel = EXCLUDED.tel,
-            homepage = EXCLUDED.homepage,
-            overview = EXCLUDED.overview,
-            first_image = EXCLUDED.first_image,
-            first_image_small = EXCLUDED.first_image_small,
-            sports_type = EXCLUDED.sports_type,
-            reservation_info = EXCLUDED.reservation_info,
-            operating_hours = EXCLUDED.operating_hours,
-            admission_fee = EXCLUDED.admission_fee,
-            parking_info = EXCLUDED.parking_info,
-            rental_info = EXCLUDED.rental_info,
-            capacity = EXCLUDED.capacity,
-            booktour = EXCLUDED.booktour,
-            createdtime = EXCLUDED.createdtime,
-            modifiedtime = EXCLUDED.modifiedtime,
-            telname = EXCLUDED.telname,
-            faxno = EXCLUDED.faxno,
-            mlevel = EXCLUDED.mlevel,
-            detail_intro_info = EXCLUDED.detail_intro_info,
-            detail_additional_info = EXCLUDED.detail_additional_info,
-            raw_data_id = EXCLUDED.raw_data_id,
-            last_sync_at = EXCLUDED.last_sync_at,
-            data_quality_score = EXCLUDED.data_quality_score,
-            processing_status = EXCLUDED.processing_status,
-            updated_at = CURRENT_TIMESTAMP
-        """
+    def _leisure_sport_row(self, data: Dict) -> tuple:
+        """레포츠 데이터 UPSERT 파라미터 구성"""
 
-        params = (
+        return (
             data.get("content_id"),
             data.get("region_code"),
             data.get("sigungu_code"),
@@ -1093,68 +1243,23 @@ class DatabaseManagerExtension:
             data.get("processing_status"),
         )
 
+    def upsert_leisure_sport(self, data: Dict) -> bool:
+        """레포츠 데이터 UPSERT"""
+
+        query = LEISURE_SPORT_UPSERT_SQL
+        params = self._leisure_sport_row(data)
+
         try:
-            self.db_manager.execute_update(query, params)
+            self._execute_upsert(query, [params])
             return True
         except Exception as e:
             self.logger.error(f"레포츠 데이터 UPSERT 실패: {e}")
             return False
 
-    def upsert_shopping(self, data: Dict) -> bool:
-        """쇼핑 데이터 UPSERT"""
+    def _shopping_row(self, data: Dict) -> tuple:
+        """쇼핑 데이터 UPSERT 파라미터 구성"""
 
-        query = """
-        INSERT INTO shopping (
-            content_id, region_code, shop_name, category_code, sub_category_code,
-            address, detail_address, latitude, longitude, zipcode, tel,
-            homepage, overview, first_image, first_image_small,
-            shop_type, opening_hours, rest_date, parking_info, credit_card, pet_allowed, baby_carriage, sale_item, fair_day,
-            booktour, createdtime, modifiedtime, telname, faxno, mlevel,
-            detail_intro_info, detail_additional_info,
-            raw_data_id, last_sync_at, data_quality_score, processing_status
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-        )
-        ON CONFLICT (content_id) DO UPDATE SET
-            region_code = EXCLUDED.region_code,
-            shop_name = EXCLUDED.shop_name,
-            category_code = EXCLUDED.category_code,
-            sub_category_code = EXCLUDED.sub_category_code,
-            address = EXCLUDED.address,
-            detail_address = EXCLUDED.detail_address,
-            latitude = EXCLUDED.latitude,
-            longitude = EXCLUDED.longitude,
-            zipcode = EXCLUDED.zipcode,
-            tel = EXCLUDED.tel,
-            homepage = EXCLUDED.homepage,
-            overview = EXCLUDED.overview,
-            first_image = EXCLUDED.first_image,
-            first_image_small = EXCLUDED.first_image_small,
-            shop_type = EXCLUDED.shop_type,
-            opening_hours = EXCLUDED.opening_hours,
-            rest_date = EXCLUDED.rest_date,
-            parking_info = EXCLUDED.parking_info,
-            credit_card = EXCLUDED.credit_card,
-            pet_allowed = EXCLUDED.pet_allowed,
-            baby_carriage = EXCLUDED.baby_carriage,
-            sale_item = EXCLUDED.sale_item,
-            fair_day = EXCLUDED.fair_day,
-            booktour = EXCLUDED.booktour,
-            createdtime = EXCLUDED.createdtime,
-            modifiedtime = EXCLUDED.modifiedtime,
-            telname = EXCLUDED.telname,
-            faxno = EXCLUDED.faxno,
-            mlevel = EXCLUDED.mlevel,
-            detail_intro_info = EXCLUDED.detail_intro_info,
-            detail_additional_info = EXCLUDED.detail_additional_info,
-            raw_data_id = EXCLUDED.raw_data_id,
-            last_sync_at = EXCLUDED.last_sync_at,
-            data_quality_score = EXCLUDED.data_quality_score,
-            processing_status = EXCLUDED.processing_status,
-            updated_at = CURRENT_TIMESTAMP
-        """
-
-        params = (
+        return (
             data.get("content_id"),
             data.get("region_code"),
             data.get("shop_name"),
@@ -1195,13 +1300,103 @@ class DatabaseManagerExtension:
             data.get("processing_status"),
         )
 
+    def upsert_shopping(self, data: Dict) -> bool:
+        """쇼핑 데이터 UPSERT"""
+
+        query = SHOPPING_UPSERT_SQL
+        params = self._shopping_row(data)
+
         try:
-            self.db_manager.execute_update(query, params)
+            self._execute_upsert(query, [params])
             return True
         except Exception as e:
             self.logger.error(f"쇼핑 데이터 UPSERT 실패: {e}")
             return False
 
+    def upsert_tourist_attractions_batch(self, records: List[Dict]) -> int:
+        """관광지 데이터 배치 UPSERT (travel_courses 동시 저장)"""
+
+        return len(self._batch_upsert(
+            "관광지",
+            TOURIST_ATTRACTION_UPSERT_SQL,
+            records,
+            self._tourist_attraction_row,
+            self.upsert_tourist_attraction,
+            after_batch=lambda saved: self.upsert_travel_courses_batch(
+                [self._tourist_attraction_to_travel_course(record) for record in saved]
+            ),
+        ))
+
+    def upsert_accommodations_batch(self, records: List[Dict]) -> int:
+        """숙박 데이터 배치 UPSERT"""
+        return len(self._batch_upsert(
+            "숙박",
+            ACCOMMODATION_UPSERT_SQL,
+            records,
+            self._accommodation_row,
+            self.upsert_accommodation,
+        ))
+
+    def upsert_festival_events_batch(self, records: List[Dict]) -> int:
+        """축제/행사 데이터 배치 UPSERT"""
+        return len(self._batch_upsert(
+            "축제/행사",
+            FESTIVAL_EVENT_UPSERT_SQL,
+            records,
+            self._festival_event_row,
+            self.upsert_festival_event,
+        ))
+
+    def upsert_restaurants_batch(self, records: List[Dict]) -> int:
+        """음식점 데이터 배치 UPSERT"""
+        return len(self._batch_upsert(
+            "음식점",
+            RESTAURANT_UPSERT_SQL,
+            records,
+            self._restaurant_row,
+            self.upsert_restaurant,
+        ))
+
+    def upsert_cultural_facilities_batch(self, records: List[Dict]) -> int:
+        """문화시설 데이터 배치 UPSERT"""
+        return len(self._batch_upsert(
+            "문화시설",
+            CULTURAL_FACILITY_UPSERT_SQL,
+            records,
+            self._cultural_facility_row,
+            self.upsert_cultural_facility,
+        ))
+
+    def upsert_travel_courses_batch(self, records: List[Dict]) -> int:
+        """여행코스 데이터 배치 UPSERT"""
+        return len(self._batch_upsert(
+            "여행코스",
+            TRAVEL_COURSE_UPSERT_SQL,
+            records,
+            self._travel_course_row,
+            self.upsert_travel_course,
+        ))
+
+    def upsert_leisure_sports_batch(self, records: List[Dict]) -> int:
+        """레포츠 데이터 배치 UPSERT"""
+        return len(self._batch_upsert(
+            "레포츠",
+            LEISURE_SPORT_UPSERT_SQL,
+            records,
+            self._leisure_sport_row,
+            self.upsert_leisure_sport,
+        ))
+
+    def upsert_shopping_batch(self, records: List[Dict]) -> int:
+        """쇼핑 데이터 배치 UPSERT"""
+        return len(self._batch_upsert(
+            "쇼핑",
+            SHOPPING_UPSERT_SQL,
+            records,
+            self._shopping_row,
+            self.upsert_shopping,
+        ))
+
 
 # 기존 database_manager에 확장 기능 추가
 def extend_database_manager(db_manager: SyncDatabaseManager) -> SyncDatabaseManager:
@@ -1234,6 +1429,16 @@ def extend_database_manager(db_manager: SyncDatabaseManager) -> SyncDatabaseMana
     db_manager.insert_content_images_batch = extension.insert_content_images_batch
     db_manager.insert_content_detail_info_batch = extension.insert_content_detail_info_batch
 
+    # 다중 행 배치 UPSERT 메서드 추가
+    db_manager.upsert_tourist_attractions_batch = extension.upsert_tourist_attractions_batch
+    db_manager.upsert_accommodations_batch = extension.upsert_accommodations_batch
+    db_manager.upsert_festival_events_batch = extension.upsert_festival_events_batch
+    db_manager.upsert_restaurants_batch = extension.upsert_restaurants_batch
+    db_manager.upsert_cultural_facilities_batch = extension.upsert_cultural_facilities_batch
+    db_manager.upsert_travel_courses_batch = extension.upsert_travel_courses_batch
+    db_manager.upsert_leisure_sports_batch = extension.upsert_leisure_sports_batch
+    db_manager.upsert_shopping_batch = extension.upsert_shopping_batch
+
     return db_manager
 
 
@@ -0,0 +1,131 @@
+"""
+프로세스 로컬 LRU 캐시
+
+Redis 앞단에서 자주 조회되는 키(지역 코드, 분류 코드, 최근 예보 등)를
+메모리에 보관하여 Redis 왕복을 줄이는 L1 캐시입니다.
+- 항목 수 및 직렬화 크기 기준 용량 제한
+- 항목별 TTL 만료
+- 히트/미스/축출 통계
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass
+class LocalCacheConfig:
+    """로컬 캐시 설정"""
+
+    max_entries: int = 2048
+    max_bytes: int = 64 * 1024 * 1024  # 64MB
+    max_ttl_seconds: int = 600         # L1 보관 상한 (Redis TTL보다 짧게 유지)
+    max_entry_bytes: int = 1024 * 1024  # 이보다 큰 응답은 L1에 보관하지 않음
+
+
+class LocalLRUCache:
+    """크기 및 TTL 인지 LRU 캐시
+
+    값은 JSON 문자열로 보관하여 호출자가 반환값을 수정해도 캐시가 오염되지 않으며,
+    문자열 길이를 항목 크기로 사용합니다.
+    """
+
+    def __init__(self, config: Optional[LocalCacheConfig] = None):
+        self.config = config or LocalCacheConfig()
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (만료된 항목은 제거 후 미스 처리)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            payload, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        return json.loads(payload)
+
+    def set(self, key: str, value: Any, ttl: float) -> bool:
+        """캐시 저장"""
+        ttl = min(ttl, self.config.max_ttl_seconds)
+        if ttl <= 0:
+            return False
+
+        try:
+            payload = json.dumps(value, ensure_ascii=False, default=str)
+        except (TypeError, ValueError):
+            return False
+
+        size = len(payload)
+        if size > self.config.max_entry_bytes:
+            return False
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (payload, time.monotonic() + ttl)
+            self._total_bytes += size
+            self._evict_if_needed()
+
+        return True
+
+    def delete(self, key: str) -> bool:
+        """캐시 삭제"""
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def clear(self):
+        """전체 캐시 삭제"""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _remove(self, key: str):
+        payload, _ = self._entries.pop(key)
+        self._total_bytes -= len(payload)
+
+    def _evict_if_needed(self):
+        """용량 초과 시 가장 오래 사용되지 않은 항목부터 축출"""
+        while self._entries and (
+            len(self._entries) > self.config.max_entries
+            or self._total_bytes > self.config.max_bytes
+        ):
+            key, (payload, _) = self._entries.popitem(last=False)
+            self._total_bytes -= len(payload)
+            self.evictions += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
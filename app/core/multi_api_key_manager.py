@@ -6,7 +6,11 @@
 
 import os
 import json
+import atexit
 import logging
+import tempfile
+import threading
+import contextvars
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -23,6 +27,22 @@ class APIProvider(Enum):
     NAVER = "NAVER"  # 네이버 API
 
 
+# 현재 호출 흐름에서 우선 사용할 API 키 (동시 API 호출 관리자가 키별 속도 제한에 따라 지정)
+_preferred_api_key: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "preferred_api_key", default=None
+)
+
+
+def set_preferred_api_key(key: Optional[str]) -> contextvars.Token:
+    """현재 컨텍스트의 우선 사용 API 키 설정 (reset_preferred_api_key로 복원)"""
+    return _preferred_api_key.set(key)
+
+
+def reset_preferred_api_key(token: contextvars.Token):
+    """우선 사용 API 키 설정 복원"""
+    _preferred_api_key.reset(token)
+
+
 @dataclass
 class APIKeyInfo:
     """API 키 정보"""
@@ -52,7 +72,12 @@ class APIKeyStats:
 class MultiAPIKeyManager:
     """다중 API 키 관리자"""
 
-    def __init__(self, cache_file: str = "data/cache/api_key_cache.json"):
+    def __init__(
+        self,
+        cache_file: str = "data/cache/api_key_cache.json",
+        flush_interval_seconds: float = 5.0,
+        flush_threshold: int = 50,
+    ):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.cache_file = cache_file
         self.api_keys: Dict[APIProvider, List[APIKeyInfo]] = {
@@ -71,6 +96,22 @@ class MultiAPIKeyManager:
         # 캐시에서 사용량 정보 로드
         self._load_cache()
 
+        # 지연 저장(write-behind) 설정: 주기 또는 변경 횟수 도달 시 백그라운드 저장
+        self.flush_interval_seconds = flush_interval_seconds
+        self.flush_threshold = flush_threshold
+        self._pending_mutations = 0
+        self._state_lock = threading.Lock()
+        self._write_lock = threading.Lock()  # 스냅샷 생성~파일 기록 순서 보장
+        self._flush_event = threading.Event()
+        self._shutdown_event = threading.Event()
+        self._writer_thread = threading.Thread(
+            target=self._cache_writer_loop,
+            name="api-key-cache-writer",
+            daemon=True,
+        )
+        self._writer_thread.start()
+        atexit.register(self.close)
+
     def _load_api_keys_from_env(self):
         """환경 변수에서 API 키들 로드"""
         # KTO API 키들 로드
@@ -137,6 +178,13 @@ class MultiAPIKeyManager:
             self.logger.error(f"❌ {provider.value} API 키가 설정되지 않았습니다.")
             return None
 
+        # 호출 흐름에서 지정한 키가 사용 가능하면 우선 사용
+        preferred_key = _preferred_api_key.get()
+        if preferred_key:
+            key_info = self._find_key_info(provider, preferred_key)
+            if key_info and self._is_key_available(key_info):
+                return key_info
+
         keys = self.api_keys[provider]
         start_index = self.current_key_index[provider]
         
@@ -236,8 +284,9 @@ class MultiAPIKeyManager:
             self.logger.warning(f"🔍 알 수 없는 API 키: {provider.value} - {key[:10]}...")
             return
 
-        key_info.current_usage += 1
-        key_info.last_used = datetime.now()
+        with self._state_lock:
+            key_info.current_usage += 1
+            key_info.last_used = datetime.now()
 
         # 키별 로깅
         key_preview = key[:10] + "..."
@@ -291,8 +340,8 @@ class MultiAPIKeyManager:
                 f"⚠️ {provider.value} 활성 키 개수: {len(active_keys)}/{len(self.api_keys[provider])}개"
             )
 
-        # 캐시 저장
-        self._save_cache()
+        # 캐시 저장 (백그라운드 지연 저장)
+        self._mark_cache_dirty()
 
     def _find_key_info(self, provider: APIProvider, key: str) -> Optional[APIKeyInfo]:
         """키 정보 찾기"""
@@ -687,30 +736,101 @@ class MultiAPIKeyManager:
         except Exception as e:
             self.logger.warning(f"캐시 로드 실패: {e}")
 
-    def _save_cache(self):
-        """캐시에 사용량 정보 저장"""
-        try:
-            cache_data = {"date": datetime.now().isoformat(), "providers": {}}
+    def _mark_cache_dirty(self):
+        """사용량 변경 기록 (임계값 도달 시 즉시 저장 요청)"""
+        with self._state_lock:
+            self._pending_mutations += 1
+            should_flush = self._pending_mutations >= self.flush_threshold
+
+        if should_flush:
+            self._flush_event.set()
+
+    def _cache_writer_loop(self):
+        """캐시 백그라운드 저장 루프"""
+        while not self._shutdown_event.is_set():
+            self._flush_event.wait(self.flush_interval_seconds)
+            self._flush_event.clear()
+            self.flush_cache()
+
+    def flush_cache(self, force: bool = False):
+        """
+        변경된 사용량 정보를 캐시 파일에 저장
+
+        스냅샷 생성과 파일 기록을 같은 쓰기 락 안에서 처리하여 먼저 만든
+        스냅샷이 나중 스냅샷을 덮어쓰지 않도록 하고, 저장 실패 시 변경 횟수를
+        되돌려 다음 저장(종료 시 포함)에서 다시 기록합니다.
+        """
+        with self._write_lock:
+            with self._state_lock:
+                pending = self._pending_mutations
+                if pending == 0 and not force:
+                    return
+                self._pending_mutations = 0
+                cache_data = self._build_cache_snapshot()
+
+            if not self._write_cache_file(cache_data):
+                with self._state_lock:
+                    self._pending_mutations += max(pending, 1)
+
+    def close(self):
+        """백그라운드 저장 중지 및 남은 변경 사항 저장"""
+        if self._shutdown_event.is_set():
+            return
+
+        self._shutdown_event.set()
+        self._flush_event.set()
+        if self._writer_thread.is_alive():
+            self._writer_thread.join(timeout=5)
 
-            for provider, keys in self.api_keys.items():
-                provider_data = {"keys": []}
+        self.flush_cache()
 
-                for key_info in keys:
-                    key_data = {
-                        "key": key_info.key,
-                        "usage": key_info.current_usage,
-                        "error_count": key_info.error_count,
-                        "is_active": key_info.is_active,
-                    }
-                    provider_data["keys"].append(key_data)
+    def _build_cache_snapshot(self) -> Dict:
+        """캐시 저장용 사용량 스냅샷 생성"""
+        cache_data = {"date": datetime.now().isoformat(), "providers": {}}
 
-                cache_data["providers"][provider.value] = provider_data
+        for provider, keys in self.api_keys.items():
+            provider_data = {"keys": []}
+
+            for key_info in keys:
+                key_data = {
+                    "key": key_info.key,
+                    "usage": key_info.current_usage,
+                    "error_count": key_info.error_count,
+                    "is_active": key_info.is_active,
+                }
+                provider_data["keys"].append(key_data)
 
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            cache_data["providers"][provider.value] = provider_data
+
+        return cache_data
+
+    def _write_cache_file(self, cache_data: Dict) -> bool:
+        """임시 파일에 기록 후 교체하여 캐시 파일을 원자적으로 저장 (쓰기 락 보유 상태에서 호출)"""
+        try:
+            cache_dir = os.path.dirname(self.cache_file) or "."
+            os.makedirs(cache_dir, exist_ok=True)
+
+            fd, temp_path = tempfile.mkstemp(
+                dir=cache_dir, prefix=".api_key_cache.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(cache_data, f, ensure_ascii=False, indent=2)
+                os.replace(temp_path, self.cache_file)
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+
+            return True
 
         except Exception as e:
             self.logger.warning(f"캐시 저장 실패: {e}")
+            return False
+
+    def _save_cache(self):
+        """캐시에 사용량 정보 즉시 저장"""
+        self.flush_cache(force=True)
 
 
 # 전역 인스턴스
@@ -728,4 +848,6 @@ def get_api_key_manager() -> MultiAPIKeyManager:
 def reset_api_key_manager():
     """API 키 매니저 싱글톤 인스턴스 리셋 (환경 변수 재로드용)"""
     global _api_key_manager
+    if _api_key_manager is not None:
+        _api_key_manager.close()
     _api_key_manager = None
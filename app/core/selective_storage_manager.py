@@ -4,8 +4,12 @@
 API 응답의 저장 여부를 정책에 따라 결정하고 관리하는 핵심 모듈입니다.
 """
 
+import csv
+import io
+import json
 import logging
 import time
+import uuid
 from typing import Dict, Any, Optional, Tuple, List
 from datetime import datetime
 from dataclasses import dataclass
@@ -17,6 +21,36 @@ from .database_manager_extension import extend_database_manager
 logger = logging.getLogger(__name__)
 
 
+# 배치 저장 시 COPY 대상 컬럼 (id는 클라이언트에서 생성하여 요청과 매핑)
+API_RAW_DATA_COPY_COLUMNS = (
+    "id", "api_provider", "endpoint", "request_method", "request_params",
+    "raw_response", "response_status", "response_size", "request_duration", "created_at",
+)
+
+# None이 될 수 있는 컬럼 (CSV 작성 시 None이 따옴표 빈 값 ""으로 기록되므로
+# FORCE_NULL로 빈 값을 빈 문자열이 아닌 NULL로 읽도록 지정)
+API_RAW_DATA_NULLABLE_COLUMNS = (
+    "response_status", "response_size", "request_duration", "created_at",
+)
+
+API_RAW_DATA_COPY_SQL = (
+    f"COPY api_raw_data ({', '.join(API_RAW_DATA_COPY_COLUMNS)}) "
+    f"FROM STDIN WITH (FORMAT csv, FORCE_NULL ({', '.join(API_RAW_DATA_NULLABLE_COLUMNS)}))"
+)
+
+API_RAW_DATA_INSERT_SQL = f"""
+INSERT INTO api_raw_data ({', '.join(API_RAW_DATA_COPY_COLUMNS)})
+VALUES ({', '.join(['%s'] * len(API_RAW_DATA_COPY_COLUMNS))})
+"""
+
+
+def json_serial(obj):
+    """JSON serialization for datetime objects"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
 @dataclass
 class StorageRequest:
     """저장 요청 데이터 구조"""
@@ -48,6 +82,8 @@ class SelectiveStorageManager:
             "storage_failures": 0,
             "decision_time_ms": 0,
             "storage_time_ms": 0,
+            "batch_writes": 0,
+            "batch_fallbacks": 0,
         }
         
         logger.info("선택적 저장 매니저 초기화 완료")
@@ -116,15 +152,6 @@ class SelectiveStorageManager:
         
         try:
             # 저장 데이터 준비 (JSON 직렬화)
-            import json
-            from datetime import datetime
-            
-            def json_serial(obj):
-                """JSON serialization for datetime objects"""
-                if isinstance(obj, datetime):
-                    return obj.isoformat()
-                raise TypeError(f"Type {type(obj)} not serializable")
-            
             insert_data = {
                 "api_provider": storage_request.provider,
                 "endpoint": storage_request.endpoint,
@@ -245,10 +272,85 @@ class SelectiveStorageManager:
             self.stats[key] = 0
         logger.info("선택적 저장 매니저 통계가 초기화되었습니다")
     
+    def store_api_responses_batch(self, storage_requests: List[StorageRequest]) -> List[Optional[str]]:
+        """
+        여러 API 응답을 한 번의 COPY로 저장
+        
+        id를 클라이언트에서 생성하므로 RETURNING 없이 요청별 UUID를 매핑할 수 있습니다.
+        COPY가 실패하면 문제 행만 실패 처리되도록 행 단위 INSERT로 재시도합니다.
+        
+        Args:
+            storage_requests: 저장 요청 리스트
+        
+        Returns:
+            요청 순서대로 저장된 UUID 리스트 (실패한 요청은 None)
+        """
+        if not storage_requests:
+            return []
+        
+        start_time = time.time()
+        rows = [self._to_copy_row(request) for request in storage_requests]
+        
+        try:
+            buffer = io.StringIO()
+            # 문자열은 모두 따옴표로 감싸 기록 (None은 "" → FORCE_NULL 컬럼에서 NULL)
+            csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC).writerows(rows)
+            buffer.seek(0)
+            
+            with self.db_manager.get_cursor() as cursor:
+                cursor.copy_expert(API_RAW_DATA_COPY_SQL, buffer)
+            
+            stored_ids = [row[0] for row in rows]
+            self.stats["batch_writes"] += 1
+            
+        except Exception as e:
+            logger.warning(f"COPY 배치 저장 실패, 행 단위 저장으로 재시도: {e}")
+            self.stats["batch_fallbacks"] += 1
+            stored_ids = self._insert_rows_individually(rows)
+        
+        storage_time = (time.time() - start_time) * 1000
+        stored_count = sum(1 for stored_id in stored_ids if stored_id)
+        self.stats["storage_executions"] += len(rows)
+        self.stats["storage_failures"] += len(rows) - stored_count
+        self.stats["storage_time_ms"] += storage_time
+        
+        logger.debug(f"API 응답 배치 저장 완료: {stored_count}/{len(rows)}개 ({storage_time:.2f}ms)")
+        
+        return stored_ids
+    
+    def _to_copy_row(self, storage_request: StorageRequest) -> Tuple:
+        """저장 요청을 COPY 행으로 변환 (API_RAW_DATA_COPY_COLUMNS 순서)"""
+        return (
+            str(uuid.uuid4()),
+            storage_request.provider,
+            storage_request.endpoint,
+            "GET",
+            json.dumps(storage_request.request_params, default=json_serial),
+            json.dumps(storage_request.response_data, default=json_serial),
+            storage_request.status_code,
+            storage_request.response_size_bytes,
+            round(storage_request.execution_time_ms) if storage_request.execution_time_ms is not None else None,
+            storage_request.created_at.isoformat() if storage_request.created_at else None,
+        )
+    
+    def _insert_rows_individually(self, rows: List[Tuple]) -> List[Optional[str]]:
+        """행 단위 INSERT (COPY 실패 시 실패 행 격리용)"""
+        stored_ids = []
+        for row in rows:
+            try:
+                self.db_manager.execute_update(API_RAW_DATA_INSERT_SQL, row)
+                stored_ids.append(row[0])
+            except Exception as e:
+                logger.error(f"API 응답 저장 실패: {row[1]}/{row[2]}, 오류: {e}")
+                stored_ids.append(None)
+        return stored_ids
+    
     def bulk_process_requests(self, storage_requests: List[StorageRequest]) -> List[Dict[str, Any]]:
         """
         여러 저장 요청을 배치로 처리
         
+        저장 여부는 요청별로 결정하고, 저장 대상은 한 번의 배치 쓰기로 저장합니다.
+        
         Args:
             storage_requests: 저장 요청 리스트
         
@@ -256,22 +358,48 @@ class SelectiveStorageManager:
             처리 결과 리스트
         """
         results = []
+        store_indexes = []
         
         logger.info(f"배치 저장 처리 시작: {len(storage_requests)}개 요청")
         
-        for request in storage_requests:
+        # 1. 저장 여부 결정
+        for index, request in enumerate(storage_requests):
+            process_start = time.time()
             try:
-                result = self.process_storage_request(request)
-                results.append(result)
+                should_store, reason, storage_metadata = self.should_store_response(request)
+                result = {
+                    "should_store": should_store,
+                    "decision_reason": reason,
+                    "storage_success": False,
+                    "stored_uuid": None,
+                    "process_time_ms": (time.time() - process_start) * 1000,
+                    "storage_metadata": storage_metadata
+                }
+                if should_store:
+                    store_indexes.append(index)
             except Exception as e:
                 logger.error(f"배치 처리 중 오류: {e}")
-                results.append({
+                result = {
                     "should_store": False,
                     "decision_reason": f"처리 오류: {str(e)}",
                     "storage_success": False,
                     "process_time_ms": 0,
                     "storage_metadata": {}
-                })
+                }
+            results.append(result)
+        
+        # 2. 저장 대상 일괄 저장 후 요청별 UUID 매핑
+        if store_indexes:
+            storage_start = time.time()
+            stored_ids = self.store_api_responses_batch(
+                [storage_requests[index] for index in store_indexes]
+            )
+            storage_time_per_request = (time.time() - storage_start) * 1000 / len(store_indexes)
+            
+            for index, stored_uuid in zip(store_indexes, stored_ids):
+                results[index]["storage_success"] = stored_uuid is not None
+                results[index]["stored_uuid"] = stored_uuid
+                results[index]["process_time_ms"] += storage_time_per_request
         
         # 배치 처리 통계
         successful_stores = sum(1 for r in results if r["storage_success"])
@@ -5,8 +5,9 @@ TTL (Time To Live) 정책 엔진
 """
 
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import re
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
 
@@ -16,6 +17,57 @@ from .database_manager_extension import extend_database_manager
 logger = logging.getLogger(__name__)
 
 
+# 제공자/엔드포인트별 보관 기간 (위에서부터 처음 일치하는 규칙 적용, 엔드포인트 None은 전체)
+RETENTION_RULES: List[Tuple[str, Optional[Tuple[str, ...]], int]] = [
+    ("KMA", ("fct_shrt_reg",), 180),
+    ("KMA", ("getUltraSrtNcst",), 30),
+    ("KMA", ("getUltraSrtFcst", "getVilageFcst"), 60),
+    ("KTO", ("areaCode2",), 365),
+    ("KTO", ("ldongCode2",), 365),
+    ("KTO", ("areaBasedList2", "detailCommon2", "detailIntro2"), 180),
+    ("KTO", ("detailImage2",), 90),
+    ("WEATHER", None, 30),
+]
+DEFAULT_RETENTION_DAYS = 90
+MIN_RETENTION_DAYS = min([days for _, _, days in RETENTION_RULES] + [DEFAULT_RETENTION_DAYS])
+MAX_RETENTION_DAYS = max([days for _, _, days in RETENTION_RULES] + [DEFAULT_RETENTION_DAYS])
+
+PARTITION_BOUND_PATTERN = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+
+def get_retention_days(api_provider: str, endpoint: str) -> int:
+    """제공자/엔드포인트의 보관 기간(일) 반환"""
+    for provider, endpoints, days in RETENTION_RULES:
+        if api_provider == provider and (endpoints is None or endpoint in endpoints):
+            return days
+    return DEFAULT_RETENTION_DAYS
+
+
+def build_retention_days_sql() -> str:
+    """RETENTION_RULES를 SQL CASE 식으로 변환"""
+    lines = ["CASE"]
+    for provider, endpoints, days in RETENTION_RULES:
+        condition = f"api_provider = '{provider}'"
+        if endpoints:
+            endpoint_list = ", ".join(f"'{endpoint}'" for endpoint in endpoints)
+            condition += f" AND endpoint IN ({endpoint_list})"
+        lines.append(f"    WHEN {condition} THEN {days}")
+    lines.append(f"    ELSE {DEFAULT_RETENTION_DAYS}")
+    lines.append("END")
+    return "\n".join(lines)
+
+
+RETENTION_DAYS_SQL = build_retention_days_sql()
+
+
+def parse_partition_bound(bound: str) -> Optional[Tuple[datetime, datetime]]:
+    """파티션 범위 식(FOR VALUES FROM (...) TO (...))을 (시작, 끝)으로 변환 (DEFAULT 파티션은 None)"""
+    match = PARTITION_BOUND_PATTERN.search(bound or "")
+    if not match:
+        return None
+    return datetime.fromisoformat(match.group(1)), datetime.fromisoformat(match.group(2))
+
+
 class CleanupPriority(Enum):
     """정리 우선순위"""
     EXPIRED = 1          # 만료된 데이터
@@ -38,6 +90,19 @@ class CleanupCandidate:
     reason: str
 
 
+@dataclass
+class PartitionExpiryPlan:
+    """api_raw_data 파티션 만료 계획"""
+    partition_name: str
+    range_start: datetime
+    range_end: datetime
+    total_bytes: int
+    estimated_rows: int
+    action: str          # 'drop': 전체 만료, 'partial': 행 단위 정리, 'keep': 만료 데이터 없음
+    retention_days: int  # 파티션에 포함된 데이터 중 가장 긴 보관 기간
+    reason: str
+
+
 @dataclass
 class CleanupResult:
     """정리 작업 결과"""
@@ -68,6 +133,7 @@ class TTLPolicyEngine:
             "total_deleted": 0,
             "total_space_freed_mb": 0.0,
             "avg_execution_time_sec": 0.0,
+            "partitions_dropped": 0,
             "last_cleanup": None,
         }
         
@@ -119,23 +185,13 @@ class TTLPolicyEngine:
     
     def _identify_expired_data(self) -> List[CleanupCandidate]:
         """만료된 데이터 식별"""
-        query = """
+        query = f"""
         SELECT 
             id, api_provider, endpoint, created_at, response_size,
             COALESCE((storage_metadata->>'priority')::int, 2) as priority
         FROM api_raw_data 
         WHERE created_at < NOW() - INTERVAL '1 day' * (
-            CASE 
-                WHEN api_provider = 'KMA' AND endpoint = 'fct_shrt_reg' THEN 180
-                WHEN api_provider = 'KMA' AND endpoint IN ('getUltraSrtNcst') THEN 30
-                WHEN api_provider = 'KMA' AND endpoint IN ('getUltraSrtFcst', 'getVilageFcst') THEN 60
-                WHEN api_provider = 'KTO' AND endpoint = 'areaCode2' THEN 365
-                WHEN api_provider = 'KTO' AND endpoint = 'ldongCode2' THEN 365
-                WHEN api_provider = 'KTO' AND endpoint IN ('areaBasedList2', 'detailCommon2', 'detailIntro2') THEN 180
-                WHEN api_provider = 'KTO' AND endpoint = 'detailImage2' THEN 90
-                WHEN api_provider = 'WEATHER' THEN 30
-                ELSE 90
-            END
+            {RETENTION_DAYS_SQL}
         )
         ORDER BY created_at ASC
         """
@@ -167,7 +223,7 @@ class TTLPolicyEngine:
     
     def _identify_low_priority_old_data(self) -> List[CleanupCandidate]:
         """낮은 우선순위 + 오래된 데이터 식별"""
-        query = """
+        query = f"""
         SELECT 
             id, api_provider, endpoint, created_at, response_size,
             COALESCE((storage_metadata->>'priority')::int, 2) as priority
@@ -175,17 +231,7 @@ class TTLPolicyEngine:
         WHERE COALESCE((storage_metadata->>'priority')::int, 2) >= 3
           AND created_at < NOW() - INTERVAL '30 days'
           AND created_at >= NOW() - INTERVAL '1 day' * (
-              CASE 
-                  WHEN api_provider = 'KMA' AND endpoint = 'fct_shrt_reg' THEN 180
-                  WHEN api_provider = 'KMA' AND endpoint IN ('getUltraSrtNcst') THEN 30
-                  WHEN api_provider = 'KMA' AND endpoint IN ('getUltraSrtFcst', 'getVilageFcst') THEN 60
-                  WHEN api_provider = 'KTO' AND endpoint = 'areaCode2' THEN 365
-                  WHEN api_provider = 'KTO' AND endpoint = 'ldongCode2' THEN 365
-                  WHEN api_provider = 'KTO' AND endpoint IN ('areaBasedList2', 'detailCommon2', 'detailIntro2') THEN 180
-                  WHEN api_provider = 'KTO' AND endpoint = 'detailImage2' THEN 90
-                  WHEN api_provider = 'WEATHER' THEN 30
-                  ELSE 90
-              END
+              {RETENTION_DAYS_SQL}
           )
         ORDER BY priority DESC, created_at ASC
         """
@@ -329,6 +375,9 @@ class TTLPolicyEngine:
         space_freed = 0.0
         errors = []
         
+        # 파티션 전환으로 외래키가 제거되었으므로 참조 행 정리를 직접 수행
+        dependent_refs = self._get_dependent_refs() if candidates and not self.dry_run else []
+        
         # 배치별로 삭제 실행
         for i in range(0, len(candidates), batch_size):
             batch = candidates[i:i + batch_size]
@@ -337,8 +386,7 @@ class TTLPolicyEngine:
             
             try:
                 if not self.dry_run:
-                    delete_query = "DELETE FROM api_raw_data WHERE id = ANY(%s)"
-                    self.db_manager.execute_query(delete_query, [batch_ids])
+                    self._delete_rows(batch_ids, dependent_refs)
                 
                 deleted_count += len(batch)
                 space_freed += batch_space
@@ -424,6 +472,271 @@ class TTLPolicyEngine:
         
         return summary
     
+    def is_raw_data_partitioned(self) -> bool:
+        """api_raw_data가 파티션 테이블인지 확인 (016 마이그레이션 적용 여부)"""
+        try:
+            row = self.db_manager.fetch_one(
+                "SELECT relkind FROM pg_class WHERE oid = to_regclass('api_raw_data')"
+            )
+            return bool(row) and row['relkind'] == 'p'
+        except Exception as e:
+            logger.error(f"파티션 여부 확인 오류: {e}")
+            return False
+
+    def ensure_future_partitions(self, months_ahead: int = 2, interval: str = "month") -> List[str]:
+        """
+        향후 파티션 사전 생성
+
+        Args:
+            months_ahead: 현재 월 이후 생성할 개월 수
+            interval: 파티션 단위 ('month' 또는 'day')
+
+        Returns:
+            생성(또는 이미 존재)된 파티션 이름 리스트
+        """
+        today = datetime.now().date()
+        if interval == "day":
+            end_date = today + timedelta(days=31 * months_ahead)
+            starts = [today + timedelta(days=n) for n in range((end_date - today).days + 1)]
+        else:
+            starts = []
+            year, month = today.year, today.month
+            for _ in range(months_ahead + 1):
+                starts.append(today.replace(year=year, month=month, day=1))
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+        partition_names = []
+        for start in starts:
+            try:
+                row = self.db_manager.fetch_one(
+                    "SELECT create_api_raw_data_partition(%s, %s) AS partition_name",
+                    (start, interval)
+                )
+                partition_names.append(row['partition_name'])
+            except Exception as e:
+                logger.error(f"파티션 생성 오류 ({start}): {e}")
+
+        return partition_names
+
+    def plan_partition_expiry(self, now: Optional[datetime] = None) -> List[PartitionExpiryPlan]:
+        """
+        파티션별 만료 계획 수립
+
+        파티션 상한이 포함된 데이터의 최장 보관 기간보다 오래되었으면 전체 삭제('drop'),
+        일부만 만료되었으면 행 단위 정리('partial') 대상으로 분류합니다.
+        """
+        now = now or datetime.now()
+        query = """
+        SELECT
+            c.relname AS partition_name,
+            pg_get_expr(c.relpartbound, c.oid) AS partition_bound,
+            pg_total_relation_size(c.oid) AS total_bytes,
+            GREATEST(c.reltuples, 0)::bigint AS estimated_rows
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'api_raw_data'::regclass
+        ORDER BY c.relname
+        """
+
+        try:
+            partitions = self.db_manager.fetch_all(query)
+        except Exception as e:
+            logger.error(f"파티션 목록 조회 오류: {e}")
+            return []
+
+        plans = []
+        for partition in partitions:
+            bounds = parse_partition_bound(partition['partition_bound'])
+            if bounds is None:
+                # DEFAULT 파티션은 행 단위 정리로만 처리
+                continue
+
+            range_start, range_end = bounds
+            if range_start >= now - timedelta(days=MIN_RETENTION_DAYS):
+                retention_days = MIN_RETENTION_DAYS
+            elif range_end <= now - timedelta(days=MAX_RETENTION_DAYS):
+                retention_days = MAX_RETENTION_DAYS
+            else:
+                retention_days = self._get_partition_retention_days(partition['partition_name'])
+
+            expiry_cutoff = now - timedelta(days=retention_days)
+            if range_end <= expiry_cutoff:
+                action, reason = "drop", f"파티션 전체 TTL 만료 (최장 보관 {retention_days}일)"
+            elif range_start < now - timedelta(days=MIN_RETENTION_DAYS):
+                action, reason = "partial", "일부 데이터만 TTL 만료 (행 단위 정리)"
+            else:
+                action, reason = "keep", "만료 데이터 없음"
+
+            plans.append(PartitionExpiryPlan(
+                partition_name=partition['partition_name'],
+                range_start=range_start,
+                range_end=range_end,
+                total_bytes=partition['total_bytes'] or 0,
+                estimated_rows=partition['estimated_rows'] or 0,
+                action=action,
+                retention_days=retention_days,
+                reason=reason
+            ))
+
+        return plans
+
+    def _get_partition_retention_days(self, partition_name: str) -> int:
+        """파티션에 포함된 제공자/엔드포인트 중 가장 긴 보관 기간 조회"""
+        rows = self.db_manager.fetch_all(
+            f'SELECT DISTINCT api_provider, endpoint FROM "{partition_name}"'
+        )
+        if not rows:
+            return MIN_RETENTION_DAYS
+        return max(get_retention_days(row['api_provider'], row['endpoint']) for row in rows)
+
+    def get_partition_expiry_report(self) -> Dict[str, Any]:
+        """파티션별 만료 계획 및 확보 예상 용량 보고서 (실제 삭제 없음)"""
+        plans = self.plan_partition_expiry()
+        drop_plans = [plan for plan in plans if plan.action == "drop"]
+
+        return {
+            "partitions": [
+                {
+                    "partition_name": plan.partition_name,
+                    "range_start": plan.range_start.isoformat(),
+                    "range_end": plan.range_end.isoformat(),
+                    "action": plan.action,
+                    "reason": plan.reason,
+                    "estimated_rows": plan.estimated_rows,
+                    "total_bytes": plan.total_bytes,
+                    "reclaimable_bytes": plan.total_bytes if plan.action == "drop" else 0,
+                }
+                for plan in plans
+            ],
+            "droppable_partitions": len(drop_plans),
+            "reclaimable_bytes": sum(plan.total_bytes for plan in drop_plans),
+            "reclaimable_mb": sum(plan.total_bytes for plan in drop_plans) / (1024 * 1024),
+        }
+
+    def execute_partition_cleanup(self, plans: Optional[List[PartitionExpiryPlan]] = None) -> CleanupResult:
+        """
+        전체 만료된 파티션 DETACH 후 DROP
+
+        Args:
+            plans: 파티션 만료 계획 (없으면 새로 수립)
+
+        Returns:
+            정리 작업 결과 (삭제 레코드 수는 통계 기반 추정치)
+        """
+        start_time = datetime.now()
+        plans = plans if plans is not None else self.plan_partition_expiry()
+        drop_plans = [plan for plan in plans if plan.action == "drop"]
+
+        logger.info(f"만료 파티션 정리 시작: {len(drop_plans)}개 (dry_run: {self.dry_run})")
+
+        dependent_refs = self._get_dependent_refs() if drop_plans and not self.dry_run else []
+
+        deleted_count = 0
+        space_freed = 0.0
+        errors = []
+        dropped = []
+
+        for plan in drop_plans:
+            try:
+                if not self.dry_run:
+                    self._drop_partition(plan.partition_name, dependent_refs)
+
+                deleted_count += plan.estimated_rows
+                space_freed += plan.total_bytes / (1024 * 1024)
+                dropped.append({
+                    "partition_name": plan.partition_name,
+                    "estimated_rows": plan.estimated_rows,
+                    "total_bytes": plan.total_bytes,
+                })
+
+                logger.info(f"파티션 {'삭제 예정' if self.dry_run else '삭제'}: {plan.partition_name} "
+                           f"({plan.total_bytes / (1024 * 1024):.2f}MB)")
+
+            except Exception as e:
+                error_msg = f"파티션 {plan.partition_name} 삭제 오류: {e}"
+                errors.append(error_msg)
+                logger.error(error_msg)
+
+        execution_time = (datetime.now() - start_time).total_seconds()
+
+        if not self.dry_run:
+            self.stats["partitions_dropped"] += len(dropped)
+            self.stats["total_deleted"] += deleted_count
+            self.stats["total_space_freed_mb"] += space_freed
+
+        return CleanupResult(
+            total_candidates=len(drop_plans),
+            deleted_records=deleted_count,
+            space_freed_mb=space_freed,
+            execution_time_sec=execution_time,
+            errors=errors,
+            cleanup_summary={
+                "dropped_partitions": dropped,
+                "partial_partitions": [
+                    plan.partition_name for plan in plans if plan.action == "partial"
+                ],
+            }
+        )
+
+    def _get_dependent_refs(self) -> List[Dict[str, Any]]:
+        """파티션 전환 시 제거된 api_raw_data 참조 외래키 정보 조회"""
+        try:
+            if not self.db_manager.fetch_one(
+                "SELECT to_regclass('api_raw_data_dependent_refs') IS NOT NULL AS exists_flag"
+            )['exists_flag']:
+                return []
+            return self.db_manager.fetch_all(
+                "SELECT table_name, column_name, on_delete FROM api_raw_data_dependent_refs"
+            )
+        except Exception as e:
+            logger.error(f"참조 테이블 정보 조회 오류: {e}")
+            return []
+
+    def _apply_dependent_refs(self, cursor, dependent_refs: List[Dict[str, Any]],
+                              partition_name: Optional[str] = None,
+                              ids: Optional[List[Any]] = None):
+        """
+        외래키 ON DELETE 동작 대행 (NO ACTION은 참조가 끊기지 않도록 NULL 처리)
+
+        partition_name이 있으면 해당 파티션의 모든 행, 없으면 ids에 해당하는 행을 대상으로 한다.
+        """
+        for ref in dependent_refs:
+            table_name, column_name = ref['table_name'], ref['column_name']
+            if partition_name is not None:
+                if ref['on_delete'] == 'CASCADE':
+                    cursor.execute(
+                        f'DELETE FROM {table_name} t USING "{partition_name}" p '
+                        f'WHERE t."{column_name}" = p.id'
+                    )
+                else:
+                    cursor.execute(
+                        f'UPDATE {table_name} t SET "{column_name}" = NULL '
+                        f'FROM "{partition_name}" p WHERE t."{column_name}" = p.id'
+                    )
+            else:
+                if ref['on_delete'] == 'CASCADE':
+                    cursor.execute(
+                        f'DELETE FROM {table_name} WHERE "{column_name}" = ANY(%s)', [ids]
+                    )
+                else:
+                    cursor.execute(
+                        f'UPDATE {table_name} SET "{column_name}" = NULL '
+                        f'WHERE "{column_name}" = ANY(%s)', [ids]
+                    )
+
+    def _delete_rows(self, ids: List[Any], dependent_refs: List[Dict[str, Any]]):
+        """참조 행 정리 후 원본 행 삭제 (단일 트랜잭션)"""
+        with self.db_manager.get_cursor() as cursor:
+            self._apply_dependent_refs(cursor, dependent_refs, ids=ids)
+            cursor.execute("DELETE FROM api_raw_data WHERE id = ANY(%s)", [ids])
+
+    def _drop_partition(self, partition_name: str, dependent_refs: List[Dict[str, Any]]):
+        """참조 행 정리 후 파티션 분리 및 삭제 (단일 트랜잭션)"""
+        with self.db_manager.get_cursor() as cursor:
+            self._apply_dependent_refs(cursor, dependent_refs, partition_name=partition_name)
+            cursor.execute(f'ALTER TABLE api_raw_data DETACH PARTITION "{partition_name}"')
+            cursor.execute(f'DROP TABLE "{partition_name}"')
+
     def get_storage_usage_stats(self) -> Dict[str, Any]:
         """현재 스토리지 사용량 통계"""
         query = """
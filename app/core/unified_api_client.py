@@ -6,10 +6,12 @@
 
 import os
 import time
+import asyncio
+import dataclasses
 import hashlib
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass
 
 import aiohttp
@@ -18,7 +20,8 @@ from urllib.parse import urlencode
 
 from app.core.database_manager_extension import get_extended_database_manager
 from app.core.multi_api_key_manager import get_api_key_manager, APIProvider
-from app.core.smart_cache_ttl_optimizer import get_smart_ttl_optimizer, get_optimal_cache_ttl, update_cache_access_stats
+from app.core.smart_cache_ttl_optimizer import get_smart_ttl_optimizer, get_optimal_cache_ttl
+from app.core.local_lru_cache import LocalLRUCache
 from app.core.selective_storage_manager import get_storage_manager, StorageRequest
 from app.archiving.archival_engine import get_archival_engine
 from app.archiving.backup_manager import get_backup_manager
@@ -71,6 +74,17 @@ class UnifiedAPIClient:
         
         # 스마트 TTL 최적화 매니저
         self.smart_ttl_optimizer = get_smart_ttl_optimizer()
+
+        # 프로세스 로컬 L1 캐시 (Redis 앞단)
+        self.local_cache = LocalLRUCache()
+        self.cache_tier_stats = {"l1_hits": 0, "l2_hits": 0, "misses": 0}
+
+        # 캐시 접근 통계 배치 반영 (건수 임계값 또는 주기 도달 시)
+        self._pending_access_stats: List[Tuple[str, bool, datetime]] = []
+        self._access_stats_flush_task: Optional[asyncio.Task] = None
+        self._access_stats_timer_task: Optional[asyncio.Task] = None
+        self.access_stats_batch_size = 100
+        self.access_stats_flush_interval_seconds = 30.0
         
         # 선택적 저장 매니저
         self.storage_manager = get_storage_manager()
@@ -91,6 +105,13 @@ class UnifiedAPIClient:
         # HTTP 세션 설정
         self.session = None
 
+        # 진행 중인 동일 요청 병합 (single-flight)
+        self._inflight_requests: Dict[Any, asyncio.Task] = {}
+        self.coalescing_stats = {
+            "upstream_calls": 0,    # 실제 외부 API로 나간 요청 수
+            "coalesced_calls": 0,   # 진행 중인 요청에 합류하여 절약된 요청 수
+        }
+
         # 만료 시간 설정 (API별) - 스마트 TTL과 함께 사용
         self.expiry_settings = {
             APIProvider.KTO: timedelta(days=7),  # KTO 데이터는 7일
@@ -111,6 +132,8 @@ class UnifiedAPIClient:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """비동기 컨텍스트 매니저 종료"""
+        await self._stop_access_stats_timer()
+        await self._flush_cache_access_stats()
         if self.session:
             await self.session.close()
 
@@ -137,23 +160,40 @@ class UnifiedAPIClient:
         expiry_delta = self.expiry_settings.get(api_provider, timedelta(hours=24))
         return datetime.utcnow() + expiry_delta
 
-    async def _get_cached_data(self, cache_key: str) -> Optional[Dict]:
-        """캐시된 데이터 조회"""
-        if not self.cache_manager:
-            return None
-
-        try:
-            cached_data = await self.cache_manager.get(cache_key)
-            if cached_data:
-                self.logger.debug(f"캐시 히트: {cache_key}")
-                return cached_data
-        except Exception as e:
-            self.logger.warning(f"캐시 조회 실패: {e}")
-
+    async def _get_cached_data(
+        self,
+        cache_key: str,
+        api_provider: Optional[APIProvider] = None,
+        endpoint: Optional[str] = None,
+    ) -> Optional[Dict]:
+        """캐시된 데이터 조회 (L1 로컬 캐시 → L2 Redis 순)"""
+        cached_data = self.local_cache.get(cache_key)
+        if cached_data is not None:
+            self.cache_tier_stats["l1_hits"] += 1
+            self.logger.debug(f"L1 캐시 히트: {cache_key}")
+            return cached_data
+
+        if self.cache_manager:
+            try:
+                cached_data = await self.cache_manager.get(cache_key)
+                if cached_data:
+                    self.cache_tier_stats["l2_hits"] += 1
+                    self.logger.debug(f"캐시 히트: {cache_key}")
+
+                    # L1으로 승격 (스마트 TTL 기준, L1 상한 적용)
+                    ttl = self.smart_ttl_optimizer.get_optimal_ttl(cache_key, api_provider, endpoint)
+                    self.local_cache.set(cache_key, cached_data, ttl)
+                    return cached_data
+            except Exception as e:
+                self.logger.warning(f"캐시 조회 실패: {e}")
+
+        self.cache_tier_stats["misses"] += 1
         return None
 
     async def _set_cached_data(self, cache_key: str, data: Dict, ttl: int = 3600):
         """데이터 캐시 저장"""
+        self.local_cache.set(cache_key, data, ttl)
+
         if not self.cache_manager:
             return
 
@@ -163,6 +203,71 @@ class UnifiedAPIClient:
         except Exception as e:
             self.logger.warning(f"캐시 저장 실패: {e}")
 
+    def _record_cache_access(self, cache_key: str, was_hit: bool):
+        """캐시 접근 통계 기록 (일정 건수마다 또는 주기적으로 백그라운드 반영)"""
+        self._pending_access_stats.append((cache_key, was_hit, datetime.now()))
+        self._ensure_access_stats_timer()
+
+        if len(self._pending_access_stats) < self.access_stats_batch_size:
+            return
+        if self._access_stats_flush_task and not self._access_stats_flush_task.done():
+            return
+
+        self._access_stats_flush_task = asyncio.ensure_future(self._flush_cache_access_stats())
+
+    async def _flush_cache_access_stats(self):
+        """대기 중인 캐시 접근 통계를 스마트 TTL 최적화기에 반영"""
+        pending, self._pending_access_stats = self._pending_access_stats, []
+
+        for cache_key, was_hit, access_time in pending:
+            await self.smart_ttl_optimizer.update_usage_stats(cache_key, was_hit, access_time)
+
+    def _ensure_access_stats_timer(self):
+        """주기 반영 태스크가 현재 이벤트 루프에서 실행 중이 아니면 시작"""
+        task = self._access_stats_timer_task
+        if task and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            return
+
+        self._access_stats_timer_task = asyncio.ensure_future(self._access_stats_flush_loop())
+
+    async def _access_stats_flush_loop(self):
+        """호출이 적어 건수 임계값에 도달하지 않아도 주기적으로 통계 반영"""
+        while True:
+            await asyncio.sleep(self.access_stats_flush_interval_seconds)
+            if not self._pending_access_stats:
+                continue
+            try:
+                await self._flush_cache_access_stats()
+            except Exception as e:
+                self.logger.warning(f"캐시 접근 통계 주기 반영 실패: {e}")
+
+    async def _stop_access_stats_timer(self):
+        """주기 반영 태스크 중지"""
+        task, self._access_stats_timer_task = self._access_stats_timer_task, None
+        if not task or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            return
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def get_cache_tier_stats(self) -> Dict[str, Any]:
+        """캐시 계층별 히트율 반환"""
+        l1_hits = self.cache_tier_stats["l1_hits"]
+        l2_hits = self.cache_tier_stats["l2_hits"]
+        total = l1_hits + l2_hits + self.cache_tier_stats["misses"]
+        return {
+            **self.cache_tier_stats,
+            "total_lookups": total,
+            "l1_hit_rate": l1_hits / total if total else 0.0,
+            "l2_hit_rate": l2_hits / total if total else 0.0,
+            "overall_hit_rate": (l1_hits + l2_hits) / total if total else 0.0,
+            "pending_access_stats": len(self._pending_access_stats),
+            "local_cache": self.local_cache.get_stats(),
+        }
+
     def _store_raw_data(
         self,
         api_provider: APIProvider,
@@ -442,24 +547,64 @@ class UnifiedAPIClient:
         # 1. 캐시 확인
         cache_key = self._generate_cache_key(api_provider.value, endpoint, params)
         if use_cache:
-            cached_response = await self._get_cached_data(cache_key)
+            cached_response = await self._get_cached_data(cache_key, api_provider, endpoint)
+            # 캐시 히트/미스 통계는 배치로 반영
+            self._record_cache_access(cache_key, was_hit=bool(cached_response))
             if cached_response:
-                # 캐시 히트 통계 업데이트
-                await update_cache_access_stats(cache_key, was_hit=True)
                 return APIResponse.from_cache(cached_response)
-            else:
-                # 캐시 미스 통계 업데이트
-                await update_cache_access_stats(cache_key, was_hit=False)
 
-        # 2. API 호출 실행
+        if not self.session:
+            return APIResponse.error_response(
+                "HTTP 세션이 초기화되지 않았습니다. async with 구문을 사용하세요."
+            )
+
+        # 2. 진행 중인 동일 요청이 있으면 결과 공유
+        flight_key = (cache_key, store_raw)
+        inflight = self._inflight_requests.get(flight_key)
+        if inflight is not None:
+            self.coalescing_stats["coalesced_calls"] += 1
+            self.logger.debug(f"진행 중인 요청에 합류: {api_provider.value}/{endpoint}")
+            response = await asyncio.shield(inflight)
+            return dataclasses.replace(response)
+
+        # 3. API 호출 실행 (호출자가 취소되어도 다른 대기자에게 영향이 없도록 별도 태스크로 실행)
+        self.coalescing_stats["upstream_calls"] += 1
+        task = asyncio.ensure_future(
+            self._fetch_and_store(
+                api_provider, endpoint, params, cache_key, store_raw, cache_ttl, use_cache
+            )
+        )
+        self._inflight_requests[flight_key] = task
+        task.add_done_callback(lambda _: self._inflight_requests.pop(flight_key, None))
+
+        return await asyncio.shield(task)
+
+    def get_coalescing_stats(self) -> Dict[str, Any]:
+        """동일 요청 병합 통계 반환"""
+        upstream = self.coalescing_stats["upstream_calls"]
+        coalesced = self.coalescing_stats["coalesced_calls"]
+        total = upstream + coalesced
+        return {
+            **self.coalescing_stats,
+            "inflight_requests": len(self._inflight_requests),
+            "saved_ratio": coalesced / total if total else 0.0,
+        }
+
+    async def _fetch_and_store(
+        self,
+        api_provider: APIProvider,
+        endpoint: str,
+        params: Dict,
+        cache_key: str,
+        store_raw: bool,
+        cache_ttl: int,
+        use_cache: bool,
+    ) -> APIResponse:
+        """외부 API 호출 후 원본 저장 및 캐시 저장"""
+
         start_time = time.time()
 
         try:
-            if not self.session:
-                return APIResponse.error_response(
-                    "HTTP 세션이 초기화되지 않았습니다. async with 구문을 사용하세요."
-                )
-
             response_data = await self._execute_api_call(api_provider, endpoint, params)
             duration_ms = int((time.time() - start_time) * 1000)
 
@@ -475,7 +620,7 @@ class UnifiedAPIClient:
                         error_details=None
                     )
 
-            # 3. 선택적 원본 데이터 저장
+            # 선택적 원본 데이터 저장
             raw_data_id = None
             if store_raw:
                 raw_data_id = await self._store_raw_data_selective(
@@ -487,7 +632,7 @@ class UnifiedAPIClient:
                     duration_ms
                 )
 
-            # 4. 캐시 저장 (스마트 TTL 최적화 적용)
+            # 캐시 저장 (스마트 TTL 최적화 적용)
             if use_cache:
                 # 스마트 TTL 계산
                 optimal_ttl = await get_optimal_cache_ttl(
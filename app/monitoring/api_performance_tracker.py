@@ -5,8 +5,9 @@ API 성능 추적 시스템
 """
 
 import logging
+import math
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from collections import defaultdict, deque
@@ -60,17 +61,189 @@ class APIEndpointStats:
     recent_errors: List[str] = field(default_factory=list)
 
 
+class LatencyHistogram:
+    """
+    로그 간격 버킷 응답 시간 히스토그램
+
+    값을 상대 오차 relative_accuracy 이내의 버킷에 세기만 하므로 기록은 O(1)이고,
+    같은 정확도의 히스토그램끼리는 버킷 합산으로 병합할 수 있다.
+    """
+
+    MIN_TRACKED_MS = 1e-3
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: Dict[int, int] = defaultdict(int)
+        self.zero_count = 0
+        self.count = 0
+        self.min_value = float('inf')
+        self.max_value = 0.0
+
+    def record(self, value: float):
+        """응답 시간 기록"""
+        self.count += 1
+        if value < self.min_value:
+            self.min_value = value
+        if value > self.max_value:
+            self.max_value = value
+        if value <= self.MIN_TRACKED_MS:
+            self.zero_count += 1
+        else:
+            self.buckets[math.ceil(math.log(value) / self._log_gamma)] += 1
+
+    def merge(self, other: "LatencyHistogram"):
+        """다른 히스토그램 병합 (같은 정확도 전제)"""
+        if not other.count:
+            return
+        for index, count in other.buckets.items():
+            self.buckets[index] += count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.min_value = min(self.min_value, other.min_value)
+        self.max_value = max(self.max_value, other.max_value)
+
+    def percentile(self, percentile: float) -> float:
+        """백분위수 추정 (상대 오차 relative_accuracy 이내)"""
+        if not self.count:
+            return 0.0
+        if percentile <= 0:
+            return self.min_value
+        if percentile >= 100:
+            return self.max_value
+
+        rank = (percentile / 100) * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return max(self.min_value, 0.0)
+
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                estimate = 2 * self._gamma ** index / (self._gamma + 1)
+                return min(max(estimate, self.min_value), self.max_value)
+
+        return self.max_value
+
+
+class RollingWindow:
+    """
+    초 단위 버킷 링 버퍼 기반 이동 윈도우
+
+    버킷이 윈도우를 벗어날 때 합계에서 빼는 증분 방식이라 기록/조회가 상수 시간이며,
+    자체 락은 합계 갱신 구간에만 잡으므로 조회가 기록을 오래 막지 않는다.
+    """
+
+    def __init__(self, window_seconds: int = 60, relative_accuracy: float = 0.01):
+        self.window_seconds = window_seconds
+        self.relative_accuracy = relative_accuracy
+        self._seconds: List[Optional[int]] = [None] * window_seconds
+        self._counts = [0] * window_seconds
+        self._errors = [0] * window_seconds
+        self._durations = [0.0] * window_seconds
+        self._histograms: List[Optional[LatencyHistogram]] = [None] * window_seconds
+        self._latest_second: Optional[int] = None
+        self.total_count = 0
+        self.total_errors = 0
+        self.total_duration_ms = 0.0
+        self._lock = threading.Lock()
+
+    def _advance(self, second: int):
+        """second까지 윈도우를 이동하며 만료된 버킷을 합계에서 제외"""
+        if self._latest_second is None:
+            self._latest_second = second - self.window_seconds
+        if second <= self._latest_second:
+            return
+
+        start = max(self._latest_second + 1, second - self.window_seconds + 1)
+        for s in range(start, second + 1):
+            slot = s % self.window_seconds
+            self.total_count -= self._counts[slot]
+            self.total_errors -= self._errors[slot]
+            self.total_duration_ms -= self._durations[slot]
+            self._seconds[slot] = s
+            self._counts[slot] = 0
+            self._errors[slot] = 0
+            self._durations[slot] = 0.0
+            self._histograms[slot] = None
+        self._latest_second = second
+
+    def record(self, timestamp: float, duration_ms: float, is_error: bool):
+        """호출 하나 기록 (윈도우보다 오래된 호출은 무시)"""
+        second = int(timestamp)
+        with self._lock:
+            self._advance(second)
+            slot = second % self.window_seconds
+            if self._seconds[slot] != second:
+                return
+
+            self._counts[slot] += 1
+            self._durations[slot] += duration_ms
+            self.total_count += 1
+            self.total_duration_ms += duration_ms
+            if is_error:
+                self._errors[slot] += 1
+                self.total_errors += 1
+
+            histogram = self._histograms[slot]
+            if histogram is None:
+                histogram = self._histograms[slot] = LatencyHistogram(self.relative_accuracy)
+            histogram.record(duration_ms)
+
+    def summary(self, now: float) -> Dict[str, Any]:
+        """now 기준 윈도우의 호출 수/오류 수/응답 시간 합계"""
+        with self._lock:
+            self._advance(int(now))
+            if self.total_count <= 0:
+                # 부동소수점 누적 오차 제거
+                self.total_duration_ms = 0.0
+            return {
+                "count": self.total_count,
+                "errors": self.total_errors,
+                "duration_ms": self.total_duration_ms,
+            }
+
+    def histogram(self, now: float) -> LatencyHistogram:
+        """now 기준 윈도우의 응답 시간 히스토그램 병합본"""
+        with self._lock:
+            self._advance(int(now))
+            histograms = [h for h in self._histograms if h is not None]
+
+        merged = LatencyHistogram(self.relative_accuracy)
+        for histogram in histograms:
+            merged.merge(histogram)
+        return merged
+
+    def clear(self):
+        """윈도우 초기화"""
+        with self._lock:
+            self._seconds = [None] * self.window_seconds
+            self._counts = [0] * self.window_seconds
+            self._errors = [0] * self.window_seconds
+            self._durations = [0.0] * self.window_seconds
+            self._histograms = [None] * self.window_seconds
+            self._latest_second = None
+            self.total_count = 0
+            self.total_errors = 0
+            self.total_duration_ms = 0.0
+
+
 class APIPerformanceTracker:
     """API 성능 추적기"""
     
-    def __init__(self, max_records_per_endpoint: int = 1000):
+    def __init__(self, max_records_per_endpoint: int = 1000, window_seconds: int = 60,
+                 clock=time.time):
         """
         API 성능 추적기 초기화
         
         Args:
             max_records_per_endpoint: 엔드포인트당 최대 기록 수
+            window_seconds: 실시간 메트릭 이동 윈도우 길이 (초)
+            clock: 현재 시각(epoch 초) 함수 (테스트용)
         """
         self.max_records_per_endpoint = max_records_per_endpoint
+        self.clock = clock
         
         # API 호출 기록 저장소
         self.call_records: Dict[str, deque] = defaultdict(
@@ -80,6 +253,9 @@ class APIPerformanceTracker:
         # 엔드포인트별 통계
         self.endpoint_stats: Dict[str, APIEndpointStats] = {}
         
+        # 엔드포인트별 누적 응답 시간 히스토그램 (백분위수용)
+        self.endpoint_latency: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        
         # 제공자별 통계
         self.provider_stats: Dict[str, Dict[str, Any]] = defaultdict(
             lambda: {
@@ -94,16 +270,10 @@ class APIPerformanceTracker:
         )
         
         # 실시간 성능 메트릭
-        self.real_time_metrics = {
-            "current_rps": 0.0,  # requests per second
-            "avg_response_time_1min": 0.0,
-            "error_rate_1min": 0.0,
-            "active_calls": 0,
-            "last_metric_update": datetime.now()
-        }
+        self.real_time_metrics = self._empty_real_time_metrics()
         
-        # 호출 시간 윈도우 (1분)
-        self.call_timestamps: deque = deque(maxlen=1000)
+        # 초 단위 링 버퍼 이동 윈도우 (1분)
+        self.window = RollingWindow(window_seconds)
         
         # 스레드 안전성을 위한 락
         self.lock = threading.RLock()
@@ -113,6 +283,17 @@ class APIPerformanceTracker:
         
         logger.info("API 성능 추적기 초기화 완료")
     
+    @staticmethod
+    def _empty_real_time_metrics() -> Dict[str, Any]:
+        return {
+            "current_rps": 0.0,  # requests per second
+            "avg_response_time_1min": 0.0,
+            "error_rate_1min": 0.0,
+            "p95_response_time_1min": 0.0,
+            "active_calls": 0,
+            "last_metric_update": datetime.now()
+        }
+    
     def record_api_call(self, call_record: APICallRecord):
         """API 호출 기록"""
         with self.lock:
@@ -121,17 +302,19 @@ class APIPerformanceTracker:
             # 호출 기록 저장
             self.call_records[endpoint_key].append(call_record)
             
-            # 호출 시간 기록 (실시간 메트릭용)
-            self.call_timestamps.append(call_record.timestamp)
-            
             # 엔드포인트 통계 업데이트
             self._update_endpoint_stats(call_record)
+            self.endpoint_latency[endpoint_key].record(call_record.duration_ms)
             
             # 제공자 통계 업데이트
             self._update_provider_stats(call_record)
-            
-            # 실시간 메트릭 업데이트
-            self._update_real_time_metrics()
+        
+        # 실시간 메트릭용 이동 윈도우 기록 (윈도우 자체 락 사용, 메트릭은 조회 시 계산)
+        self.window.record(
+            call_record.timestamp.timestamp(),
+            call_record.duration_ms,
+            call_record.status != APICallStatus.SUCCESS
+        )
     
     def _update_endpoint_stats(self, call_record: APICallRecord):
         """엔드포인트 통계 업데이트"""
@@ -209,39 +392,31 @@ class APIPerformanceTracker:
             provider_stat["failed_calls"] / provider_stat["total_calls"]
         ) * 100
     
-    def _update_real_time_metrics(self):
-        """실시간 메트릭 업데이트"""
-        now = datetime.now()
-        one_minute_ago = now - timedelta(minutes=1)
-        
-        # 1분 내 호출 수 계산
-        recent_calls = [
-            ts for ts in self.call_timestamps 
-            if ts >= one_minute_ago
-        ]
-        
-        # RPS 계산
-        self.real_time_metrics["current_rps"] = len(recent_calls) / 60.0
-        
-        # 1분 내 호출들의 평균 응답시간과 에러율
-        if recent_calls:
-            recent_records = []
-            for endpoint_key, records in self.call_records.items():
-                recent_records.extend([
-                    record for record in records 
-                    if record.timestamp >= one_minute_ago
-                ])
-            
-            if recent_records:
-                # 평균 응답시간
-                response_times = [r.duration_ms for r in recent_records]
-                self.real_time_metrics["avg_response_time_1min"] = statistics.mean(response_times)
-                
-                # 에러율
-                error_count = sum(1 for r in recent_records if r.status != APICallStatus.SUCCESS)
-                self.real_time_metrics["error_rate_1min"] = (error_count / len(recent_records)) * 100
-        
-        self.real_time_metrics["last_metric_update"] = now
+    def _update_real_time_metrics(self) -> Dict[str, Any]:
+        """실시간 메트릭 업데이트 (이동 윈도우 합계로 상수 시간 계산)"""
+        now = self.clock()
+        window = self.window.summary(now)
+        count = window["count"]
+        
+        metrics = {
+            **self.real_time_metrics,
+            "current_rps": count / self.window.window_seconds,
+            "last_metric_update": datetime.now()
+        }
+        
+        # 1분 내 호출들의 평균 응답시간, 에러율, p95
+        if count:
+            metrics["avg_response_time_1min"] = window["duration_ms"] / count
+            metrics["error_rate_1min"] = (window["errors"] / count) * 100
+            metrics["p95_response_time_1min"] = self._calculate_percentile(self.window.histogram(now), 95)
+        else:
+            metrics["avg_response_time_1min"] = 0.0
+            metrics["error_rate_1min"] = 0.0
+            metrics["p95_response_time_1min"] = 0.0
+        
+        # 읽기 측은 락 없이 참조만 교체해 사용
+        self.real_time_metrics = metrics
+        return metrics
     
     def get_endpoint_performance(self, provider: str, endpoint: str, 
                                 time_window_minutes: int = 60) -> Dict[str, Any]:
@@ -273,7 +448,10 @@ class APIPerformanceTracker:
                 "response_time_stats": {
                     "avg_ms": stats.avg_response_time_ms,
                     "min_ms": stats.min_response_time_ms if stats.min_response_time_ms != float('inf') else 0,
-                    "max_ms": stats.max_response_time_ms
+                    "max_ms": stats.max_response_time_ms,
+                    "p50_ms": self._calculate_percentile(self.endpoint_latency[endpoint_key], 50),
+                    "p95_ms": self._calculate_percentile(self.endpoint_latency[endpoint_key], 95),
+                    "p99_ms": self._calculate_percentile(self.endpoint_latency[endpoint_key], 99)
                 },
                 "recent_performance": self._calculate_recent_performance(recent_records),
                 "error_analysis": {
@@ -325,8 +503,12 @@ class APIPerformanceTracker:
         
         return dict(error_counts)
     
-    def _calculate_percentile(self, values: List[float], percentile: float) -> float:
-        """백분위수 계산"""
+    def _calculate_percentile(self, values: Union[List[float], LatencyHistogram],
+                              percentile: float) -> float:
+        """백분위수 계산 (히스토그램이면 정렬 없이 버킷으로 추정)"""
+        if isinstance(values, LatencyHistogram):
+            return values.percentile(percentile)
+        
         if not values:
             return 0.0
         
@@ -378,12 +560,11 @@ class APIPerformanceTracker:
             }
     
     def get_real_time_metrics(self) -> Dict[str, Any]:
-        """실시간 메트릭 반환"""
-        with self.lock:
-            return {
-                **self.real_time_metrics,
-                "tracking_uptime_seconds": (datetime.now() - self.tracking_start_time).total_seconds()
-            }
+        """실시간 메트릭 반환 (추적기 락을 잡지 않아 기록을 막지 않음)"""
+        return {
+            **self._update_real_time_metrics(),
+            "tracking_uptime_seconds": (datetime.now() - self.tracking_start_time).total_seconds()
+        }
     
     def get_overall_performance(self) -> Dict[str, Any]:
         """전체 성능 요약 반환"""
@@ -451,7 +632,7 @@ class APIPerformanceTracker:
                     })
             
             # 3. 낮은 처리량 감지
-            current_rps = self.real_time_metrics["current_rps"]
+            current_rps = self._update_real_time_metrics()["current_rps"]
             if current_rps < 1 and any(stats["total_calls"] > 0 for stats in self.provider_stats.values()):
                 issues.append({
                     "type": "low_throughput",
@@ -467,16 +648,11 @@ class APIPerformanceTracker:
         with self.lock:
             self.call_records.clear()
             self.endpoint_stats.clear()
+            self.endpoint_latency.clear()
             self.provider_stats.clear()
-            self.call_timestamps.clear()
+            self.window.clear()
             
-            self.real_time_metrics = {
-                "current_rps": 0.0,
-                "avg_response_time_1min": 0.0,
-                "error_rate_1min": 0.0,
-                "active_calls": 0,
-                "last_metric_update": datetime.now()
-            }
+            self.real_time_metrics = self._empty_real_time_metrics()
             
             self.tracking_start_time = datetime.now()
             
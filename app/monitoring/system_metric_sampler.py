@@ -0,0 +1,188 @@
+"""
+시스템 메트릭 백그라운드 샘플러
+
+CPU/메모리/디스크/네트워크 사용량을 별도 스레드에서 주기적으로 측정해
+최신 스냅샷과 저장 대기 샘플 버퍼를 유지합니다. API 요청 경로에서는
+측정을 기다리지 않고 스냅샷만 읽습니다.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+import psutil
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SystemMetricSnapshot:
+    """시스템 메트릭 스냅샷 (한 번의 측정 결과)"""
+    measured_at: datetime
+    cpu_percent: float
+    memory_percent: float
+    disk_percent: float
+    network_bytes: Optional[int] = None  # 누적 송수신 바이트
+    network_bytes_per_second: float = 0.0
+
+
+class SystemMetricSampler:
+    """시스템 메트릭 백그라운드 샘플러"""
+
+    def __init__(self, interval_seconds: float = 5.0, max_pending_samples: int = 720,
+                 disk_path: str = "/"):
+        """
+        샘플러 초기화
+
+        Args:
+            interval_seconds: 측정 주기 (초)
+            max_pending_samples: 저장 대기 샘플 최대 개수 (초과 시 오래된 샘플 제거)
+            disk_path: 디스크 사용률 측정 경로
+        """
+        self.interval_seconds = interval_seconds
+        self.disk_path = disk_path
+
+        # 최신 스냅샷 (참조 교체만 하므로 읽을 때 락 불필요)
+        self._latest: Optional[SystemMetricSnapshot] = None
+        self._pending: deque = deque(maxlen=max_pending_samples)
+        self._pending_lock = threading.Lock()
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_network: Optional[tuple] = None
+
+        self.stats = {
+            "samples_taken": 0,
+            "samples_dropped": 0,
+            "sample_errors": 0,
+            "last_sample_ms": 0.0,
+        }
+
+        # 첫 cpu_percent(interval=None) 호출은 기준점 설정용
+        psutil.cpu_percent(interval=None)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """샘플링 스레드 시작"""
+        if self.is_running:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._sampling_loop,
+            name="system-metric-sampler",
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(f"시스템 메트릭 샘플러 시작 (주기: {self.interval_seconds}초)")
+
+    def stop(self, timeout: float = 5.0):
+        """샘플링 스레드 중지"""
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+        logger.info("시스템 메트릭 샘플러 중지")
+
+    def _sampling_loop(self):
+        """주기적 측정 루프"""
+        while not self._stop_event.is_set():
+            try:
+                self.sample_now()
+            except Exception as e:
+                self.stats["sample_errors"] += 1
+                logger.error(f"시스템 메트릭 샘플링 오류: {e}")
+            self._stop_event.wait(self.interval_seconds)
+
+    def sample_now(self) -> SystemMetricSnapshot:
+        """
+        즉시 한 번 측정해 스냅샷과 저장 대기 버퍼를 갱신
+
+        CPU 사용률은 직전 측정 이후 구간 값을 사용하므로 대기하지 않는다.
+        """
+        started = time.perf_counter()
+        now = time.monotonic()
+
+        cpu_percent = psutil.cpu_percent(interval=None)
+        memory_percent = psutil.virtual_memory().percent
+        disk_percent = psutil.disk_usage(self.disk_path).percent
+
+        network_bytes = None
+        bytes_per_second = 0.0
+        net_io = psutil.net_io_counters()
+        if net_io:
+            network_bytes = net_io.bytes_sent + net_io.bytes_recv
+            if self._last_network is not None:
+                last_time, last_bytes = self._last_network
+                elapsed = now - last_time
+                if elapsed > 0 and network_bytes >= last_bytes:
+                    bytes_per_second = (network_bytes - last_bytes) / elapsed
+            self._last_network = (now, network_bytes)
+
+        snapshot = SystemMetricSnapshot(
+            measured_at=datetime.utcnow(),
+            cpu_percent=cpu_percent,
+            memory_percent=memory_percent,
+            disk_percent=disk_percent,
+            network_bytes=network_bytes,
+            network_bytes_per_second=bytes_per_second,
+        )
+
+        self._latest = snapshot
+        with self._pending_lock:
+            if len(self._pending) == self._pending.maxlen:
+                self.stats["samples_dropped"] += 1
+            self._pending.append(snapshot)
+
+        self.stats["samples_taken"] += 1
+        self.stats["last_sample_ms"] = (time.perf_counter() - started) * 1000
+        return snapshot
+
+    def get_latest(self) -> Optional[SystemMetricSnapshot]:
+        """최신 스냅샷 반환 (대기 없음)"""
+        return self._latest
+
+    def drain_pending(self) -> List[SystemMetricSnapshot]:
+        """저장 대기 샘플을 모두 꺼내 반환"""
+        with self._pending_lock:
+            samples = list(self._pending)
+            self._pending.clear()
+        return samples
+
+    def requeue(self, samples: List[SystemMetricSnapshot]):
+        """저장 실패한 샘플을 버퍼 앞쪽에 되돌림 (버퍼 한도 내에서)"""
+        with self._pending_lock:
+            newer = list(self._pending)
+            self._pending.clear()
+            self._pending.extend(samples)
+            self._pending.extend(newer)
+
+
+# 전역 시스템 메트릭 샘플러 인스턴스
+_system_metric_sampler: Optional[SystemMetricSampler] = None
+
+
+def get_system_metric_sampler() -> SystemMetricSampler:
+    """전역 시스템 메트릭 샘플러 인스턴스 반환 (싱글톤)"""
+    global _system_metric_sampler
+
+    if _system_metric_sampler is None:
+        _system_metric_sampler = SystemMetricSampler()
+
+    return _system_metric_sampler
+
+
+def reset_system_metric_sampler():
+    """시스템 메트릭 샘플러 인스턴스 재설정 (테스트용)"""
+    global _system_metric_sampler
+    if _system_metric_sampler is not None:
+        _system_metric_sampler.stop()
+    _system_metric_sampler = None
@@ -12,6 +12,40 @@ from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
 from app.core.database_manager_extension import get_extended_database_manager
+from app.services.region_spatial_index import get_region_index, load_region_index_from_db
+
+
+# KMA 값 변환 규칙
+KMA_NUMERIC_CATEGORIES = frozenset(["POP", "REH", "TMP", "TMN", "TMX", "WSD", "VEC", "T1H"])
+KMA_AMOUNT_CATEGORIES = frozenset(["PCP", "SNO", "RN1"])
+KMA_NO_AMOUNT_VALUES = frozenset(["강수없음", "적설없음"])
+
+
+def _convert_kma_numeric(value: str) -> float:
+    """숫자형 데이터 변환"""
+    return float(value)
+
+
+def _convert_kma_amount(value: str) -> float:
+    """강수량/적설량 변환 (mm 단위 숫자 추출)"""
+    if value in KMA_NO_AMOUNT_VALUES:
+        return 0.0
+    numeric_value = "".join(ch for ch in value if ch.isdigit() or ch == ".")
+    return float(numeric_value) if numeric_value else 0.0
+
+
+def _convert_kma_code(value: str) -> str:
+    """코드형 데이터는 문자열 그대로"""
+    return value.strip()
+
+
+def get_kma_value_converter(category: str):
+    """카테고리별 값 변환 함수 반환"""
+    if category in KMA_NUMERIC_CATEGORIES:
+        return _convert_kma_numeric
+    if category in KMA_AMOUNT_CATEGORIES:
+        return _convert_kma_amount
+    return _convert_kma_code
 
 
 @dataclass
@@ -594,6 +628,24 @@ class KMADataTransformer(BaseDataTransformer):
         "LGT": "lightning",  # 낙뢰
     }
 
+    # 카테고리별 (컬럼명, 변환 함수) - 항목마다 카테고리 분기를 반복하지 않도록 미리 구성
+    COMPILED_CATEGORIES = {
+        category: (field_name, get_kma_value_converter(category))
+        for category, field_name in CATEGORY_MAPPING.items()
+    }
+
+    # 기본적인 격자-지역 매핑 (실제로는 더 정교한 매핑이 필요)
+    GRID_TO_REGION = {
+        (60, 127): "1100000000",  # 서울
+        (98, 76): "2600000000",   # 부산
+        (89, 90): "2700000000",   # 대구
+        (55, 124): "2800000000",  # 인천
+        (67, 100): "2900000000",  # 광주
+        (68, 100): "3000000000",  # 대전
+        (102, 84): "3100000000",  # 울산
+        (52, 38): "5000000000",   # 제주
+    }
+
     def get_rule_name(self) -> str:
         return "KMA_API_STANDARD_TRANSFORM"
 
@@ -626,80 +678,100 @@ class KMADataTransformer(BaseDataTransformer):
 
     def _transform_current_weather(self, items: List[Dict]) -> List[Dict]:
         """현재 날씨 데이터 변환"""
-        # 카테고리별로 데이터 그룹화
+        # 관측 시각/격자별로 카테고리 값을 한 번에 피벗
         weather_data = {}
+        converted_values = {}
+        compiled_categories = self.COMPILED_CATEGORIES
+        processed_at = datetime.utcnow().isoformat()
 
         for item in items:
             base_date = item.get("baseDate")
             base_time = item.get("baseTime")
             nx = item.get("nx")
             ny = item.get("ny")
-            category = item.get("category")
-            value = item.get("obsrValue")
 
             # 고유 키 생성
-            key = f"{base_date}_{base_time}_{nx}_{ny}"
+            key = (base_date, base_time, nx, ny)
+            row = weather_data.get(key)
 
-            if key not in weather_data:
-                weather_data[key] = {
+            if row is None:
+                row = weather_data[key] = {
                     "base_date": base_date,
                     "base_time": base_time,
                     "nx": nx,
                     "ny": ny,
                     "observation_time": self._format_datetime(base_date, base_time),
                     "data_source": "KMA_API",
-                    "processed_at": datetime.utcnow().isoformat(),
+                    "processed_at": processed_at,
                 }
 
             # 카테고리별 값 매핑
-            if category in self.CATEGORY_MAPPING:
-                field_name = self.CATEGORY_MAPPING[category]
-                weather_data[key][field_name] = self._convert_weather_value(
-                    category, value
+            category = item.get("category")
+            compiled = compiled_categories.get(category)
+            if compiled is not None:
+                row[compiled[0]] = self._convert_cached(
+                    converted_values, category, item.get("obsrValue")
                 )
 
         return list(weather_data.values())
 
     def _transform_weather_forecast(self, items: List[Dict]) -> List[Dict]:
         """날씨 예보 데이터 변환"""
+        # 예보 시각/격자별로 카테고리 값을 한 번에 피벗
         forecast_data = {}
+        converted_values = {}
+        region_codes = {}
+        compiled_categories = self.COMPILED_CATEGORIES
+        processed_at = datetime.utcnow().isoformat()
 
         for item in items:
-            base_date = item.get("baseDate")
-            base_time = item.get("baseTime")
             fcst_date = item.get("fcstDate")
             fcst_time = item.get("fcstTime")
             nx = item.get("nx")
             ny = item.get("ny")
-            category = item.get("category")
-            value = item.get("fcstValue")
 
             # 고유 키 생성 (예보 날짜/시간별)
-            key = f"{fcst_date}_{fcst_time}_{nx}_{ny}"
-
-            if key not in forecast_data:
-                forecast_data[key] = {
-                    "base_date": base_date,
-                    "base_time": base_time,
+            key = (fcst_date, fcst_time, nx, ny)
+            row = forecast_data.get(key)
+
+            if row is None:
+                grid = (nx, ny)
+                region_code = region_codes.get(grid)
+                if region_code is None:
+                    region_code = region_codes[grid] = self._get_region_code_from_grid(nx, ny)
+
+                row = forecast_data[key] = {
+                    "base_date": item.get("baseDate"),
+                    "base_time": item.get("baseTime"),
                     "forecast_date": fcst_date,  # YYYYMMDD 형식 유지 (DB 스키마에 맞춤)
                     "forecast_time": fcst_time,
                     "nx": int(nx) if nx else None,
                     "ny": int(ny) if ny else None,
-                    "region_code": self._get_region_code_from_grid(nx, ny),
+                    "region_code": region_code,
                     "forecast_type": "short",
                     "data_source": "KMA_API",
-                    "processed_at": datetime.utcnow().isoformat(),
+                    "processed_at": processed_at,
                 }
 
             # 카테고리별 값 매핑
-            if category in self.CATEGORY_MAPPING:
-                field_name = self.CATEGORY_MAPPING[category]
-                forecast_data[key][field_name] = self._convert_weather_value(
-                    category, value
+            category = item.get("category")
+            compiled = compiled_categories.get(category)
+            if compiled is not None:
+                row[compiled[0]] = self._convert_cached(
+                    converted_values, category, item.get("fcstValue")
                 )
 
         return list(forecast_data.values())
 
+    def _convert_cached(self, converted_values: Dict, category: str, value: Any) -> Any:
+        """배치 내 동일한 (카테고리, 값) 변환 결과 재사용"""
+        cache_key = (category, value)
+        try:
+            return converted_values[cache_key]
+        except KeyError:
+            converted = converted_values[cache_key] = self._convert_weather_value(category, value)
+            return converted
+
     def _format_datetime(self, date_str: str, time_str: str) -> str:
         """날짜/시간 문자열을 ISO 형식으로 변환"""
         try:
@@ -722,54 +794,32 @@ class KMADataTransformer(BaseDataTransformer):
         if not value or value.strip() == "":
             return None
 
-        try:
-            # 숫자형 데이터
-            if category in ["POP", "REH", "TMP", "TMN", "TMX", "WSD", "VEC", "T1H"]:
-                return float(value)
-
-            # 강수량/적설량 (특수 처리)
-            elif category in ["PCP", "SNO", "RN1"]:
-                if value == "강수없음" or value == "적설없음":
-                    return 0.0
-                else:
-                    # mm 단위 숫자 추출
-                    numeric_value = "".join(
-                        filter(lambda x: x.isdigit() or x == ".", value)
-                    )
-                    return float(numeric_value) if numeric_value else 0.0
-
-            # 코드형 데이터는 문자열 그대로
-            else:
-                return value.strip()
+        compiled = self.COMPILED_CATEGORIES.get(category)
+        converter = compiled[1] if compiled else get_kma_value_converter(category)
 
+        try:
+            return converter(value)
         except Exception as e:
             self.logger.warning(f"날씨 값 변환 실패 [{category}: {value}]: {e}")
             return None
 
     def _get_region_code_from_grid(self, nx: int, ny: int) -> str:
         """격자 좌표에서 지역 코드 변환"""
-        # 기본적인 격자-지역 매핑 (실제로는 더 정교한 매핑이 필요)
-        grid_to_region = {
-            (60, 127): "1100000000",  # 서울
-            (98, 76): "2600000000",   # 부산
-            (89, 90): "2700000000",   # 대구
-            (55, 124): "2800000000",  # 인천
-            (67, 100): "2900000000",  # 광주
-            (68, 100): "3000000000",  # 대전
-            (102, 84): "3100000000",  # 울산
-            (52, 38): "5000000000",   # 제주
-        }
-        
         # 격자 좌표로 지역 코드 찾기
         if nx and ny:
-            region_code = grid_to_region.get((int(nx), int(ny)))
+            grid = (int(nx), int(ny))
+            region_code = self.GRID_TO_REGION.get(grid)
             if region_code:
                 return region_code
-            else:
-                # 기본 지역 코드 (서울)
-                return "1100000000"
-        
-        return "1100000000"  # 기본값
+
+            # regions 테이블 인덱스가 있으면 가장 가까운 격자의 지역 사용
+            region_index = get_region_index()
+            if region_index is not None:
+                entry, _ = region_index.nearest_by_grid(*grid)
+                if entry is not None:
+                    return entry.region_code
+
+        return "1100000000"  # 기본값 (서울)
 
 
 class DataValidatorRegistry:
@@ -894,6 +944,9 @@ class DataTransformationPipeline:
         self.logger = logging.getLogger(__name__)
         self.db_manager = get_extended_database_manager()
 
+        # 격자 → 지역 코드 조회용 공간 인덱스 (최초 1회 생성)
+        load_region_index_from_db(self.db_manager)
+
         # 변환기 등록
         self.transformers = {
             "KTO": KTODataTransformer(),
@@ -946,20 +999,56 @@ class DataTransformationPipeline:
         return value
 
     async def transform_raw_data(self, raw_data_id: str) -> TransformationResult:
-        """원본 데이터를 가공 데이터로 변환"""
+        """
+        저장된 원본 데이터를 가공 데이터로 변환
 
-        transformation_start = time.time()
+        api_raw_data 행을 다시 읽어 변환하므로 재처리(replay)나 재변환에
+        사용합니다. 방금 수집한 응답은 transform_response를 사용하세요.
+        """
 
         try:
-            # 1. 원본 데이터 로드
+            # 원본 데이터 로드
             raw_data = self.db_manager.get_raw_data(raw_data_id)
-            if not raw_data:
-                return TransformationResult.error_result(
-                    "원본 데이터를 찾을 수 없습니다"
-                )
+        except Exception as e:
+            self.logger.error(f"원본 데이터 로드 실패: {raw_data_id} - {e}")
+            return TransformationResult.error_result(str(e))
+
+        if not raw_data:
+            return TransformationResult.error_result(
+                "원본 데이터를 찾을 수 없습니다"
+            )
 
-            # 2. 적절한 변환기 선택
-            api_provider = raw_data.get("api_provider")
+        return await self.transform_response(
+            raw_data.get("api_provider"),
+            raw_data.get("endpoint", ""),
+            raw_data.get("raw_response", {}),
+            raw_data_id,
+        )
+
+    async def transform_response(
+        self,
+        api_provider: str,
+        endpoint: str,
+        payload: Dict,
+        raw_data_id: Optional[str] = None,
+    ) -> TransformationResult:
+        """
+        이미 파싱된 API 응답을 가공 데이터로 변환
+
+        Args:
+            api_provider: API 제공자 ('KTO', 'KMA')
+            endpoint: API 엔드포인트
+            payload: API 응답 데이터 (UnifiedAPIClient가 반환한 dict)
+            raw_data_id: 저장된 원본 데이터 ID (변환 로그 연결용)
+
+        Returns:
+            TransformationResult: 변환 결과
+        """
+
+        transformation_start = time.time()
+
+        try:
+            # 1. 적절한 변환기 선택
             transformer = self.transformers.get(api_provider)
 
             if not transformer:
@@ -967,16 +1056,14 @@ class DataTransformationPipeline:
                     f"지원하지 않는 API 제공자: {api_provider}"
                 )
 
-            # 3. 데이터 변환 실행
-            endpoint = raw_data.get("endpoint", "")
-            raw_response = raw_data.get("raw_response", {})
-
+            # 2. 데이터 변환 실행
+            raw_response = payload or {}
             processed_data = transformer.transform(endpoint, raw_response)
 
-            # 4. 데이터 유효성 검증
+            # 3. 데이터 유효성 검증
             validation_result = self.validators.validate(api_provider, processed_data)
 
-            # 5. 변환 로그 기록
+            # 4. 변환 로그 기록
             transformation_time_ms = int((time.time() - transformation_start) * 1000)
 
             transformation_log = {
@@ -6,8 +6,10 @@ Weather Flick 배치 시스템의 데이터 품질을 자동으로 검증하고
 
 from .data_validator import (
     DataValidator,
+    ValidationConfig,
     ValidationRule,
     ValidationResult,
+    ValidationSummary,
     ValidationSeverity,
     FieldType,
     get_data_validator
@@ -41,8 +43,10 @@ from .data_cleaner import (
 __all__ = [
     # 데이터 검증
     'DataValidator',
+    'ValidationConfig',
     'ValidationRule',
     'ValidationResult',
+    'ValidationSummary',
     'ValidationSeverity',
     'FieldType',
     'get_data_validator',
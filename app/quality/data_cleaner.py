@@ -5,13 +5,59 @@
 """
 
 import re
+import time
 import logging
-from typing import Dict, List, Any, Optional, Callable, Union
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Callable, Union, Iterable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 
 
+# 규칙/변환 함수에서 사용하는 정규식 (모듈 로드 시 1회 컴파일)
+_PHONE_SEARCH_RE = re.compile(r'\d{3,4}[-\s]?\d{3,4}[-\s]?\d{4}')
+_PHONE_FORMAT_RE = re.compile(r'^\d{2,3}-\d{3,4}-\d{4}$')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$')
+_WHITESPACE_RE = re.compile(r'\s+')
+_NON_DIGIT_RE = re.compile(r'\D')
+_DIGIT_RE = re.compile(r'\d')
+_NON_NUMERIC_RE = re.compile(r'[^\d.,]')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_DATE_LIKE_RE = re.compile(
+    r'\d{4}[/.-]\d{1,2}[/.-]\d{1,2}|\d{1,2}[/.-]\d{1,2}[/.-]\d{4}|\d{8}'
+)
+_DATE_NORMALIZE_PATTERNS = [
+    (re.compile(r'(\d{4})[/.-](\d{1,2})[/.-](\d{1,2})'), r'\1-\2-\3'),
+    (re.compile(r'(\d{1,2})[/.-](\d{1,2})[/.-](\d{4})'), r'\3-\1-\2'),
+    (re.compile(r'(\d{4})(\d{2})(\d{2})'), r'\1-\2-\3'),
+]
+_HTML_ENTITIES = {
+    '&amp;': '&',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&quot;': '"',
+    '&#39;': "'",
+    '&nbsp;': ' '
+}
+
+
+@lru_cache(maxsize=256)
+def compile_field_pattern(pattern: str) -> Callable[[str], bool]:
+    """필드 패턴을 필드명 매칭 함수로 컴파일"""
+    if pattern == "*":
+        return lambda field_name: True
+
+    if "*" in pattern:
+        # 와일드카드 패턴 변환
+        regex = re.compile(pattern.replace("*", ".*"), re.IGNORECASE)
+        return lambda field_name: bool(regex.match(field_name))
+
+    lowered = pattern.lower()
+    return lambda field_name: field_name.lower() == lowered
+
+
 class CleaningAction(Enum):
     """정리 작업 유형"""
     TRIM = "trim"                    # 공백 제거
@@ -33,6 +79,13 @@ class CleaningSeverity(Enum):
     CRITICAL = "critical"            # 치명적 (필수 수정)
 
 
+# 컬럼 정리 시 값이 바뀌지 않았음을 나타내는 표식
+_UNCHANGED = object()
+
+# 규칙 적용 순서 (낮은 심각도부터)
+_SEVERITY_ORDER = {severity: index for index, severity in enumerate(CleaningSeverity)}
+
+
 @dataclass
 class CleaningRule:
     """데이터 정리 규칙"""
@@ -77,6 +130,13 @@ class DataCleaner:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.rules: List[CleaningRule] = []
+        
+        # 필드명별 적용 규칙 캐시 (규칙 추가 시 초기화)
+        self._field_rule_cache: Dict[str, Tuple[CleaningRule, ...]] = {}
+        
+        # 마지막 clean_dataset 실행 통계
+        self.last_run_stats: Dict[str, Any] = {}
+        
         self._setup_default_rules()
     
     def _setup_default_rules(self):
@@ -104,9 +164,9 @@ class DataCleaner:
             action=CleaningAction.NORMALIZE,
             severity=CleaningSeverity.MEDIUM,
             description="전화번호 형식 정규화",
-            condition=lambda value: value and re.search(r'\d{3,4}[-\s]?\d{3,4}[-\s]?\d{4}', str(value)),
+            condition=lambda value: value and _PHONE_SEARCH_RE.search(str(value)),
             transform=self._normalize_phone_number,
-            validation=lambda value: bool(re.match(r'^\d{2,3}-\d{3,4}-\d{4}$', str(value))),
+            validation=lambda value: bool(_PHONE_FORMAT_RE.match(str(value))),
             examples=[
                 {"before": "010 1234 5678", "after": "010-1234-5678"},
                 {"before": "02)123-4567", "after": "02-123-4567"}
@@ -122,7 +182,7 @@ class DataCleaner:
             description="이메일 주소 정규화",
             condition=lambda value: value and '@' in str(value),
             transform=lambda value: str(value).lower().strip(),
-            validation=lambda value: bool(re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', str(value))),
+            validation=lambda value: bool(_EMAIL_RE.match(str(value))),
             examples=[
                 {"before": " USER@EXAMPLE.COM ", "after": "user@example.com"},
                 {"before": "Test.Email@Domain.org", "after": "test.email@domain.org"}
@@ -138,7 +198,7 @@ class DataCleaner:
             description="URL 정규화",
             condition=lambda value: value and ('http' in str(value) or 'www.' in str(value)),
             transform=self._normalize_url,
-            validation=lambda value: bool(re.match(r'^https?://[^\s/$.?#].[^\s]*$', str(value))),
+            validation=lambda value: bool(_URL_RE.match(str(value))),
             examples=[
                 {"before": "www.example.com", "after": "http://www.example.com"},
                 {"before": "HTTPS://EXAMPLE.COM/", "after": "https://example.com"}
@@ -215,7 +275,7 @@ class DataCleaner:
             severity=CleaningSeverity.LOW,
             description="중복 공백을 단일 공백으로 변환",
             condition=lambda value: isinstance(value, str) and '  ' in value,
-            transform=lambda value: re.sub(r'\s+', ' ', str(value)),
+            transform=lambda value: _WHITESPACE_RE.sub(' ', str(value)),
             examples=[
                 {"before": "hello    world", "after": "hello world"},
                 {"before": "text\t\twith\n\ntabs", "after": "text with tabs"}
@@ -241,6 +301,7 @@ class DataCleaner:
     def add_rule(self, rule: CleaningRule):
         """정리 규칙 추가"""
         self.rules.append(rule)
+        self._field_rule_cache.clear()
         self.logger.debug(f"정리 규칙 추가: {rule.name}")
     
     def clean_record(self, record: Dict[str, Any], record_id: Optional[str] = None) -> AutoFixResult:
@@ -275,13 +336,17 @@ class DataCleaner:
     def clean_field(self, field_name: str, value: Any) -> List[CleaningResult]:
         """단일 필드 정리"""
         
+        # 해당 필드에 적용할 규칙들 찾기
+        return self._apply_rules(field_name, value, self._find_applicable_rules(field_name))
+    
+    def _apply_rules(self, field_name: str, value: Any,
+                     rules: Iterable[CleaningRule]) -> List[CleaningResult]:
+        """필드 값에 규칙들을 순서대로 적용"""
+        
         results = []
         current_value = value
         
-        # 해당 필드에 적용할 규칙들 찾기
-        applicable_rules = self._find_applicable_rules(field_name)
-        
-        for rule in applicable_rules:
+        for rule in rules:
             try:
                 if rule.condition(current_value):
                     original_value = current_value
@@ -329,51 +394,145 @@ class DataCleaner:
         return results
     
     def clean_dataset(self, dataset: List[Dict[str, Any]], id_field: str = "id") -> List[AutoFixResult]:
-        """데이터셋 정리"""
+        """데이터셋 정리 (컬럼 단위)
+        
+        필드별 규칙 묶음을 한 번만 구한 뒤 컬럼 단위로 정리합니다.
+        같은 컬럼에서 같은 값은 한 번만 정리하고 결과를 재사용하므로
+        규칙의 조건/변환 함수는 값에 대해 결정적이어야 하며,
+        같은 값을 가진 레코드들은 CleaningResult 객체를 공유합니다 (읽기 전용).
+        결과는 레코드별 clean_record 호출과 동일합니다.
+        """
         
         self.logger.info(f"데이터셋 정리 시작: {len(dataset)}개 레코드")
+        started_at = time.perf_counter()
+        
+        # 1. 필드별 정리 계획 (등장 순서 유지)
+        field_names = dict.fromkeys(name for record in dataset for name in record)
+        plan = self.compile_cleaning_plan(field_names)
         
+        # 2. 컬럼 단위 정리: 필드별로 레코드 인덱스 → (정리 결과, 최종 값, 성공 수)
+        column_outcomes: Dict[str, List[Optional[Tuple[List[CleaningResult], Any, int]]]] = {}
+        for field_name, rules in plan.items():
+            column_outcomes[field_name] = self._clean_column(
+                field_name, rules, (record.get(field_name) for record in dataset), len(dataset)
+            )
+        
+        # 3. 레코드 단위 결과 조립 (레코드의 필드 순서 유지)
         results = []
-        for i, record in enumerate(dataset):
-            record_id = record.get(id_field, f"record_{i}")
-            result = self.clean_record(record, str(record_id))
-            results.append(result)
+        total_success = 0
+        total_errors = 0
         
-        total_success = sum(r.success_count for r in results)
-        total_errors = sum(r.error_count for r in results)
+        for i, record in enumerate(dataset):
+            cleaned_record = record.copy()
+            cleaning_results = []
+            success_count = 0
+            error_count = 0
+            
+            for field_name in record:
+                outcome = column_outcomes[field_name][i]
+                if outcome is None:
+                    continue
+                
+                field_results, cleaned_value, field_success = outcome
+                cleaning_results.extend(field_results)
+                success_count += field_success
+                error_count += len(field_results) - field_success
+                
+                if cleaned_value is not _UNCHANGED:
+                    cleaned_record[field_name] = cleaned_value
+            
+            total_success += success_count
+            total_errors += error_count
+            results.append(AutoFixResult(
+                original_record=record,
+                cleaned_record=cleaned_record,
+                cleaning_results=cleaning_results,
+                success_count=success_count,
+                error_count=error_count,
+                record_id=str(record.get(id_field, f"record_{i}"))
+            ))
+        
+        elapsed = time.perf_counter() - started_at
+        self.last_run_stats = {
+            "records": len(dataset),
+            "fields": len(plan),
+            "cells": sum(len(record) for record in dataset),
+            "success_count": total_success,
+            "error_count": total_errors,
+            "elapsed_seconds": elapsed,
+            "records_per_second": len(dataset) / elapsed if elapsed > 0 else 0.0,
+        }
         
         self.logger.info(
-            f"데이터셋 정리 완료: {total_success}개 성공, {total_errors}개 오류"
+            f"데이터셋 정리 완료: {total_success}개 성공, {total_errors}개 오류 "
+            f"({elapsed:.2f}초, {self.last_run_stats['records_per_second']:,.0f} 레코드/초)"
         )
         
         return results
     
-    def _find_applicable_rules(self, field_name: str) -> List[CleaningRule]:
-        """필드에 적용할 수 있는 규칙들 찾기"""
+    def _clean_column(self, field_name: str, rules: Tuple[CleaningRule, ...],
+                      values: Iterable[Any], size: int) -> List[Optional[Tuple[List[CleaningResult], Any, int]]]:
+        """한 컬럼의 값들을 정리 (같은 값은 한 번만 정리)"""
+        
+        outcomes: List[Optional[Tuple[List[CleaningResult], Any, int]]] = [None] * size
+        if not rules:
+            return outcomes
+        
+        memo: Dict[Any, Optional[Tuple[List[CleaningResult], Any, int]]] = {}
+        
+        for i, value in enumerate(values):
+            # 1 / 1.0 / True처럼 같은 해시의 다른 타입이 섞이지 않도록 타입 포함
+            try:
+                key = (value.__class__, value)
+                outcome = memo.get(key, _UNCHANGED)
+            except TypeError:  # dict/list 등 해시 불가 값
+                key = None
+                outcome = _UNCHANGED
+            
+            if outcome is _UNCHANGED:
+                field_results = self._apply_rules(field_name, value, rules)
+                outcome = None
+                if field_results:
+                    cleaned_value = _UNCHANGED
+                    field_success = 0
+                    for result in field_results:
+                        if result.success:
+                            cleaned_value = result.cleaned_value
+                            field_success += 1
+                    outcome = (field_results, cleaned_value, field_success)
+                if key is not None:
+                    memo[key] = outcome
+            
+            outcomes[i] = outcome
+        
+        return outcomes
+    
+    def compile_cleaning_plan(self, field_names: Iterable[str]) -> Dict[str, Tuple[CleaningRule, ...]]:
+        """필드명별 적용 규칙 계획 생성"""
+        return {field_name: self._find_applicable_rules(field_name) for field_name in field_names}
+    
+    def _find_applicable_rules(self, field_name: str) -> Tuple[CleaningRule, ...]:
+        """필드에 적용할 수 있는 규칙들 찾기 (필드명별 캐시)"""
         
-        applicable_rules = []
+        cached = self._field_rule_cache.get(field_name)
+        if cached is not None:
+            return cached
         
-        for rule in self.rules:
-            if self._field_matches_pattern(field_name, rule.field_pattern):
-                applicable_rules.append(rule)
+        applicable_rules = [
+            rule for rule in self.rules
+            if self._field_matches_pattern(field_name, rule.field_pattern)
+        ]
         
         # 심각도 순으로 정렬 (낮은 것부터)
-        applicable_rules.sort(key=lambda r: list(CleaningSeverity).index(r.severity))
+        applicable_rules.sort(key=lambda r: _SEVERITY_ORDER[r.severity])
         
-        return applicable_rules
+        cached = tuple(applicable_rules)
+        self._field_rule_cache[field_name] = cached
+        return cached
     
     def _field_matches_pattern(self, field_name: str, pattern: str) -> bool:
         """필드명이 패턴과 일치하는지 확인"""
-        
-        if pattern == "*":
-            return True
-        
-        if "*" in pattern:
-            # 와일드카드 패턴 변환
-            regex_pattern = pattern.replace("*", ".*")
-            return bool(re.match(regex_pattern, field_name, re.IGNORECASE))
-        else:
-            return field_name.lower() == pattern.lower()
+        return compile_field_pattern(pattern)(field_name)
     
     # ========== 변환 함수들 ==========
     
@@ -383,7 +542,7 @@ class DataCleaner:
             return phone
         
         # 숫자만 추출
-        digits = re.sub(r'\D', '', str(phone))
+        digits = _NON_DIGIT_RE.sub('', str(phone))
         
         # 한국 번호 형식으로 변환
         if digits.startswith('82'):
@@ -429,16 +588,10 @@ class DataCleaner:
         date_str = str(date_str).strip()
         
         # 다양한 날짜 형식 시도
-        patterns = [
-            (r'(\d{4})[/.-](\d{1,2})[/.-](\d{1,2})', r'\1-\2-\3'),
-            (r'(\d{1,2})[/.-](\d{1,2})[/.-](\d{4})', r'\3-\1-\2'),
-            (r'(\d{4})(\d{2})(\d{2})', r'\1-\2-\3'),
-        ]
-        
-        for pattern, replacement in patterns:
-            match = re.match(pattern, date_str)
+        for pattern, replacement in _DATE_NORMALIZE_PATTERNS:
+            match = pattern.match(date_str)
             if match:
-                normalized = re.sub(pattern, replacement, date_str)
+                normalized = pattern.sub(replacement, date_str)
                 # 월/일이 한 자리인 경우 0 패딩
                 parts = normalized.split('-')
                 if len(parts) == 3:
@@ -453,19 +606,10 @@ class DataCleaner:
             return text
         
         # HTML 태그 제거
-        clean_text = re.sub(r'<[^>]+>', '', str(text))
+        clean_text = _HTML_TAG_RE.sub('', str(text))
         
         # HTML 엔티티 변환
-        html_entities = {
-            '&amp;': '&',
-            '&lt;': '<',
-            '&gt;': '>',
-            '&quot;': '"',
-            '&#39;': "'",
-            '&nbsp;': ' '
-        }
-        
-        for entity, char in html_entities.items():
+        for entity, char in _HTML_ENTITIES.items():
             clean_text = clean_text.replace(entity, char)
         
         return clean_text.strip()
@@ -478,7 +622,7 @@ class DataCleaner:
         text = str(value)
         
         # 숫자와 소수점, 쉼표만 추출
-        numeric_text = re.sub(r'[^\d.,]', '', text)
+        numeric_text = _NON_NUMERIC_RE.sub('', text)
         
         if not numeric_text:
             return value
@@ -506,23 +650,16 @@ class DataCleaner:
     
     def _contains_numeric(self, value: Any) -> bool:
         """숫자를 포함하는지 확인"""
-        return bool(re.search(r'\d', str(value)))
+        return bool(_DIGIT_RE.search(str(value)))
     
     def _looks_like_date(self, value: Any) -> bool:
         """날짜처럼 보이는지 확인"""
-        date_patterns = [
-            r'\d{4}[/.-]\d{1,2}[/.-]\d{1,2}',
-            r'\d{1,2}[/.-]\d{1,2}[/.-]\d{4}',
-            r'\d{8}',
-        ]
-        
-        text = str(value)
-        return any(re.search(pattern, text) for pattern in date_patterns)
+        return bool(_DATE_LIKE_RE.search(str(value)))
     
     def _is_valid_date_format(self, value: str) -> bool:
         """유효한 날짜 형식인지 확인"""
         try:
-            if re.match(r'\d{4}-\d{2}-\d{2}', str(value)):
+            if _ISO_DATE_RE.match(str(value)):
                 year, month, day = map(int, str(value).split('-'))
                 datetime(year, month, day)
                 return True
@@ -6,13 +6,76 @@
 
 import re
 import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, date
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 
 
+# 날짜 형식 검증에 사용하는 형식 목록
+DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%Y/%m/%d',
+    '%Y.%m.%d',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y/%m/%d %H:%M:%S'
+)
+
+
+DATE_CACHE_SIZE = 4096
+
+
+def make_date_validator(formats: Tuple[str, ...] = DATE_FORMATS) -> Callable[[Any], bool]:
+    """날짜 유효성 검증 함수 생성
+
+    마지막으로 일치한 형식을 먼저 시도하므로, 같은 컬럼의 값은
+    대부분 첫 번째 시도에서 판별됩니다 (컬럼마다 하나씩 생성해 사용).
+    반복되는 문자열은 판별 결과를 재사용합니다.
+    """
+    order = list(formats)
+    cache: Dict[str, bool] = {}
+
+    def parse(date_str: str) -> bool:
+        for index, date_format in enumerate(order):
+            try:
+                datetime.strptime(date_str, date_format)
+            except ValueError:
+                continue
+
+            if index:
+                order.insert(0, order.pop(index))
+            return True
+
+        return False
+
+    def is_valid_date(value: Any) -> bool:
+        if not value:
+            return True
+
+        try:
+            if isinstance(value, (date, datetime)):
+                return True
+
+            date_str = str(value)
+
+            is_valid = cache.get(date_str)
+            if is_valid is None:
+                if len(cache) >= DATE_CACHE_SIZE:
+                    cache.clear()
+                is_valid = cache[date_str] = parse(date_str)
+
+            return is_valid
+
+        except Exception:
+            return False
+
+    return is_valid_date
+
+
 class ValidationSeverity(Enum):
     """검증 심각도"""
     INFO = "info"
@@ -47,6 +110,8 @@ class ValidationRule:
     error_message: str
     fix_suggestion: Optional[str] = None
     auto_fix: Optional[Callable[[Any], Any]] = None
+    # 컬럼별 검증 함수 생성기 (컬럼 단위 상태가 필요한 규칙용, 없으면 validator 사용)
+    column_validator: Optional[Callable[[], Callable[[Any], bool]]] = None
 
 
 @dataclass
@@ -75,13 +140,40 @@ class ValidationSummary:
     errors_by_rule: Dict[str, int] = field(default_factory=dict)
 
 
+@dataclass
+class ValidationConfig:
+    """데이터셋 검증 실행 설정"""
+    chunk_size: int = 5000                    # 청크당 레코드 수
+    process_workers: int = 0                  # 프로세스 풀 워커 수 (0 이하: 사용 안 함)
+    min_records_for_processes: int = 50000    # 프로세스 풀을 사용할 최소 레코드 수
+
+
+# 프로세스 풀 워커가 fork 시 물려받는 검증기와 데이터셋 (규칙의 lambda는 pickle 불가)
+_worker_validator: Optional["DataValidator"] = None
+_worker_dataset: Optional[List[Dict[str, Any]]] = None
+_worker_lock = threading.Lock()
+
+
+def _validate_chunk_in_worker(offset: int, chunk_size: int,
+                              id_field: str) -> Tuple[List["ValidationResult"], int]:
+    """프로세스 풀 워커에서 청크 검증"""
+    records = _worker_dataset[offset:offset + chunk_size]
+    return _worker_validator._validate_chunk(records, offset, id_field)
+
+
 class DataValidator:
     """데이터 검증기"""
     
-    def __init__(self):
+    def __init__(self, config: Optional[ValidationConfig] = None):
+        self.config = config or ValidationConfig()
         self.logger = logging.getLogger(__name__)
         self.rules: Dict[str, List[ValidationRule]] = {}
         self.field_types: Dict[str, FieldType] = {}
+        
+        # 필드명별 컴파일된 검증 함수 (규칙 추가 시 초기화)
+        self._field_validators: Dict[str, Callable[[Any, Optional[str]], List[ValidationResult]]] = {}
+        self._date_validator = make_date_validator()
+        
         self._setup_default_rules()
     
     def _setup_default_rules(self):
@@ -197,7 +289,8 @@ class DataValidator:
             description="날짜 형식 확인",
             validator=lambda value: self._is_valid_date(value),
             error_message="올바르지 않은 날짜 형식입니다.",
-            fix_suggestion="YYYY-MM-DD 형식으로 입력하세요."
+            fix_suggestion="YYYY-MM-DD 형식으로 입력하세요.",
+            column_validator=make_date_validator
         ))
         
         # JSON 형식 규칙
@@ -216,6 +309,7 @@ class DataValidator:
         if rule.field_name not in self.rules:
             self.rules[rule.field_name] = []
         self.rules[rule.field_name].append(rule)
+        self._field_validators.clear()
         self.logger.debug(f"검증 규칙 추가: {rule.field_name} - {rule.rule_type}")
     
     def add_field_type(self, field_name: str, field_type: FieldType):
@@ -227,10 +321,12 @@ class DataValidator:
         """단일 레코드 검증"""
         results = []
         
+        field_validators = self._field_validators
+        
         try:
             for field_name, value in record.items():
-                field_results = self.validate_field(field_name, value, record_id)
-                results.extend(field_results)
+                validate = field_validators.get(field_name) or self._get_field_validator(field_name)
+                results.extend(validate(value, record_id))
         except Exception as e:
             self.logger.error(f"레코드 검증 오류: {e}")
             results.append(ValidationResult(
@@ -247,39 +343,43 @@ class DataValidator:
     
     def validate_field(self, field_name: str, value: Any, record_id: Optional[str] = None) -> List[ValidationResult]:
         """단일 필드 검증"""
-        results = []
-        
-        # 해당 필드에 적용할 규칙들 수집
-        applicable_rules = []
-        
-        # 정확한 필드명 매칭
-        if field_name in self.rules:
-            applicable_rules.extend(self.rules[field_name])
-        
-        # 와일드카드 매칭
-        for rule_field, rules in self.rules.items():
-            if rule_field == "*":
-                applicable_rules.extend(rules)
-            elif "*" in rule_field:
-                pattern = rule_field.replace("*", ".*")
-                if re.match(pattern, field_name, re.IGNORECASE):
-                    applicable_rules.extend(rules)
-        
-        # 각 규칙 적용
-        for rule in applicable_rules:
-            try:
-                is_valid = rule.validator(value)
-                
-                if not is_valid:
+        return self._get_field_validator(field_name)(value, record_id)
+    
+    def _get_field_validator(self, field_name: str) -> Callable[[Any, Optional[str]], List[ValidationResult]]:
+        """필드명별 컴파일된 검증 함수 반환 (최초 1회 컴파일)"""
+        validator = self._field_validators.get(field_name)
+        if validator is None:
+            validator = self._compile_field_validator(field_name)
+            self._field_validators[field_name] = validator
+        return validator
+    
+    def _compile_field_validator(self, field_name: str) -> Callable[[Any, Optional[str]], List[ValidationResult]]:
+        """필드에 적용할 규칙들을 하나의 검증 함수로 컴파일"""
+        
+        # 해당 필드에 적용할 규칙들과 검증 함수 (컬럼별 상태가 필요한 규칙은 새로 생성)
+        checks = [
+            (rule, rule.column_validator() if rule.column_validator else rule.validator)
+            for rule in self.get_field_specific_rules(field_name)
+        ]
+        logger = self.logger
+        
+        def validate(value: Any, record_id: Optional[str] = None) -> List[ValidationResult]:
+            results = []
+            
+            for rule, rule_validator in checks:
+                try:
+                    if rule_validator(value):
+                        continue
+                    
                     # 자동 수정 시도
                     auto_fixed_value = None
                     if rule.auto_fix:
                         try:
                             auto_fixed_value = rule.auto_fix(value)
                         except Exception as e:
-                            self.logger.warning(f"자동 수정 실패 ({field_name}): {e}")
+                            logger.warning(f"자동 수정 실패 ({field_name}): {e}")
                     
-                    result = ValidationResult(
+                    results.append(ValidationResult(
                         field_name=field_name,
                         rule_type=rule.rule_type,
                         severity=rule.severity,
@@ -289,38 +389,47 @@ class DataValidator:
                         suggested_fix=rule.fix_suggestion,
                         auto_fixed_value=auto_fixed_value,
                         record_id=record_id
-                    )
-                    results.append(result)
-                
-            except Exception as e:
-                self.logger.error(f"규칙 검증 오류 ({field_name}, {rule.rule_type}): {e}")
-                results.append(ValidationResult(
-                    field_name=field_name,
-                    rule_type=rule.rule_type,
-                    severity=ValidationSeverity.CRITICAL,
-                    is_valid=False,
-                    error_message=f"검증 규칙 실행 오류: {e}",
-                    original_value=value,
-                    record_id=record_id
-                ))
+                    ))
+                    
+                except Exception as e:
+                    logger.error(f"규칙 검증 오류 ({field_name}, {rule.rule_type}): {e}")
+                    results.append(ValidationResult(
+                        field_name=field_name,
+                        rule_type=rule.rule_type,
+                        severity=ValidationSeverity.CRITICAL,
+                        is_valid=False,
+                        error_message=f"검증 규칙 실행 오류: {e}",
+                        original_value=value,
+                        record_id=record_id
+                    ))
+            
+            return results
         
-        return results
+        return validate
     
     def validate_dataset(self, dataset: List[Dict[str, Any]], id_field: str = "id") -> tuple[List[ValidationResult], ValidationSummary]:
-        """데이터셋 전체 검증"""
-        all_results = []
-        valid_records = 0
+        """데이터셋 전체 검증 (청크 단위, 대용량은 프로세스 풀 선택 사용)"""
         
         self.logger.info(f"데이터셋 검증 시작: {len(dataset)}개 레코드")
         
-        for i, record in enumerate(dataset):
-            record_id = record.get(id_field, f"record_{i}")
-            record_results = self.validate_record(record, str(record_id))
-            
-            if not record_results or all(r.is_valid for r in record_results):
-                valid_records += 1
-            
-            all_results.extend(record_results)
+        chunk_size = max(1, self.config.chunk_size)
+        offsets = range(0, len(dataset), chunk_size)
+        
+        chunk_outputs = None
+        if self._should_use_processes(len(dataset)):
+            chunk_outputs = self._validate_chunks_in_processes(dataset, offsets, chunk_size, id_field)
+        
+        if chunk_outputs is None:
+            chunk_outputs = [
+                self._validate_chunk(dataset[offset:offset + chunk_size], offset, id_field)
+                for offset in offsets
+            ]
+        
+        all_results = []
+        valid_records = 0
+        for chunk_results, chunk_valid in chunk_outputs:
+            all_results.extend(chunk_results)
+            valid_records += chunk_valid
         
         # 요약 통계 생성
         summary = self._create_summary(dataset, all_results, valid_records)
@@ -332,6 +441,60 @@ class DataValidator:
         
         return all_results, summary
     
+    def _validate_chunk(self, records: List[Dict[str, Any]], offset: int,
+                        id_field: str) -> Tuple[List[ValidationResult], int]:
+        """레코드 청크 검증 (검증 결과, 유효 레코드 수)"""
+        results = []
+        valid_records = 0
+        
+        for i, record in enumerate(records, offset):
+            record_id = record.get(id_field, f"record_{i}")
+            record_results = self.validate_record(record, str(record_id))
+            
+            if not record_results or all(r.is_valid for r in record_results):
+                valid_records += 1
+            
+            results.extend(record_results)
+        
+        return results, valid_records
+    
+    def _should_use_processes(self, record_count: int) -> bool:
+        """프로세스 풀 사용 여부"""
+        return (
+            self.config.process_workers > 1
+            and record_count >= self.config.min_records_for_processes
+            and "fork" in multiprocessing.get_all_start_methods()
+        )
+    
+    def _validate_chunks_in_processes(self, dataset: List[Dict[str, Any]], offsets: range,
+                                      chunk_size: int, id_field: str) -> Optional[List[Tuple[List[ValidationResult], int]]]:
+        """프로세스 풀에서 청크 검증 (실패 시 None 반환 → 순차 검증)
+        
+        검증 규칙은 pickle할 수 없으므로 fork로 검증기와 데이터셋을 물려받은
+        워커에 청크 위치만 전달하고 검증 결과만 돌려받습니다.
+        """
+        global _worker_validator, _worker_dataset
+        
+        with _worker_lock:
+            _worker_validator = self
+            _worker_dataset = dataset
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=self.config.process_workers,
+                    mp_context=multiprocessing.get_context("fork")
+                ) as pool:
+                    futures = [
+                        pool.submit(_validate_chunk_in_worker, offset, chunk_size, id_field)
+                        for offset in offsets
+                    ]
+                    return [future.result() for future in futures]
+            except Exception as e:
+                self.logger.warning(f"프로세스 풀 검증 실패, 순차 검증으로 전환: {e}")
+                return None
+            finally:
+                _worker_validator = None
+                _worker_dataset = None
+    
     def _create_summary(self, dataset: List[Dict[str, Any]], results: List[ValidationResult], valid_records: int) -> ValidationSummary:
         """검증 요약 생성"""
         
@@ -385,36 +548,7 @@ class DataValidator:
     
     def _is_valid_date(self, value: Any) -> bool:
         """날짜 유효성 확인"""
-        if not value:
-            return True
-        
-        try:
-            if isinstance(value, (date, datetime)):
-                return True
-            
-            # 문자열 날짜 파싱 시도
-            date_str = str(value)
-            
-            # 다양한 날짜 형식 시도
-            date_formats = [
-                '%Y-%m-%d',
-                '%Y/%m/%d',
-                '%Y.%m.%d',
-                '%Y-%m-%d %H:%M:%S',
-                '%Y/%m/%d %H:%M:%S'
-            ]
-            
-            for date_format in date_formats:
-                try:
-                    datetime.strptime(date_str, date_format)
-                    return True
-                except ValueError:
-                    continue
-            
-            return False
-            
-        except Exception:
-            return False
+        return self._date_validator(value)
     
     def _is_valid_json(self, value: Any) -> bool:
         """JSON 유효성 확인"""
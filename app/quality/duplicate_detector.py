@@ -6,12 +6,20 @@
 
 import hashlib
 import logging
-from typing import Dict, List, Any, Tuple
+import random
+import zlib
+from typing import Dict, List, Any, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 from collections import defaultdict
 
+import numpy as np
+
+
+# MinHash 해시 연산용 메르센 소수
+_MINHASH_PRIME = (1 << 31) - 1
+
 
 class DuplicateStrategy(Enum):
     """중복 처리 전략"""
@@ -44,6 +52,15 @@ class DuplicateConfig:
     
     # 유사성 임계값
     similarity_threshold: float = 0.9
+
+    # 유사 중복 후보 생성 (블로킹 + MinHash/LSH)
+    use_candidate_generation: bool = True
+    blocking_fields: List[str] = field(default_factory=lambda: ["region_code", "category_code"])
+    candidate_fields: List[str] = field(default_factory=list)  # 비어 있으면 전체 필드 사용
+    ngram_size: int = 2                # 문자 n-gram 크기 (한글은 2-gram이 적합)
+    lsh_bands: int = 16                # LSH 밴드 수
+    lsh_rows: int = 4                  # 밴드당 해시 수 (근사 임계값 ≈ (1/bands)^(1/rows))
+    lsh_min_block_size: int = 50       # 이보다 작은 블록은 블록 내 전체 비교
     
     # 품질 평가 기준 (KEEP_BEST 전략용)
     quality_fields: List[str] = field(default_factory=list)
@@ -191,6 +208,11 @@ class DuplicateDetector:
     def _detect_fuzzy_duplicates(self, dataset: List[Dict[str, Any]]) -> List[DuplicateGroup]:
         """유사 일치 중복 감지"""
         
+        if self.config.use_candidate_generation:
+            candidates = self._generate_candidate_pairs(dataset)
+        else:
+            candidates = None
+        
         duplicate_groups = []
         processed_indices = set()
         group_id = 0
@@ -202,10 +224,16 @@ class DuplicateDetector:
             similar_records = [(i, record1)]
             current_group_indices = {i}
             
-            for j, record2 in enumerate(dataset[i+1:], i+1):
+            if candidates is None:
+                compare_indices = range(i + 1, len(dataset))
+            else:
+                compare_indices = sorted(candidates.get(i, ()))
+            
+            for j in compare_indices:
                 if j in processed_indices:
                     continue
                 
+                record2 = dataset[j]
                 similarity = self._calculate_similarity(record1, record2)
                 if similarity >= self.config.similarity_threshold:
                     similar_records.append((j, record2))
@@ -227,6 +255,103 @@ class DuplicateDetector:
         
         return duplicate_groups
     
+    def _generate_candidate_pairs(self, dataset: List[Dict[str, Any]]) -> Dict[int, Set[int]]:
+        """
+        유사 중복 후보 쌍 생성
+        
+        blocking_fields 값이 같은 레코드끼리만 비교하고, 큰 블록은
+        MinHash/LSH 밴드가 하나 이상 일치하는 쌍만 후보로 남깁니다.
+        
+        Returns:
+            Dict[int, Set[int]]: 레코드 인덱스별 뒤쪽 후보 인덱스 집합
+        """
+        
+        blocks = defaultdict(list)
+        for i, record in enumerate(dataset):
+            block_key = tuple(str(record.get(field)) for field in self.config.blocking_fields)
+            blocks[block_key].append(i)
+        
+        candidates = defaultdict(set)
+        hash_params = self._minhash_parameters()
+        
+        for block_indices in blocks.values():
+            if len(block_indices) < 2:
+                continue
+            
+            if len(block_indices) < self.config.lsh_min_block_size:
+                for pos, i in enumerate(block_indices):
+                    candidates[i].update(block_indices[pos + 1:])
+                continue
+            
+            buckets = defaultdict(list)
+            for i in block_indices:
+                signature = self._calculate_minhash_signature(dataset[i], hash_params)
+                for band in range(self.config.lsh_bands):
+                    band_slice = signature[band * self.config.lsh_rows:(band + 1) * self.config.lsh_rows]
+                    buckets[(band, band_slice.tobytes())].append(i)
+            
+            for bucket_indices in buckets.values():
+                for pos, i in enumerate(bucket_indices):
+                    candidates[i].update(bucket_indices[pos + 1:])
+        
+        candidate_count = sum(len(pairs) for pairs in candidates.values())
+        self.logger.debug(
+            f"유사 중복 후보 생성: {len(blocks)}개 블록, {candidate_count}개 후보 쌍 "
+            f"(전체 비교 시 {len(dataset) * (len(dataset) - 1) // 2}개)"
+        )
+        
+        return candidates
+    
+    def _minhash_parameters(self) -> Tuple[np.ndarray, np.ndarray]:
+        """MinHash 해시 함수 계수 생성 (실행마다 동일한 시드 사용)"""
+        num_hashes = self.config.lsh_bands * self.config.lsh_rows
+        rng = random.Random(42)
+        a = np.array([rng.randint(1, _MINHASH_PRIME - 1) for _ in range(num_hashes)], dtype=np.uint64)
+        b = np.array([rng.randint(0, _MINHASH_PRIME - 1) for _ in range(num_hashes)], dtype=np.uint64)
+        return a, b
+    
+    def _calculate_minhash_signature(self, record: Dict[str, Any],
+                                     hash_params: Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+        """레코드의 MinHash 서명 계산"""
+        
+        a, b = hash_params
+        shingles = self._extract_shingles(record)
+        if not shingles:
+            return np.full(len(a), _MINHASH_PRIME, dtype=np.uint64)
+        
+        shingle_hashes = np.array(
+            [zlib.crc32(shingle.encode('utf-8')) for shingle in shingles], dtype=np.uint64
+        )
+        hashed = (np.outer(a, shingle_hashes) + b[:, None]) % _MINHASH_PRIME
+        return hashed.min(axis=1)
+    
+    def _extract_shingles(self, record: Dict[str, Any]) -> Set[str]:
+        """레코드를 필드별 문자 n-gram 집합으로 변환"""
+        
+        filtered_record = self._filter_record(record)
+        fields = self.config.candidate_fields or [
+            field for field in filtered_record if field not in self.config.blocking_fields
+        ]
+        
+        shingles = set()
+        n = self.config.ngram_size
+        
+        for field in fields:
+            value = filtered_record.get(field)
+            if value is None:
+                continue
+            
+            if isinstance(value, str):
+                text = "".join(value.lower().split())
+                if len(text) <= n:
+                    shingles.add(f"{field}:{text}")
+                else:
+                    shingles.update(f"{field}:{text[k:k + n]}" for k in range(len(text) - n + 1))
+            else:
+                shingles.add(f"{field}={value}")
+        
+        return shingles
+    
     def _apply_strategy(self, dataset: List[Dict[str, Any]], duplicate_groups: List[DuplicateGroup]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
         """중복 처리 전략 적용"""
         
@@ -11,7 +11,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 import json
 
-from .data_validator import DataValidator, ValidationResult, ValidationSeverity
+from .data_validator import DataValidator, ValidationConfig, ValidationResult, ValidationSeverity
 from .duplicate_detector import DuplicateDetector, DuplicateConfig, DuplicateResult, DuplicateStrategy
 from .data_cleaner import DataCleaner, AutoFixResult
 
@@ -45,6 +45,9 @@ class QualityConfig:
     max_warning_rate: float = 0.20      # 최대 경고율 (20%)
     min_completeness: float = 0.95      # 최소 완성도 (95%)
     
+    # 검증 실행 설정 (청크/프로세스 풀)
+    validation_config: ValidationConfig = field(default_factory=ValidationConfig)
+    
     # 중복 감지 설정
     duplicate_config: DuplicateConfig = field(default_factory=lambda: DuplicateConfig(
         strategy=DuplicateStrategy.KEEP_FIRST
@@ -90,6 +93,7 @@ class QualityMetrics:
     cleaned_fields: int = 0
     auto_fixes: int = 0
     clean_success_rate: float = 0.0
+    clean_records_per_second: float = 0.0
     
     # 완성도 통계
     completeness: float = 0.0
@@ -135,7 +139,7 @@ class DataQualityEngine:
         self.logger = logging.getLogger(__name__)
         
         # 컴포넌트 초기화
-        self.validator = DataValidator()
+        self.validator = DataValidator(self.config.validation_config)
         self.duplicate_detector = DuplicateDetector(self.config.duplicate_config)
         self.cleaner = DataCleaner()
         
@@ -226,7 +230,12 @@ class DataQualityEngine:
             if total_cleanings > 0:
                 report.metrics.clean_success_rate = report.metrics.auto_fixes / total_cleanings
             
-            self.logger.info(f"데이터 정리 완료: {report.metrics.auto_fixes}개 자동 수정")
+            report.metrics.clean_records_per_second = self.cleaner.last_run_stats.get("records_per_second", 0.0)
+            
+            self.logger.info(
+                f"데이터 정리 완료: {report.metrics.auto_fixes}개 자동 수정 "
+                f"({report.metrics.clean_records_per_second:,.0f} 레코드/초)"
+            )
             
             return cleaned_dataset, report
             
@@ -537,6 +546,7 @@ class DataQualityEngine:
                 "completeness": report.metrics.completeness,
                 "quality_score": report.metrics.quality_score,
                 "quality_status": report.metrics.quality_status.value,
+                "clean_records_per_second": report.metrics.clean_records_per_second,
                 "field_completeness": report.metrics.field_completeness
             },
             "error_summary": report.error_summary,
@@ -213,40 +213,23 @@ def get_additional_stations():
     return ADDITIONAL_KMA_STATIONS
 
 def convert_kma_grid_to_wgs84(nx: int, ny: int) -> tuple:
-    """기상청 격자 좌표를 WGS84로 변환 (근사치)"""
-    # 기존 매핑 테이블에서 가장 가까운 좌표 찾기
-    min_distance = float('inf')
-    closest_coords = (0.0, 0.0)
-    
-    for region_data in KMA_REGION_COORDINATES.values():
-        grid_distance = ((nx - region_data["nx"]) ** 2 + (ny - region_data["ny"]) ** 2) ** 0.5
-        if grid_distance < min_distance:
-            min_distance = grid_distance
-            closest_coords = (region_data["latitude"], region_data["longitude"])
-    
-    return closest_coords
+    """기상청 격자 좌표를 WGS84로 변환 (격자 중심 좌표)"""
+    from app.services.region_spatial_index import convert_kma_grid_to_wgs84 as _convert
+    return _convert(nx, ny)
+
+def convert_wgs84_to_kma_grid(lat: float, lon: float) -> tuple:
+    """WGS84 좌표를 기상청 격자 좌표로 변환"""
+    from app.services.region_spatial_index import convert_wgs84_to_kma_grid as _convert
+    return _convert(lat, lon)
 
 def get_region_by_coordinates(lat: float, lon: float, threshold: float = 0.5):
-    """좌표로 가장 가까운 지역 찾기"""
-    min_distance = float('inf')
-    closest_region = None
-    
-    # 메인 지역 검색
-    for region_name, data in KMA_REGION_COORDINATES.items():
-        distance = ((lat - data["latitude"]) ** 2 + (lon - data["longitude"]) ** 2) ** 0.5
-        if distance < min_distance:
-            min_distance = distance
-            closest_region = region_name
+    """좌표로 가장 가까운 지역 찾기 (메인 지역 및 추가 관측소)"""
+    from app.services.region_spatial_index import KMA_STATIC_INDEX
     
-    # 추가 관측소 검색
-    for station_name, data in ADDITIONAL_KMA_STATIONS.items():
-        distance = ((lat - data["latitude"]) ** 2 + (lon - data["longitude"]) ** 2) ** 0.5
-        if distance < min_distance:
-            min_distance = distance
-            closest_region = station_name
+    entry, min_distance = KMA_STATIC_INDEX.nearest(lat, lon)
     
     # 임계값 내에 있는 경우만 반환
-    if min_distance <= threshold:
-        return closest_region, min_distance
+    if entry is not None and min_distance <= threshold:
+        return entry.name, min_distance
     
-    return None, min_distance
\ No newline at end of file
+    return None, min_distance
@@ -0,0 +1,327 @@
+"""
+지역 공간 인덱스
+
+기상청 격자(Lambert Conformal Conic) ↔ WGS84 좌표 변환과
+좌표/격자 기반 최근접 지역 조회를 제공합니다.
+- 기상청 동네예보 격자 변환 공식 (5km 격자, 표준위도 30°/60°, 기준점 126°E/38°N)
+- 버킷 격자 인덱스를 이용한 최근접 지역 조회 (지점당 상수 수준 버킷 탐색)
+- 좌표 배열 일괄 변환 및 조회 API
+"""
+
+import logging
+import math
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.kma_region_coordinates import (
+    ADDITIONAL_KMA_STATIONS, KMA_REGION_COORDINATES
+)
+
+logger = logging.getLogger(__name__)
+
+
+# 기상청 격자 투영 상수
+EARTH_RADIUS_KM = 6371.00877
+GRID_SPACING_KM = 5.0
+STANDARD_LAT1 = 30.0
+STANDARD_LAT2 = 60.0
+ORIGIN_LON = 126.0
+ORIGIN_LAT = 38.0
+ORIGIN_X = 43
+ORIGIN_Y = 136
+
+
+def _lambert_parameters() -> Tuple[float, float, float, float]:
+    """투영 파라미터 (re, sn, sf, ro) 계산"""
+    degrad = math.pi / 180.0
+    re = EARTH_RADIUS_KM / GRID_SPACING_KM
+    slat1 = STANDARD_LAT1 * degrad
+    slat2 = STANDARD_LAT2 * degrad
+    olat = ORIGIN_LAT * degrad
+
+    sn = math.tan(math.pi * 0.25 + slat2 * 0.5) / math.tan(math.pi * 0.25 + slat1 * 0.5)
+    sn = math.log(math.cos(slat1) / math.cos(slat2)) / math.log(sn)
+    sf = math.tan(math.pi * 0.25 + slat1 * 0.5)
+    sf = sf ** sn * math.cos(slat1) / sn
+    ro = math.tan(math.pi * 0.25 + olat * 0.5)
+    ro = re * sf / ro ** sn
+    return re, sn, sf, ro
+
+
+_RE, _SN, _SF, _RO = _lambert_parameters()
+_DEGRAD = math.pi / 180.0
+
+
+def convert_wgs84_to_kma_grid_batch(latitudes: Sequence[float],
+                                    longitudes: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+    """위경도 배열을 기상청 격자 좌표 배열로 변환"""
+    lat = np.asarray(latitudes, dtype=np.float64)
+    lon = np.asarray(longitudes, dtype=np.float64)
+
+    ra = np.tan(np.pi * 0.25 + lat * _DEGRAD * 0.5)
+    ra = _RE * _SF / ra ** _SN
+    theta = lon * _DEGRAD - ORIGIN_LON * _DEGRAD
+    theta = np.where(theta > np.pi, theta - 2.0 * np.pi, theta)
+    theta = np.where(theta < -np.pi, theta + 2.0 * np.pi, theta)
+    theta *= _SN
+
+    x = ra * np.sin(theta) + ORIGIN_X
+    y = _RO - ra * np.cos(theta) + ORIGIN_Y
+    return np.floor(x + 0.5).astype(np.int64), np.floor(y + 0.5).astype(np.int64)
+
+
+def convert_kma_grid_to_wgs84_batch(nx: Sequence[int],
+                                    ny: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """기상청 격자 좌표 배열을 격자 중심 위경도 배열로 변환"""
+    xn = np.asarray(nx, dtype=np.float64) - ORIGIN_X
+    yn = _RO - np.asarray(ny, dtype=np.float64) + ORIGIN_Y
+
+    ra = np.sqrt(xn * xn + yn * yn)
+    if _SN < 0.0:
+        ra = -ra
+    alat = (_RE * _SF / ra) ** (1.0 / _SN)
+    alat = 2.0 * np.arctan(alat) - np.pi * 0.5
+
+    theta = np.arctan2(xn, yn)
+    alon = theta / _SN + ORIGIN_LON * _DEGRAD
+    return alat / _DEGRAD, alon / _DEGRAD
+
+
+def convert_wgs84_to_kma_grid(latitude: float, longitude: float) -> Tuple[int, int]:
+    """위경도를 기상청 격자 좌표로 변환"""
+    nx, ny = convert_wgs84_to_kma_grid_batch([latitude], [longitude])
+    return int(nx[0]), int(ny[0])
+
+
+def convert_kma_grid_to_wgs84(nx: int, ny: int) -> Tuple[float, float]:
+    """기상청 격자 좌표를 격자 중심 위경도로 변환"""
+    latitudes, longitudes = convert_kma_grid_to_wgs84_batch([nx], [ny])
+    return float(latitudes[0]), float(longitudes[0])
+
+
+@dataclass
+class SpatialRegionEntry:
+    """공간 인덱스 항목"""
+    name: str
+    latitude: float
+    longitude: float
+    nx: int
+    ny: int
+    region_code: Optional[str] = None
+    source: str = "kma_region"  # 'kma_region', 'kma_station', 'db_region'
+
+
+class GridBucketIndex:
+    """2차원 점 집합에 대한 버킷 격자 최근접 탐색 인덱스
+
+    같은 거리면 먼저 추가된 점을 반환합니다 (선형 탐색과 동일한 결과).
+    """
+
+    def __init__(self, points: Sequence[Tuple[float, float]], bucket_size: float):
+        self.bucket_size = bucket_size
+        self.points = list(points)
+        self.buckets: Dict[Tuple[int, int], List[int]] = {}
+
+        for index, (x, y) in enumerate(self.points):
+            self.buckets.setdefault(self._bucket_of(x, y), []).append(index)
+
+        if self.buckets:
+            bucket_xs = [key[0] for key in self.buckets]
+            bucket_ys = [key[1] for key in self.buckets]
+            self._bounds = (min(bucket_xs), max(bucket_xs), min(bucket_ys), max(bucket_ys))
+        else:
+            self._bounds = None
+
+    def _bucket_of(self, x: float, y: float) -> Tuple[int, int]:
+        return math.floor(x / self.bucket_size), math.floor(y / self.bucket_size)
+
+    def nearest(self, x: float, y: float) -> Tuple[Optional[int], float]:
+        """최근접 점의 인덱스와 거리 반환"""
+        if self._bounds is None:
+            return None, float("inf")
+
+        bx, by = self._bucket_of(x, y)
+        min_bx, max_bx, min_by, max_by = self._bounds
+        max_ring = max(abs(bx - min_bx), abs(bx - max_bx), abs(by - min_by), abs(by - max_by))
+
+        best_index, best_distance = None, float("inf")
+        for ring in range(max_ring + 1):
+            for key in self._ring_keys(bx, by, ring):
+                for index in self.buckets.get(key, ()):
+                    px, py = self.points[index]
+                    distance = math.hypot(x - px, y - py)
+                    if distance < best_distance or (distance == best_distance and index < best_index):
+                        best_index, best_distance = index, distance
+
+            # 다음 링의 점은 최소 ring * bucket_size 이상 떨어져 있음
+            if best_distance < ring * self.bucket_size:
+                break
+
+        return best_index, best_distance
+
+    @staticmethod
+    def _ring_keys(bx: int, by: int, ring: int) -> Iterable[Tuple[int, int]]:
+        if ring == 0:
+            yield bx, by
+            return
+        for dx in range(-ring, ring + 1):
+            yield bx + dx, by - ring
+            yield bx + dx, by + ring
+        for dy in range(-ring + 1, ring):
+            yield bx - ring, by + dy
+            yield bx + ring, by + dy
+
+
+class RegionSpatialIndex:
+    """지역/관측소 최근접 조회 인덱스 (위경도 및 기상청 격자 기준)"""
+
+    def __init__(self, entries: Sequence[SpatialRegionEntry],
+                 coordinate_bucket_degrees: float = 0.25,
+                 grid_bucket_cells: float = 8.0):
+        self.entries = list(entries)
+        self._coordinate_index = GridBucketIndex(
+            [(entry.latitude, entry.longitude) for entry in self.entries], coordinate_bucket_degrees
+        )
+        self._grid_index = GridBucketIndex(
+            [(entry.nx, entry.ny) for entry in self.entries], grid_bucket_cells
+        )
+        self._exact_grid: Dict[Tuple[int, int], SpatialRegionEntry] = {}
+        for entry in self.entries:
+            self._exact_grid.setdefault((entry.nx, entry.ny), entry)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def nearest(self, latitude: float, longitude: float) -> Tuple[Optional[SpatialRegionEntry], float]:
+        """위경도 기준 최근접 항목과 거리(도) 반환"""
+        index, distance = self._coordinate_index.nearest(latitude, longitude)
+        return (self.entries[index] if index is not None else None), distance
+
+    def nearest_by_grid(self, nx: int, ny: int) -> Tuple[Optional[SpatialRegionEntry], float]:
+        """격자 기준 최근접 항목과 거리(격자 칸) 반환"""
+        entry = self._exact_grid.get((nx, ny))
+        if entry is not None:
+            return entry, 0.0
+        index, distance = self._grid_index.nearest(nx, ny)
+        return (self.entries[index] if index is not None else None), distance
+
+    def batch_nearest(self, latitudes: Sequence[float],
+                      longitudes: Sequence[float]) -> List[Tuple[Optional[SpatialRegionEntry], float]]:
+        """위경도 배열의 최근접 항목 일괄 조회"""
+        return [self.nearest(float(lat), float(lon)) for lat, lon in zip(latitudes, longitudes)]
+
+    def batch_nearest_by_grid(self, nx: Sequence[int],
+                              ny: Sequence[int]) -> List[Tuple[Optional[SpatialRegionEntry], float]]:
+        """격자 배열의 최근접 항목 일괄 조회"""
+        return [self.nearest_by_grid(int(x), int(y)) for x, y in zip(nx, ny)]
+
+    def batch_nearest_by_coordinates_on_grid(
+        self, latitudes: Sequence[float], longitudes: Sequence[float]
+    ) -> Tuple[np.ndarray, np.ndarray, List[Optional[SpatialRegionEntry]]]:
+        """위경도 배열을 격자로 변환하고 격자별 최근접 항목 조회 (관광지 → 예보 격자 매핑용)"""
+        nx, ny = convert_wgs84_to_kma_grid_batch(latitudes, longitudes)
+        entries_by_grid = {}
+        entries = []
+        for grid in zip(nx.tolist(), ny.tolist()):
+            if grid not in entries_by_grid:
+                entries_by_grid[grid] = self.nearest_by_grid(*grid)[0]
+            entries.append(entries_by_grid[grid])
+        return nx, ny, entries
+
+
+def build_kma_static_entries() -> List[SpatialRegionEntry]:
+    """기상청 시도 지역 및 추가 관측소 항목 생성 (지역 → 관측소 순서)"""
+    entries = [
+        SpatialRegionEntry(
+            name=name, latitude=data["latitude"], longitude=data["longitude"],
+            nx=data["nx"], ny=data["ny"], source="kma_region"
+        )
+        for name, data in KMA_REGION_COORDINATES.items()
+    ]
+    entries.extend(
+        SpatialRegionEntry(
+            name=name, latitude=data["latitude"], longitude=data["longitude"],
+            nx=data["nx"], ny=data["ny"], source="kma_station"
+        )
+        for name, data in ADDITIONAL_KMA_STATIONS.items()
+    )
+    return entries
+
+
+# 기상청 정적 지역/관측소 인덱스 (모듈 로드 시 1회 생성)
+KMA_STATIC_INDEX = RegionSpatialIndex(build_kma_static_entries())
+
+
+REGION_GRID_QUERY = """
+SELECT
+    region_code,
+    region_name,
+    COALESCE(center_latitude, latitude) AS latitude,
+    COALESCE(center_longitude, longitude) AS longitude,
+    grid_x,
+    grid_y
+FROM regions
+WHERE is_active IS NOT FALSE
+  AND (grid_x IS NOT NULL OR COALESCE(center_latitude, latitude) IS NOT NULL)
+ORDER BY region_code
+"""
+
+
+def build_db_region_entries(rows: Iterable[Dict]) -> List[SpatialRegionEntry]:
+    """regions 테이블 행을 인덱스 항목으로 변환 (격자/좌표 중 빠진 값은 투영 공식으로 계산)"""
+    entries = []
+    for row in rows:
+        latitude, longitude = row.get("latitude"), row.get("longitude")
+        nx, ny = row.get("grid_x"), row.get("grid_y")
+
+        if nx is None or ny is None:
+            if latitude is None or longitude is None:
+                continue
+            nx, ny = convert_wgs84_to_kma_grid(latitude, longitude)
+        elif latitude is None or longitude is None:
+            latitude, longitude = convert_kma_grid_to_wgs84(nx, ny)
+
+        entries.append(SpatialRegionEntry(
+            name=row.get("region_name") or row["region_code"],
+            latitude=float(latitude), longitude=float(longitude),
+            nx=int(nx), ny=int(ny),
+            region_code=row["region_code"], source="db_region"
+        ))
+    return entries
+
+
+# regions 테이블 기반 인덱스 (load_region_index_from_db 호출 시 생성)
+_region_index: Optional[RegionSpatialIndex] = None
+_region_index_lock = threading.Lock()
+
+
+def load_region_index_from_db(db_manager, force: bool = False) -> Optional[RegionSpatialIndex]:
+    """regions 테이블로 지역 인덱스 생성 (이미 생성된 경우 재사용)"""
+    global _region_index
+
+    with _region_index_lock:
+        if _region_index is not None and not force:
+            return _region_index
+
+        try:
+            rows = db_manager.fetch_all(REGION_GRID_QUERY)
+            _region_index = RegionSpatialIndex(build_db_region_entries(rows))
+            logger.info(f"지역 공간 인덱스 생성 완료: {len(_region_index)}개 지역")
+        except Exception as e:
+            logger.warning(f"지역 공간 인덱스 생성 실패: {e}")
+
+        return _region_index
+
+
+def get_region_index() -> Optional[RegionSpatialIndex]:
+    """regions 테이블 기반 지역 인덱스 반환 (미생성 시 None)"""
+    return _region_index
+
+
+def reset_region_index():
+    """지역 인덱스 재설정 (테스트용)"""
+    global _region_index
+    _region_index = None
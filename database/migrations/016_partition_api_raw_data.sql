@@ -0,0 +1,166 @@
+-- api_raw_data 테이블 시간 기준 파티셔닝
+-- 날짜: 2026-10-16
+-- 설명: api_raw_data를 created_at 기준 RANGE 파티션 테이블로 전환하여
+--       TTL 정리 시 만료된 파티션 전체를 DETACH/DROP 할 수 있도록 함
+--       (행 단위 DELETE로 인한 WAL 증가 및 테이블 팽창 방지)
+--
+-- 주의사항:
+--   - 기존 데이터 복사 중 api_raw_data 쓰기가 차단되므로 배치 작업이 없는 시간에 실행
+--   - 파티션 테이블은 (id, created_at) 기본키가 필요하므로 api_raw_data(id)를 참조하던
+--     외래키는 제거하고 api_raw_data_dependent_refs 테이블에 기록함
+--     (파티션 삭제 시 TTLPolicyEngine이 기록된 ON DELETE 동작을 대신 수행)
+--   - 기존 테이블은 api_raw_data_legacy로 이름을 변경하여 보관하며, 검증 후 수동 삭제
+--
+-- 일 단위 파티션이 필요하면 create_api_raw_data_partition(날짜, 'day')로 생성
+
+BEGIN;
+
+-- 1. 파티션 생성 함수
+CREATE OR REPLACE FUNCTION create_api_raw_data_partition(
+    p_start DATE,
+    p_interval TEXT DEFAULT 'month'
+) RETURNS TEXT AS $$
+DECLARE
+    v_start DATE;
+    v_end DATE;
+    v_name TEXT;
+BEGIN
+    IF p_interval = 'day' THEN
+        v_start := p_start;
+        v_end := p_start + INTERVAL '1 day';
+        v_name := 'api_raw_data_p' || to_char(v_start, 'YYYYMMDD');
+    ELSIF p_interval = 'month' THEN
+        v_start := date_trunc('month', p_start)::DATE;
+        v_end := (v_start + INTERVAL '1 month')::DATE;
+        v_name := 'api_raw_data_p' || to_char(v_start, 'YYYYMM');
+    ELSE
+        RAISE EXCEPTION '지원하지 않는 파티션 단위: %', p_interval;
+    END IF;
+
+    IF to_regclass(v_name) IS NULL THEN
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF api_raw_data FOR VALUES FROM (%L) TO (%L)',
+            v_name, v_start, v_end
+        );
+    END IF;
+
+    RETURN v_name;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 2. 외래키 제거 전 참조 정보 기록
+CREATE TABLE IF NOT EXISTS api_raw_data_dependent_refs (
+    table_name VARCHAR(100) NOT NULL,
+    column_name VARCHAR(100) NOT NULL,
+    on_delete VARCHAR(20) NOT NULL,            -- 'CASCADE', 'SET NULL', 'NO ACTION'
+    constraint_name VARCHAR(200),
+    recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (table_name, column_name)
+);
+
+INSERT INTO api_raw_data_dependent_refs (table_name, column_name, on_delete, constraint_name)
+SELECT
+    con.conrelid::regclass::TEXT,
+    att.attname,
+    CASE con.confdeltype
+        WHEN 'c' THEN 'CASCADE'
+        WHEN 'n' THEN 'SET NULL'
+        ELSE 'NO ACTION'
+    END,
+    con.conname
+FROM pg_constraint con
+JOIN pg_attribute att
+  ON att.attrelid = con.conrelid AND att.attnum = con.conkey[1]
+WHERE con.contype = 'f'
+  AND con.confrelid = 'api_raw_data'::regclass
+ON CONFLICT (table_name, column_name) DO NOTHING;
+
+DO $$
+DECLARE
+    r RECORD;
+BEGIN
+    FOR r IN
+        SELECT conrelid::regclass AS table_name, conname
+        FROM pg_constraint
+        WHERE contype = 'f' AND confrelid = 'api_raw_data'::regclass
+    LOOP
+        EXECUTE format('ALTER TABLE %s DROP CONSTRAINT %I', r.table_name, r.conname);
+    END LOOP;
+END $$;
+
+-- 3. 파티션 부모 테이블 생성
+LOCK TABLE api_raw_data IN EXCLUSIVE MODE;
+
+CREATE TABLE api_raw_data_partitioned (
+    LIKE api_raw_data INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+) PARTITION BY RANGE (created_at);
+
+UPDATE api_raw_data SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL;
+ALTER TABLE api_raw_data_partitioned ALTER COLUMN created_at SET NOT NULL;
+ALTER TABLE api_raw_data_partitioned ADD PRIMARY KEY (id, created_at);
+
+-- 4. 테이블 교체
+ALTER TABLE api_raw_data RENAME TO api_raw_data_legacy;
+ALTER TABLE api_raw_data_partitioned RENAME TO api_raw_data;
+
+-- 5. 기존 데이터 범위 + 향후 2개월 월 단위 파티션 생성
+DO $$
+DECLARE
+    v_month DATE;
+    v_last DATE;
+BEGIN
+    SELECT date_trunc('month', COALESCE(MIN(created_at), CURRENT_TIMESTAMP))::DATE
+    INTO v_month
+    FROM api_raw_data_legacy;
+
+    v_last := (date_trunc('month', CURRENT_DATE) + INTERVAL '2 months')::DATE;
+
+    WHILE v_month <= v_last LOOP
+        PERFORM create_api_raw_data_partition(v_month, 'month');
+        v_month := (v_month + INTERVAL '1 month')::DATE;
+    END LOOP;
+END $$;
+
+CREATE TABLE IF NOT EXISTS api_raw_data_default PARTITION OF api_raw_data DEFAULT;
+
+-- 6. 데이터 복사
+INSERT INTO api_raw_data SELECT * FROM api_raw_data_legacy;
+
+-- 7. 인덱스 재생성 (인덱스 이름은 스키마 단위이므로 기존 인덱스는 _legacy로 이름 변경)
+--    유니크 인덱스는 파티션 키를 포함해야 하므로 제외
+DO $$
+DECLARE
+    r RECORD;
+BEGIN
+    FOR r IN
+        SELECT ic.relname AS index_name, n.nspname AS schema_name,
+               pg_get_indexdef(i.indexrelid) AS index_def
+        FROM pg_index i
+        JOIN pg_class ic ON ic.oid = i.indexrelid
+        JOIN pg_namespace n ON n.oid = ic.relnamespace
+        WHERE i.indrelid = 'api_raw_data_legacy'::regclass
+          AND NOT i.indisunique
+    LOOP
+        EXECUTE format('ALTER INDEX %I.%I RENAME TO %I', r.schema_name, r.index_name, r.index_name || '_legacy');
+        EXECUTE replace(
+            r.index_def,
+            'ON ' || r.schema_name || '.api_raw_data_legacy ',
+            'ON ' || r.schema_name || '.api_raw_data '
+        );
+    END LOOP;
+END $$;
+
+CREATE INDEX IF NOT EXISTS idx_api_raw_data_id ON api_raw_data(id);
+
+-- 8. 마이그레이션 완료 로그
+INSERT INTO migration_log (migration_name, applied_at, description)
+VALUES (
+    '016_partition_api_raw_data',
+    CURRENT_TIMESTAMP,
+    'api_raw_data 월 단위 RANGE 파티셔닝 전환 (기존 테이블은 api_raw_data_legacy로 보관)'
+) ON CONFLICT DO NOTHING;
+
+COMMIT;
+
+-- 검증 후 기존 테이블 삭제:
+-- DROP TABLE api_raw_data_legacy;
@@ -63,7 +63,10 @@ class TTLCleanupJob:
                        f"{storage_stats.get('overall', {}).get('total_records', 0):,}개 레코드, "
                        f"{storage_stats.get('overall', {}).get('total_size_mb', 0):.2f}MB")
             
-            # 2. 정리 대상 식별
+            # 2. 전체 만료된 파티션 삭제 (행 단위 삭제 대상 축소)
+            partition_result = self._run_partition_cleanup()
+            
+            # 3. 정리 대상 식별 (부분 만료 파티션의 행)
             candidates = self.ttl_engine.identify_cleanup_candidates(
                 target_space_mb=None,  # 일일 정리는 목표 공간 없이 만료된 데이터 위주
                 emergency_mode=False
@@ -71,17 +74,19 @@ class TTLCleanupJob:
             
             if not candidates:
                 logger.info("정리 대상이 없습니다")
-                return self._create_result_summary([], None, time.time() - start_time)
+                return self._create_result_summary([], None, time.time() - start_time, partition_result)
             
-            # 3. 정리 실행
+            # 4. 정리 실행
             batch_size = self.config.get("auto_cleanup", {}).get("batch_size", 1000)
             cleanup_result = self.ttl_engine.execute_cleanup(candidates, batch_size=batch_size)
             
-            # 4. 통계 업데이트
+            # 5. 통계 업데이트
             self._update_job_stats(cleanup_result, time.time() - start_time)
             
-            # 5. 결과 요약 생성
-            result = self._create_result_summary(candidates, cleanup_result, time.time() - start_time)
+            # 6. 결과 요약 생성
+            result = self._create_result_summary(
+                candidates, cleanup_result, time.time() - start_time, partition_result
+            )
             
             logger.info(f"일일 TTL 정리 작업 완료: {cleanup_result.deleted_records}개 삭제, "
                        f"{cleanup_result.space_freed_mb:.2f}MB 확보")
@@ -116,7 +121,16 @@ class TTLCleanupJob:
             
             logger.info(f"주간 정리 목표: {target_space_mb:.2f}MB 확보")
             
-            # 3. 정리 대상 식별 (더 적극적)
+            # 3. 전체 만료된 파티션 삭제 후 남은 목표 공간만 행 단위로 정리
+            partition_result = self._run_partition_cleanup()
+            if partition_result:
+                target_space_mb = max(target_space_mb - partition_result.space_freed_mb, 0.0)
+            
+            if partition_result and target_space_mb <= 0:
+                logger.info("파티션 삭제로 주간 정리 목표 달성")
+                return self._create_result_summary([], None, time.time() - start_time, partition_result)
+            
+            # 4. 정리 대상 식별 (더 적극적)
             candidates = self.ttl_engine.identify_cleanup_candidates(
                 target_space_mb=target_space_mb,
                 emergency_mode=False
@@ -124,17 +138,19 @@ class TTLCleanupJob:
             
             if not candidates:
                 logger.info("주간 정리 대상이 없습니다")
-                return self._create_result_summary([], None, time.time() - start_time)
+                return self._create_result_summary([], None, time.time() - start_time, partition_result)
             
-            # 4. 정리 실행
+            # 5. 정리 실행
             batch_size = self.config.get("auto_cleanup", {}).get("batch_size", 1000)
             cleanup_result = self.ttl_engine.execute_cleanup(candidates, batch_size=batch_size)
             
-            # 5. 통계 업데이트
+            # 6. 통계 업데이트
             self._update_job_stats(cleanup_result, time.time() - start_time)
             
-            # 6. 결과 요약 생성
-            result = self._create_result_summary(candidates, cleanup_result, time.time() - start_time)
+            # 7. 결과 요약 생성
+            result = self._create_result_summary(
+                candidates, cleanup_result, time.time() - start_time, partition_result
+            )
             
             logger.info(f"주간 TTL 정리 작업 완료: {cleanup_result.deleted_records}개 삭제, "
                        f"{cleanup_result.space_freed_mb:.2f}MB 확보")
@@ -278,6 +294,35 @@ class TTLCleanupJob:
                 "error": str(e)
             }
     
+    def _run_partition_cleanup(self):
+        """api_raw_data가 파티션 테이블이면 향후 파티션 생성 후 전체 만료 파티션 삭제"""
+        if not self.ttl_engine.is_raw_data_partitioned():
+            return None
+        
+        if not self.dry_run:
+            self.ttl_engine.ensure_future_partitions()
+        
+        partition_result = self.ttl_engine.execute_partition_cleanup()
+        
+        if partition_result.total_candidates:
+            self.job_stats["total_cleaned"] += partition_result.deleted_records
+            self.job_stats["total_space_freed_mb"] += partition_result.space_freed_mb
+        
+        logger.info(f"파티션 정리 완료: {partition_result.total_candidates}개 파티션, "
+                   f"약 {partition_result.deleted_records:,}개 레코드, "
+                   f"{partition_result.space_freed_mb:.2f}MB 확보")
+        return partition_result
+    
+    def get_partition_report(self) -> Dict[str, Any]:
+        """파티션별 만료 계획 및 확보 예상 용량 (dry-run 보고서)"""
+        if not self.ttl_engine.is_raw_data_partitioned():
+            return {
+                "partitioned": False,
+                "message": "api_raw_data가 파티션 테이블이 아닙니다 (016 마이그레이션 필요)"
+            }
+        
+        return {"partitioned": True, **self.ttl_engine.get_partition_expiry_report()}
+    
     def _update_job_stats(self, cleanup_result, execution_time_sec: float):
         """작업 통계 업데이트"""
         self.job_stats["runs"] += 1
@@ -288,10 +333,11 @@ class TTLCleanupJob:
             (self.job_stats["avg_run_time_sec"] + execution_time_sec) / 2
         )
     
-    def _create_result_summary(self, candidates, cleanup_result, execution_time_sec: float) -> Dict[str, Any]:
+    def _create_result_summary(self, candidates, cleanup_result, execution_time_sec: float,
+                               partition_result=None) -> Dict[str, Any]:
         """작업 결과 요약 생성"""
         if cleanup_result is None:
-            return {
+            summary = {
                 "success": True,
                 "candidates_found": len(candidates),
                 "deleted_records": 0,
@@ -299,17 +345,26 @@ class TTLCleanupJob:
                 "execution_time_sec": execution_time_sec,
                 "dry_run": self.dry_run
             }
+        else:
+            summary = {
+                "success": len(cleanup_result.errors) == 0,
+                "candidates_found": len(candidates),
+                "deleted_records": cleanup_result.deleted_records,
+                "space_freed_mb": cleanup_result.space_freed_mb,
+                "execution_time_sec": execution_time_sec,
+                "errors": cleanup_result.errors,
+                "cleanup_summary": cleanup_result.cleanup_summary,
+                "dry_run": self.dry_run
+            }
         
-        return {
-            "success": len(cleanup_result.errors) == 0,
-            "candidates_found": len(candidates),
-            "deleted_records": cleanup_result.deleted_records,
-            "space_freed_mb": cleanup_result.space_freed_mb,
-            "execution_time_sec": execution_time_sec,
-            "errors": cleanup_result.errors,
-            "cleanup_summary": cleanup_result.cleanup_summary,
-            "dry_run": self.dry_run
-        }
+        if partition_result is not None:
+            summary["deleted_records"] += partition_result.deleted_records
+            summary["space_freed_mb"] += partition_result.space_freed_mb
+            summary["success"] = summary["success"] and not partition_result.errors
+            summary["errors"] = summary.get("errors", []) + partition_result.errors
+            summary["partition_cleanup"] = partition_result.cleanup_summary
+        
+        return summary
     
     def get_job_statistics(self) -> Dict[str, Any]:
         """작업 통계 반환"""
@@ -324,7 +379,7 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='TTL 기반 데이터 정리 작업')
-    parser.add_argument('--mode', choices=['daily', 'weekly', 'emergency', 'check'], 
+    parser.add_argument('--mode', choices=['daily', 'weekly', 'emergency', 'check', 'partition-report'], 
                        default='daily', help='정리 모드')
     parser.add_argument('--dry-run', action='store_true', 
                        help='실제 삭제하지 않고 시뮬레이션만 수행')
@@ -355,6 +410,8 @@ def main():
             result = cleanup_job.run_emergency_cleanup(args.target_space_gb)
         elif args.mode == 'check':
             result = cleanup_job.check_cleanup_needed()
+        elif args.mode == 'partition-report':
+            result = cleanup_job.get_partition_report()
         
         # 결과 출력
         print("\n" + "="*60)
@@ -369,6 +426,16 @@ def main():
                 print("권장사항:")
                 for rec in result['recommendations']:
                     print(f"  • {rec}")
+        elif args.mode == 'partition-report':
+            if not result.get('partitioned'):
+                print(result.get('message'))
+            else:
+                for partition in result['partitions']:
+                    print(f"{partition['partition_name']}: {partition['action']:<7} "
+                          f"{partition['reclaimable_bytes'] / (1024 * 1024):10.2f}MB 확보 예상 "
+                          f"({partition['reason']})")
+                print(f"삭제 가능 파티션: {result['droppable_partitions']}개, "
+                      f"확보 예상: {result['reclaimable_mb']:.2f}MB")
         else:
             success = result.get('success', False)
             print(f"작업 성공: {'✅' if success else '❌'}")
@@ -107,11 +107,18 @@ class WeatherChangeNotificationJob(BaseJob):
             active_plans = await self._get_active_travel_plans()
             self.logger.info(f"{len(active_plans)}개의 활성 여행 플랜 발견")
             
-            # 2. 각 플랜에 대해 날씨 변화 체크
+            # 2. 계획 단계: 전체 플랜의 목적지/예보/최근 알림 정보를 일괄 조회
+            try:
+                lookup_context = await self._build_lookup_context(active_plans)
+            except Exception as e:
+                self.logger.warning(f"일괄 조회 실패, 플랜별 조회로 전환: {str(e)}")
+                lookup_context = None
+            
+            # 3. 각 플랜에 대해 날씨 변화 체크
             total_notifications = 0
             for plan in active_plans:
                 try:
-                    notifications_sent = await self._process_travel_plan(plan)
+                    notifications_sent = await self._process_travel_plan(plan, lookup_context)
                     total_notifications += notifications_sent
                 except Exception as e:
                     self.logger.error(f"플랜 {plan['plan_id']} 처리 중 오류: {str(e)}")
@@ -178,12 +185,144 @@ class WeatherChangeNotificationJob(BaseJob):
         
         return plans
     
-    async def _process_travel_plan(self, plan: Dict) -> int:
+    async def _build_lookup_context(self, plans: List[Dict]) -> Dict[str, Any]:
+        """
+        전체 활성 플랜에 필요한 조회 결과를 일괄 준비
+        
+        플랜 수와 목적지 수에 관계없이 지역 조회, 예보 조회, 최근 알림 조회를
+        각각 한 번씩만 실행하고 결과를 플랜 간에 재사용합니다.
+        """
+        context = {
+            'recent_plan_ids': set(),
+            'destination_regions': {},
+            'region_forecasts': {},
+        }
+        
+        if not plans:
+            return context
+        
+        context['recent_plan_ids'] = await self._get_recent_notification_plan_ids(
+            [plan['plan_id'] for plan in plans]
+        )
+        
+        destinations = sorted({
+            destination
+            for plan in plans
+            if plan['plan_id'] not in context['recent_plan_ids']
+            for destination in (plan.get('destinations') or [])
+        })
+        if not destinations:
+            return context
+        
+        context['destination_regions'] = await self._get_destination_regions(destinations)
+        
+        region_codes = sorted({
+            region_info['region_code'] for region_info in context['destination_regions'].values()
+        })
+        if region_codes:
+            start_date = min(plan['start_date'] for plan in plans)
+            end_date = max(plan['end_date'] for plan in plans) + timedelta(days=1)
+            context['region_forecasts'] = await self._get_region_forecasts(
+                region_codes, start_date, end_date
+            )
+        
+        self.logger.info(
+            f"일괄 조회 완료: 목적지 {len(destinations)}개, 지역 {len(region_codes)}개, "
+            f"최근 알림 플랜 {len(context['recent_plan_ids'])}개"
+        )
+        
+        return context
+    
+    async def _get_recent_notification_plan_ids(self, plan_ids: List[UUID]) -> set:
+        """최근 24시간 내 알림이 전송된 플랜 ID 일괄 조회"""
+        query = """
+            SELECT DISTINCT plan_id
+            FROM weather_notifications
+            WHERE plan_id = ANY(%s::uuid[])
+              AND notification_status = 'sent'
+              AND created_at >= CURRENT_TIMESTAMP - INTERVAL '24 hours';
+        """
+        
+        results = self.db_manager.execute_query(query, ([str(plan_id) for plan_id in plan_ids],))
+        recent_ids = {str(row['plan_id']) for row in results}
+        
+        return {plan_id for plan_id in plan_ids if str(plan_id) in recent_ids}
+    
+    async def _get_destination_regions(self, destinations: List[str]) -> Dict[str, Dict]:
+        """목적지별 지역 정보 일괄 조회"""
+        query = """
+            SELECT DISTINCT ON (d.name) d.name, r.region_code, r.nx, r.ny
+            FROM destinations d
+            JOIN regions r ON d.region_id = r.region_id
+            WHERE d.name = ANY(%s)
+            ORDER BY d.name;
+        """
+        
+        results = self.db_manager.execute_query(query, (destinations,))
+        return {
+            row['name']: {
+                'region_code': row['region_code'],
+                'nx': row['nx'],
+                'ny': row['ny'],
+            }
+            for row in results
+        }
+    
+    async def _get_region_forecasts(self,
+                                    region_codes: List[str],
+                                    start_date: date,
+                                    end_date: date) -> Dict[str, Dict[str, Dict]]:
+        """지역별 날씨 예보 일괄 조회"""
+        query = """
+            SELECT 
+                region_code,
+                forecast_date,
+                max_temperature as max_temp,
+                min_temperature as min_temp,
+                rain_probability,
+                weather_description as weather_condition,
+                wind_speed
+            FROM weather_forecast
+            WHERE region_code = ANY(%s)
+              AND forecast_date >= %s
+              AND forecast_date < %s
+              AND created_at >= CURRENT_TIMESTAMP - INTERVAL '1 day'
+            ORDER BY region_code, forecast_date, created_at DESC;
+        """
+        
+        forecasts = self.db_manager.execute_query(query, (region_codes, start_date, end_date))
+        
+        region_forecasts: Dict[str, Dict[str, Dict]] = {}
+        for forecast in forecasts:
+            date_str = forecast['forecast_date'].strftime('%Y-%m-%d')
+            region_forecasts.setdefault(forecast['region_code'], {})[date_str] = (
+                self._format_forecast(forecast)
+            )
+        
+        return region_forecasts
+    
+    def _get_destination_weather_from_context(self,
+                                              destination: str,
+                                              lookup_context: Dict[str, Any]) -> Dict[str, Dict]:
+        """일괄 조회 결과에서 목적지 날씨 정보 반환"""
+        region_info = lookup_context['destination_regions'].get(destination)
+        if not region_info:
+            self.logger.warning(f"목적지 {destination}의 지역 정보를 찾을 수 없음")
+            return {}
+        
+        return lookup_context['region_forecasts'].get(region_info['region_code'], {})
+    
+    async def _process_travel_plan(self, plan: Dict, lookup_context: Optional[Dict[str, Any]] = None) -> int:
         """개별 여행 플랜 처리"""
         notifications_sent = 0
         
         # 1. 최근 알림 전송 여부 확인 (하루에 한 번만)
-        if await self._has_recent_notification(plan['plan_id']):
+        if lookup_context is not None:
+            has_recent_notification = plan['plan_id'] in lookup_context['recent_plan_ids']
+        else:
+            has_recent_notification = await self._has_recent_notification(plan['plan_id'])
+        
+        if has_recent_notification:
             self.logger.debug(f"플랜 {plan['plan_id']}는 최근 알림이 전송됨")
             return 0
         
@@ -197,11 +336,16 @@ class WeatherChangeNotificationJob(BaseJob):
             try:
                 # 날씨 정보 수집 (start_date부터 end_date까지)
                 days_count = (plan['end_date'] - plan['start_date']).days + 1
-                weather_data = await self._collect_weather_for_destination(
-                    destination, 
-                    plan['start_date'],
-                    days_count
-                )
+                if lookup_context is not None:
+                    weather_data = self._get_destination_weather_from_context(
+                        destination, lookup_context
+                    )
+                else:
+                    weather_data = await self._collect_weather_for_destination(
+                        destination, 
+                        plan['start_date'],
+                        days_count
+                    )
                 
                 # 날짜별로 정리
                 for day_offset in range(days_count):
@@ -305,16 +449,20 @@ class WeatherChangeNotificationJob(BaseJob):
         
         for forecast in forecasts:
             date_str = forecast['forecast_date'].strftime('%Y-%m-%d')
-            weather_data[date_str] = {
-                'max_temp': float(forecast['max_temp']) if forecast['max_temp'] else None,
-                'min_temp': float(forecast['min_temp']) if forecast['min_temp'] else None,
-                'rain_probability': int(forecast['rain_probability']) if forecast['rain_probability'] else 0,
-                'weather_condition': forecast['weather_condition'] or 'unknown',
-                'wind_speed': float(forecast['wind_speed']) if forecast['wind_speed'] else 0
-            }
+            weather_data[date_str] = self._format_forecast(forecast)
         
         return weather_data
     
+    def _format_forecast(self, forecast: Dict) -> Dict[str, Any]:
+        """예보 레코드를 날씨 비교용 형식으로 변환"""
+        return {
+            'max_temp': float(forecast['max_temp']) if forecast['max_temp'] else None,
+            'min_temp': float(forecast['min_temp']) if forecast['min_temp'] else None,
+            'rain_probability': int(forecast['rain_probability']) if forecast['rain_probability'] else 0,
+            'weather_condition': forecast['weather_condition'] or 'unknown',
+            'wind_speed': float(forecast['wind_speed']) if forecast['wind_speed'] else 0
+        }
+    
     async def _has_recent_notification(self, plan_id: UUID) -> bool:
         """최근 24시간 내 알림 전송 여부 확인"""
         query = """
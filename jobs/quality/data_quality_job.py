@@ -6,9 +6,10 @@
 
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
 from app.core.base_job import BaseJob, JobResult, JobConfig
@@ -50,6 +51,103 @@ class TableQualityResult:
     quality_score: float
     issues: List[QualityIssue]
     check_timestamp: datetime
+    column_stats: Dict[str, Any] = field(default_factory=dict)
+
+
+def build_table_profile_query(
+    table_name: str, check_config: Dict, available_columns: Set[str]
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    테이블 품질 검사 설정을 단일 집계 쿼리로 변환
+
+    누락/범위/신선도/일관성 검사는 COUNT(*) FILTER 집계로, 중복 검사는 중복 키
+    GROUP BY 결과에 대한 외부 집계로 계산하여 테이블을 한 번만 스캔합니다.
+    존재하지 않는 컬럼을 참조하는 검사는 제외합니다.
+
+    Returns:
+        Tuple[str, Dict[str, Any]]: (쿼리, 결과 컬럼 별칭 정보)
+    """
+    inner = ["COUNT(*) AS row_count"]
+    outer = ["SUM(row_count) AS row_count"]
+    plan: Dict[str, Any] = {
+        "missing": [],
+        "ranges": {},
+        "freshness": None,
+        "consistency": None,
+    }
+
+    def add(alias: str, expression: str, outer_aggregate: str):
+        inner.append(f"{expression} AS {alias}")
+        outer.append(f"{outer_aggregate}({alias}) AS {alias}")
+
+    for index, column in enumerate(check_config.get("required_columns", [])):
+        if column in available_columns:
+            alias = f"missing_{index}"
+            add(alias, f"COUNT(*) FILTER (WHERE {column} IS NULL)", "SUM")
+            plan["missing"].append(alias)
+
+    date_column = check_config.get("date_column")
+    if date_column in available_columns:
+        threshold_days = int(check_config["freshness_threshold_days"])
+        add(
+            "outdated_count",
+            f"COUNT(*) FILTER (WHERE {date_column} < CURRENT_DATE - INTERVAL '{threshold_days} days')",
+            "SUM",
+        )
+        add("latest_value", f"MAX({date_column})", "MAX")
+        plan["freshness"] = {
+            "column": date_column,
+            "threshold_days": threshold_days,
+            "count": "outdated_count",
+            "latest": "latest_value",
+        }
+
+    for index, (column, (min_val, max_val)) in enumerate(
+        check_config.get("value_ranges", {}).items()
+    ):
+        if column not in available_columns:
+            continue
+        add(
+            f"invalid_{index}",
+            f"COUNT(*) FILTER (WHERE {column} IS NOT NULL "
+            f"AND ({column} < {float(min_val)} OR {column} > {float(max_val)}))",
+            "SUM",
+        )
+        add(f"min_{index}", f"MIN({column})", "MIN")
+        add(f"max_{index}", f"MAX({column})", "MAX")
+        plan["ranges"][column] = {
+            "range": (min_val, max_val),
+            "count": f"invalid_{index}",
+            "min": f"min_{index}",
+            "max": f"max_{index}",
+        }
+
+    # 날씨 데이터 특화 일관성 검사
+    if table_name == "historical_weather_daily" and {"max_temp", "min_temp"} <= available_columns:
+        add(
+            "inconsistent_count",
+            "COUNT(*) FILTER (WHERE max_temp IS NOT NULL AND min_temp IS NOT NULL "
+            "AND max_temp < min_temp)",
+            "SUM",
+        )
+        plan["consistency"] = "inconsistent_count"
+
+    key_columns = [
+        column for column in check_config.get("duplicate_key_columns", [])
+        if column in available_columns
+    ]
+    if key_columns and len(key_columns) == len(check_config["duplicate_key_columns"]):
+        outer.append("COUNT(*) FILTER (WHERE row_count > 1) AS duplicate_count")
+        query = (
+            f"SELECT {', '.join(outer)} FROM ("
+            f"SELECT {', '.join(inner)} FROM {table_name} "
+            f"GROUP BY {', '.join(key_columns)}) grouped"
+        )
+    else:
+        inner.append("0 AS duplicate_count")
+        query = f"SELECT {', '.join(inner)} FROM {table_name}"
+
+    return query, plan
 
 
 class DataQualityJob(BaseJob):
@@ -63,6 +161,9 @@ class DataQualityJob(BaseJob):
         # 품질 검사 대상 테이블 정의 (외부 JSON 파일에서 로드)
         self.quality_checks = self._load_quality_checks_config()
 
+        # 테이블별 프로파일링 동시 실행 수
+        self.profile_concurrency = config.metadata.get("profile_concurrency", 4)
+
     def _load_quality_checks_config(self) -> Dict:
         """외부 JSON 파일에서 품질 검사 설정을 로드합니다."""
         config_path = os.path.join(
@@ -93,10 +194,20 @@ class DataQualityJob(BaseJob):
             quality_results = []
             total_issues = 0
 
-            # 각 테이블별 품질 검사 수행
-            for table_name, check_config in self.quality_checks.items():
+            # 각 테이블별 품질 검사 수행 (테이블 간 동시 실행)
+            table_items = list(self.quality_checks.items())
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(self.profile_concurrency, len(table_items) or 1)),
+                thread_name_prefix="quality-profile",
+            ) as executor:
+                futures = [
+                    (table_name, executor.submit(self._check_table_quality, table_name, check_config))
+                    for table_name, check_config in table_items
+                ]
+
+            for table_name, future in futures:
                 try:
-                    table_result = self._check_table_quality(table_name, check_config)
+                    table_result = future.result()
                     quality_results.append(table_result)
                     total_issues += len(table_result.issues)
                     self.processed_tables += 1
@@ -144,30 +255,147 @@ class DataQualityJob(BaseJob):
     def _check_table_quality(
         self, table_name: str, check_config: Dict
     ) -> TableQualityResult:
-        """특정 테이블의 품질 검사"""
+        """특정 테이블의 품질 검사 (단일 스캔 프로파일)"""
+        available_columns = self._get_table_columns(table_name)
+        if not available_columns:
+            return self._missing_table_result(table_name)
+
+        try:
+            profile, plan = self._profile_table(table_name, check_config, available_columns)
+        except Exception as e:
+            self.logger.warning(
+                f"테이블 {table_name} 단일 스캔 프로파일 실패, 개별 검사로 전환: {str(e)}"
+            )
+            return self._check_table_quality_per_check(table_name, check_config)
+
+        issues = []
+        column_stats: Dict[str, Any] = {}
+
+        total_records = int(profile.get("row_count") or 0)
+        missing_data_count = sum(int(profile.get(alias) or 0) for alias in plan["missing"])
+        duplicate_count = int(profile.get("duplicate_count") or 0)
+
+        # 데이터 신선도
+        freshness = plan["freshness"]
+        if freshness:
+            column_stats[freshness["column"]] = {"latest": profile.get(freshness["latest"])}
+            old_count = int(profile.get(freshness["count"]) or 0)
+            if old_count > 0:
+                issues.append(
+                    QualityIssue(
+                        issue_type=QualityIssueType.OUTDATED_DATA,
+                        table_name=table_name,
+                        column_name=freshness["column"],
+                        severity="medium",
+                        description=f"{freshness['threshold_days']}일 이전의 오래된 데이터 발견",
+                        count=old_count,
+                        recommendation="오래된 데이터 정리 또는 업데이트 주기 검토",
+                    )
+                )
+
+        # 값 범위
+        for column, range_plan in plan["ranges"].items():
+            min_val, max_val = range_plan["range"]
+            column_stats[column] = {
+                "min": profile.get(range_plan["min"]),
+                "max": profile.get(range_plan["max"]),
+            }
+            invalid_count = int(profile.get(range_plan["count"]) or 0)
+            if invalid_count > 0:
+                issues.append(
+                    QualityIssue(
+                        issue_type=QualityIssueType.INVALID_FORMAT,
+                        table_name=table_name,
+                        column_name=column,
+                        severity="high",
+                        description=f"유효 범위({min_val}-{max_val}) 벗어난 값 발견",
+                        count=invalid_count,
+                        recommendation="데이터 수집 로직 검토 및 유효성 검증 강화",
+                    )
+                )
+
+        # 일관성
+        if plan["consistency"]:
+            inconsistent_count = int(profile.get(plan["consistency"]) or 0)
+            if inconsistent_count > 0:
+                issues.append(
+                    QualityIssue(
+                        issue_type=QualityIssueType.INCONSISTENT_DATA,
+                        table_name=table_name,
+                        column_name="max_temp,min_temp",
+                        severity="high",
+                        description="최고기온이 최저기온보다 낮은 데이터 발견",
+                        count=inconsistent_count,
+                        recommendation="온도 데이터 수집 로직 검토",
+                    )
+                )
+
+        quality_score = self._calculate_quality_score(
+            total_records, missing_data_count, duplicate_count, issues
+        )
+
+        return TableQualityResult(
+            table_name=table_name,
+            total_records=total_records,
+            missing_data_count=missing_data_count,
+            duplicate_count=duplicate_count,
+            quality_score=quality_score,
+            issues=issues,
+            check_timestamp=datetime.now(),
+            column_stats=column_stats,
+        )
+
+    def _profile_table(
+        self, table_name: str, check_config: Dict, available_columns: Set[str]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """단일 집계 쿼리로 테이블 프로파일 수집"""
+        query, plan = build_table_profile_query(table_name, check_config, available_columns)
+        result = self.db_manager.execute_query(query)
+        return (dict(result[0]) if result else {}), plan
+
+    def _get_table_columns(self, table_name: str) -> Set[str]:
+        """테이블 컬럼 목록 조회 (테이블이 없으면 빈 집합)"""
+        query = """
+        SELECT column_name
+        FROM information_schema.columns
+        WHERE table_name = %s AND table_schema = 'public'
+        """
+        try:
+            result = self.db_manager.execute_query(query, (table_name,))
+            return {row["column_name"] for row in result}
+        except:
+            return set()
+
+    def _missing_table_result(self, table_name: str) -> TableQualityResult:
+        """테이블이 존재하지 않는 경우의 검사 결과"""
+        issue = QualityIssue(
+            issue_type=QualityIssueType.MISSING_DATA,
+            table_name=table_name,
+            column_name=None,
+            severity="critical",
+            description=f"테이블 {table_name}이 존재하지 않음",
+            count=1,
+            recommendation="테이블 생성 또는 스키마 확인 필요",
+        )
+        return TableQualityResult(
+            table_name=table_name,
+            total_records=0,
+            missing_data_count=0,
+            duplicate_count=0,
+            quality_score=0.0,
+            issues=[issue],
+            check_timestamp=datetime.now(),
+        )
+
+    def _check_table_quality_per_check(
+        self, table_name: str, check_config: Dict
+    ) -> TableQualityResult:
+        """특정 테이블의 품질 검사 (검사 항목별 개별 쿼리)"""
         issues = []
 
         # 테이블 존재 여부 확인
         if not self._table_exists(table_name):
-            issue = QualityIssue(
-                issue_type=QualityIssueType.MISSING_DATA,
-                table_name=table_name,
-                column_name=None,
-                severity="critical",
-                description=f"테이블 {table_name}이 존재하지 않음",
-                count=1,
-                recommendation="테이블 생성 또는 스키마 확인 필요",
-            )
-            issues.append(issue)
-            return TableQualityResult(
-                table_name=table_name,
-                total_records=0,
-                missing_data_count=0,
-                duplicate_count=0,
-                quality_score=0.0,
-                issues=issues,
-                check_timestamp=datetime.now(),
-            )
+            return self._missing_table_result(table_name)
 
         # 기본 통계 수집
         total_records = self._get_record_count(table_name)
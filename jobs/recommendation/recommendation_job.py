@@ -5,7 +5,11 @@
 """
 
 from datetime import datetime
-from typing import Dict, List
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterator, List, Tuple
+
+import psycopg2.extras
 
 from app.core.base_job import BaseJob, JobResult, JobConfig
 from jobs.recommendation.travel_recommendation_engine import (
@@ -14,6 +18,35 @@ from jobs.recommendation.travel_recommendation_engine import (
 from app.core.database_manager import DatabaseManager
 
 
+# travel_weather_scores 일괄 UPSERT 쿼리
+TRAVEL_WEATHER_SCORE_UPSERT_SQL = """
+INSERT INTO travel_weather_scores
+(region_code, attraction_id, date_period, weather_score, temperature_score,
+ precipitation_score, humidity_score, overall_score, recommendation_level)
+VALUES %s
+ON CONFLICT (region_code, date_period) DO UPDATE SET
+weather_score = EXCLUDED.weather_score,
+temperature_score = EXCLUDED.temperature_score,
+precipitation_score = EXCLUDED.precipitation_score,
+humidity_score = EXCLUDED.humidity_score,
+overall_score = EXCLUDED.overall_score,
+recommendation_level = EXCLUDED.recommendation_level,
+updated_at = CURRENT_TIMESTAMP
+"""
+
+TRAVEL_WEATHER_SCORE_COLUMNS = (
+    "region_code",
+    "attraction_id",
+    "date_period",
+    "weather_score",
+    "temperature_score",
+    "precipitation_score",
+    "humidity_score",
+    "overall_score",
+    "recommendation_level",
+)
+
+
 class RecommendationJob(BaseJob):
     """추천 점수 계산 배치 작업"""
 
@@ -23,6 +56,10 @@ class RecommendationJob(BaseJob):
         self.db_manager = DatabaseManager()
         self.processed_records = 0
 
+        # 일괄 모드: 전체 지역 과거 날씨를 단일 쿼리로 스트리밍하고 한 번에 저장
+        self.bulk_mode = config.metadata.get("bulk_mode", True)
+        self.history_fetch_size = config.metadata.get("history_fetch_size", 10000)
+
     def execute(self) -> JobResult:
         """추천 점수 계산 실행"""
         result = JobResult(
@@ -37,25 +74,16 @@ class RecommendationJob(BaseJob):
             active_regions = self._get_active_regions()
             self.logger.info(f"추천 계산 대상 지역: {len(active_regions)}개")
 
-            # 지역별 추천 점수 계산
-            total_recommendations = 0
-            for region in active_regions:
-                try:
-                    recommendations = self._calculate_region_recommendations(region)
-                    saved_count = self._save_recommendations(recommendations)
-                    total_recommendations += saved_count
-                    self.logger.debug(
-                        f"지역 {region['region_name']} 추천 점수 {saved_count}건 저장"
-                    )
-                except Exception as e:
-                    self.logger.warning(
-                        f"지역 {region['region_name']} 추천 계산 실패: {str(e)}"
-                    )
+            if self.bulk_mode:
+                total_recommendations = self._execute_bulk(active_regions)
+            else:
+                total_recommendations = self._execute_per_region(active_regions)
 
             result.processed_records = total_recommendations
             result.metadata = {
                 "regions_processed": len(active_regions),
                 "recommendations_generated": total_recommendations,
+                "bulk_mode": self.bulk_mode,
             }
 
             self.logger.info(f"추천 점수 계산 완료: 총 {total_recommendations}건 처리")
@@ -66,6 +94,98 @@ class RecommendationJob(BaseJob):
 
         return result
 
+    def _execute_per_region(self, active_regions: List[Dict]) -> int:
+        """지역별 조회/저장 방식으로 추천 점수 계산"""
+        total_recommendations = 0
+        for region in active_regions:
+            try:
+                recommendations = self._calculate_region_recommendations(region)
+                saved_count = self._save_recommendations(recommendations)
+                total_recommendations += saved_count
+                self.logger.debug(
+                    f"지역 {region['region_name']} 추천 점수 {saved_count}건 저장"
+                )
+            except Exception as e:
+                self.logger.warning(
+                    f"지역 {region['region_name']} 추천 계산 실패: {str(e)}"
+                )
+
+        return total_recommendations
+
+    def _execute_bulk(self, active_regions: List[Dict]) -> int:
+        """
+        일괄 방식으로 추천 점수 계산
+
+        지역 수와 관계없이 과거 날씨 조회 1회, 저장 1회로 처리합니다.
+        """
+        region_infos = {
+            region["region_code"]: {
+                "region_code": region["region_code"],
+                "region_name": region["region_name"],
+                "attraction_id": None,
+            }
+            for region in active_regions
+        }
+        if not region_infos:
+            return 0
+
+        db_recommendations = []
+        regions_with_data = set()
+
+        for region_code, weather_data in self._stream_historical_weather_by_region(
+            list(region_infos.keys())
+        ):
+            regions_with_data.add(region_code)
+            try:
+                recommendations = self.recommendation_engine.calculate_monthly_recommendations_bulk(
+                    weather_data, {region_code: region_infos[region_code]}
+                ).get(region_code, [])
+                db_recommendations.extend(
+                    self._to_db_recommendation(rec) for rec in recommendations
+                )
+            except Exception as e:
+                self.logger.warning(
+                    f"지역 {region_infos[region_code]['region_name']} 추천 계산 실패: {str(e)}"
+                )
+
+        for region_code in region_infos.keys() - regions_with_data:
+            self.logger.warning(f"지역 {region_infos[region_code]['region_name']} 날씨 데이터 없음")
+
+        return self._save_recommendations_batch(db_recommendations)
+
+    def _stream_historical_weather_by_region(
+        self, region_codes: List[str]
+    ) -> Iterator[Tuple[str, List[Dict]]]:
+        """전체 지역의 과거 날씨를 서버 사이드 커서로 스트리밍하여 지역별로 반환"""
+        query = """
+        SELECT
+            region_code,
+            weather_date,
+            avg_temp,
+            max_temp,
+            min_temp,
+            humidity,
+            precipitation,
+            wind_speed,
+            weather_condition
+        FROM historical_weather_daily
+        WHERE region_code = ANY(%s)
+        AND weather_date >= CURRENT_DATE - INTERVAL '2 year'
+        AND avg_temp IS NOT NULL
+        ORDER BY region_code, weather_date
+        """
+
+        with self.db_manager.get_connection() as connection:
+            with connection.cursor(
+                name="recommendation_history_stream",
+                cursor_factory=psycopg2.extras.RealDictCursor,
+            ) as cursor:
+                cursor.itersize = self.history_fetch_size
+                cursor.execute(query, (region_codes,))
+
+                for region_code, rows in groupby(cursor, key=itemgetter("region_code")):
+                    yield region_code, [dict(row) for row in rows]
+
     def _get_active_regions(self) -> List[Dict]:
         """활성 지역 목록 조회"""
         query = """
@@ -118,27 +238,27 @@ class RecommendationJob(BaseJob):
             "attraction_id": None,
         }
 
-        recommendations = self.recommendation_engine.calculate_monthly_recommendations(
-            weather_data, region_info
-        )
+        recommendations = self.recommendation_engine.calculate_monthly_recommendations_bulk(
+            [dict(data, region_code=region["region_code"]) for data in weather_data],
+            {region["region_code"]: region_info},
+        ).get(region["region_code"], [])
 
         # 데이터베이스 저장 형식으로 변환
-        db_recommendations = []
-        for rec in recommendations:
-            db_rec = {
-                "region_code": rec.region_code,
-                "attraction_id": rec.attraction_id,
-                "date_period": rec.date_period.replace(year=datetime.now().year).date(),
-                "weather_score": rec.weather_score.overall_score,
-                "temperature_score": rec.weather_score.temperature_score,
-                "precipitation_score": rec.weather_score.precipitation_score,
-                "humidity_score": rec.weather_score.humidity_score,
-                "overall_score": rec.weather_score.overall_score,
-                "recommendation_level": rec.recommendation_level.value,
-            }
-            db_recommendations.append(db_rec)
-
-        return db_recommendations
+        return [self._to_db_recommendation(rec) for rec in recommendations]
+
+    def _to_db_recommendation(self, rec) -> Dict:
+        """추천 결과를 travel_weather_scores 저장 형식으로 변환"""
+        return {
+            "region_code": rec.region_code,
+            "attraction_id": rec.attraction_id,
+            "date_period": rec.date_period.replace(year=datetime.now().year).date(),
+            "weather_score": rec.weather_score.overall_score,
+            "temperature_score": rec.weather_score.temperature_score,
+            "precipitation_score": rec.weather_score.precipitation_score,
+            "humidity_score": rec.weather_score.humidity_score,
+            "overall_score": rec.weather_score.overall_score,
+            "recommendation_level": rec.recommendation_level.value,
+        }
 
     def _get_historical_weather_data(self, region_code: str) -> List[Dict]:
         """특정 지역의 과거 날씨 데이터 조회"""
@@ -209,6 +329,29 @@ class RecommendationJob(BaseJob):
         self.logger.debug(f"추천 점수 {saved_count}건 저장")
         return saved_count
 
+    def _save_recommendations_batch(self, recommendations: List[Dict]) -> int:
+        """추천 점수를 단일 UPSERT 문으로 저장"""
+        if not recommendations:
+            return 0
+
+        rows = [
+            tuple(rec[column] for column in TRAVEL_WEATHER_SCORE_COLUMNS)
+            for rec in recommendations
+        ]
+
+        try:
+            with self.db_manager.get_cursor() as cursor:
+                psycopg2.extras.execute_values(
+                    cursor, TRAVEL_WEATHER_SCORE_UPSERT_SQL, rows, page_size=len(rows)
+                )
+                saved_count = cursor.rowcount
+        except Exception as e:
+            self.logger.warning(f"추천 점수 일괄 저장 실패, 개별 저장으로 전환: {e}")
+            return self._save_recommendations(recommendations)
+
+        self.logger.debug(f"추천 점수 {saved_count}건 일괄 저장")
+        return saved_count
+
     def pre_execute(self) -> bool:
         """실행 전 검증"""
         # 데이터베이스 연결 확인
@@ -7,7 +7,7 @@
 
 import numpy as np
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 from dataclasses import dataclass
 from enum import Enum
 
@@ -44,6 +44,34 @@ class TravelRecommendation:
     best_activities: List[str]
 
 
+# 월별 최적 기온 범위
+MONTHLY_OPTIMAL_TEMP_RANGES = {
+    1: (-5, 10),
+    2: (0, 12),
+    3: (8, 18),
+    4: (15, 23),
+    5: (18, 26),
+    6: (22, 30),
+    7: (24, 32),
+    8: (24, 32),
+    9: (20, 28),
+    10: (15, 25),
+    11: (8, 18),
+    12: (-2, 12),
+}
+
+# 계절별 최적 풍속 범위
+SEASONAL_OPTIMAL_WIND = {
+    "spring": (2, 8),
+    "summer": (3, 10),
+    "autumn": (2, 8),
+    "winter": (0, 6),
+}
+
+# 월별 평균 계산 대상 컬럼
+WEATHER_COLUMNS = ("avg_temp", "precipitation", "humidity", "wind_speed")
+
+
 class WeatherBasedRecommendationEngine:
     """날씨 기반 여행지 추천 엔진"""
 
@@ -102,23 +130,7 @@ class WeatherBasedRecommendationEngine:
 
     def calculate_temperature_score(self, temp: float, month: int) -> float:
         """기온 점수 계산"""
-        # 월별 최적 기온 범위
-        optimal_ranges = {
-            1: (-5, 10),
-            2: (0, 12),
-            3: (8, 18),
-            4: (15, 23),
-            5: (18, 26),
-            6: (22, 30),
-            7: (24, 32),
-            8: (24, 32),
-            9: (20, 28),
-            10: (15, 25),
-            11: (8, 18),
-            12: (-2, 12),
-        }
-
-        min_temp, max_temp = optimal_ranges[month]
+        min_temp, max_temp = MONTHLY_OPTIMAL_TEMP_RANGES[month]
 
         if min_temp <= temp <= max_temp:
             # 최적 범위 내: 8-10점
@@ -176,14 +188,7 @@ class WeatherBasedRecommendationEngine:
 
     def calculate_wind_score(self, wind_speed: float, season: str) -> float:
         """풍속 점수 계산"""
-        seasonal_optimal = {
-            "spring": (2, 8),
-            "summer": (3, 10),
-            "autumn": (2, 8),
-            "winter": (0, 6),
-        }
-
-        min_wind, max_wind = seasonal_optimal.get(season, (2, 8))
+        min_wind, max_wind = SEASONAL_OPTIMAL_WIND.get(season, (2, 8))
 
         if min_wind <= wind_speed <= max_wind:
             return 9 + (wind_speed - min_wind) / (max_wind - min_wind)
@@ -243,6 +248,121 @@ class WeatherBasedRecommendationEngine:
             overall_score=round(overall_score, 2),
         )
 
+    def calculate_weather_scores_array(
+        self,
+        avg_temp: Sequence[float],
+        precipitation: Sequence[float],
+        humidity: Sequence[float],
+        wind_speed: Sequence[float],
+        months: Sequence[int],
+    ) -> Dict[str, np.ndarray]:
+        """
+        날씨 점수 일괄 계산 (컬럼 단위)
+
+        calculate_weather_score와 동일한 규칙을 배열 연산으로 적용합니다.
+        결측값(NaN)은 스칼라 경로의 max() 동작과 같도록 np.fmax로 하한을 적용합니다.
+
+        Returns:
+            Dict[str, np.ndarray]: 구성 요소별 점수 배열 (반올림 전)
+        """
+        temp = np.asarray(avg_temp, dtype=float)
+        precip = np.asarray(precipitation, dtype=float)
+        humid = np.asarray(humidity, dtype=float)
+        wind = np.asarray(wind_speed, dtype=float)
+        months = np.asarray(months, dtype=int)
+
+        month_index = np.arange(13)
+        seasons = [self.get_season(m) if m else "winter" for m in month_index]
+
+        temp_min = np.array([MONTHLY_OPTIMAL_TEMP_RANGES.get(m, (0, 0))[0] for m in month_index], dtype=float)[months]
+        temp_max = np.array([MONTHLY_OPTIMAL_TEMP_RANGES.get(m, (0, 0))[1] for m in month_index], dtype=float)[months]
+        wind_min = np.array([SEASONAL_OPTIMAL_WIND[s][0] for s in seasons], dtype=float)[months]
+        wind_max = np.array([SEASONAL_OPTIMAL_WIND[s][1] for s in seasons], dtype=float)[months]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # 기온 점수
+            center = (temp_min + temp_max) / 2
+            in_range_score = np.fmax(
+                8, 10 - (np.abs(temp - center) / ((temp_max - temp_min) / 2)) * 2
+            )
+            temp_score = np.select(
+                [(temp_min <= temp) & (temp <= temp_max), temp < temp_min],
+                [in_range_score, np.fmax(0, 8 - (temp_min - temp) * 0.5)],
+                default=np.fmax(0, 8 - (temp - temp_max) * 0.3),
+            )
+
+            # 강수 점수
+            precip_score = np.select(
+                [precip == 0, precip <= 1, precip <= 5, precip <= 10, precip <= 20],
+                [
+                    10,
+                    9,
+                    8 - (precip - 1) * 0.5,
+                    6 - (precip - 5) * 0.4,
+                    4 - (precip - 10) * 0.2,
+                ],
+                default=np.fmax(0, 2 - (precip - 20) * 0.1),
+            )
+
+            # 습도 점수 (기온 고려)
+            humidity_score = np.select(
+                [
+                    (temp < 10) & (humid <= 80),
+                    temp < 10,
+                    (temp < 25) & (40 <= humid) & (humid <= 70),
+                    temp < 25,
+                    humid <= 60,
+                ],
+                [
+                    10 - (humid - 40) * 0.05,
+                    np.fmax(6, 10 - (humid - 80) * 0.2),
+                    10 - np.abs(humid - 55) * 0.1,
+                    np.fmax(4, 10 - np.abs(humid - 55) * 0.15),
+                    10 - (humid - 30) * 0.1,
+                ],
+                default=np.fmax(2, 10 - (humid - 60) * 0.2),
+            )
+
+            # 풍속 점수
+            wind_score = np.select(
+                [
+                    (wind_min <= wind) & (wind <= wind_max),
+                    wind < wind_min,
+                    wind <= wind_max + 5,
+                ],
+                [
+                    9 + (wind - wind_min) / (wind_max - wind_min),
+                    7 + (wind / wind_min) * 2,
+                    9 - (wind - wind_max) * 0.8,
+                ],
+                default=np.fmax(0, 5 - (wind - wind_max - 5) * 0.3),
+            )
+
+        # 계절별 가중치 적용 (스칼라 경로와 같은 연산 순서 유지)
+        weights = self.seasonal_weights
+        weight_columns = {
+            key: np.array([weights[key][s] for s in seasons], dtype=float)[months]
+            for key in weights.keys()
+        }
+        weight_total = np.array(
+            [sum(weights[key][s] for key in weights.keys()) for s in seasons], dtype=float
+        )[months]
+
+        overall_score = (
+            temp_score * weight_columns["temperature"]
+            + precip_score * weight_columns["precipitation"]
+            + humidity_score * weight_columns["humidity"]
+            + wind_score * weight_columns["wind"]
+        ) / weight_total
+
+        return {
+            "temperature_score": temp_score,
+            "precipitation_score": precip_score,
+            "humidity_score": humidity_score,
+            "wind_score": wind_score,
+            "overall_score": overall_score,
+        }
+
     def get_recommendation_level(self, score: float) -> RecommendationLevel:
         """점수를 기반으로 추천 등급 결정"""
         if score >= 8.5:
@@ -377,6 +497,112 @@ class WeatherBasedRecommendationEngine:
 
         return monthly_recommendations
 
+    def calculate_monthly_recommendations_bulk(
+        self, historical_weather_data: List[Dict], region_infos: Dict[str, Dict]
+    ) -> Dict[str, List[TravelRecommendation]]:
+        """
+        여러 지역의 월별 여행 추천 일괄 계산
+
+        calculate_monthly_recommendations와 같은 결과를 반환하지만, 전체 지역의
+        과거 날씨를 한 번에 컬럼 배열로 변환하여 월별 평균과 점수를 벡터 연산으로 계산합니다.
+
+        Args:
+            historical_weather_data: region_code가 포함된 과거 날씨 레코드 목록
+            region_infos: 지역 코드별 지역 정보 (region_code, region_name, attraction_id)
+
+        Returns:
+            Dict[str, List[TravelRecommendation]]: 지역 코드별 월별 추천 목록
+        """
+        if not historical_weather_data:
+            return {}
+
+        region_codes = list(region_infos.keys())
+        region_positions = {code: idx for idx, code in enumerate(region_codes)}
+
+        rows = [
+            data for data in historical_weather_data
+            if data.get("region_code") in region_positions
+        ]
+        if not rows:
+            return {}
+
+        region_idx = np.fromiter(
+            (region_positions[data["region_code"]] for data in rows), dtype=np.int64, count=len(rows)
+        )
+        months = np.fromiter(
+            (data["weather_date"].month for data in rows), dtype=np.int64, count=len(rows)
+        )
+
+        # 값이 없거나 0인 항목은 스칼라 경로와 같이 평균에서 제외
+        columns = {}
+        for column in WEATHER_COLUMNS:
+            values = np.array(
+                [data[column] if data[column] else np.nan for data in rows], dtype=float
+            )
+            columns[column] = values
+
+        # (지역, 월) 그룹화: 그룹 내 원래 순서를 유지하여 평균 계산 결과를 동일하게 유지
+        group_codes = region_idx * 13 + months
+        unique_codes, first_index, inverse = np.unique(
+            group_codes, return_index=True, return_inverse=True
+        )
+        order = np.argsort(inverse, kind="stable")
+        boundaries = np.cumsum(np.bincount(inverse))[:-1]
+
+        group_means = {}
+        for column, values in columns.items():
+            means = np.empty(len(unique_codes))
+            for group, chunk in enumerate(np.split(values[order], boundaries)):
+                valid = chunk[~np.isnan(chunk)]
+                means[group] = np.mean(valid) if len(valid) else np.nan
+            group_means[column] = means
+
+        group_months = unique_codes % 13
+        scores = self.calculate_weather_scores_array(
+            group_means["avg_temp"],
+            group_means["precipitation"],
+            group_means["humidity"],
+            group_means["wind_speed"],
+            group_months,
+        )
+
+        # 지역별로 월이 처음 등장한 순서대로 추천 생성
+        results: Dict[str, List[TravelRecommendation]] = {}
+        for group in np.argsort(first_index, kind="stable"):
+            region_info = region_infos[region_codes[unique_codes[group] // 13]]
+            month = int(group_months[group])
+
+            avg_weather = {column: group_means[column][group] for column in WEATHER_COLUMNS}
+            weather_score = WeatherScore(
+                temperature_score=round(float(scores["temperature_score"][group]), 2),
+                precipitation_score=round(float(scores["precipitation_score"][group]), 2),
+                humidity_score=round(float(scores["humidity_score"][group]), 2),
+                wind_score=round(float(scores["wind_score"][group]), 2),
+                overall_score=round(float(scores["overall_score"][group]), 2),
+            )
+            recommendation_level = self.get_recommendation_level(
+                weather_score.overall_score
+            )
+
+            results.setdefault(region_info["region_code"], []).append(
+                TravelRecommendation(
+                    region_code=region_info["region_code"],
+                    region_name=region_info["region_name"],
+                    attraction_id=region_info.get("attraction_id"),
+                    date_period=datetime(2024, month, 1),  # 예시 연도
+                    weather_score=weather_score,
+                    recommendation_level=recommendation_level,
+                    recommendation_reason=self.generate_recommendation_reason(
+                        weather_score, recommendation_level, avg_weather
+                    ),
+                    best_activities=self.get_recommended_activities(
+                        avg_weather, weather_score.overall_score
+                    ),
+                )
+            )
+
+        return results
+
 
 # 사용 예시
 if __name__ == "__main__":
@@ -5,7 +5,7 @@
 실행 주기: 매일 새벽 1시
 """
 
-import gzip
+import asyncio
 import shutil
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -13,6 +13,7 @@ from typing import Dict, Any
 import boto3
 from botocore.exceptions import ClientError
 
+from app.core.cpu_offload_executor import get_cpu_offload_executor
 from app.core.logger import get_logger
 from config.batch_settings import get_log_settings, get_aws_settings
 from utils.file_manager import FileManager
@@ -121,6 +122,7 @@ class LogCleanupJob:
 
             # 로그 파일 검색 패턴들
             patterns = ["*.log", "*.out", "*.err"]
+            compress_targets = []
 
             for pattern in patterns:
                 log_files = list(log_dir.glob(pattern))
@@ -131,8 +133,7 @@ class LogCleanupJob:
                         file_mtime = datetime.fromtimestamp(log_file.stat().st_mtime)
 
                         if file_mtime < cutoff_date:
-                            await self._compress_file(log_file)
-                            self.compressed_files += 1
+                            compress_targets.append(log_file)
 
                         self.processed_files += 1
 
@@ -140,6 +141,17 @@ class LogCleanupJob:
                         self.logger.warning(f"파일 압축 실패 [{log_file}]: {e}")
                         continue
 
+            # 압축은 CPU 오프로드 실행기에서 동시에 처리 (대기 작업 수는 실행기가 제한)
+            results = await asyncio.gather(
+                *(self._compress_file(log_file) for log_file in compress_targets),
+                return_exceptions=True,
+            )
+            for log_file, result in zip(compress_targets, results):
+                if isinstance(result, Exception):
+                    self.logger.warning(f"파일 압축 실패 [{log_file}]: {result}")
+                else:
+                    self.compressed_files += 1
+
             self.logger.info(f"로그 파일 압축 완료: {self.compressed_files}개")
 
         except Exception as e:
@@ -157,10 +169,8 @@ class LogCleanupJob:
 
             original_size = file_path.stat().st_size
 
-            # 파일 압축
-            with open(file_path, "rb") as f_in:
-                with gzip.open(compressed_path, "wb") as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+            # 파일 압축 (이벤트 루프 밖 스레드 풀에서 실행)
+            await get_cpu_offload_executor().gzip_file(file_path, compressed_path)
 
             # 압축률 확인
             compressed_size = compressed_path.stat().st_size
@@ -77,6 +77,7 @@ class ComprehensiveTourismJob(BaseJob):
                     auto_transform=True,  # 자동 변환 수행
                     include_new_apis=True,  # 신규 추가된 4개 API 포함
                     include_hierarchical_regions=True,  # 계층적 지역코드 수집 포함
+                    parallel_pages=True,  # 목록 페이지 병렬 수집
                 )
 
                 self.logger.info(
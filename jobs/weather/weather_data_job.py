@@ -140,8 +140,11 @@ class WeatherDataJob(BaseJob):
             if response.success:
                 # 데이터 변환 및 저장
                 transform_result = (
-                    await self.transformation_pipeline.transform_raw_data(
-                        response.raw_data_id
+                    await self.transformation_pipeline.transform_response(
+                        APIProvider.WEATHER.value,
+                        "weather",
+                        response.data,
+                        response.raw_data_id,
                     )
                 )
 
@@ -188,8 +191,11 @@ class WeatherDataJob(BaseJob):
             if response.success:
                 # 데이터 변환 및 저장
                 transform_result = (
-                    await self.transformation_pipeline.transform_raw_data(
-                        response.raw_data_id
+                    await self.transformation_pipeline.transform_response(
+                        APIProvider.WEATHER.value,
+                        "forecast",
+                        response.data,
+                        response.raw_data_id,
                     )
                 )
 
@@ -239,8 +245,11 @@ class WeatherDataJob(BaseJob):
             if response.success:
                 # 데이터 변환 및 저장
                 transform_result = (
-                    await self.transformation_pipeline.transform_raw_data(
-                        response.raw_data_id
+                    await self.transformation_pipeline.transform_response(
+                        APIProvider.KMA.value,
+                        "getWthrDataList",
+                        response.data,
+                        response.raw_data_id,
                     )
                 )
 
@@ -60,7 +60,7 @@ class TestWeatherDataJobIntegration(unittest.TestCase):
         mock_transform_result = Mock()
         mock_transform_result.success = True
         mock_transform_result.processed_data = [{"temperature": 25.0, "humidity": 60.0}]
-        mock_transform_pipeline.transform_raw_data.return_value = mock_transform_result
+        mock_transform_pipeline.transform_response.return_value = mock_transform_result
 
         # 데이터베이스 실행 mock
         mock_db_mgr.execute_query.return_value = None
@@ -0,0 +1,148 @@
+"""
+API 키별 토큰 버킷 속도 제한기 단위 테스트
+"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from app.core.concurrent_api_manager import APIKeyRateLimiter, TokenBucket
+from app.core.multi_api_key_manager import (
+    APIKeyInfo, APIProvider, MultiAPIKeyManager, set_preferred_api_key, reset_preferred_api_key
+)
+
+
+class FakeClock:
+    """asyncio.sleep 호출 시 시간이 흐르는 가짜 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeKeyManager:
+    """사용 가능한 키 목록만 제공하는 키 매니저"""
+
+    def __init__(self, keys):
+        self.keys = keys
+
+    def get_available_keys(self, provider):
+        return [k for k in self.keys if k.provider == provider and k.current_usage < k.daily_limit]
+
+
+class TestTokenBucket(unittest.TestCase):
+    """토큰 버킷 테스트"""
+
+    def test_refill_and_wait_time(self):
+        bucket = TokenBucket(rate=2.0, capacity=2, now=0.0)
+
+        self.assertTrue(bucket.try_acquire(0.0))
+        self.assertTrue(bucket.try_acquire(0.0))
+        self.assertFalse(bucket.try_acquire(0.0))
+        self.assertAlmostEqual(bucket.wait_time(0.0), 0.5)
+        self.assertTrue(bucket.try_acquire(0.5))
+        self.assertAlmostEqual(bucket.available(10.0), 2.0)
+
+        bucket.drain(10.0)
+        self.assertAlmostEqual(bucket.wait_time(10.0), 0.5)
+
+
+class TestAPIKeyRateLimiter(unittest.TestCase):
+    """키별 속도 제한기 테스트"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.keys = [APIKeyInfo(key=f"kto-key-{n}-abcdef", provider=APIProvider.KTO) for n in range(3)]
+        self.limiter = APIKeyRateLimiter(
+            FakeKeyManager(self.keys), rates={APIProvider.KTO: 5.0}, burst=5, clock=self.clock
+        )
+
+    def _acquire(self, count, provider=APIProvider.KTO):
+        async def run():
+            with patch("app.core.concurrent_api_manager.asyncio.sleep", self.clock.sleep):
+                return [await self.limiter.acquire(provider) for _ in range(count)]
+        return asyncio.run(run())
+
+    def test_spreads_across_keys_without_sleeping(self):
+        """키 수만큼 버스트를 대기 없이 분산 사용"""
+        acquired = self._acquire(15)
+
+        self.assertEqual(self.clock.sleeps, [])
+        for key_info in self.keys:
+            self.assertEqual(sum(1 for k in acquired if k is key_info), 5)
+
+    def test_waits_only_when_all_buckets_empty(self):
+        """모든 키의 버킷이 비었을 때만 다음 토큰까지 대기"""
+        self._acquire(16)
+
+        self.assertEqual(len(self.clock.sleeps), 1)
+        self.assertAlmostEqual(self.clock.sleeps[0], 0.2)
+
+    def test_throughput_scales_with_keys(self):
+        """키 N개면 같은 시간에 N배 호출"""
+        self._acquire(3 * 5 + 3 * 10)
+        multi_key_elapsed = self.clock.now
+
+        self.clock = FakeClock()
+        self.limiter = APIKeyRateLimiter(
+            FakeKeyManager(self.keys[:1]), rates={APIProvider.KTO: 5.0}, burst=5, clock=self.clock
+        )
+        self._acquire(5 + 10)
+
+        self.assertAlmostEqual(multi_key_elapsed, 2.0, places=5)
+        self.assertAlmostEqual(self.clock.now, 2.0, places=5)
+
+    def test_daily_limit_includes_in_flight_calls(self):
+        """진행 중인 호출까지 포함해 일일 한도 초과 키 제외"""
+        self.keys[0].daily_limit = 2
+        self.keys[0].current_usage = 1
+        acquired = self._acquire(15)
+
+        self.assertEqual(sum(1 for k in acquired if k is self.keys[0]), 1)
+
+        self.limiter.release(APIProvider.KTO, self.keys[0])
+        self.assertEqual(self.limiter._in_flight.get((APIProvider.KTO, self.keys[0].key)), None)
+
+    def test_provider_bucket_without_keys(self):
+        """키가 없는 제공자는 제공자 단위 버킷 사용"""
+        acquired = self._acquire(3, provider=APIProvider.KMA)
+
+        self.assertEqual(acquired, [None, None, None])
+        self.assertEqual(self.limiter.get_status()["calls_by_key"], {"provider": 3})
+
+
+class TestPreferredAPIKey(unittest.TestCase):
+    """호출 컨텍스트 지정 키 우선 사용 테스트"""
+
+    def test_get_active_key_prefers_context_key(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        env = {"KTO_API_KEY": "test-kto-key-1,test-kto-key-2", "KMA_API_KEY": ""}
+        with patch.dict(os.environ, env), patch("dotenv.load_dotenv"):
+            manager = MultiAPIKeyManager(cache_file=os.path.join(temp_dir.name, "cache.json"))
+
+        try:
+            self.assertEqual(manager.get_active_key(APIProvider.KTO).key, "test-kto-key-1")
+
+            token = set_preferred_api_key("test-kto-key-2")
+            try:
+                self.assertEqual(manager.get_active_key(APIProvider.KTO).key, "test-kto-key-2")
+            finally:
+                reset_preferred_api_key(token)
+
+            self.assertEqual(manager.get_active_key(APIProvider.KTO).key, "test-kto-key-1")
+        finally:
+            manager.close()
+            temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+API 성능 추적기 링 버퍼 이동 윈도우 단위 테스트
+"""
+
+import random
+import unittest
+from datetime import datetime
+
+from app.monitoring.api_performance_tracker import (
+    APICallRecord, APICallStatus, APIPerformanceTracker, LatencyHistogram, RollingWindow
+)
+
+
+class FakeClock:
+    """epoch 초를 직접 지정하는 시계"""
+
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """응답 시간 히스토그램 테스트"""
+
+    def test_percentile_within_relative_accuracy(self):
+        rng = random.Random(24)
+        values = [rng.lognormvariate(5, 1) for _ in range(5000)]
+        histogram = LatencyHistogram(relative_accuracy=0.01)
+        for value in values:
+            histogram.record(value)
+
+        tracker = APIPerformanceTracker()
+        for percentile in (50, 95, 99):
+            exact = tracker._calculate_percentile(values, percentile)
+            estimate = tracker._calculate_percentile(histogram, percentile)
+            self.assertLess(abs(estimate - exact) / exact, 0.03)
+
+        self.assertEqual(histogram.percentile(0), min(values))
+        self.assertEqual(histogram.percentile(100), max(values))
+
+    def test_merge(self):
+        left, right, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for value in range(1, 101):
+            (left if value % 2 else right).record(float(value))
+            combined.record(float(value))
+        left.merge(right)
+
+        self.assertEqual(left.count, 100)
+        self.assertEqual(left.percentile(90), combined.percentile(90))
+
+
+class TestRollingWindow(unittest.TestCase):
+    """초 단위 이동 윈도우 테스트"""
+
+    def test_buckets_expire(self):
+        window = RollingWindow(window_seconds=60)
+        for second in range(100):
+            window.record(1000 + second, 10.0, is_error=second % 10 == 0)
+
+        summary = window.summary(1099.5)
+        self.assertEqual(summary["count"], 60)
+        self.assertEqual(summary["errors"], 6)
+        self.assertAlmostEqual(summary["duration_ms"], 600.0)
+
+        self.assertEqual(window.summary(1130)["count"], 29)
+        self.assertEqual(window.summary(5000)["count"], 0)
+
+        # 윈도우 밖 과거 호출은 무시
+        window.record(1000, 10.0, False)
+        self.assertEqual(window.summary(5000)["count"], 0)
+
+
+class TestTrackerRealTimeMetrics(unittest.TestCase):
+    """실시간 메트릭 테스트"""
+
+    def _record(self, tracker, second, duration_ms, status=APICallStatus.SUCCESS):
+        tracker.record_api_call(APICallRecord(
+            call_id=f"call_{second}_{duration_ms}",
+            provider="kto",
+            endpoint="areaBasedList2",
+            timestamp=datetime.fromtimestamp(second),
+            duration_ms=duration_ms,
+            status=status,
+        ))
+
+    def test_real_time_metrics_follow_clock(self):
+        clock = FakeClock()
+        tracker = APIPerformanceTracker(clock=clock)
+        start = int(clock.now) - 89
+        for n in range(90):
+            self._record(tracker, start + n + 0.5, 100.0 if n < 60 else 200.0,
+                         APICallStatus.ERROR if n % 3 == 0 else APICallStatus.SUCCESS)
+
+        metrics = tracker.get_real_time_metrics()
+
+        self.assertAlmostEqual(metrics["current_rps"], 1.0)
+        self.assertAlmostEqual(metrics["avg_response_time_1min"], 150.0)
+        self.assertAlmostEqual(metrics["error_rate_1min"], 100 / 3)
+        self.assertAlmostEqual(metrics["p95_response_time_1min"], 200.0, delta=4.0)
+
+        clock.now += 120
+        self.assertEqual(tracker.get_real_time_metrics()["current_rps"], 0.0)
+
+        performance = tracker.get_endpoint_performance("kto", "areaBasedList2")
+        self.assertAlmostEqual(performance["response_time_stats"]["p50_ms"], 100.0, delta=2.0)
+
+        tracker.reset_statistics()
+        self.assertEqual(tracker.get_real_time_metrics()["avg_response_time_1min"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+아카이빙 엔진 keyset 후보 페이지 조회 단위 테스트
+"""
+
+import asyncio
+import unittest
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from app.archiving.archival_engine import ArchivalEngine
+
+
+class FakeConnection:
+    """keyset 페이지 조회와 페이로드 조회에 응답하는 asyncpg 연결"""
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def fetch(self, query, *params):
+        self.pool.queries.append((query, params))
+
+        if "raw_response" in query:
+            ids = set(params[0])
+            return [(row[0], self.pool.payloads[row[0]]) for row in self.pool.rows if row[0] in ids]
+
+        limit = params[-1]
+        rows = sorted(self.pool.rows, key=lambda row: (row[3], row[0]))
+        if "(created_at, id) >" in query:
+            last_key = (params[-3], params[-2])
+            rows = [row for row in rows if (row[3], row[0]) > last_key]
+        return rows[:limit]
+
+
+class FakePool:
+    """get_async_connection만 제공하는 연결 풀"""
+
+    def __init__(self, rows, payloads):
+        self.rows = rows
+        self.payloads = payloads
+        self.queries = []
+
+    @asynccontextmanager
+    async def get_async_connection(self):
+        yield FakeConnection(self)
+
+
+class TestKeysetCandidatePages(unittest.TestCase):
+    """(created_at, id) keyset 페이지 조회 테스트"""
+
+    def setUp(self):
+        same_time = datetime(2026, 1, 1, 9, 0)
+        created = [
+            datetime(2025, 12, 31), same_time, same_time, same_time, same_time,
+            datetime(2026, 1, 2), same_time,
+        ]
+        # 같은 created_at 값이 페이지 경계를 넘어가도록 구성
+        self.rows = [
+            (record_id, "KTO", "areaBasedList2", created_at, created_at, 100, 200)
+            for record_id, created_at in zip([7, 3, 1, 6, 2, 4, 5], created)
+        ]
+        self.payloads = {row[0]: {"items": [row[0]]} for row in self.rows}
+        self.pool = FakePool(self.rows, self.payloads)
+
+        with patch("app.archiving.archival_engine.get_archival_policy_manager"), \
+                patch("app.archiving.archival_engine.get_connection_pool", return_value=self.pool):
+            self.engine = ArchivalEngine(backup_manager=MagicMock())
+        self.engine.candidate_page_size = 2
+
+    def _pages(self):
+        async def collect():
+            return [page async for page in self.engine._iter_archival_candidate_pages("KTO")]
+        return asyncio.run(collect())
+
+    def test_pages_across_equal_created_at(self):
+        """같은 created_at이 여러 페이지에 걸쳐도 id 순으로 누락/중복 없이 조회"""
+        pages = self._pages()
+
+        ids = [candidate["id"] for page in pages for candidate in page]
+        self.assertEqual(ids, [7, 1, 2, 3, 5, 6, 4])
+        self.assertEqual([len(page) for page in pages], [2, 2, 2, 1])
+
+        candidate_queries = [query for query, _ in self.pool.queries]
+        self.assertTrue(all("raw_response" not in query for query in candidate_queries))
+        self.assertNotIn("(created_at, id) >", candidate_queries[0])
+        self.assertIn("ORDER BY created_at ASC, id ASC", candidate_queries[1])
+        self.assertEqual(self.pool.queries[1][1], ("KTO", datetime(2026, 1, 1, 9, 0), 1, 2))
+
+    def test_payloads_loaded_lazily_per_batch(self):
+        """응답 본문은 실행 배치 단위로만 로드하고 실행 후 해제"""
+        rule = MagicMock(rule_id="rule", name="규칙")
+        self.engine.policy_manager.get_archival_rules.return_value = [rule]
+        self.engine.policy_manager.evaluate_archival_condition.return_value = True
+
+        async def run():
+            page = [page async for page in self.engine._iter_archival_candidate_pages()][0]
+            tasks = await self.engine._create_archival_tasks(page)
+            self.assertTrue(all("response_data" not in t.metadata["candidate_data"] for t in tasks))
+
+            await self.engine._load_task_payloads(tasks)
+            loaded = [t.metadata["candidate_data"]["response_data"] for t in tasks]
+            self.engine._release_task_payloads(tasks)
+            return tasks, loaded
+
+        tasks, loaded = asyncio.run(run())
+
+        self.assertEqual(loaded, [{"items": [7]}, {"items": [1]}])
+        self.assertEqual(self.pool.queries[-1][1], ([7, 1],))
+        self.assertTrue(all("response_data" not in t.metadata["candidate_data"] for t in tasks))
+
+
+if __name__ == "__main__":
+    unittest.main()
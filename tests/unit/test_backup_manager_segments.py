@@ -0,0 +1,159 @@
+"""
+백업 관리자 세그먼트 저장 형식 단위 테스트
+"""
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.archiving.archival_policies import (
+    ArchivalRule, ArchivalTrigger, CompressionType, StorageLocation
+)
+from app.archiving.backup_manager import (
+    BackupManager, BackupConfiguration, BackupStatus
+)
+
+
+class TestSegmentBackup(unittest.TestCase):
+    """세그먼트 백업/복원 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = BackupManager(BackupConfiguration(
+            base_backup_path=self.temp_dir.name,
+            segment_max_bytes=256,
+        ))
+        self.rule = ArchivalRule(
+            rule_id="test_rule",
+            name="테스트 규칙",
+            description="세그먼트 테스트",
+            trigger=list(ArchivalTrigger)[0],
+            condition={},
+            target_location=StorageLocation.LOCAL_DISK,
+            compression=CompressionType.GZIP,
+            retention_days=30,
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _items(self, count, start=0):
+        return [
+            {
+                "data_id": f"data-{n}",
+                "api_provider": "KTO",
+                "endpoint": "areaBasedList2",
+                "data": {"contentid": n, "title": f"관광지 {n}", "addr": "서울특별시 " * (n % 7)},
+            }
+            for n in range(start, start + count)
+        ]
+
+    def test_batch_backup_and_single_record_restore(self):
+        """여러 레코드를 하나의 세그먼트에 저장하고 개별 복원"""
+        items = self._items(20)
+
+        async def scenario():
+            records = await self.manager.backup_data_batch(items, self.rule)
+            restored = [await self.manager.restore_data(r.backup_id) for r in records]
+            return records, restored
+
+        records, restored = asyncio.run(scenario())
+
+        self.assertTrue(all(r.status == BackupStatus.COMPLETED for r in records))
+        self.assertEqual(len({r.backup_path for r in records}), 1)
+        self.assertEqual(restored, [item["data"] for item in items])
+
+    def test_segments_roll_and_are_sealed(self):
+        """세그먼트 크기 초과 시 새 세그먼트로 롤링하고 봉인 시 체크섬 기록"""
+
+        async def scenario():
+            records = []
+            for start in range(0, 60, 10):
+                records += await self.manager.backup_data_batch(self._items(10, start), self.rule)
+            await self.manager.seal_active_segments()
+            return records
+
+        records = asyncio.run(scenario())
+        segment_paths = sorted({Path(r.backup_path) for r in records})
+
+        self.assertGreater(len(segment_paths), 1)
+        for path in segment_paths:
+            checksum_file = path.with_name(path.name + ".sha256")
+            index_file = path.with_name(path.name + ".idx")
+            self.assertTrue(checksum_file.exists())
+            self.assertEqual(
+                checksum_file.read_text().split()[0],
+                self.manager.calculate_checksum(path.read_bytes()),
+            )
+            self.assertTrue(index_file.exists())
+
+        restored = asyncio.run(self.manager.restore_data(records[37].backup_id))
+        self.assertEqual(restored["contentid"], 37)
+
+    def _restarted_manager(self):
+        return BackupManager(BackupConfiguration(
+            base_backup_path=self.temp_dir.name,
+            segment_max_bytes=256,
+        ))
+
+    def test_restore_after_restart_uses_segment_index(self):
+        """재시작 후 메모리에 없는 backup_id는 오프셋 인덱스로 복원"""
+        items = self._items(30)
+
+        async def scenario():
+            records = await self.manager.backup_data_batch(items, self.rule)
+            await self.manager.seal_active_segments()
+
+            restarted = self._restarted_manager()
+            restored = [await restarted.restore_data(r.backup_id) for r in records]
+            return records, restarted, restored
+
+        records, restarted, restored = asyncio.run(scenario())
+
+        self.assertEqual(restored, [item["data"] for item in items])
+        record = restarted.get_backup_record(records[7].backup_id)
+        self.assertEqual(record.original_data_id, "data-7")
+        self.assertEqual(record.api_provider, "KTO")
+        self.assertEqual(record.metadata, records[7].metadata)
+        self.assertIsNone(asyncio.run(restarted.restore_data("unknown")))
+
+    def test_cleanup_after_restart_releases_segments(self):
+        """재시작 후 정리 시 인덱스로 참조 수를 복구해 세그먼트 삭제"""
+
+        async def scenario():
+            records = await self.manager.backup_data_batch(self._items(30), self.rule)
+            await self.manager.seal_active_segments()
+
+            restarted = self._restarted_manager()
+            cleaned = await restarted.cleanup_old_backups(cleanup_days=-1)
+            return records, restarted, cleaned
+
+        records, restarted, cleaned = asyncio.run(scenario())
+
+        self.assertEqual(cleaned, len(records))
+        self.assertEqual(restarted.backup_records, {})
+        self.assertEqual(restarted.segment_ref_counts, {})
+        for path in {Path(r.backup_path) for r in records}:
+            self.assertFalse(path.exists())
+            self.assertFalse(path.with_name(path.name + ".idx").exists())
+            self.assertFalse(path.with_name(path.name + ".sha256").exists())
+
+    def test_corrupted_block_is_not_restored(self):
+        """블록이 손상되면 복원 실패"""
+
+        async def scenario():
+            record = await self.manager.backup_data(
+                "data-x", "KTO", "areaBasedList2", {"value": 1}, self.rule
+            )
+            path = Path(record.backup_path)
+            data = bytearray(path.read_bytes())
+            data[record.metadata["block_offset"] + 5] ^= 0xFF
+            path.write_bytes(bytes(data))
+            return await self.manager.restore_data(record.backup_id)
+
+        self.assertIsNone(asyncio.run(scenario()))
+
+
+if __name__ == "__main__":
+    unittest.main()
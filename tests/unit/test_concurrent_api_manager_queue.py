@@ -0,0 +1,126 @@
+"""
+동시 API 호출 관리자 우선순위 작업 큐 단위 테스트
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from app.core.concurrent_api_manager import (
+    ConcurrentAPIManager, ConcurrencyConfig, APICallTask, APICallPriority
+)
+from app.core.multi_api_key_manager import APIProvider
+
+
+def _build_manager(**config) -> ConcurrentAPIManager:
+    """키 매니저/속도 제한 없이 테스트용 관리자 생성"""
+    with patch("app.core.concurrent_api_manager.get_api_key_manager"):
+        manager = ConcurrentAPIManager(ConcurrencyConfig(**config))
+    manager.rate_limiter = None
+    return manager
+
+
+class TestPriorityWorkQueue(unittest.TestCase):
+    """우선순위 작업 큐 테스트"""
+
+    def setUp(self):
+        self.started = []
+
+    def _task(self, task_id, priority=APICallPriority.MEDIUM, delay=0.0, error=None):
+        async def callback(endpoint, params):
+            self.started.append(task_id)
+            await asyncio.sleep(delay)
+            if error:
+                raise error
+            return task_id
+
+        return APICallTask(
+            task_id=task_id,
+            api_provider=APIProvider.KTO,
+            endpoint="detailCommon2",
+            params={},
+            callback=callback,
+            priority=priority,
+        )
+
+    def test_priority_orders_dispatch(self):
+        """우선순위 높은 순, 같은 우선순위는 제출 순으로 실행"""
+        manager = _build_manager(worker_count=1)
+        tasks = [
+            self._task("low_1", APICallPriority.LOW),
+            self._task("medium_1"),
+            self._task("high_1", APICallPriority.HIGH),
+            self._task("low_2", APICallPriority.LOW),
+            self._task("critical_1", APICallPriority.CRITICAL),
+            self._task("medium_2"),
+        ]
+
+        results = asyncio.run(manager.execute_batch(tasks))
+
+        self.assertEqual(self.started, ["critical_1", "high_1", "medium_1", "medium_2", "low_1", "low_2"])
+        self.assertEqual([r["task_id"] for r in results], [t.task_id for t in tasks])
+        self.assertEqual(manager.stats["queued_calls"], 6)
+
+    def test_stream_keeps_slots_full(self):
+        """느린 호출이 다른 호출의 진행을 막지 않고 완료 순서대로 반환"""
+        manager = _build_manager(max_concurrent_total=2, max_concurrent_kto=2)
+        tasks = [self._task("slow", delay=0.2)] + [self._task(f"fast_{n}", delay=0.01) for n in range(6)]
+
+        async def collect():
+            return [result["task_id"] async for result in manager.stream_batch(tasks)]
+
+        order = asyncio.run(collect())
+
+        self.assertEqual(order[-1], "slow")
+        self.assertEqual(sorted(order[:-1]), sorted(f"fast_{n}" for n in range(6)))
+
+    def test_failure_results(self):
+        """콜백 예외는 실패 결과로 반환"""
+        manager = _build_manager()
+        results = asyncio.run(manager.execute_batch([
+            self._task("ok"), self._task("bad", error=ValueError("boom"))
+        ]))
+
+        self.assertTrue(results[0]["success"])
+        self.assertEqual(results[0]["data"], "ok")
+        self.assertFalse(results[1]["success"])
+        self.assertEqual(results[1]["error"], "boom")
+
+    def test_abandoned_stream_skips_pending_tasks(self):
+        """스트림 소비를 중단하면 시작하지 않은 작업은 실행하지 않음"""
+        manager = _build_manager(worker_count=1)
+        tasks = [self._task(f"task_{n}") for n in range(5)]
+
+        async def take_first():
+            stream = manager.stream_batch(tasks)
+            async for result in stream:
+                break
+            await stream.aclose()
+            await asyncio.sleep(0.05)
+            return result
+
+        first = asyncio.run(take_first())
+
+        self.assertEqual(first["task_id"], "task_0")
+        self.assertLessEqual(len(self.started), 2)
+
+    def test_shutdown_fails_queued_tasks(self):
+        """워커 종료 시 대기 중인 작업은 실패 결과로 전달"""
+        manager = _build_manager(worker_count=1)
+
+        async def run():
+            stream = manager.stream_batch([self._task("slow", delay=1.0), self._task("queued")])
+            first = asyncio.ensure_future(stream.__anext__())
+            await asyncio.sleep(0.05)
+            await manager.shutdown()
+            results = [await first, await stream.__anext__()]
+            return {r["task_id"]: r for r in results}
+
+        results = asyncio.run(run())
+
+        self.assertFalse(results["slow"]["success"])
+        self.assertEqual(results["queued"]["error"], "작업 큐 종료")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+CPU 오프로드 실행기 단위 테스트
+"""
+
+import asyncio
+import gzip
+import hashlib
+import lzma
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from app.core.cpu_offload_executor import CPUOffloadConfig, CPUOffloadExecutor
+
+
+def _slow_task(active, peak, lock):
+    with lock:
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+    time.sleep(0.02)
+    with lock:
+        active[0] -= 1
+
+
+class TestCPUOffloadExecutor(unittest.TestCase):
+    """압축/체크섬 오프로드 테스트"""
+
+    def setUp(self):
+        self.executor = CPUOffloadExecutor(CPUOffloadConfig(
+            process_workers=1, thread_workers=4, max_pending=2
+        ))
+        self.data = ("서울 맑음 " * 2000).encode("utf-8")
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_compress_round_trip(self):
+        """압축 방식별 압축/해제 결과 일치"""
+        async def run():
+            results = {}
+            for compression in ("none", "gzip", "bzip2", "lzma"):
+                compressed = await self.executor.compress(self.data, compression, 6)
+                results[compression] = (
+                    compressed, await self.executor.decompress(compressed, compression)
+                )
+            return results
+
+        results = asyncio.run(run())
+
+        for compression, (_, restored) in results.items():
+            self.assertEqual(restored, self.data, compression)
+        self.assertEqual(gzip.decompress(results["gzip"][0]), self.data)
+        self.assertEqual(lzma.decompress(results["lzma"][0]), self.data)
+
+        stats = self.executor.get_stats()
+        self.assertEqual(stats["process_tasks"] + stats["process_fallbacks"], 2)
+
+    def test_checksum(self):
+        """SHA-256 체크섬 계산"""
+        checksum = asyncio.run(self.executor.checksum(self.data))
+        self.assertEqual(checksum, hashlib.sha256(self.data).hexdigest())
+
+    def test_gzip_file(self):
+        """파일 gzip 압축"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "app.log"
+            target = Path(temp_dir) / "app.log.gz"
+            source.write_bytes(self.data)
+
+            asyncio.run(self.executor.gzip_file(source, target))
+
+            with gzip.open(target, "rb") as f:
+                self.assertEqual(f.read(), self.data)
+
+    def test_pending_tasks_are_bounded(self):
+        """동시 제출 작업 수가 max_pending을 넘지 않음"""
+        active, peak, lock = [0], [0], threading.Lock()
+
+        async def run():
+            await asyncio.gather(*(
+                self.executor.run(_slow_task, active, peak, lock) for _ in range(8)
+            ))
+
+        asyncio.run(run())
+
+        self.assertLessEqual(peak[0], 2)
+        self.assertEqual(self.executor.get_stats()["in_flight"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
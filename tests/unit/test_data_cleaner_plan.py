@@ -0,0 +1,86 @@
+"""
+데이터 정리기 컬럼 단위 정리 단위 테스트
+"""
+
+import random
+import unittest
+
+from app.quality.data_cleaner import (
+    DataCleaner, CleaningRule, CleaningAction, CleaningSeverity, compile_field_pattern
+)
+
+
+class TestCompiledCleaningPlan(unittest.TestCase):
+    """필드별 규칙 캐시 및 컬럼 단위 정리 테스트"""
+
+    VALUES = {
+        "title": [" 경복궁 ", "남산  타워", "", "NULL", "한옥마을"],
+        "tel": ["010 1234 5678", "02)123-4567", "없음", "", None],
+        "email": [" USER@EXAMPLE.COM ", "bad@", "x"],
+        "homepage": ["www.example.com", "HTTPS://EXAMPLE.COM/", "<a href=x>link</a>"],
+        "mapx": ["127.123456789", 127.0, "", "abc", True, 1],
+        "overview": ["<p>Hello <b>world</b></p>", "a  b", "설명 &amp; <br>"],
+        "createdtime": ["20240115093000", "2024/01/15", "15.01.2024", "2024-13-45"],
+        "price": ["$1,234.56", "약 100개", "무료", 5],
+        "meta": [{"a": 1}, None, ["x"]],
+    }
+
+    def setUp(self):
+        self.cleaner = DataCleaner()
+        rng = random.Random(19)
+        self.dataset = []
+        for i in range(300):
+            fields = list(self.VALUES)
+            rng.shuffle(fields)
+            record = {"contentid": str(i)}
+            for name in fields[:rng.randint(3, len(fields))]:
+                record[name] = rng.choice(self.VALUES[name])
+            self.dataset.append(record)
+
+    def test_dataset_matches_record_cleaning(self):
+        """컬럼 단위 정리 결과가 레코드별 정리 결과와 동일"""
+        results = self.cleaner.clean_dataset(self.dataset, id_field="contentid")
+        expected = [self.cleaner.clean_record(record, record["contentid"]) for record in self.dataset]
+
+        self.assertEqual(results, expected)
+        self.assertEqual(self.cleaner.last_run_stats["records"], 300)
+        self.assertGreater(self.cleaner.last_run_stats["records_per_second"], 0)
+
+    def test_hash_equal_values_of_different_types(self):
+        """True와 1처럼 해시가 같은 값도 타입별로 따로 정리"""
+        results = self.cleaner.clean_dataset([{"price": True}, {"price": 1}, {"price": "1"}])
+
+        self.assertEqual(results[0].cleaning_results, [])
+        self.assertEqual(results[1].cleaned_record["price"], 1)
+        self.assertEqual(results[2].cleaned_record["price"], 1)
+
+    def test_rule_cache_invalidated_on_add_rule(self):
+        """규칙 추가 시 필드별 규칙 캐시 초기화"""
+        before = self.cleaner._find_applicable_rules("tel")
+        self.assertIs(self.cleaner._find_applicable_rules("tel"), before)
+
+        self.cleaner.add_rule(CleaningRule(
+            name="upper_code",
+            field_pattern="code",
+            action=CleaningAction.FORMAT,
+            severity=CleaningSeverity.CRITICAL,
+            description="코드 대문자 변환",
+            condition=lambda value: isinstance(value, str),
+            transform=lambda value: value.upper(),
+        ))
+
+        self.assertEqual(len(self.cleaner._find_applicable_rules("tel")), len(before))
+        self.assertEqual(self.cleaner._find_applicable_rules("CODE")[-1].name, "upper_code")
+        self.assertEqual(self.cleaner.clean_dataset([{"code": "ab"}])[0].cleaned_record, {"code": "AB"})
+
+    def test_compile_field_pattern(self):
+        """필드 패턴 매칭 규칙"""
+        self.assertTrue(compile_field_pattern("*")("anything"))
+        self.assertTrue(compile_field_pattern("*phone*|*tel*")("TEL"))
+        self.assertTrue(compile_field_pattern("*lat*|*lng*|*lon*")("mapLongitude"))
+        self.assertFalse(compile_field_pattern("*email*")("mail"))
+        self.assertTrue(compile_field_pattern("code")("Code"))
+
+
+if __name__ == "__main__":
+    unittest.main()
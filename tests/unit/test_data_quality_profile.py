@@ -0,0 +1,56 @@
+"""
+데이터 품질 검사 단일 스캔 프로파일 쿼리 단위 테스트
+"""
+
+import unittest
+
+from jobs.quality.data_quality_job import build_table_profile_query
+
+
+class TestTableProfileQuery(unittest.TestCase):
+    """품질 검사 설정 → 집계 쿼리 변환 테스트"""
+
+    def setUp(self):
+        self.check_config = {
+            "required_columns": ["region_code", "weather_date", "avg_temp"],
+            "date_column": "weather_date",
+            "freshness_threshold_days": 2,
+            "duplicate_key_columns": ["region_code", "weather_date"],
+            "value_ranges": {"avg_temp": [-50, 60], "humidity": [0, 100]},
+        }
+        self.columns = {
+            "region_code", "weather_date", "avg_temp", "humidity", "max_temp", "min_temp",
+        }
+
+    def test_single_query_with_duplicate_grouping(self):
+        """모든 검사가 하나의 쿼리로 합쳐지고 중복 키로 그룹화"""
+        query, plan = build_table_profile_query(
+            "historical_weather_daily", self.check_config, self.columns
+        )
+
+        self.assertEqual(query.count("FROM historical_weather_daily"), 1)
+        self.assertIn("GROUP BY region_code, weather_date", query)
+        self.assertIn("COUNT(*) FILTER (WHERE row_count > 1) AS duplicate_count", query)
+        self.assertEqual(plan["missing"], ["missing_0", "missing_1", "missing_2"])
+        self.assertEqual(set(plan["ranges"]), {"avg_temp", "humidity"})
+        self.assertEqual(plan["ranges"]["avg_temp"]["range"], (-50, 60))
+        self.assertEqual(plan["freshness"]["threshold_days"], 2)
+        self.assertEqual(plan["consistency"], "inconsistent_count")
+
+    def test_unknown_columns_are_skipped(self):
+        """존재하지 않는 컬럼 검사는 제외하고 중복 검사는 0으로 대체"""
+        query, plan = build_table_profile_query(
+            "weather_forecasts", self.check_config, {"region_code", "avg_temp"}
+        )
+
+        self.assertNotIn("GROUP BY", query)
+        self.assertIn("0 AS duplicate_count", query)
+        self.assertNotIn("weather_date", query)
+        self.assertNotIn("humidity", query)
+        self.assertIsNone(plan["freshness"])
+        self.assertIsNone(plan["consistency"])
+        self.assertEqual(len(plan["missing"]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+데이터 검증기 컴파일/청크 검증 단위 테스트
+"""
+
+import multiprocessing
+import random
+import unittest
+from datetime import date
+
+from app.quality.data_validator import (
+    DataValidator, ValidationConfig, ValidationSeverity, make_date_validator
+)
+
+
+def reference_validate_dataset(validator, dataset, id_field="id"):
+    """필드마다 규칙을 다시 찾던 기존 방식의 기준 구현"""
+    results = []
+    valid_records = 0
+    for i, record in enumerate(dataset):
+        record_id = str(record.get(id_field, f"record_{i}"))
+        record_results = []
+        for field_name, value in record.items():
+            for rule in validator.get_field_specific_rules(field_name):
+                try:
+                    if not rule.validator(value):
+                        record_results.append((field_name, rule.rule_type, rule.severity, record_id))
+                except Exception:
+                    record_results.append((field_name, rule.rule_type, ValidationSeverity.CRITICAL, record_id))
+        if not record_results:
+            valid_records += 1
+        results.extend(record_results)
+    return results, valid_records
+
+
+class TestCompiledValidator(unittest.TestCase):
+    """컴파일된 필드 검증 및 청크 검증 테스트"""
+
+    VALUES = {
+        "title": ["경복궁", "", None, "x" * 1200],
+        "email": ["a@b.com", "bad", ""],
+        "homepage_url": ["http://x.kr", "www.x", None],
+        "latitude": ["37.5", "91", "abc", None, 40],
+        "longitude": ["127", "200", None],
+        "phone": ["010-1234-5678", "12", "02 123 4567"],
+        "created_date": ["2024-01-15", "2024/01/15 10:00:00", "2024.13.01", "", "bad", date(2024, 1, 1)],
+        "extra_json": ['{"a": 1}', "{bad", {"a": 1}],
+    }
+
+    def setUp(self):
+        rng = random.Random(20)
+        self.dataset = []
+        for i in range(120):
+            record = {"id": i} if i % 10 else {}
+            for name, values in self.VALUES.items():
+                record[name] = rng.choice(values)
+            self.dataset.append(record)
+
+    def _flatten(self, results):
+        return [(r.field_name, r.rule_type, r.severity, r.record_id) for r in results]
+
+    def test_matches_reference(self):
+        """컴파일된 검증 결과가 기존 규칙 탐색 결과와 동일"""
+        validator = DataValidator(ValidationConfig(chunk_size=7))
+        results, summary = validator.validate_dataset(self.dataset)
+        expected, expected_valid = reference_validate_dataset(validator, self.dataset)
+
+        self.assertEqual(self._flatten(results), expected)
+        self.assertEqual(summary.valid_records, expected_valid)
+        self.assertEqual(summary.total_errors, len(expected))
+        self.assertIn("record_10", {r.record_id for r in results})
+
+    def test_chunk_size_does_not_change_summary(self):
+        """청크 크기와 무관하게 동일한 요약"""
+        _, summary = DataValidator(ValidationConfig(chunk_size=1000)).validate_dataset(self.dataset)
+        _, chunked = DataValidator(ValidationConfig(chunk_size=3)).validate_dataset(self.dataset)
+
+        self.assertEqual(chunked, summary)
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "fork 미지원 플랫폼")
+    def test_process_pool_identical_summary(self):
+        """프로세스 풀 검증 결과가 순차 검증과 동일"""
+        sequential = DataValidator(ValidationConfig(chunk_size=25))
+        parallel = DataValidator(ValidationConfig(chunk_size=25, process_workers=2, min_records_for_processes=1))
+
+        results, summary = sequential.validate_dataset(self.dataset)
+        parallel_results, parallel_summary = parallel.validate_dataset(self.dataset)
+
+        self.assertEqual(parallel_summary, summary)
+        self.assertEqual(self._flatten(parallel_results), self._flatten(results))
+
+    def test_field_validator_cache_invalidated_on_add_rule(self):
+        """규칙 추가 시 컴파일된 필드 검증 함수 초기화"""
+        validator = DataValidator()
+        self.assertEqual(validator.validate_field("code", "ab"), [])
+
+        validator.add_custom_rule("code", "code_upper", lambda value: value.isupper())
+
+        self.assertEqual([r.rule_type for r in validator.validate_field("code", "ab")], ["code_upper"])
+
+    def test_date_validator(self):
+        """날짜 형식 감지 및 결과 재사용"""
+        is_valid_date = make_date_validator()
+
+        self.assertTrue(is_valid_date("2024/01/15 10:00:00"))
+        self.assertTrue(is_valid_date("2024/01/15 10:00:00"))
+        self.assertTrue(is_valid_date("2024.01.15"))
+        self.assertTrue(is_valid_date("2024-01-15"))
+        self.assertTrue(is_valid_date(date(2024, 1, 15)))
+        self.assertTrue(is_valid_date(""))
+        self.assertFalse(is_valid_date("2024.13.01"))
+        self.assertFalse(is_valid_date("15/01/2024"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+데이터베이스 매니저 확장 배치 UPSERT 단위 테스트
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.core.database_manager_extension import (
+    DatabaseManagerExtension, TOURIST_ATTRACTION_UPSERT_SQL, TRAVEL_COURSE_UPSERT_SQL
+)
+
+
+class TestBatchUpsert(unittest.TestCase):
+    """다중 행 UPSERT 및 건별 대체 테스트"""
+
+    def setUp(self):
+        self.extension = DatabaseManagerExtension(MagicMock())
+        self.executed = []
+        self.fail_queries = set()
+
+        def execute_upsert(query, rows):
+            if query in self.fail_queries or any(row[0] == "bad" for row in rows):
+                raise RuntimeError("UPSERT 실패")
+            self.executed.append((query, [row[0] for row in rows]))
+            return len(rows)
+
+        patcher = patch.object(self.extension, "_execute_upsert", side_effect=execute_upsert)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _records(self, *content_ids):
+        return [{"content_id": content_id, "title": f"관광지 {content_id}"} for content_id in content_ids]
+
+    def _content_ids(self, query):
+        return [ids for executed_query, ids in self.executed if executed_query == query]
+
+    def test_batch_path_writes_travel_courses_once(self):
+        """배치 성공 시 저장된 레코드로 travel_courses를 한 번만 저장"""
+        saved = self.extension.upsert_tourist_attractions_batch(self._records("1", "2", "1"))
+
+        self.assertEqual(saved, 2)
+        self.assertEqual(self._content_ids(TOURIST_ATTRACTION_UPSERT_SQL), [["1", "2"]])
+        self.assertEqual(self._content_ids(TRAVEL_COURSE_UPSERT_SQL), [["1", "2"]])
+
+    def test_fallback_path_skips_batch_travel_courses(self):
+        """건별 대체 시 travel_courses는 건별 UPSERT에서만 저장하고 실패 행은 제외"""
+        saved = self.extension.upsert_tourist_attractions_batch(self._records("1", "bad", "2"))
+
+        self.assertEqual(saved, 2)
+        self.assertEqual(self._content_ids(TOURIST_ATTRACTION_UPSERT_SQL), [["1"], ["2"]])
+        self.assertEqual(self._content_ids(TRAVEL_COURSE_UPSERT_SQL), [["1"], ["2"]])
+
+    def test_records_without_content_id_skipped(self):
+        """content_id가 없는 레코드는 하나로 합쳐지지 않고 제외"""
+        records = self._records("1", None, "") + [{"title": "무명"}]
+        saved = self.extension.upsert_accommodations_batch(records)
+
+        self.assertEqual(saved, 1)
+        self.assertEqual(len(self.executed), 1)
+        self.assertEqual(self.executed[0][1], ["1"])
+        self.assertEqual(self.extension.upsert_accommodations_batch([{"title": "무명"}]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
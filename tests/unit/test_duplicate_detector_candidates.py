@@ -0,0 +1,61 @@
+"""
+유사 중복 후보 생성(블로킹 + MinHash/LSH) 단위 테스트
+"""
+
+import unittest
+
+from app.quality.duplicate_detector import DuplicateDetector, DuplicateConfig
+
+
+class TestFuzzyCandidateGeneration(unittest.TestCase):
+    """후보 생성 결과가 전체 비교 결과와 일치하는지 검증"""
+
+    def _build_dataset(self):
+        dataset = []
+        for region in ("11", "26"):
+            for n in range(40):
+                base = {
+                    "region_code": region,
+                    "category_code": "A01",
+                    "title": f"관광지 이름 {region}-{n:03d} 해변공원",
+                    "address": f"{region}시 {n}번길 {n * 7}",
+                }
+                dataset.append(base)
+                if n % 5 == 0:
+                    near = dict(base)
+                    near["title"] = base["title"] + " "
+                    dataset.append(near)
+        return dataset
+
+    def _group_indices(self, config):
+        detector = DuplicateDetector(config)
+        groups = detector._detect_fuzzy_duplicates(self.dataset)
+        return sorted(tuple(group.record_indices) for group in groups)
+
+    def setUp(self):
+        self.dataset = self._build_dataset()
+
+    def test_lsh_matches_brute_force(self):
+        """LSH 후보 비교 결과가 전체 비교와 동일"""
+        brute = self._group_indices(DuplicateConfig(use_candidate_generation=False))
+        lsh = self._group_indices(DuplicateConfig(lsh_min_block_size=10))
+
+        self.assertTrue(brute)
+        self.assertEqual(lsh, brute)
+
+    def test_candidates_limited_to_blocks(self):
+        """다른 블록의 레코드는 후보로 생성되지 않음"""
+        detector = DuplicateDetector(DuplicateConfig(lsh_min_block_size=10))
+        candidates = detector._generate_candidate_pairs(self.dataset)
+
+        for i, others in candidates.items():
+            for j in others:
+                self.assertGreater(j, i)
+                self.assertEqual(self.dataset[i]["region_code"], self.dataset[j]["region_code"])
+
+        total_pairs = sum(len(others) for others in candidates.values())
+        self.assertLess(total_pairs, len(self.dataset) * (len(self.dataset) - 1) // 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+KMA 데이터 변환기 단위 테스트
+"""
+
+import random
+import unittest
+
+from app.processors.data_transformation_pipeline import KMADataTransformer
+
+
+def reference_forecast_rows(items):
+    """카테고리 값을 항목별로 변환하던 기존 방식의 기준 구현"""
+    numeric = ["POP", "REH", "TMP", "TMN", "TMX", "WSD", "VEC", "T1H"]
+    amount = ["PCP", "SNO", "RN1"]
+    grid_to_region = {(60, 127): "1100000000", (98, 76): "2600000000", (52, 38): "5000000000"}
+
+    def convert(category, value):
+        if not value or value.strip() == "":
+            return None
+        try:
+            if category in numeric:
+                return float(value)
+            if category in amount:
+                if value in ("강수없음", "적설없음"):
+                    return 0.0
+                digits = "".join(filter(lambda x: x.isdigit() or x == ".", value))
+                return float(digits) if digits else 0.0
+            return value.strip()
+        except Exception:
+            return None
+
+    rows = {}
+    for item in items:
+        key = f"{item['fcstDate']}_{item['fcstTime']}_{item['nx']}_{item['ny']}"
+        if key not in rows:
+            rows[key] = {
+                "base_date": item["baseDate"],
+                "base_time": item["baseTime"],
+                "forecast_date": item["fcstDate"],
+                "forecast_time": item["fcstTime"],
+                "nx": int(item["nx"]),
+                "ny": int(item["ny"]),
+                "region_code": grid_to_region.get((item["nx"], item["ny"]), "1100000000"),
+                "forecast_type": "short",
+                "data_source": "KMA_API",
+            }
+        if item["category"] in KMADataTransformer.CATEGORY_MAPPING:
+            rows[key][KMADataTransformer.CATEGORY_MAPPING[item["category"]]] = convert(
+                item["category"], item["fcstValue"]
+            )
+    return list(rows.values())
+
+
+class TestKMAForecastTransform(unittest.TestCase):
+    """예보 피벗 변환 테스트"""
+
+    VALUES = {
+        "TMP": ["12", "13", "-2"], "POP": ["0", "30"], "PCP": ["강수없음", "1mm 미만", "30.0~50.0mm"],
+        "SNO": ["적설없음", "1cm"], "SKY": ["1", "4"], "PTY": ["0", " 1 "], "REH": ["60", ""],
+        "UUU": ["-1.2"], "VVV": ["0.8"], "VEC": ["270"], "WSD": ["3.1", "bad"], "WAV": ["0.5"], "XYZ": ["1"],
+    }
+
+    def setUp(self):
+        self.transformer = KMADataTransformer()
+        rng = random.Random(17)
+        self.items = []
+        for nx, ny in [(60, 127), (98, 76), (52, 38), (61, 125)]:
+            for hour in range(24):
+                for category, values in self.VALUES.items():
+                    self.items.append({
+                        "baseDate": "20261016", "baseTime": "0500",
+                        "fcstDate": "20261016" if hour < 20 else "20261017",
+                        "fcstTime": f"{hour:02d}00",
+                        "category": category, "fcstValue": rng.choice(values),
+                        "nx": nx, "ny": ny,
+                    })
+
+    def test_matches_reference_rows(self):
+        """기존 항목별 변환과 동일한 행 생성"""
+        rows = self.transformer._transform_weather_forecast(self.items)
+        expected = reference_forecast_rows(self.items)
+
+        for row in rows:
+            self.assertIn("processed_at", row)
+            del row["processed_at"]
+
+        self.assertEqual(rows, expected)
+        self.assertEqual(len(rows), 4 * 24)
+
+    def test_value_conversion(self):
+        """카테고리별 값 변환 규칙"""
+        convert = self.transformer._convert_weather_value
+        self.assertEqual(convert("TMP", "12.5"), 12.5)
+        self.assertEqual(convert("PCP", "강수없음"), 0.0)
+        self.assertEqual(convert("PCP", "1mm 미만"), 1.0)
+        self.assertEqual(convert("SKY", " 3 "), "3")
+        self.assertIsNone(convert("REH", " "))
+        self.assertIsNone(convert("WSD", "bad"))
+
+    def test_transform_current_weather(self):
+        """현재 날씨 피벗 변환"""
+        items = [
+            {"baseDate": "20261016", "baseTime": "0900", "nx": 60, "ny": 127, "category": "T1H", "obsrValue": "15.2"},
+            {"baseDate": "20261016", "baseTime": "0900", "nx": 60, "ny": 127, "category": "RN1", "obsrValue": "0"},
+            {"baseDate": "20261016", "baseTime": "0900", "nx": 98, "ny": 76, "category": "T1H", "obsrValue": "18"},
+        ]
+
+        rows = self.transformer._transform_current_weather(items)
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]["observation_time"], "2026-10-16 09:00:00")
+        self.assertEqual(rows[0]["temperature"], 15.2)
+        self.assertEqual(rows[0]["precipitation"], 0.0)
+        self.assertEqual(rows[1]["temperature"], 18.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+프로세스 로컬 LRU 캐시 단위 테스트
+"""
+
+import unittest
+from unittest.mock import patch
+
+from app.core.local_lru_cache import LocalLRUCache, LocalCacheConfig
+
+
+class TestLocalLRUCache(unittest.TestCase):
+    """L1 캐시 용량/TTL 테스트"""
+
+    def test_returns_copy_of_cached_value(self):
+        """반환값을 수정해도 캐시는 변하지 않음"""
+        cache = LocalLRUCache()
+        cache.set("key", {"items": [1, 2]}, ttl=60)
+
+        value = cache.get("key")
+        value["items"].append(3)
+
+        self.assertEqual(cache.get("key"), {"items": [1, 2]})
+
+    def test_evicts_least_recently_used(self):
+        """항목 수 초과 시 가장 오래 사용되지 않은 항목 축출"""
+        cache = LocalLRUCache(LocalCacheConfig(max_entries=2))
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")
+        cache.set("c", 3, ttl=60)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_evicts_by_size(self):
+        """직렬화 크기 초과 시 축출"""
+        cache = LocalLRUCache(LocalCacheConfig(max_bytes=30))
+        cache.set("a", "x" * 10, ttl=60)
+        cache.set("b", "y" * 10, ttl=60)
+        cache.set("c", "z" * 10, ttl=60)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertLessEqual(cache.get_stats()["bytes"], 30)
+
+    def test_expires_entries(self):
+        """TTL 경과 시 미스 처리"""
+        cache = LocalLRUCache(LocalCacheConfig(max_ttl_seconds=10))
+        with patch("app.core.local_lru_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1, ttl=3600)
+        with patch("app.core.local_lru_cache.time.monotonic", return_value=109.0):
+            self.assertEqual(cache.get("a"), 1)
+        with patch("app.core.local_lru_cache.time.monotonic", return_value=111.0):
+            self.assertIsNone(cache.get("a"))
+
+        stats = cache.get_stats()
+        self.assertEqual(stats["expirations"], 1)
+        self.assertEqual(stats["entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
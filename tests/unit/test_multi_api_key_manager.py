@@ -0,0 +1,126 @@
+"""
+다중 API 키 관리자 캐시 저장 단위 테스트
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from app.core.multi_api_key_manager import MultiAPIKeyManager, APIProvider
+
+
+class TestMultiAPIKeyManagerCache(unittest.TestCase):
+    """API 키 사용량 지연 저장 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.temp_dir.name, "cache", "api_key_cache.json")
+
+        env = {"KTO_API_KEY": "test-kto-key-1,test-kto-key-2", "KMA_API_KEY": ""}
+        with patch.dict(os.environ, env), patch("dotenv.load_dotenv"):
+            self.manager = MultiAPIKeyManager(
+                cache_file=self.cache_file,
+                flush_interval_seconds=60,
+                flush_threshold=3,
+            )
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.manager.close()
+        self.temp_dir.cleanup()
+
+    def _read_cache(self) -> dict:
+        with open(self.cache_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_record_api_call_does_not_write_synchronously(self):
+        """API 호출 기록 시 파일을 즉시 쓰지 않음"""
+        with patch.object(self.manager, "_write_cache_file") as mock_write:
+            self.manager.record_api_call(APIProvider.KTO, "test-kto-key-1")
+
+        mock_write.assert_not_called()
+        self.assertEqual(self.manager._pending_mutations, 1)
+
+    def test_flush_after_threshold(self):
+        """변경 횟수 임계값 도달 시 백그라운드 저장"""
+        for _ in range(3):
+            self.manager.record_api_call(APIProvider.KTO, "test-kto-key-1")
+
+        # 백그라운드 저장 완료 대기
+        for _ in range(50):
+            if os.path.exists(self.cache_file):
+                break
+            self.manager._writer_thread.join(timeout=0.05)
+
+        cache_data = self._read_cache()
+        usage = cache_data["providers"]["KTO"]["keys"][0]["usage"]
+        self.assertEqual(usage, 3)
+
+    def test_close_flushes_pending_mutations(self):
+        """종료 시 남은 변경 사항 저장"""
+        self.manager.record_api_call(APIProvider.KTO, "test-kto-key-2")
+        self.manager.close()
+
+        cache_data = self._read_cache()
+        usage = cache_data["providers"]["KTO"]["keys"][1]["usage"]
+        self.assertEqual(usage, 1)
+        self.assertEqual(self.manager._pending_mutations, 0)
+
+    def test_atomic_write_leaves_no_temp_files(self):
+        """원자적 저장 후 임시 파일이 남지 않음"""
+        self.manager.flush_cache(force=True)
+
+        cache_dir = os.path.dirname(self.cache_file)
+        self.assertEqual(os.listdir(cache_dir), ["api_key_cache.json"])
+
+    def test_failed_write_keeps_pending_mutations(self):
+        """저장 실패 시 변경 횟수를 유지하여 종료 시 다시 저장"""
+        self.manager.record_api_call(APIProvider.KTO, "test-kto-key-1")
+
+        with patch("app.core.multi_api_key_manager.os.replace", side_effect=OSError("disk full")):
+            self.manager.flush_cache()
+
+        self.assertEqual(self.manager._pending_mutations, 1)
+        self.assertFalse(os.path.exists(self.cache_file))
+
+        self.manager.close()
+
+        self.assertEqual(self._read_cache()["providers"]["KTO"]["keys"][0]["usage"], 1)
+        self.assertEqual(self.manager._pending_mutations, 0)
+
+    def test_older_snapshot_never_overwrites_newer(self):
+        """먼저 만든 스냅샷 기록 중 강제 저장이 끼어들어도 최신 스냅샷이 남음"""
+        original_write = self.manager._write_cache_file
+        first_write_started = threading.Event()
+        release_first_write = threading.Event()
+
+        def slow_write(cache_data):
+            if not first_write_started.is_set():
+                first_write_started.set()
+                release_first_write.wait(2)
+            return original_write(cache_data)
+
+        with patch.object(self.manager, "_write_cache_file", side_effect=slow_write):
+            first = threading.Thread(target=self.manager.flush_cache, kwargs={"force": True})
+            first.start()
+            self.assertTrue(first_write_started.wait(2))
+
+            self.manager.record_api_call(APIProvider.KTO, "test-kto-key-1")
+            second = threading.Thread(target=self.manager._save_cache)
+            second.start()
+            time.sleep(0.05)
+
+            release_first_write.set()
+            first.join(timeout=2)
+            second.join(timeout=2)
+
+        self.assertEqual(self._read_cache()["providers"]["KTO"]["keys"][0]["usage"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+"""
+추천 점수 배치 작업 일괄 조회/저장 단위 테스트
+"""
+
+import unittest
+from contextlib import contextmanager
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from app.core.base_job import JobConfig
+from config.constants import JobType
+from jobs.recommendation.recommendation_job import (
+    RecommendationJob, TRAVEL_WEATHER_SCORE_COLUMNS, TRAVEL_WEATHER_SCORE_UPSERT_SQL
+)
+from jobs.recommendation.travel_recommendation_engine import WeatherBasedRecommendationEngine
+
+
+class FakeCursor:
+    """region_code, weather_date 순으로 정렬된 행을 반환하는 커서"""
+
+    def __init__(self, db, name=None):
+        self.db = db
+        self.name = name
+        self.itersize = None
+        self.rowcount = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, query, params=None):
+        self.db.streamed_queries.append((self.name, query, params))
+        region_codes = set(params[0])
+        self.rows = sorted(
+            (row for row in self.db.history if row["region_code"] in region_codes),
+            key=lambda row: (row["region_code"], row["weather_date"])
+        )
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+class FakeConnection:
+    """서버 사이드 커서 생성 인자를 기록하는 연결"""
+
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self, name=None, cursor_factory=None):
+        self.db.cursor_names.append(name)
+        return FakeCursor(self.db, name)
+
+
+class FakeDBManager:
+    """쿼리/커서 사용 횟수를 기록하는 DB 매니저"""
+
+    def __init__(self, regions, history):
+        self.regions = regions
+        self.history = history
+        self.queries = []
+        self.streamed_queries = []
+        self.cursor_names = []
+        self.updates = []
+
+    def execute_query(self, query, params=None):
+        self.queries.append((query, params))
+        return [dict(region) for region in self.regions]
+
+    def execute_update(self, query, params=None):
+        self.updates.append((query, params))
+        return 1
+
+    @contextmanager
+    def get_connection(self):
+        yield FakeConnection(self)
+
+    @contextmanager
+    def get_cursor(self):
+        yield FakeCursor(self)
+
+
+class RecordingEngine(WeatherBasedRecommendationEngine):
+    """지역별로 전달된 날씨 행을 기록하는 추천 엔진"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def calculate_monthly_recommendations_bulk(self, historical_weather_data, region_infos):
+        self.calls.append((list(region_infos), [row["region_code"] for row in historical_weather_data]))
+        return super().calculate_monthly_recommendations_bulk(historical_weather_data, region_infos)
+
+
+class TestBulkRecommendationJob(unittest.TestCase):
+    """과거 날씨 스트리밍 1회, 점수 저장 1회 검증"""
+
+    def _history(self, region_codes, days=365):
+        start = date(2025, 1, 1)
+        rows = []
+        for n, region_code in enumerate(region_codes):
+            for offset in range(days):
+                rows.append({
+                    "region_code": region_code,
+                    "weather_date": start + timedelta(days=offset),
+                    "avg_temp": 5 + (offset % 30) + n,
+                    "max_temp": 10 + (offset % 30) + n,
+                    "min_temp": (offset % 30) + n,
+                    "humidity": 50 + offset % 40,
+                    "precipitation": offset % 7,
+                    "wind_speed": 2 + offset % 5,
+                    "weather_condition": "맑음",
+                })
+        # 스트리밍 커서가 정렬하므로 입력 순서는 섞어 둠
+        return rows[::2] + rows[1::2]
+
+    def _run(self, region_codes, regions_with_data):
+        db = FakeDBManager(
+            [{"region_code": code, "region_name": f"지역{code}"} for code in region_codes],
+            self._history(regions_with_data),
+        )
+        upserts = []
+
+        def execute_values(cursor, sql, rows, page_size=100):
+            upserts.append((sql, list(rows), page_size))
+            cursor.rowcount = len(rows)
+
+        with patch("jobs.recommendation.recommendation_job.DatabaseManager", return_value=db), \
+                patch("jobs.recommendation.recommendation_job.psycopg2.extras.execute_values",
+                      side_effect=execute_values):
+            job = RecommendationJob(JobConfig(
+                job_name="recommendation_test",
+                job_type=JobType.SCORE_CALCULATION,
+                schedule_expression="0 3 * * *",
+            ))
+            job.recommendation_engine = RecordingEngine()
+            with self.assertLogs(job.logger, level="WARNING") as logs:
+                result = job.execute()
+
+        return db, upserts, job.recommendation_engine, result, logs
+
+    def test_rows_grouped_per_region_and_missing_regions_logged(self):
+        """정렬된 스트림을 지역별로 묶어 계산하고 데이터 없는 지역은 경고"""
+        db, upserts, engine, result, logs = self._run(["11", "26", "50"], ["11", "26"])
+
+        self.assertEqual(db.cursor_names, ["recommendation_history_stream"])
+        self.assertEqual(len(db.streamed_queries), 1)
+        self.assertEqual(sorted(db.streamed_queries[0][2][0]), ["11", "26", "50"])
+
+        # 지역마다 해당 지역 행만 한 번씩 전달
+        self.assertEqual([region_codes for region_codes, _ in engine.calls], [["11"], ["26"]])
+        for (region_code,), row_codes in engine.calls:
+            self.assertEqual(len(row_codes), 365)
+            self.assertEqual(set(row_codes), {region_code})
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("지역50 날씨 데이터 없음", logs.output[0])
+
+        self.assertEqual(len(upserts), 1)
+        sql, rows, page_size = upserts[0]
+        self.assertEqual(sql, TRAVEL_WEATHER_SCORE_UPSERT_SQL)
+        self.assertEqual(page_size, len(rows))
+        self.assertEqual(len(rows), 24)
+        region_index = TRAVEL_WEATHER_SCORE_COLUMNS.index("region_code")
+        self.assertEqual({row[region_index] for row in rows}, {"11", "26"})
+        self.assertEqual(result.processed_records, 24)
+        self.assertEqual(db.updates, [])
+
+    def test_round_trips_do_not_grow_with_region_count(self):
+        """지역 수와 관계없이 활성 지역 조회 1회, 스트리밍 1회, UPSERT 1회"""
+        for region_count in (2, 12):
+            region_codes = [f"{n + 11}" for n in range(region_count)]
+            db, upserts, engine, result, _ = self._run(region_codes + ["99"], region_codes)
+
+            self.assertEqual(len(db.queries), 1)
+            self.assertEqual(len(db.streamed_queries), 1)
+            self.assertEqual(len(upserts), 1)
+            self.assertEqual(len(engine.calls), region_count)
+            self.assertEqual(result.processed_records, region_count * 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
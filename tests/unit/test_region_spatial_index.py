@@ -0,0 +1,163 @@
+"""
+지역 공간 인덱스 단위 테스트
+"""
+
+import math
+import random
+import unittest
+
+from app.services.kma_region_coordinates import (
+    KMA_REGION_COORDINATES, ADDITIONAL_KMA_STATIONS, get_region_by_coordinates
+)
+from app.services.region_spatial_index import (
+    GridBucketIndex, KMA_STATIC_INDEX,
+    build_db_region_entries, convert_kma_grid_to_wgs84, convert_kma_grid_to_wgs84_batch,
+    convert_wgs84_to_kma_grid, convert_wgs84_to_kma_grid_batch,
+    get_region_index, load_region_index_from_db, reset_region_index,
+)
+
+
+def linear_region_by_coordinates(lat, lon, threshold=0.5):
+    """지역 → 관측소 순서로 전체를 훑던 기존 방식의 기준 구현"""
+    closest, min_distance = None, float("inf")
+    for table in (KMA_REGION_COORDINATES, ADDITIONAL_KMA_STATIONS):
+        for name, data in table.items():
+            distance = math.sqrt((lat - data["latitude"]) ** 2 + (lon - data["longitude"]) ** 2)
+            if distance < min_distance:
+                closest, min_distance = name, distance
+    return (closest if min_distance <= threshold else None), min_distance
+
+
+class FakeDBManager:
+    """regions 조회 결과를 반환하는 DB 매니저"""
+
+    def __init__(self, rows=None, error=None):
+        self.rows = rows or []
+        self.error = error
+        self.calls = 0
+
+    def fetch_all(self, query, params=None):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return self.rows
+
+
+class TestLambertConversion(unittest.TestCase):
+    """기상청 격자 변환 테스트"""
+
+    def test_known_grid(self):
+        """서울시청 좌표 → (60, 127)"""
+        self.assertEqual(convert_wgs84_to_kma_grid(37.5665, 126.9780), (60, 127))
+        self.assertEqual(convert_wgs84_to_kma_grid(35.1796, 129.0756), (98, 76))
+
+    def test_grid_round_trip(self):
+        """격자 중심 → 위경도 → 격자 왕복 변환"""
+        nx, ny = zip(*[(x, y) for x in range(1, 150) for y in range(1, 254)])
+        latitudes, longitudes = convert_kma_grid_to_wgs84_batch(nx, ny)
+        back_x, back_y = convert_wgs84_to_kma_grid_batch(latitudes, longitudes)
+
+        self.assertEqual(back_x.tolist(), list(nx))
+        self.assertEqual(back_y.tolist(), list(ny))
+        self.assertEqual(convert_wgs84_to_kma_grid(*convert_kma_grid_to_wgs84(60, 127)), (60, 127))
+
+
+class TestGridBucketIndex(unittest.TestCase):
+    """버킷 최근접 탐색 테스트"""
+
+    def test_matches_linear_scan(self):
+        """무작위 점에서 선형 탐색과 동일한 결과 (동률 포함)"""
+        rng = random.Random(18)
+        points = [(rng.randint(0, 40) / 2, rng.randint(0, 40) / 2) for _ in range(300)]
+        index = GridBucketIndex(points, bucket_size=1.5)
+
+        for _ in range(500):
+            x, y = rng.uniform(-5, 25), rng.uniform(-5, 25)
+            distances = [math.hypot(x - px, y - py) for px, py in points]
+            expected = min(range(len(points)), key=lambda i: (distances[i], i))
+
+            found, distance = index.nearest(x, y)
+            self.assertEqual(found, expected)
+            self.assertAlmostEqual(distance, distances[expected])
+
+    def test_empty_index(self):
+        """빈 인덱스는 None 반환"""
+        self.assertEqual(GridBucketIndex([], bucket_size=1.0).nearest(1.0, 1.0), (None, float("inf")))
+
+
+class TestRegionSpatialIndex(unittest.TestCase):
+    """지역 공간 인덱스 테스트"""
+
+    def test_region_by_coordinates_unchanged(self):
+        """get_region_by_coordinates가 기존 선형 탐색과 동일"""
+        rng = random.Random(7)
+        for _ in range(500):
+            lat, lon = rng.uniform(32.5, 39.0), rng.uniform(124.0, 132.0)
+            name, distance = get_region_by_coordinates(lat, lon)
+            expected_name, expected_distance = linear_region_by_coordinates(lat, lon)
+            self.assertEqual(name, expected_name)
+            self.assertAlmostEqual(distance, expected_distance)
+
+    def test_nearest_by_grid(self):
+        """정확히 일치하는 격자 우선, 없으면 최근접 격자"""
+        entry, distance = KMA_STATIC_INDEX.nearest_by_grid(60, 127)
+        self.assertEqual((entry.name, distance), ("서울", 0.0))
+
+        entry, distance = KMA_STATIC_INDEX.nearest_by_grid(98, 77)
+        self.assertEqual(entry.name, "부산")
+        self.assertEqual(distance, 1.0)
+
+    def test_batch_nearest_by_coordinates_on_grid(self):
+        """좌표 일괄 격자 변환 및 지역 조회"""
+        nx, ny, entries = KMA_STATIC_INDEX.batch_nearest_by_coordinates_on_grid(
+            [37.5665, 37.5665, 35.1796], [126.9780, 126.9780, 129.0756]
+        )
+        self.assertEqual(nx.tolist(), [60, 60, 98])
+        self.assertEqual(ny.tolist(), [127, 127, 76])
+        self.assertEqual([entry.name for entry in entries], ["서울", "서울", "부산"])
+
+
+class TestRegionIndexFromDB(unittest.TestCase):
+    """regions 테이블 기반 인덱스 테스트"""
+
+    ROWS = [
+        {"region_code": "1100000000", "region_name": "서울특별시", "latitude": 37.5665,
+         "longitude": 126.9780, "grid_x": 60, "grid_y": 127},
+        {"region_code": "2600000000", "region_name": "부산광역시", "latitude": 35.1796,
+         "longitude": 129.0756, "grid_x": None, "grid_y": None},
+        {"region_code": "5000000000", "region_name": "제주특별자치도", "latitude": None,
+         "longitude": None, "grid_x": 52, "grid_y": 38},
+        {"region_code": "9900000000", "region_name": "좌표 없음", "latitude": None,
+         "longitude": None, "grid_x": None, "grid_y": None},
+    ]
+
+    def setUp(self):
+        reset_region_index()
+
+    def tearDown(self):
+        reset_region_index()
+
+    def test_build_entries_fills_missing_values(self):
+        """빠진 격자/좌표는 투영 공식으로 계산하고 둘 다 없으면 제외"""
+        entries = build_db_region_entries(self.ROWS)
+
+        self.assertEqual([entry.region_code for entry in entries], ["1100000000", "2600000000", "5000000000"])
+        self.assertEqual((entries[1].nx, entries[1].ny), (98, 76))
+        self.assertEqual(convert_wgs84_to_kma_grid(entries[2].latitude, entries[2].longitude), (52, 38))
+
+    def test_load_once_and_failure(self):
+        """한 번만 조회하고 실패 시 None 유지"""
+        self.assertIsNone(load_region_index_from_db(FakeDBManager(error=Exception("db down"))))
+        self.assertIsNone(get_region_index())
+
+        db = FakeDBManager(self.ROWS)
+        index = load_region_index_from_db(db)
+        self.assertIs(load_region_index_from_db(db), index)
+        self.assertEqual(db.calls, 1)
+
+        entry, _ = get_region_index().nearest_by_grid(97, 75)
+        self.assertEqual(entry.region_code, "2600000000")
+
+
+if __name__ == "__main__":
+    unittest.main()
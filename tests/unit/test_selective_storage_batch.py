@@ -0,0 +1,157 @@
+"""
+선택적 저장 매니저 배치 저장 단위 테스트
+"""
+
+import csv
+import io
+import json
+import re
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from app.core.selective_storage_manager import SelectiveStorageManager, StorageRequest
+
+
+# 문자열이 아닌 타입의 컬럼 (빈 문자열을 넣으면 PostgreSQL이 COPY 전체를 거부)
+NON_TEXT_COLUMNS = {"response_status", "response_size", "request_duration", "created_at"}
+
+
+def parse_copy_rows(sql, data):
+    """
+    PostgreSQL CSV COPY 해석 흉내
+
+    QUOTE_NONNUMERIC으로 기록한 빈 값은 모두 따옴표 빈 값("")이므로
+    FORCE_NULL 컬럼에서만 NULL이 되고 나머지는 빈 문자열이 된다.
+    """
+    columns = [c.strip() for c in re.search(r"api_raw_data \(([^)]*)\)", sql).group(1).split(",")]
+    force_null_match = re.search(r"FORCE_NULL \(([^)]*)\)", sql)
+    force_null = {c.strip() for c in force_null_match.group(1).split(",")} if force_null_match else set()
+
+    rows = []
+    for raw_row in csv.reader(io.StringIO(data)):
+        row = []
+        for column, value in zip(columns, raw_row):
+            if value == "" and column in force_null:
+                value = None
+            elif value == "" and column in NON_TEXT_COLUMNS:
+                raise Exception(f"invalid input syntax for column {column}: \"\"")
+            row.append(value)
+        rows.append(row)
+    return rows
+
+
+class FakeDBManager:
+    """COPY 입력을 기록하는 DB 매니저"""
+
+    def __init__(self, copy_error=None, failing_endpoints=()):
+        self.copy_error = copy_error
+        self.failing_endpoints = failing_endpoints
+        self.copied_rows = []
+        self.inserted_rows = []
+
+    def get_cursor(self):
+        cursor = MagicMock()
+
+        def copy_expert(sql, buffer):
+            if self.copy_error:
+                raise self.copy_error
+            self.copied_rows.extend(parse_copy_rows(sql, buffer.read()))
+
+        cursor.copy_expert.side_effect = copy_expert
+        context = MagicMock()
+        context.__enter__.return_value = cursor
+        return context
+
+    def execute_update(self, query, params=None):
+        if params[2] in self.failing_endpoints:
+            raise Exception("check constraint violation")
+        self.inserted_rows.append(params)
+        return 1
+
+
+class TestBulkProcessRequests(unittest.TestCase):
+    """배치 COPY 저장 테스트"""
+
+    def setUp(self):
+        self.policy_engine = MagicMock()
+        self.policy_engine.should_store.side_effect = (
+            lambda provider, endpoint, **kwargs: (endpoint != "skip", "정책 결정")
+        )
+        self.policy_engine.get_storage_metadata.return_value = {"priority": 2}
+
+    def _manager(self, db):
+        with patch("app.core.selective_storage_manager.get_policy_engine", return_value=self.policy_engine), \
+                patch("app.core.selective_storage_manager.DatabaseManager"), \
+                patch("app.core.selective_storage_manager.extend_database_manager", return_value=db):
+            return SelectiveStorageManager()
+
+    def _requests(self, endpoints):
+        return [
+            StorageRequest(
+                provider="KMA",
+                endpoint=endpoint,
+                request_params={"nx": 60, "ny": 127},
+                response_data={"items": [{"category": "TMP", "value": f"{n}"}], "note": "쉼표, \"따옴표\""},
+                response_size_bytes=100 + n,
+                status_code=200,
+                execution_time_ms=12.6,
+                created_at=datetime(2026, 10, 16, 9, 0),
+            )
+            for n, endpoint in enumerate(endpoints)
+        ]
+
+    def test_single_copy_and_id_mapping(self):
+        """저장 대상만 한 번의 COPY로 저장하고 요청 순서대로 UUID 매핑"""
+        db = FakeDBManager()
+        manager = self._manager(db)
+
+        results = manager.bulk_process_requests(self._requests(["getVilageFcst", "skip", "getUltraSrtNcst"]))
+
+        self.assertEqual(manager.stats["batch_writes"], 1)
+        self.assertEqual(len(db.copied_rows), 2)
+        self.assertEqual([row[2] for row in db.copied_rows], ["getVilageFcst", "getUltraSrtNcst"])
+        self.assertEqual(json.loads(db.copied_rows[0][5])["note"], '쉼표, "따옴표"')
+        self.assertEqual(db.copied_rows[0][8], "13")
+
+        self.assertEqual(results[0]["stored_uuid"], db.copied_rows[0][0])
+        self.assertFalse(results[1]["should_store"])
+        self.assertIsNone(results[1]["stored_uuid"])
+        self.assertEqual(results[2]["stored_uuid"], db.copied_rows[1][0])
+        self.assertTrue(results[2]["storage_success"])
+
+    def test_none_fields_copied_as_null(self):
+        """None 필드는 COPY에서 NULL로 저장되어 행 단위 저장으로 떨어지지 않음"""
+        db = FakeDBManager()
+        manager = self._manager(db)
+        requests = self._requests(["getVilageFcst", "getUltraSrtNcst"])
+        requests[0].execution_time_ms = None
+        requests[1].created_at = None
+
+        results = manager.bulk_process_requests(requests)
+
+        self.assertEqual(manager.stats["batch_writes"], 1)
+        self.assertEqual(manager.stats["batch_fallbacks"], 0)
+        self.assertEqual(db.inserted_rows, [])
+        self.assertIsNone(db.copied_rows[0][8])
+        self.assertEqual(db.copied_rows[0][9], "2026-10-16T09:00:00")
+        self.assertEqual(db.copied_rows[1][8], "13")
+        self.assertIsNone(db.copied_rows[1][9])
+        self.assertTrue(all(result["storage_success"] for result in results))
+
+    def test_copy_failure_falls_back_to_row_inserts(self):
+        """COPY 실패 시 행 단위 저장으로 실패 행만 격리"""
+        db = FakeDBManager(copy_error=Exception("copy failed"), failing_endpoints=("bad",))
+        manager = self._manager(db)
+
+        results = manager.bulk_process_requests(self._requests(["getVilageFcst", "bad"]))
+
+        self.assertEqual(manager.stats["batch_fallbacks"], 1)
+        self.assertTrue(results[0]["storage_success"])
+        self.assertEqual(results[0]["stored_uuid"], db.inserted_rows[0][0])
+        self.assertFalse(results[1]["storage_success"])
+        self.assertEqual(manager.stats["storage_failures"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
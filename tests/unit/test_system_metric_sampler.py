@@ -0,0 +1,184 @@
+"""
+시스템 메트릭 백그라운드 샘플러 단위 테스트
+"""
+
+import asyncio
+import time
+import unittest
+from collections import namedtuple
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+from app.api.services.performance_manager import PerformanceManager
+from app.models import MetricType as MetricTypeEnum
+from app.monitoring.system_metric_sampler import SystemMetricSampler
+
+
+Usage = namedtuple("Usage", "percent")
+NetIO = namedtuple("NetIO", "bytes_sent bytes_recv")
+
+
+class FakePsutil:
+    """측정 호출을 기록하는 psutil 대체"""
+
+    def __init__(self):
+        self.cpu_intervals = []
+        self.net_bytes = 1000
+
+    def cpu_percent(self, interval=None):
+        self.cpu_intervals.append(interval)
+        return 12.5
+
+    def virtual_memory(self):
+        return Usage(40.0)
+
+    def disk_usage(self, path):
+        return Usage(70.0)
+
+    def net_io_counters(self):
+        self.net_bytes += 500
+        return NetIO(self.net_bytes, 0)
+
+
+class FakeSession:
+    """execute/commit 호출을 기록하는 AsyncSession 대체"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.executions = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def execute(self, statement, params=None):
+        if self.fail:
+            raise RuntimeError("DB 연결 실패")
+        self.executions.append((statement, params))
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+class TestSystemMetricSampler(unittest.TestCase):
+    """샘플러 테스트"""
+
+    def setUp(self):
+        self.psutil = FakePsutil()
+        patcher = patch("app.monitoring.system_metric_sampler.psutil", self.psutil)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_sample_never_blocks_on_cpu(self):
+        """CPU 측정은 interval=None으로 대기하지 않음"""
+        sampler = SystemMetricSampler()
+        snapshot = sampler.sample_now()
+        sampler.sample_now()
+
+        self.assertEqual(set(self.psutil.cpu_intervals), {None})
+        self.assertEqual(snapshot.cpu_percent, 12.5)
+        self.assertEqual(snapshot.network_bytes, 1500)
+        self.assertGreater(sampler.get_latest().network_bytes_per_second, 0)
+        self.assertEqual(len(sampler.drain_pending()), 2)
+        self.assertEqual(sampler.drain_pending(), [])
+
+    def test_background_thread_and_bounded_buffer(self):
+        """백그라운드 스레드가 샘플을 쌓고 버퍼 초과 시 오래된 샘플 제거"""
+        sampler = SystemMetricSampler(interval_seconds=0.01, max_pending_samples=3)
+        sampler.start()
+        try:
+            deadline = time.monotonic() + 2
+            while sampler.stats["samples_taken"] < 5 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            sampler.stop()
+
+        self.assertFalse(sampler.is_running)
+        self.assertGreaterEqual(sampler.stats["samples_taken"], 5)
+        self.assertGreaterEqual(sampler.stats["samples_dropped"], 2)
+        self.assertEqual(len(sampler.drain_pending()), 3)
+
+    def test_collect_persists_samples_in_one_insert(self):
+        """쌓인 샘플을 다중 행 INSERT 한 번, 커밋 한 번으로 저장"""
+        sampler = SystemMetricSampler()
+        for _ in range(3):
+            sampler.sample_now()
+        manager = PerformanceManager(sampler=sampler)
+        session = FakeSession()
+
+        with patch.object(sampler, "start"):
+            asyncio.run(manager.collect_system_metrics(session))
+
+        self.assertEqual(len(session.executions), 1)
+        self.assertEqual(session.commits, 1)
+        rows = session.executions[0][1]
+        self.assertEqual(len(rows), 12)
+        self.assertEqual(
+            [row["metric_type"] for row in rows[:4]],
+            [MetricTypeEnum.CPU_USAGE, MetricTypeEnum.MEMORY_USAGE,
+             MetricTypeEnum.DISK_USAGE, MetricTypeEnum.NETWORK_IO]
+        )
+        self.assertEqual(sampler.drain_pending(), [])
+
+    def test_collect_without_new_samples_saves_nothing(self):
+        """새 샘플이 없으면 최신 스냅샷을 중복 저장하지 않음"""
+        sampler = SystemMetricSampler()
+        sampler.sample_now()
+        sampler.drain_pending()
+        manager = PerformanceManager(sampler=sampler)
+        session = FakeSession()
+
+        with patch.object(sampler, "start"):
+            asyncio.run(manager.collect_system_metrics(session))
+
+        self.assertEqual(session.executions, [])
+        self.assertEqual(session.commits, 0)
+
+    def test_failed_persist_rolls_back_and_requeues_samples(self):
+        """저장 실패 시 롤백 후 샘플을 버퍼로 되돌림"""
+        sampler = SystemMetricSampler()
+        sampler.sample_now()
+        manager = PerformanceManager(sampler=sampler)
+        session = FakeSession(fail=True)
+
+        with patch.object(sampler, "start"):
+            asyncio.run(manager.collect_system_metrics(session))
+
+        self.assertEqual(session.rollbacks, 1)
+        self.assertEqual(len(sampler.drain_pending()), 1)
+
+    def test_periodic_flush_saves_in_batches(self):
+        """주기 저장 루프가 쌓인 샘플을 세션마다 한 번에 저장"""
+        sampler = SystemMetricSampler()
+        manager = PerformanceManager(sampler=sampler)
+        sessions = []
+
+        @asynccontextmanager
+        async def session_factory():
+            session = FakeSession()
+            sessions.append(session)
+            yield session
+
+        async def run():
+            task = asyncio.create_task(manager.run_system_metric_flush(0.1, session_factory))
+            for _ in range(2):
+                sampler.sample_now()
+            await asyncio.sleep(0.15)
+            sampler.sample_now()
+            await asyncio.sleep(0.1)
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        with patch.object(sampler, "start"):
+            asyncio.run(run())
+
+        row_counts = [len(session.executions[0][1]) for session in sessions if session.executions]
+        self.assertEqual(row_counts, [8, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+여행지 추천 엔진 벡터 연산 경로 단위 테스트
+"""
+
+import random
+import unittest
+import warnings
+from datetime import date, timedelta
+
+import numpy as np
+
+from jobs.recommendation.travel_recommendation_engine import (
+    WeatherBasedRecommendationEngine,
+)
+
+
+class TestVectorizedScoring(unittest.TestCase):
+    """벡터 연산 점수가 스칼라 경로와 동일한지 검증"""
+
+    def setUp(self):
+        self.engine = WeatherBasedRecommendationEngine()
+        self.rng = random.Random(20240501)
+
+    def _maybe_missing(self, value):
+        roll = self.rng.random()
+        if roll < 0.05:
+            return None
+        if roll < 0.1:
+            return 0
+        return value
+
+    def _build_history(self, region_codes, days=730):
+        rows = []
+        start = date(2022, 10, 1)
+        for region_code in region_codes:
+            for offset in range(days):
+                rows.append({
+                    "region_code": region_code,
+                    "weather_date": start + timedelta(days=offset),
+                    "avg_temp": self._maybe_missing(self.rng.uniform(-15, 38)),
+                    "precipitation": self._maybe_missing(self.rng.choice([0, 0.5, self.rng.uniform(0, 60)])),
+                    "humidity": self._maybe_missing(self.rng.uniform(10, 100)),
+                    "wind_speed": self._maybe_missing(self.rng.uniform(0, 25)),
+                })
+        return rows
+
+    def test_component_scores_match_scalar_path(self):
+        """구성 요소별 점수가 스칼라 계산과 일치"""
+        samples = [
+            (self.rng.uniform(-20, 45), self.rng.choice([0, 1, self.rng.uniform(0, 80)]),
+             self.rng.uniform(0, 100), self.rng.uniform(0, 30), self.rng.randint(1, 12))
+            for _ in range(5000)
+        ]
+        # 경계값 포함
+        samples += [(t, p, h, w, m) for m in range(1, 13)
+                    for t, p, h, w in [(10, 5, 40, 2), (25, 20, 70, 8), (24, 10, 80, 11), (-5, 1, 60, 6)]]
+
+        temp, precip, humid, wind, months = (np.array(column) for column in zip(*samples))
+        scores = self.engine.calculate_weather_scores_array(temp, precip, humid, wind, months)
+
+        for i, (t, p, h, w, m) in enumerate(samples):
+            expected = self.engine.calculate_weather_score(
+                {"avg_temp": t, "precipitation": p, "humidity": h, "wind_speed": w}, m
+            )
+            self.assertEqual(round(float(scores["temperature_score"][i]), 2), expected.temperature_score)
+            self.assertEqual(round(float(scores["precipitation_score"][i]), 2), expected.precipitation_score)
+            self.assertEqual(round(float(scores["humidity_score"][i]), 2), expected.humidity_score)
+            self.assertEqual(round(float(scores["wind_score"][i]), 2), expected.wind_score)
+            self.assertEqual(round(float(scores["overall_score"][i]), 2), expected.overall_score)
+
+    def test_bulk_recommendations_match_scalar_path(self):
+        """다중 지역 일괄 추천이 지역별 스칼라 추천과 일치"""
+        region_codes = ["11", "26", "50"]
+        rows = self._build_history(region_codes)
+        # 특정 월의 강수 데이터가 모두 없는 경우 (평균 NaN)
+        for row in rows:
+            if row["region_code"] == "26" and row["weather_date"].month == 3:
+                row["precipitation"] = None
+
+        region_infos = {
+            code: {"region_code": code, "region_name": f"지역{code}", "attraction_id": None}
+            for code in region_codes
+        }
+
+        bulk = self.engine.calculate_monthly_recommendations_bulk(rows, region_infos)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            for code in region_codes:
+                region_rows = [row for row in rows if row["region_code"] == code]
+                expected = self.engine.calculate_monthly_recommendations(
+                    region_rows, region_infos[code]
+                )
+                self.assertEqual(bulk[code], expected)
+
+    def test_bulk_ignores_unknown_regions(self):
+        """지역 정보가 없는 레코드는 무시"""
+        rows = self._build_history(["11", "99"], days=40)
+        region_infos = {"11": {"region_code": "11", "region_name": "서울"}}
+
+        bulk = self.engine.calculate_monthly_recommendations_bulk(rows, region_infos)
+
+        self.assertEqual(list(bulk.keys()), ["11"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+"""
+TTL 정책 엔진 파티션 만료 단위 테스트
+"""
+
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from app.core.ttl_policy_engine import (
+    TTLPolicyEngine, CleanupCandidate, CleanupPriority, get_retention_days, parse_partition_bound,
+    RETENTION_DAYS_SQL
+)
+
+
+def _bound(start: str, end: str) -> str:
+    return f"FOR VALUES FROM ('{start} 00:00:00') TO ('{end} 00:00:00')"
+
+
+class FakeDBManager:
+    """파티션 카탈로그 조회를 흉내 내는 DB 매니저"""
+
+    def __init__(self, partitions, pairs_by_partition):
+        self.partitions = partitions
+        self.pairs_by_partition = pairs_by_partition
+        self.executed = []
+        self.executed_params = []
+
+    def fetch_all(self, query, params=None):
+        if "pg_inherits" in query:
+            return self.partitions
+        if "DISTINCT api_provider, endpoint" in query:
+            name = query.split('"')[1]
+            return self.pairs_by_partition.get(name, [])
+        if "api_raw_data_dependent_refs" in query:
+            return [{"table_name": "kma_api_metadata", "column_name": "raw_data_id", "on_delete": "CASCADE"}]
+        return []
+
+    def fetch_one(self, query, params=None):
+        if "exists_flag" in query:
+            return {"exists_flag": True}
+        return None
+
+    def get_cursor(self):
+        cursor = MagicMock()
+        def execute(sql, params=None):
+            self.executed.append(sql)
+            self.executed_params.append(params)
+        cursor.execute.side_effect = execute
+        context = MagicMock()
+        context.__enter__.return_value = cursor
+        return context
+
+
+class TestPartitionExpiry(unittest.TestCase):
+    """파티션 만료 계획 테스트"""
+
+    def setUp(self):
+        self.now = datetime(2026, 10, 16)
+        partitions = [
+            {"partition_name": "api_raw_data_p202501", "partition_bound": _bound("2025-01-01", "2025-02-01"),
+             "total_bytes": 4 * 1024 * 1024, "estimated_rows": 1000},
+            {"partition_name": "api_raw_data_p202606", "partition_bound": _bound("2026-06-01", "2026-07-01"),
+             "total_bytes": 2 * 1024 * 1024, "estimated_rows": 500},
+            {"partition_name": "api_raw_data_p202607", "partition_bound": _bound("2026-07-01", "2026-08-01"),
+             "total_bytes": 2 * 1024 * 1024, "estimated_rows": 500},
+            {"partition_name": "api_raw_data_p202610", "partition_bound": _bound("2026-10-01", "2026-11-01"),
+             "total_bytes": 1024 * 1024, "estimated_rows": 100},
+            {"partition_name": "api_raw_data_default", "partition_bound": "DEFAULT",
+             "total_bytes": 8192, "estimated_rows": 0},
+        ]
+        pairs = {
+            # 예보 데이터만 있는 파티션 (60일 보관) → 전체 만료
+            "api_raw_data_p202606": [{"api_provider": "KMA", "endpoint": "getVilageFcst"}],
+            # 지역 코드(365일 보관)가 섞인 파티션 → 부분 만료
+            "api_raw_data_p202607": [
+                {"api_provider": "KMA", "endpoint": "getVilageFcst"},
+                {"api_provider": "KTO", "endpoint": "areaCode2"},
+            ],
+        }
+        self.db = FakeDBManager(partitions, pairs)
+
+        with patch("app.core.ttl_policy_engine.DatabaseManager"), \
+                patch("app.core.ttl_policy_engine.extend_database_manager", return_value=self.db):
+            self.engine = TTLPolicyEngine(dry_run=False)
+
+    def test_retention_rules(self):
+        """보관 기간 규칙 및 SQL CASE 식"""
+        self.assertEqual(get_retention_days("KMA", "getUltraSrtNcst"), 30)
+        self.assertEqual(get_retention_days("KTO", "areaCode2"), 365)
+        self.assertEqual(get_retention_days("WEATHER", "anything"), 30)
+        self.assertEqual(get_retention_days("NAVER", "search"), 90)
+        self.assertIn("WHEN api_provider = 'KTO' AND endpoint IN ('detailImage2') THEN 90", RETENTION_DAYS_SQL)
+        self.assertIn("ELSE 90", RETENTION_DAYS_SQL)
+
+    def test_parse_partition_bound(self):
+        """파티션 범위 식 파싱"""
+        self.assertEqual(
+            parse_partition_bound(_bound("2026-01-01", "2026-02-01")),
+            (datetime(2026, 1, 1), datetime(2026, 2, 1))
+        )
+        self.assertIsNone(parse_partition_bound("DEFAULT"))
+
+    def test_plan_partition_expiry(self):
+        """파티션별 drop/partial/keep 분류"""
+        plans = {plan.partition_name: plan for plan in self.engine.plan_partition_expiry(now=self.now)}
+
+        self.assertEqual(plans["api_raw_data_p202501"].action, "drop")
+        self.assertEqual(plans["api_raw_data_p202606"].action, "drop")
+        self.assertEqual(plans["api_raw_data_p202607"].action, "partial")
+        self.assertEqual(plans["api_raw_data_p202610"].action, "keep")
+        self.assertNotIn("api_raw_data_default", plans)
+
+    def test_execute_partition_cleanup(self):
+        """만료 파티션 참조 정리 후 DETACH/DROP"""
+        plans = self.engine.plan_partition_expiry(now=self.now)
+        result = self.engine.execute_partition_cleanup(plans)
+
+        self.assertEqual(result.total_candidates, 2)
+        self.assertEqual(result.deleted_records, 1500)
+        self.assertAlmostEqual(result.space_freed_mb, 6.0)
+        self.assertEqual(self.engine.stats["partitions_dropped"], 2)
+
+        executed = self.db.executed
+        self.assertTrue(executed[0].startswith("DELETE FROM kma_api_metadata"))
+        self.assertIn('DETACH PARTITION "api_raw_data_p202501"', executed[1])
+        self.assertIn('DROP TABLE "api_raw_data_p202501"', executed[2])
+        self.assertFalse(any("p202607" in sql for sql in executed))
+
+    def _candidate(self, record_id):
+        return CleanupCandidate(
+            id=record_id, api_provider="KMA", endpoint="getVilageFcst",
+            created_at=datetime(2026, 7, 15), response_size=1024, priority=1,
+            cleanup_priority=CleanupPriority.EXPIRED, estimated_space_mb=0.5, reason="만료"
+        )
+
+    def test_execute_cleanup_handles_dependent_refs(self):
+        """행 단위 삭제도 배치마다 참조 행을 먼저 정리 (단일 트랜잭션)"""
+        candidates = [self._candidate(n) for n in range(1, 6)]
+        result = self.engine.execute_cleanup(candidates, batch_size=3)
+
+        self.assertEqual(result.deleted_records, 5)
+        self.assertEqual(result.errors, [])
+        self.assertEqual(self.db.executed, [
+            'DELETE FROM kma_api_metadata WHERE "raw_data_id" = ANY(%s)',
+            "DELETE FROM api_raw_data WHERE id = ANY(%s)",
+        ] * 2)
+        self.assertEqual(self.db.executed_params, [[[1, 2, 3]], [[1, 2, 3]], [[4, 5]], [[4, 5]]])
+
+    def test_execute_cleanup_nullifies_non_cascade_refs(self):
+        """CASCADE가 아닌 참조는 NULL 처리"""
+        self.db.fetch_all = lambda query, params=None: (
+            [{"table_name": "kto_api_metadata", "column_name": "raw_data_id", "on_delete": "SET NULL"}]
+            if "api_raw_data_dependent_refs" in query else []
+        )
+        self.engine.execute_cleanup([self._candidate(7)])
+
+        self.assertEqual(self.db.executed[0],
+                         'UPDATE kto_api_metadata SET "raw_data_id" = NULL WHERE "raw_data_id" = ANY(%s)')
+        self.assertEqual(self.db.executed_params[0], [[7]])
+
+    def test_dry_run_does_not_drop(self):
+        """dry-run 시 파티션을 삭제하지 않음"""
+        self.engine.dry_run = True
+        result = self.engine.execute_partition_cleanup(self.engine.plan_partition_expiry(now=self.now))
+
+        self.assertEqual(result.total_candidates, 2)
+        self.assertEqual(self.db.executed, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
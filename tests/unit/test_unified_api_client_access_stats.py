@@ -0,0 +1,97 @@
+"""
+통합 API 클라이언트 캐시 접근 통계 배치 반영 단위 테스트
+"""
+
+import asyncio
+import logging
+import unittest
+
+from app.core.unified_api_client import UnifiedAPIClient
+
+
+class FakeTTLOptimizer:
+    """반영된 접근 통계를 기록하는 스마트 TTL 최적화기"""
+
+    def __init__(self):
+        self.updates = []
+
+    async def update_usage_stats(self, cache_key, was_hit, access_time=None):
+        self.updates.append((cache_key, was_hit))
+
+
+def _build_client(batch_size=100, interval_seconds=30.0) -> UnifiedAPIClient:
+    """외부 의존성 없이 테스트용 클라이언트 생성"""
+    client = UnifiedAPIClient.__new__(UnifiedAPIClient)
+    client.logger = logging.getLogger(__name__)
+    client.session = None
+    client.smart_ttl_optimizer = FakeTTLOptimizer()
+    client._pending_access_stats = []
+    client._access_stats_flush_task = None
+    client._access_stats_timer_task = None
+    client.access_stats_batch_size = batch_size
+    client.access_stats_flush_interval_seconds = interval_seconds
+    return client
+
+
+class TestAccessStatsFlush(unittest.TestCase):
+    """건수/주기 기반 통계 반영 테스트"""
+
+    def test_low_traffic_flushes_on_interval(self):
+        """건수 임계값에 못 미쳐도 주기마다 반영"""
+        client = _build_client(batch_size=100, interval_seconds=0.05)
+
+        async def scenario():
+            client._record_cache_access("api_cache:kto:areaBasedList2:1", True)
+            client._record_cache_access("api_cache:kto:areaBasedList2:2", False)
+            timer = client._access_stats_timer_task
+            await asyncio.sleep(0.15)
+            applied = list(client.smart_ttl_optimizer.updates)
+
+            client._record_cache_access("api_cache:kma:getVilageFcst:1", True)
+            self.assertIs(client._access_stats_timer_task, timer)
+            await asyncio.sleep(0.1)
+            await client._stop_access_stats_timer()
+            return applied
+
+        applied = asyncio.run(scenario())
+
+        self.assertEqual(applied, [
+            ("api_cache:kto:areaBasedList2:1", True),
+            ("api_cache:kto:areaBasedList2:2", False),
+        ])
+        self.assertEqual(len(client.smart_ttl_optimizer.updates), 3)
+        self.assertEqual(client._pending_access_stats, [])
+
+    def test_batch_size_triggers_flush_before_interval(self):
+        """건수 임계값 도달 시 주기를 기다리지 않고 반영"""
+        client = _build_client(batch_size=3, interval_seconds=60)
+
+        async def scenario():
+            for n in range(3):
+                client._record_cache_access(f"api_cache:kto:detailCommon2:{n}", True)
+            await client._access_stats_flush_task
+            await client._stop_access_stats_timer()
+
+        asyncio.run(scenario())
+
+        self.assertEqual(len(client.smart_ttl_optimizer.updates), 3)
+
+    def test_exit_stops_timer_and_flushes_remaining(self):
+        """컨텍스트 종료 시 주기 태스크를 멈추고 남은 통계 반영"""
+        client = _build_client(interval_seconds=60)
+
+        async def scenario():
+            client._record_cache_access("api_cache:kto:areaBasedList2:1", True)
+            timer = client._access_stats_timer_task
+            await client.__aexit__(None, None, None)
+            return timer
+
+        timer = asyncio.run(scenario())
+
+        self.assertTrue(timer.cancelled())
+        self.assertIsNone(client._access_stats_timer_task)
+        self.assertEqual(client.smart_ttl_optimizer.updates, [("api_cache:kto:areaBasedList2:1", True)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+통합 API 클라이언트 동일 요청 병합(single-flight) 단위 테스트
+"""
+
+import asyncio
+import logging
+import unittest
+from unittest.mock import MagicMock
+
+from app.core.unified_api_client import UnifiedAPIClient
+from app.core.multi_api_key_manager import APIProvider
+
+
+def _build_client() -> UnifiedAPIClient:
+    """외부 의존성 없이 테스트용 클라이언트 생성"""
+    client = UnifiedAPIClient.__new__(UnifiedAPIClient)
+    client.logger = logging.getLogger(__name__)
+    client.session = MagicMock()
+    client.key_manager = MagicMock()
+    client.key_manager.get_active_key.return_value = None
+    client._inflight_requests = {}
+    client.coalescing_stats = {"upstream_calls": 0, "coalesced_calls": 0}
+    return client
+
+
+class TestRequestCoalescing(unittest.TestCase):
+    """동일 요청 병합 테스트"""
+
+    def setUp(self):
+        self.client = _build_client()
+        self.calls = 0
+
+        async def fake_execute(api_provider, endpoint, params):
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return {"endpoint": endpoint, "params": dict(params)}
+
+        self.client._execute_api_call = fake_execute
+
+    def _run(self, coro):
+        return asyncio.run(coro)
+
+    def test_concurrent_identical_calls_share_upstream_request(self):
+        """동시에 들어온 동일 요청은 외부 API를 한 번만 호출"""
+
+        async def scenario():
+            return await asyncio.gather(*[
+                self.client.call_api(APIProvider.KTO, "detailCommon2", {"contentId": "1"},
+                                     store_raw=False, use_cache=False)
+                for _ in range(5)
+            ])
+
+        responses = self._run(scenario())
+
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(r.success for r in responses))
+        self.assertEqual(len({id(r) for r in responses}), 5)
+        stats = self.client.get_coalescing_stats()
+        self.assertEqual(stats["upstream_calls"], 1)
+        self.assertEqual(stats["coalesced_calls"], 4)
+        self.assertEqual(stats["inflight_requests"], 0)
+
+    def test_different_params_are_not_coalesced(self):
+        """파라미터가 다른 요청은 각각 호출"""
+
+        async def scenario():
+            return await asyncio.gather(*[
+                self.client.call_api(APIProvider.KTO, "detailCommon2", {"contentId": str(n)},
+                                     store_raw=False, use_cache=False)
+                for n in range(3)
+            ])
+
+        self._run(scenario())
+
+        self.assertEqual(self.calls, 3)
+        self.assertEqual(self.client.coalescing_stats["coalesced_calls"], 0)
+
+    def test_cancelled_caller_does_not_cancel_shared_request(self):
+        """먼저 호출한 코루틴이 취소되어도 합류한 호출자는 결과를 받음"""
+
+        async def scenario():
+            params = {"contentId": "1"}
+            leader = asyncio.create_task(self.client.call_api(
+                APIProvider.KTO, "detailCommon2", params, store_raw=False, use_cache=False))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(self.client.call_api(
+                APIProvider.KTO, "detailCommon2", params, store_raw=False, use_cache=False))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await follower
+
+        response = self._run(scenario())
+
+        self.assertTrue(response.success)
+        self.assertEqual(self.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+여행 플랜 날씨 변화 알림 일괄 조회 단위 테스트
+"""
+
+import asyncio
+import logging
+import unittest
+from datetime import date, timedelta
+from uuid import uuid4
+
+from jobs.notification.weather_change_notification_job import WeatherChangeNotificationJob
+
+
+BASE_DATE = date(2026, 10, 20)
+
+
+def _day(offset):
+    return BASE_DATE + timedelta(days=offset)
+
+
+class FakeDB:
+    """플랜별 조회와 일괄 조회 SQL에 모두 응답하는 DB"""
+
+    def __init__(self, destination_regions, forecasts, recent_plan_ids):
+        self.destination_regions = destination_regions
+        self.forecasts = forecasts
+        self.recent_plan_ids = {str(plan_id) for plan_id in recent_plan_ids}
+        self.queries = []
+
+    def _forecast_rows(self, region_codes, start_date, end_date, order_by_region):
+        rows = [
+            row for row in self.forecasts
+            if row['region_code'] in region_codes and start_date <= row['forecast_date'] < end_date
+        ]
+        # ORDER BY [region_code,] forecast_date, created_at DESC
+        rows.sort(key=lambda row: (
+            row['region_code'] if order_by_region else '', row['forecast_date'], -row['created_at']
+        ))
+        return [dict(row) for row in rows]
+
+    def execute_query(self, query, params=None):
+        self.queries.append(query)
+
+        if "SELECT DISTINCT plan_id" in query:
+            return [{'plan_id': plan_id} for plan_id in params[0] if plan_id in self.recent_plan_ids]
+        if "COUNT(*) as count" in query:
+            return [{'count': 1 if params[0] in self.recent_plan_ids else 0}]
+        if "DISTINCT ON (d.name)" in query:
+            return [
+                {'name': name, **self.destination_regions[name]}
+                for name in sorted(params[0]) if name in self.destination_regions
+            ]
+        if "WHERE d.name = %s" in query:
+            region = self.destination_regions.get(params[0])
+            return [dict(region)] if region else []
+        if "region_code = ANY(%s)" in query:
+            return self._forecast_rows(set(params[0]), params[1], params[2], order_by_region=True)
+        if "WHERE region_code = %s" in query:
+            return self._forecast_rows({params[0]}, params[1], params[2], order_by_region=False)
+        raise AssertionError(f"예상하지 않은 쿼리: {query}")
+
+
+class RecordingComparison:
+    """비교 입력을 기록하고 날씨 정보가 달라지면 변화로 판단"""
+
+    def __init__(self):
+        self.calls = {}
+
+    def compare_weather(self, old_weather, new_weather, preferences):
+        self.calls[self.current_plan_id] = new_weather
+        return [{'changed': True}] if old_weather != new_weather else []
+
+    def get_notification_message(self, changes, plan_info):
+        return {'title': '날씨 변화', 'changes': len(changes)}
+
+
+class TestBatchedLookups(unittest.TestCase):
+    """일괄 조회 경로가 플랜별 조회 경로와 같은 결과를 내는지 검증"""
+
+    def setUp(self):
+        def forecast(region_code, offset, created_at, max_temp, condition='맑음'):
+            return {
+                'region_code': region_code, 'forecast_date': _day(offset), 'created_at': created_at,
+                'max_temp': max_temp, 'min_temp': max_temp - 8, 'rain_probability': 20,
+                'weather_condition': condition, 'wind_speed': 2.5,
+            }
+
+        self.destination_regions = {
+            '서울': {'region_code': '11', 'nx': 60, 'ny': 127},
+            '부산': {'region_code': '26', 'nx': 98, 'ny': 76},
+            # 제주는 지역 정보 없음
+        }
+        self.forecasts = [forecast('11', offset, 1, 20 + offset) for offset in range(6)]
+        # 같은 날짜 예보가 여러 번 수집된 경우 (정렬상 마지막 행이 사용됨)
+        self.forecasts.append(forecast('11', 1, 2, 30, '비'))
+        self.forecasts += [forecast('26', offset, 1, 25 + offset) for offset in (2, 3, 4)]
+
+        def plan(destinations, start, end, weather_info=None):
+            return {
+                'plan_id': uuid4(), 'user_id': uuid4(), 'start_date': _day(start), 'end_date': _day(end),
+                'weather_info': weather_info if weather_info is not None else {'old': True},
+                'itinerary': [], 'email': 'user@example.com', 'user_name': '여행자',
+                'destinations': destinations,
+            }
+
+        self.plans = {
+            'seoul': plan(['서울'], 0, 2),
+            'busan_jeju': plan(['부산', '제주'], 1, 3),
+            'recent': plan(['서울'], 1, 2),
+            # 예보가 전혀 없는 목적지: 날짜만 있는 빈 날씨 정보와 동일 → 변화 없음
+            'no_forecast': plan(['제주'], 0, 1, {_day(0).isoformat(): {}, _day(1).isoformat(): {}}),
+            'no_destinations': plan([], 0, 1),
+            'late_busan': plan(['부산'], 4, 5),
+        }
+        self.recent_plan_ids = [self.plans['recent']['plan_id']]
+
+    def _run(self, batched):
+        db = FakeDB(self.destination_regions, self.forecasts, self.recent_plan_ids)
+        comparison = RecordingComparison()
+        sent = []
+
+        job = WeatherChangeNotificationJob.__new__(WeatherChangeNotificationJob)
+        job.logger = logging.getLogger(__name__)
+        job.db_manager = db
+        job.weather_comparison = comparison
+
+        async def send_notification(plan, message_data, changes, old_weather_info, new_weather_info):
+            sent.append(plan['plan_id'])
+            return True
+
+        async def update_plan_weather_info(plan_id, new_weather_info):
+            pass
+
+        job._send_notification = send_notification
+        job._update_plan_weather_info = update_plan_weather_info
+
+        async def run():
+            plans = list(self.plans.values())
+            context = await job._build_lookup_context(plans) if batched else None
+            total = 0
+            for plan in plans:
+                comparison.current_plan_id = plan['plan_id']
+                total += await job._process_travel_plan(plan, context)
+            return total
+
+        total = asyncio.run(run())
+        return total, sent, comparison.calls, db.queries
+
+    def test_batched_matches_per_plan(self):
+        """알림 대상 플랜, 비교 입력(감지 변화), 최근 알림 중복 방지가 동일"""
+        per_plan_total, per_plan_sent, per_plan_calls, per_plan_queries = self._run(batched=False)
+        batched_total, batched_sent, batched_calls, batched_queries = self._run(batched=True)
+
+        self.assertEqual(batched_total, per_plan_total)
+        self.assertEqual(batched_sent, per_plan_sent)
+        self.assertEqual(batched_calls, per_plan_calls)
+
+        plan_ids = {name: plan['plan_id'] for name, plan in self.plans.items()}
+        self.assertEqual(per_plan_sent, [plan_ids['seoul'], plan_ids['busan_jeju'], plan_ids['late_busan']])
+        self.assertNotIn(plan_ids['recent'], per_plan_calls)
+        self.assertNotIn(plan_ids['no_destinations'], per_plan_calls)
+
+        # 중복 수집된 예보는 정렬상 마지막 행(먼저 수집된 값) 사용
+        seoul_day1 = batched_calls[plan_ids['seoul']][_day(1).isoformat()]['서울']
+        self.assertEqual(seoul_day1['max_temp'], 21.0)
+        # 예보가 없는 날짜/목적지는 빈 값
+        self.assertEqual(batched_calls[plan_ids['busan_jeju']][_day(1).isoformat()], {})
+        self.assertEqual(batched_calls[plan_ids['late_busan']][_day(5).isoformat()], {})
+
+        self.assertEqual(len(batched_queries), 3)
+        self.assertGreater(len(per_plan_queries), len(batched_queries))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+WebSocket 연결별 송신 큐 단위 테스트
+"""
+
+import asyncio
+import unittest
+
+from app.api.routers.websocket import ConnectionManager, OutboundQueueConfig
+
+
+class FakeWebSocket:
+    """전송 지연/실패를 흉내내는 WebSocket"""
+
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.sent = []
+        self.gate = None
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, data):
+        if self.gate is not None:
+            await self.gate.wait()
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("연결 끊김")
+        self.sent.append(data)
+
+    async def send_text(self, data):
+        await self.send_json(data)
+
+
+class TestConnectionManager(unittest.TestCase):
+    """연결별 팬아웃 테스트"""
+
+    def test_slow_client_does_not_block_others(self):
+        """느린 연결이 다른 연결/작업의 전송을 막지 않음"""
+        manager = ConnectionManager()
+        slow, fast, other = FakeWebSocket(delay=0.5), FakeWebSocket(), FakeWebSocket()
+
+        async def run():
+            await manager.connect(slow, "job-1")
+            await manager.connect(fast, "job-1")
+            await manager.connect(other, "job-2")
+            for n in range(5):
+                await manager.send_log("job-1", {"n": n})
+            await manager.send_log("job-2", {"n": 0})
+            await asyncio.sleep(0.05)
+            result = (list(fast.sent), list(other.sent), list(slow.sent))
+            stats = {s["job_id"] + str(s["queue_depth"]): s for s in manager.get_connection_stats()}
+            await manager.disconnect(slow, "job-1")
+            return result, stats
+
+        (fast_sent, other_sent, slow_sent), stats = asyncio.run(run())
+
+        self.assertEqual(fast_sent, [{"n": n} for n in range(5)])
+        self.assertEqual(other_sent, [{"n": 0}])
+        self.assertEqual(slow_sent, [])
+        self.assertIn("job-14", stats)
+        self.assertGreater(stats["job-14"]["current_lag"], 0.0)
+        self.assertEqual(list(manager.active_connections), ["job-1", "job-2"])
+
+    def test_progress_coalesced_and_oldest_dropped(self):
+        """대기 중인 진행률은 최신 값으로 병합, 큐 초과 시 가장 오래된 메시지 제거"""
+        manager = ConnectionManager(OutboundQueueConfig(max_queue_size=3))
+        websocket = FakeWebSocket()
+
+        async def run():
+            websocket.gate = asyncio.Event()
+            connection = await manager.connect(websocket, "job-1")
+            for progress in (10.0, 20.0, 30.0):
+                await manager.broadcast_job_update("job-1", {"progress": progress})
+            await manager.send_log("job-1", {"n": 0})
+            queued = connection.queue_depth
+            await manager.send_log("job-1", {"n": 1})
+            await manager.send_log("job-1", {"n": 2})
+            await manager.broadcast_job_update("job-1", {"progress": 40.0})
+            websocket.gate.set()
+            await asyncio.sleep(0.05)
+            stats = connection.get_stats()
+            await manager.disconnect(websocket, "job-1")
+            return queued, stats
+
+        queued, stats = asyncio.run(run())
+
+        self.assertEqual(queued, 2)
+        self.assertEqual(websocket.sent[:2], [{"n": 1}, {"n": 2}])
+        self.assertEqual(websocket.sent[2]["data"], {"progress": 40.0})
+        self.assertEqual(stats["coalesced"], 2)
+        self.assertEqual(stats["dropped"], 2)
+        self.assertEqual(stats["sent"], 3)
+
+    def test_failed_connection_removed(self):
+        """전송 실패한 연결은 관리 목록에서 제거"""
+        manager = ConnectionManager()
+        broken = FakeWebSocket(fail=True)
+
+        async def run():
+            connection = await manager.connect(broken, "job-1")
+            await manager.send_log("job-1", {"n": 0})
+            await asyncio.sleep(0.02)
+            await manager.send_log("job-1", {"n": 1})
+            return connection
+
+        connection = asyncio.run(run())
+
+        self.assertTrue(connection.closed)
+        self.assertEqual(manager.active_connections, {})
+
+
+if __name__ == "__main__":
+    unittest.main()